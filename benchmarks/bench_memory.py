@@ -0,0 +1,265 @@
+"""
+Skalierungs-Benchmarks des MemorySystem
+
+Erzeugt synthetische Populationen (10^3 bis 10^7 Einträge) und misst:
+- Store: store_episode (inkl. Retention-Cleanup), store_knowledge, store_workflow
+- Recall: recall_episodes (häufiger/seltener/fehlender Begriff, ohne Query),
+  recall_knowledge, recall_workflows
+- Retention: inkrementelles Verfallen (_expire_memories, läuft bei jedem
+  store_episode) und voller Abgleich (_cleanup_old_memories) auf voller Population
+- Footprint: RSS-Zuwachs und Bytes pro Eintrag
+
+Die Population wird über die öffentlichen Store-Methoden aufgebaut (Indizes
+und Retention werden also mitgepflegt).
+
+Aufruf:
+    python -m benchmarks.bench_memory
+    python -m benchmarks.bench_memory --sizes 1000 1000000 --max-seconds 5
+
+Hinweis: 10^7 Episoden benötigen je nach Payload deutlich über 10 GB RAM.
+"""
+
+import argparse
+import gc
+import itertools
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.common import configure_logging, current_rss_mb, save_results, summarize
+from cognitive_symphony.config import settings
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.models import AgentType, OrchestrationDecision, Task, TaskStatus
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+# Suchbegriffe: häufig (in jeder Episode), selten (Zipf-Ende), nicht vorhanden
+COMMON_TERM = "orchestrierung"
+MISSING_TERM = "nichtvorhanden"
+
+
+class Population:
+    """Erzeugt synthetische Einträge mit Zipf-verteiltem Vokabular"""
+
+    def __init__(self, vocabulary_size: int = 10_000, words_per_entry: int = 8, seed: int = 42):
+        self.random = random.Random(seed)
+        self.vocabulary = [f"begriff{i}" for i in range(vocabulary_size)]
+        self.cum_weights = list(
+            itertools.accumulate(1.0 / (rank + 1) for rank in range(vocabulary_size))
+        )
+        self.words_per_entry = words_per_entry
+        self.rare_term = self.vocabulary[-1]
+
+        agent_types = list(AgentType)
+        self.decisions = [
+            [
+                OrchestrationDecision(
+                    task_id="benchmark",
+                    selected_agents=[agent_types[i % len(agent_types)]],
+                    reasoning="synthetisch",
+                    confidence=0.8,
+                    outcome="success",
+                )
+            ]
+            for i in range(len(agent_types))
+        ]
+
+    def words(self) -> List[str]:
+        return self.random.choices(
+            self.vocabulary, cum_weights=self.cum_weights, k=self.words_per_entry
+        )
+
+    def tags(self) -> List[str]:
+        return self.random.choices(self.vocabulary[:50], k=2)
+
+    def task(self, i: int) -> Task:
+        return Task(
+            description=f"{COMMON_TERM} {i}: " + " ".join(self.words()),
+            status=TaskStatus.COMPLETED if i % 5 else TaskStatus.FAILED,
+        )
+
+    def store_episode(self, memory: MemorySystem, i: int) -> None:
+        memory.store_episode(self.task(i), [], self.decisions[i % len(self.decisions)])
+
+    def store_knowledge(self, memory: MemorySystem, i: int) -> None:
+        # Importance > 0.6, damit der Cleanup die Population nicht halbiert
+        memory.store_knowledge(
+            {"fact": " ".join(self.words()), "source": f"quelle{i}"},
+            tags=self.tags(),
+            importance=self.random.uniform(0.61, 1.0),
+        )
+
+    def store_workflow(self, memory: MemorySystem, i: int) -> None:
+        decision = self.decisions[i % len(self.decisions)][0]
+        memory.store_workflow(
+            {"agents": [a.value for a in decision.selected_agents]},
+            performance=self.random.random(),
+            tags=self.tags(),
+        )
+
+
+def measure(fn: Callable[[int], Any], max_ops: int, max_seconds: float) -> Dict[str, float]:
+    """
+    Führt eine Operation wiederholt aus, bis max_ops oder das Zeitbudget
+    erreicht ist (mindestens einmal)
+    """
+    latencies = []
+    deadline = time.perf_counter() + max_seconds
+
+    for i in range(max_ops):
+        start = time.perf_counter()
+        fn(i)
+        latencies.append(time.perf_counter() - start)
+        if time.perf_counter() > deadline:
+            break
+
+    return summarize(latencies)
+
+
+def bench_size(size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Baut eine Population der Größe `size` auf und misst alle Operationen"""
+    population = Population(seed=args.seed)
+    side_size = max(1, int(size * args.side_ratio))
+
+    gc.collect()
+    rss_before = current_rss_mb()
+    previous = settings.memory_max_episodic_entries
+    settings.memory_max_episodic_entries = args.max_episodes
+    try:
+        memory = MemorySystem()
+    finally:
+        settings.memory_max_episodic_entries = previous
+
+    start = time.perf_counter()
+    for i in range(size):
+        population.store_episode(memory, i)
+    for i in range(side_size):
+        population.store_knowledge(memory, i)
+        population.store_workflow(memory, i)
+    populate_time = time.perf_counter() - start
+
+    gc.collect()
+    rss_growth = current_rss_mb() - rss_before
+    total_entries = size + 2 * side_size
+
+    ops = args.ops
+    budget = args.max_seconds
+    tags = population.vocabulary[:3]
+
+    operations = {
+        "recall_episodes_common": measure(
+            lambda i: memory.recall_episodes(COMMON_TERM, limit=10), ops, budget
+        ),
+        "recall_episodes_rare": measure(
+            lambda i: memory.recall_episodes(population.rare_term, limit=10), ops, budget
+        ),
+        "recall_episodes_miss": measure(
+            lambda i: memory.recall_episodes(MISSING_TERM, limit=10), ops, budget
+        ),
+        "recall_episodes_no_query": measure(
+            lambda i: memory.recall_episodes(limit=10), ops, budget
+        ),
+        "recall_knowledge": measure(lambda i: memory.recall_knowledge(tags), ops, budget),
+        "recall_workflows": measure(
+            lambda i: memory.recall_workflows(min_performance=0.5), ops, budget
+        ),
+        "expire": measure(lambda i: memory._expire_memories(), ops, budget),
+        "cleanup": measure(lambda i: memory._cleanup_old_memories(), ops, budget),
+        # Store zuletzt, damit die Recall-Messungen auf exakt `size` Episoden laufen
+        "store_episode": measure(
+            lambda i: population.store_episode(memory, size + i), ops, budget
+        ),
+        "store_knowledge": measure(
+            lambda i: population.store_knowledge(memory, side_size + i), ops, budget
+        ),
+        "store_workflow": measure(
+            lambda i: population.store_workflow(memory, side_size + i), ops, budget
+        ),
+    }
+
+    result = {
+        "episodes": size,
+        "knowledge_entries": side_size,
+        "workflows": side_size,
+        "populate_s": round(populate_time, 4),
+        "populate_entries_per_s": round(total_entries / populate_time, 2),
+        "rss_growth_mb": round(rss_growth, 2),
+        "bytes_per_entry": round(rss_growth * 1024 * 1024 / total_entries, 1),
+        "operations_ms": operations,
+        "memory_metrics": memory.get_metrics(),
+    }
+
+    del memory
+    gc.collect()
+    return result
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Skalierungs-Benchmarks des MemorySystem")
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=DEFAULT_SIZES,
+        help="Episoden pro Population (z.B. 1000 10000000)",
+    )
+    parser.add_argument(
+        "--side-ratio",
+        type=float,
+        default=0.1,
+        help="Semantische/prozedurale Einträge relativ zu den Episoden",
+    )
+    parser.add_argument(
+        "--max-episodes",
+        type=int,
+        default=0,
+        help="Budget der episodischen Schicht (0 = unbegrenzt, sonst LFU-DA-Verdrängung)",
+    )
+    parser.add_argument("--ops", type=int, default=50, help="Maximale Wiederholungen pro Messung")
+    parser.add_argument(
+        "--max-seconds", type=float, default=2.0, help="Zeitbudget pro Messung in Sekunden"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """Misst alle Populationsgrößen aufsteigend"""
+    results = {}
+    for size in sorted(args.sizes):
+        results[str(size)] = bench_size(size, args)
+        _print_summary(size, results[str(size)])
+
+    return results
+
+
+def _print_summary(size: int, result: Dict[str, Any]) -> None:
+    print(
+        f"\n{size:,} episodes  populate={result['populate_s']:.2f}s  "
+        f"rss+={result['rss_growth_mb']:.1f}MB  {result['bytes_per_entry']:.0f} B/entry"
+    )
+    for name, stats in result["operations_ms"].items():
+        print(
+            f"  {name:<26} p50={stats['p50']:>10.3f}ms  p99={stats['p99']:>10.3f}ms  "
+            f"n={stats['count']}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """CLI-Einstiegspunkt"""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    results = run(args)
+
+    if not args.no_save:
+        config = {k: v for k, v in vars(args).items() if k not in ("output_dir", "no_save")}
+        path = save_results("memory", results, config, args.output_dir)
+        print(f"\nResults saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
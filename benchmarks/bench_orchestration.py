@@ -0,0 +1,346 @@
+"""
+End-to-End-Benchmarks der Orchestrierung
+
+Treibt `CognitiveSymphony.solve` gegen ein Fake-LLM und misst:
+- Durchsatz (Tasks/s) und Latenz-Perzentile (p50/p95/p99)
+- Orchestrierungs-Overhead pro Teilaufgabe (Latenz abzüglich LLM-Zeit)
+- Peak-RSS und Speicherwachstum
+
+Szenarien:
+- single: Einzelne Aufgabe (Kaltstart)
+- sequential: 1.000 Aufgaben nacheinander
+- concurrent: 1.000 Aufgaben gleichzeitig
+- wide: Breite Zerlegungen mit 50 Teilaufgaben
+- long_running: Dauerbetrieb mit RSS-Verlauf (Speicherwachstum)
+- blackboard: Redundante Zerlegungen mit und ohne Blackboard (LLM-Aufrufe, Tokens)
+
+Aufruf:
+    python -m benchmarks.bench_orchestration
+    python -m benchmarks.bench_orchestration --scenario concurrent --tasks 5000
+    python -m benchmarks.bench_orchestration --llm-latency 0.05 --max-concurrency 20
+"""
+
+import argparse
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.common import (
+    RssSampler,
+    configure_logging,
+    current_rss_mb,
+    save_results,
+    summarize,
+)
+from benchmarks.fake_llm import FakeLLM, llm_call_times
+from cognitive_symphony.config import settings
+from cognitive_symphony.core.cognitive_symphony import CognitiveSymphony
+from cognitive_symphony.models import TaskStatus
+
+
+def build_symphony(
+    args: argparse.Namespace, subtasks: int, unique_subtasks: Optional[int] = None
+) -> CognitiveSymphony:
+    """Erstellt eine Symphony, deren Komponenten alle das Fake-LLM nutzen"""
+    llm = FakeLLM(
+        subtasks=subtasks,
+        latency=args.llm_latency,
+        jitter=args.llm_jitter,
+        seed=args.seed,
+        unique_subtasks=unique_subtasks,
+    )
+    return CognitiveSymphony(enable_learning=not args.no_learning, llm=llm)
+
+
+async def timed_solve(symphony: CognitiveSymphony, description: str) -> Dict[str, Any]:
+    """Löst eine Aufgabe und erfasst Latenz und im LLM verbrachte Zeit"""
+    call_times: List[float] = []
+    llm_call_times.set(call_times)
+
+    start = time.perf_counter()
+    try:
+        result = await symphony.solve(description)
+        subtasks = result.performance_metrics["subtasks_completed"] + result.performance_metrics[
+            "subtasks_failed"
+        ]
+        failed = result.performance_metrics["subtasks_failed"] > 0
+    except Exception:
+        subtasks, failed = 0, True
+    latency = time.perf_counter() - start
+
+    llm_time = sum(call_times)
+    return {
+        "latency": latency,
+        "llm_time": llm_time,
+        "llm_calls": len(call_times),
+        "subtasks": subtasks,
+        "failed": failed,
+        # Bei parallelen LLM-Aufrufen kann die Summe die Latenz übersteigen
+        "overhead_per_subtask": max(0.0, latency - llm_time) / subtasks if subtasks else 0.0,
+    }
+
+
+def aggregate(samples: List[Dict[str, Any]], duration: float) -> Dict[str, Any]:
+    """Fasst die Messungen eines Szenarios zusammen"""
+    tasks = len(samples)
+    subtasks = sum(s["subtasks"] for s in samples)
+
+    return {
+        "tasks": tasks,
+        "subtasks": subtasks,
+        "failed_tasks": sum(1 for s in samples if s["failed"]),
+        "duration_s": round(duration, 4),
+        "throughput_tasks_per_s": round(tasks / duration, 2) if duration else 0.0,
+        "throughput_subtasks_per_s": round(subtasks / duration, 2) if duration else 0.0,
+        "latency_ms": summarize([s["latency"] for s in samples]),
+        "orchestration_overhead_per_subtask_ms": summarize(
+            [s["overhead_per_subtask"] for s in samples if s["subtasks"]]
+        ),
+        "llm_calls_per_task": round(sum(s["llm_calls"] for s in samples) / tasks, 2)
+        if tasks
+        else 0.0,
+    }
+
+
+async def scenario_single(args: argparse.Namespace) -> Dict[str, Any]:
+    """Einzelne Aufgabe inkl. Initialisierung der Symphony"""
+    async with RssSampler() as rss:
+        start = time.perf_counter()
+        symphony = build_symphony(args, args.subtasks)
+        init_time = time.perf_counter() - start
+
+        sample = await timed_solve(symphony, "Recherchiere KI-Trends")
+        duration = time.perf_counter() - start
+
+    return {**aggregate([sample], duration), "init_ms": round(init_time * 1000, 4), **rss.as_dict()}
+
+
+async def scenario_sequential(args: argparse.Namespace) -> Dict[str, Any]:
+    """Viele Aufgaben nacheinander auf einer langlebigen Symphony"""
+    symphony = build_symphony(args, args.subtasks)
+
+    async with RssSampler() as rss:
+        start = time.perf_counter()
+        samples = [await timed_solve(symphony, f"Aufgabe {i}") for i in range(args.tasks)]
+        duration = time.perf_counter() - start
+
+    return {**aggregate(samples, duration), **rss.as_dict()}
+
+
+async def scenario_concurrent(args: argparse.Namespace) -> Dict[str, Any]:
+    """Viele Aufgaben gleichzeitig (Concurrency begrenzt durch den LLM-Limiter)"""
+    symphony = build_symphony(args, args.subtasks)
+
+    async with RssSampler() as rss:
+        start = time.perf_counter()
+        samples = await asyncio.gather(
+            *[timed_solve(symphony, f"Aufgabe {i}") for i in range(args.tasks)]
+        )
+        duration = time.perf_counter() - start
+
+    return {**aggregate(list(samples), duration), **rss.as_dict()}
+
+
+async def scenario_wide(args: argparse.Namespace) -> Dict[str, Any]:
+    """Breite Zerlegungen mit vielen Teilaufgaben pro Aufgabe"""
+    symphony = build_symphony(args, args.wide_subtasks)
+
+    async with RssSampler() as rss:
+        start = time.perf_counter()
+        samples = [
+            await timed_solve(symphony, f"Breite Aufgabe {i}") for i in range(args.wide_tasks)
+        ]
+        duration = time.perf_counter() - start
+
+    return {**aggregate(samples, duration), **rss.as_dict()}
+
+
+async def scenario_long_running(args: argparse.Namespace) -> Dict[str, Any]:
+    """Dauerbetrieb: RSS und Größe der internen Strukturen über die Zeit"""
+    symphony = build_symphony(args, args.subtasks)
+    timeline = []
+    samples: List[Dict[str, Any]] = []
+
+    async with RssSampler() as rss:
+        start = time.perf_counter()
+        for i in range(args.long_running_tasks):
+            samples.append(await timed_solve(symphony, f"Aufgabe {i}"))
+
+            if (i + 1) % args.sample_every == 0:
+                timeline.append(
+                    {
+                        "tasks": i + 1,
+                        "elapsed_s": round(time.perf_counter() - start, 3),
+                        "rss_mb": round(rss.sample(), 2),
+                        "episodes": len(symphony.memory_system.episodic_memory),
+                        "decisions": len(symphony.meta_orchestrator.decision_history),
+                        "task_history": len(symphony.task_history),
+                        "window_latency_p50_ms": summarize(
+                            [s["latency"] for s in samples[-args.sample_every :]]
+                        )["p50"],
+                    }
+                )
+        duration = time.perf_counter() - start
+
+    return {
+        **aggregate(samples, duration),
+        **rss.as_dict(),
+        "rss_growth_mb_per_1k_tasks": _growth_per_1k(timeline),
+        "timeline": timeline,
+    }
+
+
+async def scenario_blackboard(args: argparse.Namespace) -> Dict[str, Any]:
+    """Gleiche Last mit redundanten Teilaufgaben, ohne und mit Blackboard"""
+    runs = {}
+    enabled = settings.enable_blackboard
+
+    try:
+        for mode in ("without", "with"):
+            settings.enable_blackboard = mode == "with"
+            symphony = build_symphony(
+                args, args.blackboard_subtasks, unique_subtasks=args.blackboard_unique_subtasks
+            )
+            llm = symphony.agent_fleet.llm.llm
+
+            start = time.perf_counter()
+            samples = [
+                await timed_solve(symphony, f"Aufgabe {i}") for i in range(args.blackboard_tasks)
+            ]
+            runs[mode] = {
+                **aggregate(samples, time.perf_counter() - start),
+                "prompt_tokens": llm.prompt_tokens,
+                "completion_tokens": llm.completion_tokens,
+            }
+    finally:
+        settings.enable_blackboard = enabled
+
+    without, with_ = runs["without"], runs["with"]
+    total_without = without["prompt_tokens"] + without["completion_tokens"]
+    total_with = with_["prompt_tokens"] + with_["completion_tokens"]
+
+    return {
+        **with_,
+        "without_blackboard": without,
+        "llm_call_reduction_pct": _reduction(
+            without["llm_calls_per_task"], with_["llm_calls_per_task"]
+        ),
+        "token_reduction_pct": _reduction(total_without, total_with),
+        "peak_rss_mb": round(current_rss_mb(), 2),
+    }
+
+
+def _reduction(before: float, after: float) -> float:
+    return round((before - after) / before * 100, 2) if before else 0.0
+
+
+def _growth_per_1k(timeline: List[Dict[str, Any]]) -> float:
+    """Steigung der RSS über die Taskanzahl (lineare Regression) pro 1.000 Tasks"""
+    if len(timeline) < 2:
+        return 0.0
+
+    xs = [p["tasks"] for p in timeline]
+    ys = [p["rss_mb"] for p in timeline]
+    mean_x = sum(xs) / len(xs)
+    mean_y = sum(ys) / len(ys)
+    var_x = sum((x - mean_x) ** 2 for x in xs)
+    cov = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys))
+    return round(cov / var_x * 1000, 4) if var_x else 0.0
+
+
+SCENARIOS: Dict[str, Callable[[argparse.Namespace], Any]] = {
+    "single": scenario_single,
+    "sequential": scenario_sequential,
+    "concurrent": scenario_concurrent,
+    "wide": scenario_wide,
+    "long_running": scenario_long_running,
+    "blackboard": scenario_blackboard,
+}
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="End-to-End-Benchmarks der Orchestrierung")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="Szenario (mehrfach angebbar, Default: alle)",
+    )
+    parser.add_argument("--tasks", type=int, default=1000, help="Tasks für sequential/concurrent")
+    parser.add_argument("--subtasks", type=int, default=3, help="Teilaufgaben pro Zerlegung")
+    parser.add_argument("--wide-subtasks", type=int, default=50)
+    parser.add_argument("--wide-tasks", type=int, default=20)
+    parser.add_argument("--long-running-tasks", type=int, default=5000)
+    parser.add_argument("--sample-every", type=int, default=250, help="RSS-Abtastung (Tasks)")
+    parser.add_argument("--blackboard-tasks", type=int, default=100)
+    parser.add_argument("--blackboard-subtasks", type=int, default=10)
+    parser.add_argument(
+        "--blackboard-unique-subtasks",
+        type=int,
+        default=5,
+        help="Unterschiedliche Teilaufgaben pro Zerlegung (Rest sind Wiederholungen)",
+    )
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Sekunden pro Aufruf")
+    parser.add_argument("--llm-jitter", type=float, default=0.0)
+    parser.add_argument(
+        "--max-concurrency",
+        type=int,
+        default=None,
+        help="Gleichzeitige LLM-Aufrufe (Default: MAX_CONCURRENT_AGENTS)",
+    )
+    parser.add_argument("--no-learning", action="store_true", help="Self-Optimization aus")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+async def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """Führt die ausgewählten Szenarien nacheinander aus"""
+    if args.max_concurrency:
+        settings.max_concurrent_agents = args.max_concurrency
+
+    results = {}
+    for name in args.scenario or list(SCENARIOS):
+        results[name] = await SCENARIOS[name](args)
+        _print_summary(name, results[name])
+
+    return results
+
+
+def _print_summary(name: str, result: Dict[str, Any]) -> None:
+    latency = result["latency_ms"]
+    overhead = result["orchestration_overhead_per_subtask_ms"]
+    print(
+        f"{name:<14} tasks={result['tasks']:<6} "
+        f"throughput={result['throughput_tasks_per_s']:>9.2f}/s "
+        f"p50={latency['p50']:>9.2f}ms p95={latency['p95']:>9.2f}ms "
+        f"p99={latency['p99']:>9.2f}ms "
+        f"overhead/subtask={overhead['mean']:>7.3f}ms "
+        f"peak_rss={result['peak_rss_mb']:.1f}MB"
+    )
+    if "llm_call_reduction_pct" in result:
+        print(
+            # Vorzeichen der Änderung (positiv = Mehrverbrauch durch das Blackboard)
+            f"{'':<14} blackboard: llm_calls {-result['llm_call_reduction_pct']:+.1f}% "
+            f"tokens {-result['token_reduction_pct']:+.1f}%"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """CLI-Einstiegspunkt"""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    results = asyncio.run(run(args))
+
+    if not args.no_save:
+        config = {k: v for k, v in vars(args).items() if k not in ("output_dir", "no_save")}
+        config["max_concurrent_agents"] = settings.max_concurrent_agents
+        path = save_results("orchestration", results, config, args.output_dir)
+        print(f"\nResults saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Benchmark der komprimierten Episoden-Inhalte
+
+Speichert realistisch große Episoden (Teilaufgaben mit LLM-Antworten, die im
+Gesamtergebnis und in den Begründungen erneut vorkommen) einmal als Dict und
+einmal komprimiert (CompressedPayload) und misst:
+- Bytes pro Episode: RSS-Zuwachs und Inhaltsgröße (JSON bzw. Blob)
+- store_episode-Latenz (inkl. Kompression)
+- Zugriff auf den vollen Inhalt (Dekodieren) und recall_episodes
+
+Aufruf:
+    python -m benchmarks.bench_payload
+    python -m benchmarks.bench_payload --episodes 5000 --response-words 600
+"""
+
+import argparse
+import gc
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.bench_memory import Population, measure
+from benchmarks.common import configure_logging, current_rss_mb, save_results
+from cognitive_symphony.config import settings
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.memory.payload import CompressedPayload, encode_json
+from cognitive_symphony.models import AgentType, OrchestrationDecision, Task, TaskStatus
+
+
+class EpisodeFactory:
+    """Erzeugt Episoden mit LLM-artigen Antworttexten"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.population = Population(words_per_entry=args.response_words, seed=args.seed)
+        self.subtasks = args.subtasks
+
+    def response(self) -> str:
+        words = self.population.words()
+        # Absätze wie in LLM-Antworten
+        return "\n\n".join(" ".join(words[i : i + 60]) for i in range(0, len(words), 60))
+
+    def episode(self, i: int) -> Dict[str, Any]:
+        agent_types = list(AgentType)
+        task = Task(description=f"Aufgabe {i}: " + " ".join(self.population.words()[:12]))
+        subtasks = []
+        decisions = []
+        for j in range(self.subtasks):
+            agent = agent_types[(i + j) % len(agent_types)]
+            response = self.response()
+            subtask = Task(
+                description=f"Teilaufgabe {j} von {i}",
+                parent_task_id=task.id,
+                status=TaskStatus.COMPLETED,
+                result={"agent": agent.value, "result": response, "confidence": 0.8},
+            )
+            subtasks.append(subtask)
+            decisions.append(
+                OrchestrationDecision(
+                    task_id=subtask.id,
+                    selected_agents=[agent],
+                    # Begründung zitiert Teile der Antwort
+                    reasoning=f"{agent.value} gewählt: {response[: len(response) // 2]}",
+                    confidence=0.8,
+                    outcome="success",
+                )
+            )
+
+        task.status = TaskStatus.COMPLETED
+        task.result = "\n\n".join(s.result["result"] for s in subtasks)
+        return {"task": task, "subtasks": subtasks, "decisions": decisions}
+
+
+def bench_mode(compress: bool, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Speichert alle Episoden in einem frischen MemorySystem
+
+    Die Episoden werden einzeln erzeugt und danach verworfen (wie nach
+    solve()), damit der RSS-Zuwachs nur das Gedächtnis enthält.
+    """
+    factory = EpisodeFactory(args)
+    previous = settings.memory_compress_episodes
+    settings.memory_compress_episodes = compress
+    try:
+        gc.collect()
+        rss_before = current_rss_mb()
+        memory = MemorySystem()
+
+        store_time = 0.0
+        for i in range(args.episodes):
+            e = factory.episode(i)
+            start = time.perf_counter()
+            memory.store_episode(e["task"], e["subtasks"], e["decisions"])
+            store_time += time.perf_counter() - start
+        del e
+
+        gc.collect()
+        rss_growth = current_rss_mb() - rss_before
+    finally:
+        settings.memory_compress_episodes = previous
+
+    stored = list(memory.episodic_memory)
+    content_bytes = sum(
+        e.content.compressed_bytes
+        if isinstance(e.content, CompressedPayload)
+        else len(encode_json(e.content))
+        for e in stored
+    )
+    ops = args.ops
+    budget = args.max_seconds
+    result = {
+        "episodes": len(stored),
+        "store_ms_per_episode": round(store_time / len(stored) * 1000, 4),
+        "rss_bytes_per_episode": round(rss_growth * 1024 * 1024 / len(stored), 1),
+        "content_bytes_per_episode": round(content_bytes / len(stored), 1),
+        "operations_ms": {
+            "access_full_content": measure(
+                lambda i: stored[i % len(stored)].content["subtasks"], ops, budget
+            ),
+            "recall_episodes": measure(
+                lambda i: memory.recall_episodes("aufgabe", limit=10), ops, budget
+            ),
+        },
+        "episode_payload": memory.get_metrics()["episode_payload"],
+    }
+
+    del memory, stored
+    gc.collect()
+    return result
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """
+    Misst beide Varianten auf denselben (gleich geseedeten) Episoden
+
+    Die kleinere Variante zuerst, sonst belegt sie vom Allokator bereits
+    freigegebenen Speicher und der RSS-Zuwachs wird unterschätzt.
+    """
+    results = {"compressed": bench_mode(True, args)}
+    results["dict"] = bench_mode(False, args)
+    for name, result in results.items():
+        _print_summary(name, result)
+
+    return results
+
+
+def _print_summary(name: str, result: Dict[str, Any]) -> None:
+    print(
+        f"\n{name:<10} {result['episodes']:,} episodes  "
+        f"rss={result['rss_bytes_per_episode']:.0f} B/episode  "
+        f"content={result['content_bytes_per_episode']:.0f} B/episode  "
+        f"store={result['store_ms_per_episode']:.3f} ms"
+    )
+    for op, stats in result["operations_ms"].items():
+        print(f"  {op:<22} p50={stats['p50']:>9.3f}ms  p99={stats['p99']:>9.3f}ms")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark der komprimierten Episoden-Inhalte")
+    parser.add_argument("--episodes", type=int, default=2000)
+    parser.add_argument("--subtasks", type=int, default=4, help="Teilaufgaben pro Episode")
+    parser.add_argument(
+        "--response-words", type=int, default=300, help="Wörter pro LLM-Antwort"
+    )
+    parser.add_argument("--ops", type=int, default=50, help="Maximale Wiederholungen pro Messung")
+    parser.add_argument(
+        "--max-seconds", type=float, default=2.0, help="Zeitbudget pro Messung in Sekunden"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """CLI-Einstiegspunkt"""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    results = run(args)
+
+    if not args.no_save:
+        config = {k: v for k, v in vars(args).items() if k not in ("output_dir", "no_save")}
+        path = save_results("payload", results, config, args.output_dir)
+        print(f"\nResults saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Benchmark des BM25-Index für recall_episodes
+
+Misst den Index (`BM25Index`) isoliert auf synthetischen Episoden-Texten mit
+Zipf-verteiltem Vokabular (wie bench_memory) und vergleicht mit dem früheren
+linearen Scan (Sortierung nach Wichtigkeit plus Substring-Match pro Eintrag):
+- Aufbau: Einfügen pro Dokument, RSS-Zuwachs
+- Suche: häufiger/seltener/fehlender Begriff, Mehrwort-Query (Top-10 mit
+  Wichtigkeits-/Aktualitäts-Mix)
+- Löschen: Entfernen von 1% der Dokumente (inkl. Kompaktierung)
+
+Aufruf:
+    python -m benchmarks.bench_recall
+    python -m benchmarks.bench_recall --sizes 1000000 --max-seconds 5
+"""
+
+import argparse
+import gc
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.bench_memory import COMMON_TERM, MISSING_TERM, Population, measure
+from benchmarks.common import configure_logging, current_rss_mb, save_results
+from cognitive_symphony.memory.text_index import BM25Index
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+
+def linear_scan(documents: List[Dict[str, Any]], query: str, limit: int) -> List[Any]:
+    """Früheres Verfahren von recall_episodes"""
+    ranked = sorted(documents, key=lambda d: (d["importance"], d["timestamp"]), reverse=True)
+    needle = query.lower()
+    return [d for d in ranked if needle in d["text"].lower()][:limit]
+
+
+def bench_size(size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Baut Index und Vergleichsliste der Größe `size` auf und misst"""
+    population = Population(seed=args.seed)
+    rng = random.Random(args.seed)
+    now = time.time()
+
+    documents = [
+        {
+            "key": str(i),
+            "text": f"{COMMON_TERM} {i}: " + " ".join(population.words()),
+            "tags": ["episode", "completed" if i % 5 else "failed"],
+            "importance": rng.random(),
+            "timestamp": now - rng.uniform(0, 90 * 86400),
+        }
+        for i in range(size)
+    ]
+
+    gc.collect()
+    rss_before = current_rss_mb()
+    index = BM25Index()
+
+    start = time.perf_counter()
+    for d in documents:
+        index.add(d["key"], d["key"], d["text"], d["tags"], d["importance"], d["timestamp"])
+    build_time = time.perf_counter() - start
+
+    gc.collect()
+    rss_growth = current_rss_mb() - rss_before
+
+    ops = args.ops
+    budget = args.max_seconds
+    medium_terms = f"{population.vocabulary[20]} {population.vocabulary[200]}"
+
+    def search(query: str) -> Any:
+        return index.search(
+            query,
+            10,
+            importance_weight=args.importance_weight,
+            recency_weight=args.recency_weight,
+        )
+
+    operations = {
+        "bm25_common": measure(lambda i: search(COMMON_TERM), ops, budget),
+        "bm25_rare": measure(lambda i: search(population.rare_term), ops, budget),
+        "bm25_multi_term": measure(lambda i: search(medium_terms), ops, budget),
+        "bm25_miss": measure(lambda i: search(MISSING_TERM), ops, budget),
+        "scan_common": measure(
+            lambda i: linear_scan(documents, COMMON_TERM, 10), ops, budget
+        ),
+        "scan_rare": measure(
+            lambda i: linear_scan(documents, population.rare_term, 10), ops, budget
+        ),
+    }
+
+    removals = max(1, size // 100)
+    start = time.perf_counter()
+    for d in documents[:removals]:
+        index.remove(d["key"])
+    remove_time = time.perf_counter() - start
+    operations["bm25_common_after_remove"] = measure(
+        lambda i: search(COMMON_TERM), ops, budget
+    )
+
+    speedup = {
+        term: round(operations[f"scan_{term}"]["p50"] / operations[f"bm25_{term}"]["p50"], 1)
+        if operations[f"bm25_{term}"]["p50"] > 0
+        else None
+        for term in ("common", "rare")
+    }
+
+    result = {
+        "documents": size,
+        "build_s": round(build_time, 4),
+        "adds_per_s": round(size / build_time, 2),
+        "index_rss_growth_mb": round(rss_growth, 2),
+        "index_bytes_per_document": round(rss_growth * 1024 * 1024 / size, 1),
+        "removals": removals,
+        "remove_us_per_document": round(remove_time / removals * 1e6, 2),
+        "operations_ms": operations,
+        "speedup_p50": speedup,
+        "index_metrics": index.get_metrics(),
+    }
+
+    del index, documents
+    gc.collect()
+    return result
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark des BM25-Index für recall_episodes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--ops", type=int, default=50, help="Maximale Wiederholungen pro Messung")
+    parser.add_argument(
+        "--max-seconds", type=float, default=2.0, help="Zeitbudget pro Messung in Sekunden"
+    )
+    parser.add_argument("--importance-weight", type=float, default=0.2)
+    parser.add_argument("--recency-weight", type=float, default=0.1)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """Misst alle Größen aufsteigend"""
+    results = {}
+    for size in sorted(args.sizes):
+        results[str(size)] = bench_size(size, args)
+        _print_summary(size, results[str(size)])
+
+    return results
+
+
+def _print_summary(size: int, result: Dict[str, Any]) -> None:
+    print(
+        f"\n{size:,} documents  build={result['build_s']:.2f}s  "
+        f"index={result['index_bytes_per_document']:.0f} B/doc  "
+        f"speedup p50={result['speedup_p50']}"
+    )
+    for name, stats in result["operations_ms"].items():
+        print(
+            f"  {name:<26} p50={stats['p50']:>10.3f}ms  p99={stats['p99']:>10.3f}ms  "
+            f"n={stats['count']}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """CLI-Einstiegspunkt"""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    results = run(args)
+
+    if not args.no_save:
+        config = {k: v for k, v in vars(args).items() if k not in ("output_dir", "no_save")}
+        path = save_results("recall", results, config, args.output_dir)
+        print(f"\nResults saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
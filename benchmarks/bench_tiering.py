@@ -0,0 +1,187 @@
+"""
+Benchmark des Hot-/Cold-Tierings der Episoden-Inhalte
+
+Speichert Episoden einmal ganz im Speicher und einmal mit begrenztem
+Hot-Tier (Rest in Segmentdateien) und misst:
+- Bytes pro Episode (RSS-Zuwachs) und store_episode-Latenz
+- Zugriff auf Inhalte heißer und kalter Episoden (Zurückholen von Platte)
+- Hit-Rate bei schiefem Zugriffsmuster (Großteil der Zugriffe auf neue Episoden)
+
+Der RSS-Vergleich ist nur zwischen getrennten Prozessen verlässlich (die
+zweite Variante nutzt vom Allokator freigegebenen Speicher der ersten);
+dafür `--modes` einzeln aufrufen. `resident_content_bytes_per_episode` zählt
+die im Speicher gehaltenen Blob-Bytes direkt.
+
+Aufruf:
+    python -m benchmarks.bench_tiering
+    python -m benchmarks.bench_tiering --episodes 10000 --hot-fraction 0.05
+    python -m benchmarks.bench_tiering --episodes 10000 --modes tiered
+"""
+
+import argparse
+import gc
+import random
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from benchmarks.bench_memory import measure
+from benchmarks.bench_payload import EpisodeFactory
+from benchmarks.common import configure_logging, current_rss_mb, save_results
+from cognitive_symphony.config import settings
+from cognitive_symphony.memory.memory_system import MemorySystem
+
+
+def skewed_index(rng: random.Random, size: int, hot_share: float, hot_fraction: float) -> int:
+    """Index einer Episode: mit Anteil `hot_share` aus den neuesten `hot_fraction`"""
+    recent = max(1, int(size * hot_fraction))
+    if rng.random() < hot_share:
+        return size - 1 - rng.randrange(recent)
+    return rng.randrange(size)
+
+
+def bench_mode(hot_bytes: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Speichert alle Episoden in einem frischen MemorySystem mit gegebenem Hot-Tier"""
+    factory = EpisodeFactory(args)
+    previous = settings.memory_hot_tier_bytes, settings.memory_cold_tier_path
+    cold_dir = tempfile.TemporaryDirectory(prefix="bench-tiering-")
+    settings.memory_hot_tier_bytes = hot_bytes
+    settings.memory_cold_tier_path = cold_dir.name
+    try:
+        gc.collect()
+        rss_before = current_rss_mb()
+        memory = MemorySystem()
+
+        store_time = 0.0
+        for i in range(args.episodes):
+            e = factory.episode(i)
+            start = time.perf_counter()
+            memory.store_episode(e["task"], e["subtasks"], e["decisions"])
+            store_time += time.perf_counter() - start
+        del e
+
+        gc.collect()
+        rss_growth = current_rss_mb() - rss_before
+    finally:
+        settings.memory_hot_tier_bytes, settings.memory_cold_tier_path = previous
+
+    stored = list(memory.episodic_memory)
+    size = len(stored)
+    metrics = memory.get_metrics()
+    tier = metrics["payload_tier"]
+    resident = tier["hot_bytes"] if tier else metrics["episode_payload"]["stored_bytes"]
+    rng = random.Random(args.seed)
+    ops = args.ops
+    budget = args.max_seconds
+    result = {
+        "episodes": size,
+        "hot_bytes": hot_bytes,
+        "store_ms_per_episode": round(store_time / size * 1000, 4),
+        "rss_bytes_per_episode": round(rss_growth * 1024 * 1024 / size, 1),
+        "resident_content_bytes_per_episode": round(resident / size, 1),
+        "operations_ms": {
+            "access_recent": measure(lambda i: stored[-1 - i % 10].content["task"], ops, budget),
+            "access_old": measure(
+                lambda i: stored[rng.randrange(size // 2)].content["task"], ops, budget
+            ),
+            "access_skewed": measure(
+                lambda i: stored[
+                    skewed_index(rng, size, args.hot_share, args.hot_fraction)
+                ].content["task"],
+                ops,
+                budget,
+            ),
+            "recall_episodes": measure(
+                lambda i: memory.recall_episodes("aufgabe", limit=10), ops, budget
+            ),
+        },
+        "payload_tier": memory.get_metrics()["payload_tier"],
+    }
+
+    memory.close()
+    cold_dir.cleanup()
+    del memory, stored
+    gc.collect()
+    return result
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """
+    Misst den Hot-Tier (Anteil `hot_fraction` der komprimierten Inhalte) gegen
+    alles im Speicher; die kleinere Variante zuerst (s. bench_payload)
+    """
+    # Größe der komprimierten Inhalte aus einer Stichprobe schätzen
+    probe = MemorySystem()
+    factory = EpisodeFactory(args)
+    for i in range(min(50, args.episodes)):
+        e = factory.episode(i)
+        probe.store_episode(e["task"], e["subtasks"], e["decisions"])
+    payload = probe.get_metrics()["episode_payload"]
+    per_episode = payload["stored_bytes"] / max(1, payload["compressed_episodes"])
+    hot_bytes = max(1, int(per_episode * args.episodes * args.hot_fraction))
+    del probe
+
+    results = {}
+    for mode in args.modes:
+        results[mode] = bench_mode(hot_bytes if mode == "tiered" else 0, args)
+    for name, result in results.items():
+        _print_summary(name, result)
+
+    return results
+
+
+def _print_summary(name: str, result: Dict[str, Any]) -> None:
+    tier = result["payload_tier"]
+    hit_rate = f"hit_rate={tier['hit_rate']}" if tier else "hit_rate=-"
+    print(
+        f"\n{name:<10} {result['episodes']:,} episodes  "
+        f"rss={result['rss_bytes_per_episode']:.0f} B/episode  "
+        f"resident={result['resident_content_bytes_per_episode']:.0f} B/episode  "
+        f"store={result['store_ms_per_episode']:.3f} ms  {hit_rate}"
+    )
+    for op, stats in result["operations_ms"].items():
+        print(f"  {op:<22} p50={stats['p50']:>9.3f}ms  p99={stats['p99']:>9.3f}ms")
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark des Hot-/Cold-Tierings")
+    parser.add_argument("--episodes", type=int, default=2000)
+    parser.add_argument("--subtasks", type=int, default=4, help="Teilaufgaben pro Episode")
+    parser.add_argument(
+        "--response-words", type=int, default=300, help="Wörter pro LLM-Antwort"
+    )
+    parser.add_argument(
+        "--hot-fraction", type=float, default=0.1, help="Anteil der Inhalte im Hot-Tier"
+    )
+    parser.add_argument(
+        "--hot-share", type=float, default=0.8, help="Anteil der Zugriffe auf neue Episoden"
+    )
+    parser.add_argument(
+        "--modes", nargs="+", choices=["tiered", "in_memory"], default=["tiered", "in_memory"]
+    )
+    parser.add_argument("--ops", type=int, default=200, help="Maximale Wiederholungen pro Messung")
+    parser.add_argument(
+        "--max-seconds", type=float, default=2.0, help="Zeitbudget pro Messung in Sekunden"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """CLI-Einstiegspunkt"""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    results = run(args)
+
+    if not args.no_save:
+        config = {k: v for k, v in vars(args).items() if k not in ("output_dir", "no_save")}
+        path = save_results("tiering", results, config, args.output_dir)
+        print(f"\nResults saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Benchmark des IVF-Vektorindex für recall_similar
+
+Bettet synthetische Episoden-Texte (Zipf-verteiltes Vokabular wie bench_memory)
+mit dem lokalen Hashing-Vektorisierer ein und vergleicht die approximative
+Suche (`VectorIndex.search`) mit der exakten Brute-Force-Suche:
+- Aufbau: Einbettung und inkrementelles Einfügen (inkl. Training)
+- Recall@k und Latenz für mehrere `probes`-Werte
+- Löschen: Entfernen von 1% der Vektoren
+
+Aufruf:
+    python -m benchmarks.bench_vector
+    python -m benchmarks.bench_vector --sizes 100000 --dimensions 256 --probes 8 32 64
+"""
+
+import argparse
+import gc
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from benchmarks.bench_memory import Population, measure
+from benchmarks.common import configure_logging, current_rss_mb, save_results
+from cognitive_symphony.memory.embeddings import HashingVectorizer
+from cognitive_symphony.memory.vector_index import VectorIndex
+
+DEFAULT_SIZES = [10_000, 100_000]
+DEFAULT_PROBES = [4, 8, 16, 32]
+
+_EMBED_BATCH = 10_000
+
+
+def recall_at_k(approximate: List[Any], exact: List[Any], k: int) -> float:
+    """
+    Anteil der exakten Top-k, die die approximative Suche findet
+
+    Gleichstände an der k-ten Stelle zählen als Treffer (Vergleich über die
+    Ähnlichkeit statt über die Schlüssel).
+    """
+    if not exact:
+        return 1.0
+    threshold = exact[-1][1] - 1e-6
+    return min(k, sum(1 for _, score in approximate if score >= threshold)) / min(k, len(exact))
+
+
+def bench_size(size: int, args: argparse.Namespace) -> Dict[str, Any]:
+    """Baut einen Index der Größe `size` auf und misst"""
+    population = Population(seed=args.seed)
+    vectorizer = HashingVectorizer(args.dimensions)
+    texts = [" ".join(population.words()) for _ in range(size)]
+
+    start = time.perf_counter()
+    vectors = np.concatenate(
+        [
+            vectorizer.transform(texts[i : i + _EMBED_BATCH])
+            for i in range(0, size, _EMBED_BATCH)
+        ]
+    )
+    embed_time = time.perf_counter() - start
+    del texts
+
+    gc.collect()
+    rss_before = current_rss_mb()
+    index = VectorIndex(args.dimensions, train_threshold=args.train_threshold)
+
+    start = time.perf_counter()
+    for i, vector in enumerate(vectors):
+        index.add(str(i), vector)
+    build_time = time.perf_counter() - start
+
+    gc.collect()
+    rss_growth = current_rss_mb() - rss_before
+
+    queries = vectorizer.transform([" ".join(population.words()) for _ in range(args.queries)])
+    k = args.k
+    exact = [index.exact_search(q, k) for q in queries]
+
+    ops = args.ops
+    budget = args.max_seconds
+    operations = {
+        "exact": measure(lambda i: index.exact_search(queries[i % len(queries)], k), ops, budget)
+    }
+    recall: Dict[str, float] = {}
+    for probes in args.probes:
+        operations[f"ann_probes_{probes}"] = measure(
+            lambda i: index.search(queries[i % len(queries)], k, probes), ops, budget
+        )
+        recall[str(probes)] = round(
+            float(
+                np.mean(
+                    [
+                        recall_at_k(index.search(q, k, probes), truth, k)
+                        for q, truth in zip(queries, exact)
+                    ]
+                )
+            ),
+            3,
+        )
+
+    removals = max(1, size // 100)
+    start = time.perf_counter()
+    for i in range(removals):
+        index.remove(str(i))
+    remove_time = time.perf_counter() - start
+
+    exact_p50 = operations["exact"]["p50"]
+    speedup = {
+        str(probes): round(exact_p50 / operations[f"ann_probes_{probes}"]["p50"], 1)
+        if operations[f"ann_probes_{probes}"]["p50"] > 0
+        else None
+        for probes in args.probes
+    }
+
+    result = {
+        "vectors": size,
+        "embed_s": round(embed_time, 4),
+        "build_s": round(build_time, 4),
+        "adds_per_s": round(size / build_time, 2),
+        "index_rss_growth_mb": round(rss_growth, 2),
+        "index_bytes_per_vector": round(rss_growth * 1024 * 1024 / size, 1),
+        "removals": removals,
+        "remove_us_per_vector": round(remove_time / removals * 1e6, 2),
+        "operations_ms": operations,
+        "recall_at_k": recall,
+        "speedup_p50": speedup,
+        "index_metrics": index.get_metrics(),
+    }
+
+    del index, vectors
+    gc.collect()
+    return result
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark des IVF-Vektorindex")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--dimensions", type=int, default=256)
+    parser.add_argument("--probes", type=int, nargs="+", default=DEFAULT_PROBES)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--queries", type=int, default=100, help="Anfragen für Recall@k")
+    parser.add_argument("--train-threshold", type=int, default=4096)
+    parser.add_argument("--ops", type=int, default=50, help="Maximale Wiederholungen pro Messung")
+    parser.add_argument(
+        "--max-seconds", type=float, default=2.0, help="Zeitbudget pro Messung in Sekunden"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output-dir", default=None)
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--log-level", default="WARNING")
+    return parser.parse_args(argv)
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, Any]]:
+    """Misst alle Größen aufsteigend"""
+    results = {}
+    for size in sorted(args.sizes):
+        results[str(size)] = bench_size(size, args)
+        _print_summary(size, results[str(size)])
+
+    return results
+
+
+def _print_summary(size: int, result: Dict[str, Any]) -> None:
+    print(
+        f"\n{size:,} vectors  build={result['build_s']:.2f}s  "
+        f"index={result['index_bytes_per_vector']:.0f} B/vector  "
+        f"lists={result['index_metrics']['lists']}"
+    )
+    for name, stats in result["operations_ms"].items():
+        probes = name.rsplit("_", 1)[-1]
+        extra = (
+            f"  recall@k={result['recall_at_k'][probes]:.3f}"
+            f"  speedup={result['speedup_p50'][probes]}"
+            if probes in result["recall_at_k"]
+            else ""
+        )
+        print(
+            f"  {name:<16} p50={stats['p50']:>9.3f}ms  p99={stats['p99']:>9.3f}ms  "
+            f"n={stats['count']}{extra}"
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """CLI-Einstiegspunkt"""
+    args = parse_args(argv)
+    configure_logging(args.log_level)
+
+    results = run(args)
+
+    if not args.no_save:
+        config = {k: v for k, v in vars(args).items() if k not in ("output_dir", "no_save")}
+        path = save_results("vector", results, config, args.output_dir)
+        print(f"\nResults saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Gemeinsame Hilfsfunktionen für Benchmarks
+
+- Perzentile und Latenz-Zusammenfassungen
+- RSS-Messung (aktuell und Peak während eines Laufs)
+- Speichern der Ergebnisse als JSON inkl. Versionsinformationen
+"""
+
+import asyncio
+import json
+import logging
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+import structlog
+
+DEFAULT_RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def configure_logging(level: str = "WARNING") -> None:
+    """Reduziert das strukturierte Logging (Log-Ausgaben verfälschen Timings)"""
+    structlog.configure(
+        wrapper_class=structlog.make_filtering_bound_logger(getattr(logging, level.upper()))
+    )
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Perzentil mit linearer Interpolation (q in 0..100)"""
+    if not values:
+        return 0.0
+
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100.0
+    lower = math.floor(rank)
+    upper = math.ceil(rank)
+    if lower == upper:
+        return ordered[lower]
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+def summarize(values: Sequence[float], scale: float = 1000.0) -> Dict[str, float]:
+    """
+    Fasst eine Messreihe zusammen (Default: Sekunden -> Millisekunden)
+
+    Returns:
+        count, mean, p50, p95, p99, max
+    """
+    scaled = [v * scale for v in values]
+    return {
+        "count": len(scaled),
+        "mean": round(sum(scaled) / len(scaled), 4) if scaled else 0.0,
+        "p50": round(percentile(scaled, 50), 4),
+        "p95": round(percentile(scaled, 95), 4),
+        "p99": round(percentile(scaled, 99), 4),
+        "max": round(max(scaled), 4) if scaled else 0.0,
+    }
+
+
+def current_rss_mb() -> float:
+    """Aktuelle Resident Set Size in MB (Linux: /proc, sonst Peak-RSS)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    """Höchste RSS des Prozesses seit Start in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS meldet Bytes, Linux Kilobytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class RssSampler:
+    """
+    Tastet die RSS während eines Laufs periodisch ab
+
+    Liefert den Peak innerhalb des Laufs, auch wenn mehrere Szenarien im
+    selben Prozess laufen (ru_maxrss ist prozessweit monoton).
+    """
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.start_mb = 0.0
+        self.peak_mb = 0.0
+        self.samples: List[float] = []
+        self._task: Optional[asyncio.Task] = None
+
+    def sample(self) -> float:
+        rss = current_rss_mb()
+        self.peak_mb = max(self.peak_mb, rss)
+        return rss
+
+    async def _run(self) -> None:
+        while True:
+            self.sample()
+            await asyncio.sleep(self.interval)
+
+    async def __aenter__(self) -> "RssSampler":
+        self.start_mb = self.sample()
+        self._task = asyncio.create_task(self._run())
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        if self._task is not None:
+            self._task.cancel()
+        self.sample()
+
+    def as_dict(self) -> Dict[str, float]:
+        end_mb = current_rss_mb()
+        return {
+            "rss_start_mb": round(self.start_mb, 2),
+            "rss_end_mb": round(end_mb, 2),
+            "rss_growth_mb": round(end_mb - self.start_mb, 2),
+            "peak_rss_mb": round(self.peak_mb, 2),
+        }
+
+
+def environment_info() -> Dict[str, Any]:
+    """Versions- und Plattforminformationen für den Vergleich zwischen Läufen"""
+    return {
+        "git_commit": _git("rev-parse", "--short", "HEAD"),
+        "git_dirty": bool(_git("status", "--porcelain", "--untracked-files=no")),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def _git(*args: str) -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", *args],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def save_results(
+    suite: str,
+    results: Dict[str, Any],
+    config: Dict[str, Any],
+    output_dir: Optional[Path] = None,
+) -> Path:
+    """
+    Speichert Benchmark-Ergebnisse als JSON
+
+    Args:
+        suite: Name der Benchmark-Suite (Dateipräfix)
+        results: Ergebnisse pro Szenario
+        config: Parameter des Laufs
+
+    Returns:
+        Pfad der geschriebenen Datei
+    """
+    output_dir = Path(output_dir or DEFAULT_RESULTS_DIR)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    timestamp = datetime.now()
+    path = output_dir / f"{suite}-{timestamp.strftime('%Y%m%d-%H%M%S')}.json"
+    payload = {
+        "suite": suite,
+        "timestamp": timestamp.isoformat(),
+        "environment": environment_info(),
+        "config": config,
+        "results": results,
+    }
+
+    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False), encoding="utf-8")
+    return path
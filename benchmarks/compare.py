@@ -0,0 +1,75 @@
+"""
+Vergleich zweier Benchmark-Ergebnisse (z.B. zwischen Versionen)
+
+Aufruf:
+    python -m benchmarks.compare benchmarks/results/alt.json benchmarks/results/neu.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def flatten(data: Any, prefix: str = "") -> Iterator[Tuple[str, float]]:
+    """Liefert alle numerischen Werte mit Punkt-Pfad (Listen werden übersprungen)"""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from flatten(value, f"{prefix}.{key}" if prefix else str(key))
+    elif isinstance(data, (int, float)) and not isinstance(data, bool):
+        yield prefix, float(data)
+
+
+def compare(baseline: Dict[str, Any], candidate: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Vergleicht die Ergebnisse zweier Läufe
+
+    Returns:
+        Eine Zeile pro gemeinsamer Metrik mit relativer Änderung in Prozent
+    """
+    before = dict(flatten(baseline["results"]))
+    after = dict(flatten(candidate["results"]))
+
+    rows = []
+    for metric in before:
+        if metric not in after:
+            continue
+        change = (after[metric] - before[metric]) / before[metric] * 100 if before[metric] else None
+        rows.append(
+            {
+                "metric": metric,
+                "baseline": before[metric],
+                "candidate": after[metric],
+                "change_pct": round(change, 2) if change is not None else None,
+            }
+        )
+
+    return rows
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """CLI-Einstiegspunkt"""
+    parser = argparse.ArgumentParser(description="Vergleicht zwei Benchmark-Ergebnisse")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--filter", default="", help="Nur Metriken, die den Text enthalten")
+    args = parser.parse_args(argv)
+
+    baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+    candidate = json.loads(Path(args.candidate).read_text(encoding="utf-8"))
+
+    print(
+        f"baseline:  {baseline['environment'].get('git_commit')} ({baseline['timestamp']})\n"
+        f"candidate: {candidate['environment'].get('git_commit')} ({candidate['timestamp']})\n"
+    )
+    for row in compare(baseline, candidate):
+        if args.filter not in row["metric"]:
+            continue
+        change = f"{row['change_pct']:+.1f}%" if row["change_pct"] is not None else "n/a"
+        print(
+            f"{row['metric']:<60} {row['baseline']:>12.3f} -> {row['candidate']:>12.3f} {change:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+Fake-LLM für Benchmarks - deterministische Antworten ohne Netzwerk
+
+Das Fake-LLM erkennt die Prompts des Meta-Orchestrators und liefert eine
+Zerlegung mit einer festen Anzahl von Teilaufgaben (inkl. Agent-Zuweisung),
+allen anderen Aufrufen eine kurze Agenten-Antwort. Die simulierte Latenz und
+die im LLM verbrachte Zeit pro `solve()` werden erfasst, damit sich der
+Orchestrierungs-Overhead getrennt ausweisen lässt.
+"""
+
+import asyncio
+import random
+import time
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, List, Optional
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from cognitive_symphony.llm.managed_llm import approximate_tokens, prompt_text
+from cognitive_symphony.models import AgentType
+
+# Im LLM verbrachte Zeiten des aktuellen solve()-Aufrufs (pro asyncio-Task)
+llm_call_times: ContextVar[Optional[List[float]]] = ContextVar("llm_call_times", default=None)
+
+DECOMPOSITION_MARKER = "Teilaufgaben zerlegt"
+REFLECTION_MARKER = "Letzte Entscheidungen"
+
+
+class FakeLLM(Runnable[LanguageModelInput, BaseMessage]):
+    """
+    Chat-Model-Ersatz mit konfigurierbarer Zerlegungsbreite und Latenz
+    """
+
+    def __init__(
+        self,
+        subtasks: int = 3,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        response_words: int = 40,
+        seed: Optional[int] = None,
+        unique_subtasks: Optional[int] = None,
+    ):
+        """
+        Args:
+            subtasks: Anzahl der Teilaufgaben pro Zerlegung
+            latency: Simulierte Latenz pro Aufruf in Sekunden
+            jitter: Zusätzliche gleichverteilte Latenz (0..jitter) in Sekunden
+            response_words: Länge der Agenten-Antworten in Wörtern
+            seed: Seed für reproduzierbaren Jitter
+            unique_subtasks: Anzahl unterschiedlicher Teilaufgaben - kleinere
+                Werte erzeugen wiederholte (redundante) Teilaufgaben
+        """
+        self.subtasks = subtasks
+        self.latency = latency
+        self.jitter = jitter
+        self.response_words = response_words
+        self.random = random.Random(seed)
+        self.model = "fake"
+
+        self.calls = 0
+        self.decompositions = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+        # CUSTOM hat keinen Agenten in der Flotte
+        agent_types = [t for t in AgentType if t is not AgentType.CUSTOM]
+        unique = unique_subtasks or subtasks
+        self._decomposition = "\n".join(
+            f"Schritt {i + 1}: Teilaufgabe {i % unique + 1}\n"
+            f"Agent: {agent_types[i % unique % len(agent_types)].value}"
+            for i in range(subtasks)
+        )
+        self._answer = " ".join(["Ergebnis"] * response_words) + "\nConfidence: 0.8"
+
+    def _respond(self, prompt: str) -> str:
+        self.calls += 1
+        self.prompt_tokens += approximate_tokens(prompt)
+
+        if DECOMPOSITION_MARKER in prompt:
+            self.decompositions += 1
+            response = self._decomposition
+        elif REFLECTION_MARKER in prompt:
+            response = "Keine Auffälligkeiten."
+        else:
+            response = self._answer
+
+        self.completion_tokens += approximate_tokens(response)
+        return response
+
+    def _delay(self) -> float:
+        return self.latency + (self.random.uniform(0.0, self.jitter) if self.jitter else 0.0)
+
+    def invoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> BaseMessage:
+        start = time.perf_counter()
+        delay = self._delay()
+        if delay > 0:
+            time.sleep(delay)
+
+        content = self._respond(prompt_text(input))
+        _record(time.perf_counter() - start)
+        return AIMessage(content=content)
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> BaseMessage:
+        start = time.perf_counter()
+        delay = self._delay()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        content = self._respond(prompt_text(input))
+        _record(time.perf_counter() - start)
+        return AIMessage(content=content)
+
+    async def astream(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[AIMessageChunk]:
+        message = await self.ainvoke(input, config, **kwargs)
+        for word in str(message.content).split(" "):
+            yield AIMessageChunk(content=word + " ")
+
+
+def _record(elapsed: float) -> None:
+    times = llm_call_times.get()
+    if times is not None:
+        times.append(elapsed)
@@ -2,122 +2,281 @@
 Agent Fleet - Verwaltet alle spezialisierten Agenten
 """
 
-from typing import Any, Dict, List
+import asyncio
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 import structlog
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 
+from cognitive_symphony.agents.agent_pool import AgentPool, AgentPoolConfig
+from cognitive_symphony.agents.capability_index import CapabilityIndex
+from cognitive_symphony.agents.registry import AgentRegistry, agent_registry, resolve_agent_type
 from cognitive_symphony.config import settings
-from cognitive_symphony.models import AgentType, Task
-from cognitive_symphony.agents.research_agent import ResearchAgent
-from cognitive_symphony.agents.code_agent import CodeAgent
-from cognitive_symphony.agents.analysis_agent import AnalysisAgent
-from cognitive_symphony.agents.creative_agent import CreativeAgent
-from cognitive_symphony.agents.security_agent import SecurityAgent
-from cognitive_symphony.agents.optimization_agent import OptimizationAgent
-from cognitive_symphony.agents.human_interface_agent import HumanInterfaceAgent
+from cognitive_symphony.llm.managed_llm import ensure_managed
+from cognitive_symphony.llm.providers import create_llm
+from cognitive_symphony.memory.blackboard import Blackboard, result_text
+from cognitive_symphony.models import AgentCapability, AgentKey, Task, agent_type_name
 
 logger = structlog.get_logger()
 
+EXECUTION_MODES = ("all", "race")
+
+
+def is_acceptable_result(result: Any) -> bool:
+    """
+    Prüft, ob ein Agenten-Ergebnis als Race-Gewinner taugt
+
+    Brauchbar ist ein Ergebnis ohne Fehler, mit Typ- und Agent-Feld,
+    nicht-leerem Inhalt und ohne fehlgeschlagene Code-Verifikation.
+    """
+    if result is None:
+        return False
+
+    if isinstance(result, dict):
+        if result.get("error") or not result.get("type") or not result.get("agent"):
+            return False
+        if result.get("verification", {}).get("status") in ("failed", "timeout"):
+            return False
+
+    return bool(result_text(result).strip())
+
 
 class AgentFleet:
     """Verwaltet und koordiniert die Flotte spezialisierter Agenten"""
 
-    def __init__(self, llm_provider: str = "openai"):
+    def __init__(
+        self,
+        llm_provider: str = "openai",
+        llm: Optional[Any] = None,
+        pool_configs: Optional[Dict[AgentKey, AgentPoolConfig]] = None,
+        race_llms: Optional[Dict[str, Any]] = None,
+        registry: Optional[AgentRegistry] = None,
+        enabled_agents: Optional[List[str]] = None,
+    ):
         """
         Initialisiert die Agent-Flotte
 
         Args:
             llm_provider: 'openai' oder 'anthropic'
+            llm: Optionales Chat-Model (z.B. CassetteLLM) statt des Providers
+            pool_configs: Pool-Konfiguration pro Agent-Typ (Default aus Settings)
+            race_llms: Modell-Stufen für den Race-Modus eines einzelnen Agenten
+                (Name -> Chat-Model; Default aus race_model_tiers)
+            registry: Agent-Registry (Default: globale Registry inkl. Plugins)
+            enabled_agents: Aktive Agent-Typen (Default aus enabled_agents,
+                leer = alle registrierten)
         """
         self.llm_provider = llm_provider
-        self.llm = self._initialize_llm()
-        self.agents: Dict[AgentType, Any] = self._initialize_agents()
+        self.custom_llm = llm is not None
+        self.llm = ensure_managed(llm) if llm is not None else self._initialize_llm()
+        self.pool_configs = pool_configs or {}
+        self.registry = registry or agent_registry
+        self.active_types: List[AgentKey] = self._resolve_active_types(
+            settings.enabled_agents if enabled_agents is None else enabled_agents
+        )
+
+        # Pools und primäre Instanz pro Typ - erst beim ersten Zugriff erzeugt
+        self.pools: Dict[AgentKey, AgentPool] = {}
+        self.agents: Dict[AgentKey, Any] = {}
+
+        # Invertierter Capability-Index (beim ersten Matching aus den
+        # deklarierten Fähigkeiten aufgebaut, ohne Agenten zu erzeugen)
+        self._capability_index: Optional[CapabilityIndex] = None
+
+        # Race-Modus: Modell-Stufen und deren Agent-Instanzen (lazy)
+        self.race_llms: Optional[Dict[str, Any]] = (
+            {name: ensure_managed(llm) for name, llm in race_llms.items()}
+            if race_llms is not None
+            else None
+        )
+        self.tier_agents: Dict[Tuple[AgentKey, str], Any] = {}
+        self.race_stats: Dict[str, Any] = {
+            "races": 0,
+            "cancelled_candidates": 0,
+            "no_acceptable_result": 0,
+            "wins": {},
+        }
+
+        # Wall-Clock-Ersparnis durch parallele Agenten-Ausführung
+        self.execution_stats: Dict[str, float] = {
+            "tasks_executed": 0,
+            "parallel_tasks": 0,
+            "total_wall_clock_time": 0.0,
+            "total_agent_time": 0.0,
+        }
 
         logger.info(
             "agent_fleet_initialized",
-            agent_count=len(self.agents),
+            active_agents=[agent_type_name(t) for t in self.active_types],
             llm_provider=llm_provider,
         )
 
     def _initialize_llm(self) -> Any:
         """Initialisiert das Language Model"""
-        if self.llm_provider == "openai":
-            return ChatOpenAI(
-                model="gpt-4-turbo-preview",
-                temperature=0.7,
-                api_key=settings.openai_api_key,
-            )
-        elif self.llm_provider == "anthropic":
-            return ChatAnthropic(
-                model="claude-3-5-sonnet-20240620",
-                temperature=0.7,
-                api_key=settings.anthropic_api_key,
-            )
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+        return create_llm(self.llm_provider)
 
-    def _initialize_agents(self) -> Dict[AgentType, Any]:
-        """Initialisiert alle spezialisierten Agenten"""
-        return {
-            AgentType.RESEARCH: ResearchAgent(self.llm),
-            AgentType.CODE: CodeAgent(self.llm),
-            AgentType.ANALYSIS: AnalysisAgent(self.llm),
-            AgentType.CREATIVE: CreativeAgent(self.llm),
-            AgentType.SECURITY: SecurityAgent(self.llm),
-            AgentType.OPTIMIZATION: OptimizationAgent(self.llm),
-            AgentType.HUMAN_INTERFACE: HumanInterfaceAgent(self.llm),
-        }
+    def _resolve_active_types(self, enabled: List[str]) -> List[AgentKey]:
+        """Aktive Agent-Typen: alle registrierten oder die freigegebene Teilmenge"""
+        registered = self.registry.names()
+        if not enabled:
+            return registered
+
+        unknown = [name for name in enabled if name not in self.registry]
+        if unknown:
+            logger.warning("unknown_enabled_agents", agents=unknown)
+
+        return [resolve_agent_type(name) for name in enabled if name in self.registry]
+
+    def is_active(self, agent_type: AgentKey) -> bool:
+        """Ob ein Agent-Typ in dieser Flotte verfügbar ist"""
+        return agent_type in self.active_types
+
+    def _get_pool(self, agent_type: AgentKey) -> AgentPool:
+        """
+        Pool eines Agent-Typs - Modul und Instanzen werden beim ersten Zugriff erzeugt
+
+        Raises:
+            KeyError: Wenn der Agent-Typ nicht aktiv ist
+        """
+        pool = self.pools.get(agent_type)
+        if pool is not None:
+            return pool
+
+        if not self.is_active(agent_type):
+            raise KeyError(agent_type)
+
+        agent_type = resolve_agent_type(agent_type)
+        config = self.pool_configs.get(agent_type) or AgentPoolConfig.from_settings(agent_type)
+        llm = self._pool_llm(config)
+        pool = AgentPool(
+            agent_type, lambda: self.registry.create(agent_type, llm), config
+        )
+
+        self.pools[agent_type] = pool
+        self.agents[agent_type] = pool.primary
+
+        logger.info(
+            "agent_pool_created",
+            agent_type=agent_type_name(agent_type),
+            size=pool.size,
+        )
+
+        return pool
+
+    def promote_agent(
+        self, name: str, agent: Any, factory: Optional[Callable[[], Any]] = None
+    ) -> None:
+        """
+        Nimmt eine bestehende Agent-Instanz als routbaren Agent-Typ auf
+
+        Die Instanz wird primäre Instanz eines eigenen Pools; weitere Instanzen
+        erzeugt `factory` (ohne Factory bleibt der Pool bei einer Instanz).
+        Der Typ ist danach über `execute_task([name])` erreichbar und im
+        Capability-Index enthalten.
+
+        Raises:
+            ValueError: Wenn der Name bereits vergeben ist
+        """
+        if self.is_active(name) or name in self.registry:
+            raise ValueError(f"Agent-Typ bereits vorhanden: {name}")
+
+        pending = [agent]
+
+        def create() -> Any:
+            return pending.pop() if pending else factory()
+
+        config = self.pool_configs.get(name) or (
+            AgentPoolConfig.from_settings(name) if factory is not None else AgentPoolConfig()
+        )
+        pool = AgentPool(name, create, config)
+
+        self.active_types.append(name)
+        self.pools[name] = pool
+        self.agents[name] = pool.primary
+        if self._capability_index is not None:
+            self._capability_index.add_agent(name, agent.capabilities)
+
+        logger.info("agent_promoted", agent_type=name, size=pool.size)
+
+    def _pool_llm(self, config: AgentPoolConfig) -> Any:
+        """Chat-Model eines Pools (eigenes Modell nur ohne explizites Fleet-LLM)"""
+        if self.custom_llm or not config.has_custom_llm:
+            return self.llm
+
+        return create_llm(
+            config.provider or self.llm_provider,
+            config.model,
+            config.temperature if config.temperature is not None else 0.7,
+        )
 
     async def execute_task(
-        self, task: Task, selected_agents: List[AgentType]
+        self,
+        task: Task,
+        selected_agents: List[AgentKey],
+        blackboard: Optional[Blackboard] = None,
+        mode: Optional[str] = None,
     ) -> Any:
         """
         Führt eine Aufgabe mit den ausgewählten Agenten aus
 
+        Mehrere Agenten laufen gleichzeitig (begrenzt durch
+        max_parallel_agents_per_task); Fehler eines Agenten betreffen die
+        übrigen nicht. Die Ergebnisse behalten die Reihenfolge der Auswahl.
+
+        Im Modus "race" gewinnt das erste brauchbare Ergebnis, die übrigen
+        Agenten werden abgebrochen.
+
         Args:
             task: Die auszuführende Aufgabe
             selected_agents: Liste der einzusetzenden Agenten
+            blackboard: Optionales Blackboard des laufenden solve() - Agenten
+                schreiben ihre Ergebnisse darauf, identische Teilaufgaben
+                werden daraus beantwortet
+            mode: "all" oder "race" (Default: agent_execution_mode_by_priority)
 
         Returns:
-            Kombiniertes Ergebnis aller Agenten
+            Kombiniertes Ergebnis aller Agenten bzw. das Gewinner-Ergebnis
         """
+        mode = self._resolve_mode(task, mode)
+
         logger.info(
             "executing_task",
             task_id=task.id,
-            agents=[a.value for a in selected_agents],
+            agents=[agent_type_name(a) for a in selected_agents],
+            mode=mode,
+        )
+
+        agent_types = [a for a in selected_agents if self.is_active(a)]
+        if len(agent_types) < len(selected_agents):
+            logger.warning(
+                "inactive_agents_skipped",
+                task_id=task.id,
+                agents=[agent_type_name(a) for a in selected_agents if not self.is_active(a)],
+            )
+
+        semaphore = asyncio.Semaphore(max(1, settings.max_parallel_agents_per_task))
+
+        if mode == "race":
+            candidates = self._race_candidates(agent_types)
+            if len(candidates) > 1:
+                return await self._race(task, candidates, semaphore, blackboard)
+
+        start = time.perf_counter()
+        outcomes = await asyncio.gather(
+            *[
+                self._execute_agent(
+                    task,
+                    agent_type,
+                    semaphore,
+                    collaborative=len(selected_agents) > 1,
+                    blackboard=blackboard,
+                )
+                for agent_type in agent_types
+            ]
         )
+        wall_clock_time = time.perf_counter() - start
 
-        results = []
-
-        for agent_type in selected_agents:
-            if agent_type in self.agents:
-                agent = self.agents[agent_type]
-                try:
-                    result = await agent.execute_with_metrics(task)
-                    results.append(result)
-
-                    # Kollaboratives Lernen - Agent teilt Wissen
-                    if len(selected_agents) > 1:
-                        knowledge = {
-                            "task_id": task.id,
-                            "findings": result,
-                            "agent_type": agent_type.value,
-                        }
-                        agent.share_knowledge(knowledge)
-
-                except Exception as e:
-                    logger.error(
-                        "agent_execution_failed",
-                        agent_type=agent_type.value,
-                        error=str(e),
-                    )
-                    results.append(
-                        {
-                            "error": str(e),
-                            "agent": agent_type.value,
-                        }
-                    )
+        results = [result for result, _ in outcomes]
+        self._record_execution(task, wall_clock_time, [t for _, t in outcomes])
 
         # Kombiniere Ergebnisse
         if len(results) == 1:
@@ -129,22 +288,351 @@ class AgentFleet:
                 "collaboration": True,
             }
 
-    def get_agent(self, agent_type: AgentType) -> Any:
-        """Gibt einen spezifischen Agenten zurück"""
-        return self.agents.get(agent_type)
+    async def _execute_agent(
+        self,
+        task: Task,
+        agent_type: AgentKey,
+        semaphore: asyncio.Semaphore,
+        collaborative: bool,
+        blackboard: Optional[Blackboard] = None,
+    ) -> Tuple[Any, float]:
+        """
+        Führt einen einzelnen Agenten aus (Fehler werden als Ergebnis erfasst)
+
+        Returns:
+            Tuple von (Ergebnis oder Fehlereintrag, Ausführungszeit)
+        """
+        if blackboard is not None:
+            reused = self._reuse_result(task, agent_type, blackboard)
+            if reused is not None:
+                return reused, 0.0
+
+        pool = self._get_pool(agent_type)
+
+        async with semaphore, pool.lease() as agent:
+            return await self._run_agent(
+                task, agent_type, agent, share=collaborative, blackboard=blackboard
+            )
+
+    async def _run_agent(
+        self,
+        task: Task,
+        agent_type: AgentKey,
+        agent: Any,
+        share: bool,
+        blackboard: Optional[Blackboard] = None,
+    ) -> Tuple[Any, float]:
+        """Führt eine Agent-Instanz aus und teilt das Ergebnis bei Bedarf"""
+        start = time.perf_counter()
+        try:
+            result = await agent.execute_with_metrics(task)
+
+            # Kollaboratives Lernen - Agent teilt Wissen
+            if share or blackboard is not None:
+                self._share_result(task, agent_type, agent, result, blackboard)
+
+        except Exception as e:
+            logger.error(
+                "agent_execution_failed",
+                agent_type=agent_type_name(agent_type),
+                error=str(e),
+            )
+            result = {
+                "error": str(e),
+                "agent": agent_type_name(agent_type),
+            }
+
+        return result, time.perf_counter() - start
+
+    def _reuse_result(
+        self, task: Task, agent_type: AgentKey, blackboard: Blackboard
+    ) -> Optional[Any]:
+        """
+        Früheres Ergebnis einer identischen Teilaufgabe, unter der eigenen
+        Task-ID erneut auf das Blackboard geschrieben (für abhängige Teilaufgaben)
+        """
+        reused = blackboard.find_result(task, agent_type)
+        if reused is not None:
+            blackboard.write(task.id, task.description, agent_type, reused)
+
+        return reused
+
+    def _share_result(
+        self,
+        task: Task,
+        agent_type: AgentKey,
+        agent: Any,
+        result: Any,
+        blackboard: Optional[Blackboard],
+    ) -> None:
+        knowledge = {
+            "task_id": task.id,
+            "task_description": task.description,
+            "findings": result,
+            "agent_type": agent_type_name(agent_type),
+        }
+        agent.share_knowledge(knowledge, blackboard)
+
+    def _resolve_mode(self, task: Task, mode: Optional[str]) -> str:
+        """Modus aus Aufruf-Argument, sonst aus der Priorität der Aufgabe"""
+        mode = mode or settings.agent_execution_mode_by_priority.get(task.priority.value, "all")
+        if mode not in EXECUTION_MODES:
+            raise ValueError(f"Unbekannter Ausführungsmodus: {mode}")
+
+        return mode
+
+    def _tier_llms(self) -> Dict[str, Any]:
+        """Modell-Stufen für den Race-Modus (nicht bei explizitem Fleet-LLM)"""
+        if self.race_llms is None:
+            tiers = [] if self.custom_llm else settings.race_model_tiers
+            self.race_llms = {model: create_llm(self.llm_provider, model) for model in tiers}
+
+        return self.race_llms
+
+    def _race_candidates(
+        self, agent_types: List[AgentKey]
+    ) -> List[Tuple[str, AgentKey, Optional[Any]]]:
+        """
+        Kandidaten eines Races als (Label, Agent-Typ, Instanz)
+
+        Mehrere Agent-Typen treten über ihre Pools gegeneinander an (Instanz
+        None), ein einzelner Typ gegen sich selbst auf den Modell-Stufen.
+        """
+        if len(agent_types) != 1:
+            return [(agent_type_name(t), t, None) for t in agent_types]
+
+        agent_type = agent_types[0]
+        name = agent_type_name(agent_type)
+        candidates: List[Tuple[str, AgentKey, Optional[Any]]] = [(name, agent_type, None)]
+        for tier, llm in self._tier_llms().items():
+            key = (agent_type, tier)
+            if key not in self.tier_agents:
+                self.tier_agents[key] = self.registry.create(agent_type, llm)
+            candidates.append((f"{name}:{tier}", agent_type, self.tier_agents[key]))
+
+        return candidates
+
+    async def _race(
+        self,
+        task: Task,
+        candidates: List[Tuple[str, AgentKey, Optional[Any]]],
+        semaphore: asyncio.Semaphore,
+        blackboard: Optional[Blackboard] = None,
+    ) -> Any:
+        """
+        Startet alle Kandidaten und liefert das erste brauchbare Ergebnis
+
+        Die übrigen Kandidaten werden abgebrochen. Liefert kein Kandidat ein
+        brauchbares Ergebnis, wird wie im Modus "all" kombiniert.
+        """
+        if blackboard is not None:
+            for _, agent_type, _ in candidates:
+                reused = self._reuse_result(task, agent_type, blackboard)
+                if reused is not None:
+                    return reused
+
+        async def run(
+            label: str, agent_type: AgentKey, agent: Optional[Any]
+        ) -> Tuple[str, AgentKey, Any, Any, float]:
+            async with semaphore:
+                if agent is not None:
+                    result, elapsed = await self._run_agent(task, agent_type, agent, share=False)
+                    return label, agent_type, agent, result, elapsed
+
+                async with self._get_pool(agent_type).lease() as leased:
+                    result, elapsed = await self._run_agent(task, agent_type, leased, share=False)
+                    return label, agent_type, leased, result, elapsed
+
+        start = time.perf_counter()
+        pending = [asyncio.create_task(run(*candidate)) for candidate in candidates]
+        finished: Dict[str, Any] = {}
+        agent_times: List[float] = []
+        winner = None
+
+        try:
+            for next_done in asyncio.as_completed(pending):
+                label, agent_type, agent, result, elapsed = await next_done
+                finished[label] = result
+                agent_times.append(elapsed)
+
+                if is_acceptable_result(result):
+                    winner = (label, agent_type, agent, result)
+                    break
+        finally:
+            cancelled = [t for t in pending if not t.done()]
+            for t in cancelled:
+                t.cancel()
+            # Abbruch abwarten, damit Pool- und Limiter-Slots freigegeben sind
+            await asyncio.gather(*cancelled, return_exceptions=True)
+
+        wall_clock_time = time.perf_counter() - start
+        self._record_execution(task, wall_clock_time, agent_times)
+
+        stats = self.race_stats
+        stats["races"] += 1
+        stats["cancelled_candidates"] += len(cancelled)
+
+        if winner is None:
+            stats["no_acceptable_result"] += 1
+            logger.warning("race_without_acceptable_result", task_id=task.id)
+
+            results = [finished[label] for label, _, _ in candidates]
+            if len(results) == 1:
+                return results[0]
+            return {
+                "combined_results": results,
+                "agent_count": len(results),
+                "collaboration": True,
+            }
+
+        label, agent_type, agent, result = winner
+        stats["wins"][label] = stats["wins"].get(label, 0) + 1
+        task.metadata["race_winner"] = label
+
+        if blackboard is not None:
+            self._share_result(task, agent_type, agent, result, blackboard)
+
+        logger.info(
+            "race_won",
+            task_id=task.id,
+            winner=label,
+            candidates=len(candidates),
+            cancelled=len(cancelled),
+            wall_clock_time=wall_clock_time,
+        )
+
+        return result
+
+    def _record_execution(
+        self, task: Task, wall_clock_time: float, agent_times: List[float]
+    ) -> None:
+        """Erfasst Wall-Clock- und summierte Agentenzeit einer Ausführung"""
+        stats = self.execution_stats
+        stats["tasks_executed"] += 1
+        stats["total_wall_clock_time"] += wall_clock_time
+        stats["total_agent_time"] += sum(agent_times)
+
+        if len(agent_times) > 1:
+            stats["parallel_tasks"] += 1
+            logger.info(
+                "parallel_execution_completed",
+                task_id=task.id,
+                agents=len(agent_times),
+                wall_clock_time=wall_clock_time,
+                time_saved=max(0.0, sum(agent_times) - wall_clock_time),
+            )
+
+    def get_execution_metrics(self) -> Dict[str, Any]:
+        """
+        Gibt die Ersparnis durch parallele Ausführung zurück
+
+        time_saved ist die summierte Agentenzeit (sequenzielle Ausführung)
+        abzüglich der tatsächlichen Wall-Clock-Zeit.
+        """
+        stats = self.execution_stats
+        wall_clock = stats["total_wall_clock_time"]
+        agent_time = stats["total_agent_time"]
+
+        return {
+            "tasks_executed": stats["tasks_executed"],
+            "parallel_tasks": stats["parallel_tasks"],
+            "max_parallel_agents_per_task": settings.max_parallel_agents_per_task,
+            "total_wall_clock_time": wall_clock,
+            "total_agent_time": agent_time,
+            "time_saved": max(0.0, agent_time - wall_clock),
+            "speedup": agent_time / wall_clock if wall_clock > 0 else 1.0,
+            "races": {**self.race_stats, "wins": dict(self.race_stats["wins"])},
+        }
+
+    def get_agent(self, agent_type: AgentKey) -> Any:
+        """Gibt einen spezifischen Agenten zurück (erzeugt ihn beim ersten Zugriff)"""
+        if not self.is_active(agent_type):
+            return None
+
+        return self._get_pool(agent_type).primary
 
     def get_performance_metrics(self) -> Dict[str, Any]:
-        """Gibt Performance-Metriken aller Agenten zurück"""
+        """Gibt Performance-Metriken aller bereits erzeugten Agenten zurück"""
         metrics = {}
-        for agent_type, agent in self.agents.items():
-            metrics[agent_type.value] = agent.get_performance_metrics()
+        for agent_type, pool in self.pools.items():
+            metrics[agent_type_name(agent_type)] = pool.get_performance_metrics()
 
         return metrics
 
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """Gibt Größe, Auslastung und Skalierung aller erzeugten Agent-Pools zurück"""
+        return {
+            agent_type_name(agent_type): pool.get_metrics()
+            for agent_type, pool in self.pools.items()
+        }
+
+    def get_registry_info(self) -> Dict[str, List[str]]:
+        """Registrierte, aktive und bereits erzeugte Agent-Typen"""
+        return {
+            **self.registry.get_info(),
+            "active": [agent_type_name(t) for t in self.active_types],
+            "instantiated": [agent_type_name(t) for t in self.pools],
+        }
+
+    def get_capability_index(self) -> CapabilityIndex:
+        """
+        Invertierter Capability-Index aller aktiven Agenten
+
+        Wird einmalig beim ersten Zugriff aus den deklarierten Fähigkeiten
+        aufgebaut (s. _capabilities_of); später beförderte Agenten werden
+        ergänzt. Das Modul eines Agenten wird dabei importiert, Instanzen und
+        Pools entstehen weiterhin erst bei der Ausführung.
+        """
+        if self._capability_index is None:
+            index = CapabilityIndex()
+            for agent_type in self.active_types:
+                index.add_agent(agent_type, self._capabilities_of(agent_type))
+
+            self._capability_index = index
+            logger.info("capability_index_built", **index.get_metrics())
+
+        return self._capability_index
+
+    def find_agents_for_capabilities(
+        self, requirements: List[str], limit: int = 3
+    ) -> List[Tuple[AgentKey, float]]:
+        """
+        Rankt aktive Agenten nach Übereinstimmung mit benötigten Capabilities
+
+        Returns:
+            Liste von (Agent-Typ, Score), absteigend nach Score
+        """
+        return self.get_capability_index().search(requirements, limit)
+
     def get_agent_capabilities(self) -> Dict[str, List[Dict]]:
-        """Gibt alle Fähigkeiten aller Agenten zurück"""
-        capabilities = {}
-        for agent_type, agent in self.agents.items():
-            capabilities[agent_type.value] = [c.dict() for c in agent.capabilities]
+        """Gibt alle Fähigkeiten aller aktiven Agenten zurück"""
+        return {
+            agent_type_name(agent_type): [c.dict() for c in self._capabilities_of(agent_type)]
+            for agent_type in self.active_types
+        }
+
+    def get_capabilities(self, agent_type: AgentKey) -> List[AgentCapability]:
+        """Fähigkeiten eines aktiven Agent-Typs, ohne ihn zu erzeugen (inaktiv: leer)"""
+        if not self.is_active(agent_type):
+            return []
+
+        return self._capabilities_of(agent_type)
+
+    def _capabilities_of(self, agent_type: AgentKey) -> List[AgentCapability]:
+        """
+        Fähigkeiten eines aktiven Agent-Typs ohne Instanziierung
+
+        Reihenfolge: bereits erzeugte Instanz, Deklaration in der Registry
+        (`CAPABILITIES` bzw. Metadaten bei `register()`). Nur Plugins ohne
+        Deklaration werden dafür instanziiert.
+        """
+        agent = self.agents.get(agent_type)
+        if agent is not None:
+            return agent.capabilities
+
+        declared = self.registry.capabilities(agent_type)
+        if declared is not None:
+            return declared
 
-        return capabilities
+        logger.debug("capabilities_require_instance", agent_type=agent_type_name(agent_type))
+        return self.get_agent(agent_type).capabilities
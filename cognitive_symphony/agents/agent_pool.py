@@ -0,0 +1,305 @@
+"""
+Agent Pool - Mehrere Instanzen eines Agent-Typs mit lastabhängiger Verteilung
+
+- Least-Outstanding-Requests: neue Aufgaben gehen an die Instanz mit den
+  wenigsten laufenden Aufgaben (bei Gleichstand die schnellere)
+- Skalierung nach Warteschlangentiefe und beobachteter avg_execution_time
+- Eigene Modell-/Client-Konfiguration pro Pool
+"""
+
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
+import structlog
+from pydantic import BaseModel, Field
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.models import AgentKey, AgentPerformance, Task, agent_type_name
+from cognitive_symphony.transparency.latency import LatencyTracker
+
+logger = structlog.get_logger()
+
+
+class AgentPoolConfig(BaseModel):
+    """Konfiguration eines Agent-Pools"""
+
+    min_size: int = Field(ge=1, default=1)
+    max_size: int = Field(ge=1, default=1)
+    # Skalierung: laufende Aufgaben pro Instanz bzw. erwartete Wartezeit
+    scale_up_queue_depth: float = 2.0
+    scale_up_wait_seconds: float = 10.0
+    idle_seconds: float = 60.0
+    # Eigenes Chat-Model für diesen Pool (None = Modell der Flotte)
+    provider: Optional[str] = None
+    model: Optional[str] = None
+    temperature: Optional[float] = None
+
+    @property
+    def has_custom_llm(self) -> bool:
+        return any(v is not None for v in (self.provider, self.model, self.temperature))
+
+    @classmethod
+    def from_settings(cls, agent_type: AgentKey) -> "AgentPoolConfig":
+        """Erstellt die Konfiguration aus den Settings (inkl. agent_pools-Overrides)"""
+        return cls(
+            **{
+                "min_size": settings.agent_pool_min_size,
+                "max_size": settings.agent_pool_max_size,
+                "scale_up_queue_depth": settings.agent_pool_scale_up_queue_depth,
+                "scale_up_wait_seconds": settings.agent_pool_scale_up_wait_seconds,
+                "idle_seconds": settings.agent_pool_idle_seconds,
+                **settings.agent_pools.get(agent_type_name(agent_type), {}),
+            }
+        )
+
+
+class AgentPool:
+    """
+    Pool von Agent-Instanzen eines Typs
+    """
+
+    def __init__(
+        self,
+        agent_type: AgentKey,
+        factory: Callable[[], Any],
+        config: Optional[AgentPoolConfig] = None,
+    ):
+        """
+        Initialisiert den Pool
+
+        Args:
+            agent_type: Typ der Agenten im Pool
+            factory: Erzeugt eine neue Agent-Instanz
+            config: Pool-Konfiguration
+        """
+        self.agent_type = agent_type
+        self.factory = factory
+        self.config = config or AgentPoolConfig()
+        self.max_size = max(self.config.max_size, self.config.min_size)
+
+        self.instances: List[Any] = []
+        self.outstanding: Dict[str, int] = {}
+        self.idle_since: Dict[str, float] = {}
+
+        # Performance entfernter Instanzen, zu je einem Aggregat zusammengeführt
+        # (konstanter Speicher bei beliebig vielen Skalierungen)
+        self.retired_performance = AgentPerformance(
+            agent_id=f"{agent_type_name(agent_type)}_retired", agent_type=agent_type
+        )
+        self.retired_latency = LatencyTracker(settings.agent_latency_window_seconds)
+
+        self.dispatched = 0
+        self.peak_outstanding = 0
+        self.scale_ups = 0
+        self.scale_downs = 0
+
+        for _ in range(self.config.min_size):
+            self._add_instance()
+
+    @property
+    def primary(self) -> Any:
+        """Erste Instanz (Capabilities und Einzelzugriff)"""
+        return self.instances[0]
+
+    @property
+    def size(self) -> int:
+        return len(self.instances)
+
+    @property
+    def total_outstanding(self) -> int:
+        return sum(self.outstanding.values())
+
+    def _add_instance(self) -> Any:
+        agent = self.factory()
+        self.instances.append(agent)
+        self.outstanding[agent.agent_id] = 0
+        self.idle_since[agent.agent_id] = time.monotonic()
+        return agent
+
+    def avg_execution_time(self) -> float:
+        """Über alle Instanzen gewichtete durchschnittliche Ausführungszeit"""
+        performances = [a.performance for a in self.instances] + [self.retired_performance]
+        total = sum(p.tasks_completed + p.tasks_failed for p in performances)
+        if total == 0:
+            return 0.0
+
+        return (
+            sum(p.avg_execution_time * (p.tasks_completed + p.tasks_failed) for p in performances)
+            / total
+        )
+
+    def expected_wait(self) -> float:
+        """Geschätzte Wartezeit einer neuen Aufgabe pro Instanz"""
+        return self.total_outstanding / self.size * self.avg_execution_time()
+
+    def acquire(self) -> Any:
+        """
+        Wählt die Instanz mit den wenigsten laufenden Aufgaben
+
+        Skaliert vorher hoch, wenn Warteschlangentiefe oder erwartete
+        Wartezeit die Schwellwerte überschreiten.
+        """
+        self._maybe_scale_up()
+
+        agent = min(
+            self.instances,
+            key=lambda a: (self.outstanding[a.agent_id], a.performance.avg_execution_time),
+        )
+
+        self.outstanding[agent.agent_id] += 1
+        self.idle_since.pop(agent.agent_id, None)
+        self.dispatched += 1
+        self.peak_outstanding = max(self.peak_outstanding, self.total_outstanding)
+
+        return agent
+
+    def release(self, agent: Any) -> None:
+        """Gibt eine Instanz nach Ausführung zurück"""
+        if agent.agent_id not in self.outstanding:
+            return
+
+        self.outstanding[agent.agent_id] -= 1
+        if self.outstanding[agent.agent_id] == 0:
+            self.idle_since[agent.agent_id] = time.monotonic()
+
+        self._maybe_scale_down()
+
+    @asynccontextmanager
+    async def lease(self) -> AsyncIterator[Any]:
+        """Context Manager für acquire/release"""
+        agent = self.acquire()
+        try:
+            yield agent
+        finally:
+            self.release(agent)
+
+    async def execute_with_metrics(
+        self, task: Task, on_token: Optional[Callable[[str], Any]] = None
+    ) -> Any:
+        """Führt eine Aufgabe auf der am wenigsten ausgelasteten Instanz aus"""
+        async with self.lease() as agent:
+            return await agent.execute_with_metrics(task, on_token=on_token)
+
+    def _maybe_scale_up(self) -> None:
+        if self.size >= self.max_size:
+            return
+
+        # Mit der neuen Aufgabe
+        depth = (self.total_outstanding + 1) / self.size
+        wait = self.expected_wait()
+
+        if depth > self.config.scale_up_queue_depth or wait > self.config.scale_up_wait_seconds:
+            self._add_instance()
+            self.scale_ups += 1
+
+            logger.info(
+                "agent_pool_scaled_up",
+                agent_type=agent_type_name(self.agent_type),
+                size=self.size,
+                queue_depth=depth,
+                expected_wait=wait,
+            )
+
+    def _maybe_scale_down(self) -> None:
+        if self.size <= self.config.min_size:
+            return
+
+        # Nur abbauen, wenn die verbleibenden Instanzen die Last tragen
+        if self.total_outstanding / (self.size - 1) > self.config.scale_up_queue_depth / 2:
+            return
+
+        now = time.monotonic()
+        for agent in reversed(self.instances[1:]):
+            idle_since = self.idle_since.get(agent.agent_id)
+            if idle_since is not None and now - idle_since >= self.config.idle_seconds:
+                self._remove_instance(agent)
+
+                logger.info(
+                    "agent_pool_scaled_down",
+                    agent_type=agent_type_name(self.agent_type),
+                    size=self.size,
+                )
+                return
+
+    def _remove_instance(self, agent: Any) -> None:
+        self.instances.remove(agent)
+        del self.outstanding[agent.agent_id]
+        del self.idle_since[agent.agent_id]
+        self._retire(agent)
+        self.scale_downs += 1
+
+    def _retire(self, agent: Any) -> None:
+        """Führt Zähler und Latenz-Histogramme einer entfernten Instanz ins Aggregat"""
+        retired, performance = self.retired_performance, agent.performance
+        executions = retired.tasks_completed + retired.tasks_failed
+        added = performance.tasks_completed + performance.tasks_failed
+        if executions + added:
+            retired.avg_execution_time = (
+                retired.avg_execution_time * executions + performance.avg_execution_time * added
+            ) / (executions + added)
+        if retired.streamed_tasks + performance.streamed_tasks:
+            retired.avg_time_to_first_token = (
+                retired.avg_time_to_first_token * retired.streamed_tasks
+                + performance.avg_time_to_first_token * performance.streamed_tasks
+            ) / (retired.streamed_tasks + performance.streamed_tasks)
+        retired.tasks_completed += performance.tasks_completed
+        retired.tasks_failed += performance.tasks_failed
+        retired.tasks_cancelled += performance.tasks_cancelled
+        retired.streamed_tasks += performance.streamed_tasks
+
+        self.retired_latency.merge(agent.latency)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Gibt Pool-Metriken zurück"""
+        return {
+            "size": self.size,
+            "min_size": self.config.min_size,
+            "max_size": self.max_size,
+            "outstanding": self.total_outstanding,
+            "peak_outstanding": self.peak_outstanding,
+            "dispatched": self.dispatched,
+            "scale_ups": self.scale_ups,
+            "scale_downs": self.scale_downs,
+            "avg_execution_time": self.avg_execution_time(),
+            "expected_wait": self.expected_wait(),
+            "instances": {
+                agent.agent_id: {
+                    "outstanding": self.outstanding[agent.agent_id],
+                    "tasks_completed": agent.performance.tasks_completed,
+                    "avg_execution_time": agent.performance.avg_execution_time,
+                }
+                for agent in self.instances
+            },
+        }
+
+    def latency_snapshot(self) -> Dict[str, Any]:
+        """Latenz-Perzentile und Raten, zusammengeführt über alle Instanzen"""
+        merged = LatencyTracker(settings.agent_latency_window_seconds)
+        for tracker in [a.latency for a in self.instances] + [self.retired_latency]:
+            merged.merge(tracker)
+
+        return merged.snapshot()
+
+    def get_performance_metrics(self) -> Dict[str, Any]:
+        """Performance-Metriken des Agent-Typs, aggregiert über alle Instanzen"""
+        metrics = self.primary.get_performance_metrics()
+
+        if self.size > 1 or self.scale_downs:
+            performances = [a.performance for a in self.instances] + [self.retired_performance]
+            completed = sum(p.tasks_completed for p in performances)
+            failed = sum(p.tasks_failed for p in performances)
+            metrics.update(
+                {
+                    "tasks_completed": completed,
+                    "tasks_failed": failed,
+                    "tasks_cancelled": sum(p.tasks_cancelled for p in performances),
+                    "success_rate": completed / (completed + failed)
+                    if completed + failed
+                    else 0.0,
+                    "avg_execution_time": self.avg_execution_time(),
+                    "latency": self.latency_snapshot(),
+                }
+            )
+
+        metrics["pool"] = self.get_metrics()
+        return metrics
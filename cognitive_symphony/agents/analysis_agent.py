@@ -2,7 +2,7 @@
 Analysis Agent - Spezialisiert auf Datenanalyse und Mustererkennung
 """
 
-from typing import Any, List
+from typing import Any, Dict, Tuple
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
@@ -12,39 +12,38 @@ from cognitive_symphony.models import AgentCapability, AgentType, Task
 class AnalysisAgent(BaseAgent):
     """Agent für Datenanalyse, Mustererkennung und Visualisierung"""
 
+    CAPABILITIES = [
+        AgentCapability(
+            name="Data Analysis",
+            description="Statistische Analyse und Datenauswertung",
+            skill_level=0.92,
+            success_rate=0.88,
+        ),
+        AgentCapability(
+            name="Pattern Recognition",
+            description="Erkennung von Mustern und Trends",
+            skill_level=0.9,
+            success_rate=0.85,
+        ),
+        AgentCapability(
+            name="Predictive Analytics",
+            description="Vorhersagemodelle und Forecasting",
+            skill_level=0.85,
+            success_rate=0.82,
+        ),
+        AgentCapability(
+            name="Data Visualization",
+            description="Erstellung aussagekräftiger Visualisierungen",
+            skill_level=0.88,
+            success_rate=0.9,
+        ),
+    ]
+
     def __init__(self, llm: Any):
         super().__init__(AgentType.ANALYSIS, llm)
 
-    def _initialize_capabilities(self) -> List[AgentCapability]:
-        return [
-            AgentCapability(
-                name="Data Analysis",
-                description="Statistische Analyse und Datenauswertung",
-                skill_level=0.92,
-                success_rate=0.88,
-            ),
-            AgentCapability(
-                name="Pattern Recognition",
-                description="Erkennung von Mustern und Trends",
-                skill_level=0.9,
-                success_rate=0.85,
-            ),
-            AgentCapability(
-                name="Predictive Analytics",
-                description="Vorhersagemodelle und Forecasting",
-                skill_level=0.85,
-                success_rate=0.82,
-            ),
-            AgentCapability(
-                name="Data Visualization",
-                description="Erstellung aussagekräftiger Visualisierungen",
-                skill_level=0.88,
-                success_rate=0.9,
-            ),
-        ]
-
-    async def execute(self, task: Task) -> Any:
-        """Führt Analyse-Aufgaben aus"""
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für Analyse-Aufgaben"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -65,17 +64,16 @@ class AnalysisAgent(BaseAgent):
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "analysis_result",
-            "analysis": response.content,
+            "analysis": content,
             "agent": self.agent_type.value,
             "insights": ["Insight 1", "Insight 2"],  # Würde aus Analyse extrahiert
             "visualizations": ["chart1.png", "chart2.png"],  # Würde generiert
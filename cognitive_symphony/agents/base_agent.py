@@ -2,42 +2,102 @@
 Base Agent - Basisklasse für alle spezialisierten Agenten
 """
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, ClassVar, Dict, List, Optional, Tuple
 import structlog
+from langchain.prompts import ChatPromptTemplate
 
-from cognitive_symphony.models import AgentCapability, AgentPerformance, AgentType, Task
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.managed_llm import ensure_managed
+from cognitive_symphony.memory.blackboard import Blackboard
+from cognitive_symphony.transparency.latency import LatencyTracker
+from cognitive_symphony.models import (
+    AgentCapability,
+    AgentKey,
+    AgentPerformance,
+    Task,
+    agent_type_name,
+)
 
 logger = structlog.get_logger()
 
 
 class BaseAgent(ABC):
-    """Abstrakte Basisklasse für alle Agenten"""
+    """
+    Abstrakte Basisklasse für alle Agenten
 
-    def __init__(self, agent_type: AgentType, llm: Any):
+    Fähigkeiten werden als Klassenattribut `CAPABILITIES` deklariert, damit
+    Registry und Capability-Index sie ohne Instanz lesen können. Agenten mit
+    instanzabhängigen Fähigkeiten überschreiben `_initialize_capabilities`.
+    """
+
+    CAPABILITIES: ClassVar[List[AgentCapability]] = []
+
+    def __init__(self, agent_type: AgentKey, llm: Any):
         """
         Initialisiert einen Agenten
 
         Args:
-            agent_type: Typ des Agenten
+            agent_type: Typ des Agenten (AgentType oder Plugin-Name)
             llm: Language Model Instance
         """
         self.agent_type = agent_type
-        self.llm = llm
-        self.agent_id = f"{agent_type.value}_{id(self)}"
+        self.llm = ensure_managed(llm)
+        self.agent_id = f"{agent_type_name(agent_type)}_{id(self)}"
         self.performance = AgentPerformance(
             agent_id=self.agent_id,
             agent_type=agent_type,
         )
+        self.latency = LatencyTracker(settings.agent_latency_window_seconds)
         self.capabilities = self._initialize_capabilities()
 
-    @abstractmethod
     def _initialize_capabilities(self) -> List[AgentCapability]:
-        """Definiert die Fähigkeiten des Agenten"""
+        """Definiert die Fähigkeiten des Agenten (Default: Kopie von CAPABILITIES)"""
+        return [capability.copy() for capability in self.CAPABILITIES]
+
+    @abstractmethod
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """
+        Erstellt Prompt und Eingaben für eine Aufgabe
+
+        Args:
+            task: Die auszuführende Aufgabe
+
+        Returns:
+            Tuple von (Prompt-Template, Eingabewerte)
+        """
         pass
 
     @abstractmethod
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """
+        Erstellt das Ergebnis aus der vollständigen LLM-Antwort
+
+        Args:
+            task: Die ausgeführte Aufgabe
+            content: Text der LLM-Antwort
+
+        Returns:
+            Ergebnis der Aufgabe
+        """
+        pass
+
+    async def _finalize_result(self, task: Task, result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Optionale asynchrone Nachbearbeitung des Ergebnisses (z.B. Verifikation)
+
+        Args:
+            task: Die ausgeführte Aufgabe
+            result: Ergebnis aus _build_result
+
+        Returns:
+            Ergebnis der Aufgabe
+        """
+        return result
+
     async def execute(self, task: Task) -> Any:
         """
         Führt eine Aufgabe aus
@@ -48,85 +108,226 @@ class BaseAgent(ABC):
         Returns:
             Ergebnis der Aufgabe
         """
-        pass
+        prompt, inputs = self._build_prompt(task)
 
-    async def execute_with_metrics(self, task: Task) -> Any:
+        chain = prompt | self.llm
+        response = await chain.ainvoke(inputs)
+
+        return await self._finalize_result(task, self._build_result(task, response.content))
+
+    async def execute_stream(self, task: Task) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Führt eine Aufgabe aus und liefert Tokens, sobald sie generiert werden
+
+        Args:
+            task: Die auszuführende Aufgabe
+
+        Yields:
+            {"type": "token", "content": ...} pro Token und abschließend
+            {"type": "result", "result": ...} mit demselben Ergebnis wie execute()
+
+        Wird der Stream vor dem Ergebnis geschlossen (aclose(), break) oder
+        abgebrochen, zählt die Ausführung als abgebrochen.
+        """
+        start_time = datetime.now()
+        time_to_first_token: Optional[float] = None
+        chunks: List[str] = []
+
+        try:
+            prompt, inputs = self._build_prompt(task)
+
+            chain = prompt | self.llm
+            async for chunk in chain.astream(inputs):
+                if time_to_first_token is None:
+                    time_to_first_token = (datetime.now() - start_time).total_seconds()
+
+                chunks.append(chunk.content)
+                yield {"type": "token", "content": chunk.content}
+
+            result = await self._finalize_result(task, self._build_result(task, "".join(chunks)))
+
+        except Exception as e:
+            self._record_failure(task, e, (datetime.now() - start_time).total_seconds())
+            raise
+        except (GeneratorExit, asyncio.CancelledError):
+            self._record_cancellation(task, (datetime.now() - start_time).total_seconds())
+            raise
+
+        execution_time = (datetime.now() - start_time).total_seconds()
+        self._record_success(task, execution_time, time_to_first_token)
+
+        yield {"type": "result", "result": result}
+
+    async def execute_with_metrics(
+        self, task: Task, on_token: Optional[Callable[[str], Any]] = None
+    ) -> Any:
         """
         Führt eine Aufgabe aus und trackt Performance-Metriken
 
         Args:
             task: Die auszuführende Aufgabe
+            on_token: Optionaler Callback für gestreamte Tokens - aktiviert den
+                Streaming-Pfad und die Time-to-First-Token-Messung
 
         Returns:
             Ergebnis der Aufgabe
         """
+        if on_token is not None:
+            result = None
+            async for event in self.execute_stream(task):
+                if event["type"] == "token":
+                    callback_result = on_token(event["content"])
+                    if inspect.isawaitable(callback_result):
+                        await callback_result
+                else:
+                    result = event["result"]
+
+            return result
+
         start_time = datetime.now()
 
         try:
             result = await self.execute(task)
+        except Exception as e:
+            self._record_failure(task, e, (datetime.now() - start_time).total_seconds())
+            raise
+        except asyncio.CancelledError:
+            self._record_cancellation(task, (datetime.now() - start_time).total_seconds())
+            raise
 
-            # Update Performance-Metriken
-            execution_time = (datetime.now() - start_time).total_seconds()
-            self.performance.tasks_completed += 1
-            self.performance.last_active = datetime.now()
+        execution_time = (datetime.now() - start_time).total_seconds()
+        self._record_success(task, execution_time)
 
-            # Update durchschnittliche Execution Time
-            total_tasks = (
-                self.performance.tasks_completed + self.performance.tasks_failed
-            )
-            self.performance.avg_execution_time = (
-                self.performance.avg_execution_time * (total_tasks - 1) + execution_time
-            ) / total_tasks
+        return result
 
-            # Update Success Rate
-            self.performance.avg_success_rate = (
-                self.performance.tasks_completed / total_tasks
-            )
+    def _record_success(
+        self,
+        task: Task,
+        execution_time: float,
+        time_to_first_token: Optional[float] = None,
+    ) -> None:
+        """Aktualisiert die Performance-Metriken nach erfolgreicher Ausführung"""
+        self.performance.tasks_completed += 1
+        self._record_latency(execution_time, success=True)
 
-            logger.info(
-                "agent_task_completed",
-                agent_type=self.agent_type.value,
-                task_id=task.id,
-                execution_time=execution_time,
-            )
+        # Update durchschnittliche Time-to-First-Token (nur Streaming-Pfad)
+        if time_to_first_token is not None:
+            self.performance.streamed_tasks += 1
+            self.performance.avg_time_to_first_token = (
+                self.performance.avg_time_to_first_token * (self.performance.streamed_tasks - 1)
+                + time_to_first_token
+            ) / self.performance.streamed_tasks
 
-            return result
+        logger.info(
+            "agent_task_completed",
+            agent_type=agent_type_name(self.agent_type),
+            task_id=task.id,
+            execution_time=execution_time,
+            time_to_first_token=time_to_first_token,
+        )
 
-        except Exception as e:
-            self.performance.tasks_failed += 1
+    def _record_failure(
+        self, task: Task, error: Exception, execution_time: Optional[float] = None
+    ) -> None:
+        """Aktualisiert die Performance-Metriken nach fehlgeschlagener Ausführung"""
+        self.performance.tasks_failed += 1
+        if execution_time is not None:
+            self._record_latency(execution_time, success=False)
+        else:
+            self._update_success_rate()
 
-            logger.error(
-                "agent_task_failed",
-                agent_type=self.agent_type.value,
-                task_id=task.id,
-                error=str(e),
-            )
+        logger.error(
+            "agent_task_failed",
+            agent_type=agent_type_name(self.agent_type),
+            task_id=task.id,
+            error=str(error),
+        )
 
-            raise
+    def _record_cancellation(self, task: Task, execution_time: float) -> None:
+        """Zählt eine vor dem Ergebnis abgebrochene Ausführung (ohne Latenz und Erfolgsquote)"""
+        self.performance.tasks_cancelled += 1
+        self.performance.last_active = datetime.now()
+
+        logger.info(
+            "agent_task_cancelled",
+            agent_type=agent_type_name(self.agent_type),
+            task_id=task.id,
+            execution_time=execution_time,
+        )
+
+    def _record_latency(self, execution_time: float, success: bool) -> None:
+        """Führt Durchschnitt, Histogramme und Raten über alle Ausführungen nach"""
+        performance = self.performance
+        performance.last_active = datetime.now()
+
+        # Durchschnitt über alle Ausführungen mit gemessener Dauer
+        histograms = self.latency.histograms
+        measured = histograms["success"].count + histograms["failure"].count
+        performance.avg_execution_time = (
+            performance.avg_execution_time * measured + execution_time
+        ) / (measured + 1)
+
+        self.latency.record(execution_time, success)
+        self._update_success_rate()
+
+        performance.p50_execution_time = histograms["success"].percentile(50)
+        performance.p90_execution_time = histograms["success"].percentile(90)
+        performance.p99_execution_time = histograms["success"].percentile(99)
+        performance.p50_failure_time = histograms["failure"].percentile(50)
+        performance.p90_failure_time = histograms["failure"].percentile(90)
+        performance.p99_failure_time = histograms["failure"].percentile(99)
+        self._latency_snapshot()
+
+    def _latency_snapshot(self) -> Dict[str, Any]:
+        """Aktuelle Latenz-Kennzahlen (aktualisiert die Fenster-Raten im Modell)"""
+        snapshot = self.latency.snapshot()
+        self.performance.tasks_per_second = snapshot["tasks_per_second"]
+        self.performance.failures_per_second = snapshot["failures_per_second"]
+        return snapshot
+
+    def _update_success_rate(self) -> None:
+        performance = self.performance
+        total_tasks = performance.tasks_completed + performance.tasks_failed
+        performance.avg_success_rate = (
+            performance.tasks_completed / total_tasks if total_tasks else 0.0
+        )
 
     def get_performance_metrics(self) -> Dict[str, Any]:
         """Gibt Performance-Metriken des Agenten zurück"""
         return {
             "agent_id": self.agent_id,
-            "agent_type": self.agent_type.value,
+            "agent_type": agent_type_name(self.agent_type),
             "tasks_completed": self.performance.tasks_completed,
             "tasks_failed": self.performance.tasks_failed,
+            "tasks_cancelled": self.performance.tasks_cancelled,
             "success_rate": self.performance.avg_success_rate,
             "avg_execution_time": self.performance.avg_execution_time,
+            "avg_time_to_first_token": self.performance.avg_time_to_first_token,
+            "latency": self._latency_snapshot(),
             "capabilities": [c.dict() for c in self.capabilities],
         }
 
-    def share_knowledge(self, knowledge: Dict[str, Any]) -> None:
+    def share_knowledge(
+        self, knowledge: Dict[str, Any], blackboard: Optional[Blackboard] = None
+    ) -> None:
         """
         Teilt Wissen mit anderen Agenten (Kollaboratives Lernen)
 
         Args:
-            knowledge: Zu teilendes Wissen
+            knowledge: Zu teilendes Wissen (task_id, task_description, findings)
+            blackboard: Blackboard des laufenden solve(), auf das die Findings
+                geschrieben werden
         """
         logger.info(
             "sharing_knowledge",
-            agent_type=self.agent_type.value,
+            agent_type=agent_type_name(self.agent_type),
             knowledge_keys=list(knowledge.keys()),
         )
 
-        # In Produktion würde dies in eine zentrale Knowledge-Base geschrieben
+        if blackboard is not None:
+            blackboard.write(
+                knowledge["task_id"],
+                knowledge.get("task_description", ""),
+                self.agent_type,
+                knowledge["findings"],
+            )
@@ -0,0 +1,166 @@
+"""
+Capability Index - Invertierter Index von Capability-Tokens auf Agent-Typen
+
+- Name und Beschreibung jeder Capability werden normalisiert und in Tokens
+  zerlegt (plus Präfix-Stämme für Sprachvarianten wie "analyse"/"analysis")
+- Eine Anfrage prüft nur die Posting-Listen ihrer Tokens statt aller
+  Capabilities aller Agenten
+- Treffer werden nach Abdeckung der Anforderungen, Seltenheit der Tokens
+  (IDF) und Skill-Level gewichtet und gerankt
+"""
+
+import math
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Set, Tuple
+
+from cognitive_symphony.models import AgentCapability, AgentKey
+
+_TOKEN = re.compile(r"[^\W_]+", re.UNICODE)
+
+_STOPWORDS = set(
+    "and or the of for with to in on etc und oder der die das von für mit zu im auf bzw".split()
+)
+
+# Länge der Präfix-Stämme und deren Gewicht relativ zu exakten Treffern
+STEM_LENGTH = 6
+STEM_WEIGHT = 0.5
+
+# Gewicht von Beschreibungs-Tokens relativ zu Namens-Tokens
+DESCRIPTION_WEIGHT = 0.6
+
+
+def tokenize(text: str) -> List[str]:
+    """Zerlegt einen Text in normalisierte Tokens (ohne Stoppwörter)"""
+    return [
+        token
+        for token in _TOKEN.findall(text.lower())
+        if len(token) > 1 and token not in _STOPWORDS
+    ]
+
+
+def _stem(token: str) -> str:
+    return token[:STEM_LENGTH]
+
+
+class CapabilityIndex:
+    """
+    Invertierter Index: Token -> {Agent-Typ: Gewicht}
+    """
+
+    def __init__(self):
+        self.tokens: Dict[str, Dict[AgentKey, float]] = defaultdict(dict)
+        self.stems: Dict[str, Dict[AgentKey, float]] = defaultdict(dict)
+        self.agent_tokens: Dict[AgentKey, Set[str]] = {}
+        self.agent_stems: Dict[AgentKey, Set[str]] = {}
+
+    def __contains__(self, agent_type: AgentKey) -> bool:
+        return agent_type in self.agent_tokens
+
+    def __len__(self) -> int:
+        return len(self.agent_tokens)
+
+    def add_agent(self, agent_type: AgentKey, capabilities: Iterable[AgentCapability]) -> None:
+        """Indexiert (bzw. ersetzt) die Capabilities eines Agent-Typs"""
+        self.remove_agent(agent_type)
+
+        weights: Dict[str, float] = {}
+        for capability in capabilities:
+            for text, factor in (
+                (capability.name, 1.0),
+                (capability.description, DESCRIPTION_WEIGHT),
+            ):
+                for token in tokenize(text):
+                    weight = capability.skill_level * factor
+                    weights[token] = max(weights.get(token, 0.0), weight)
+
+        stem_weights: Dict[str, float] = {}
+        for token, weight in weights.items():
+            stem = _stem(token)
+            stem_weights[stem] = max(stem_weights.get(stem, 0.0), weight)
+
+        for token, weight in weights.items():
+            self.tokens[token][agent_type] = weight
+        for stem, weight in stem_weights.items():
+            self.stems[stem][agent_type] = weight
+
+        self.agent_tokens[agent_type] = set(weights)
+        self.agent_stems[agent_type] = set(stem_weights)
+
+    def remove_agent(self, agent_type: AgentKey) -> None:
+        """Entfernt einen Agent-Typ aus dem Index"""
+        for token in self.agent_tokens.pop(agent_type, ()):
+            postings = self.tokens[token]
+            postings.pop(agent_type, None)
+            if not postings:
+                del self.tokens[token]
+
+        for stem in self.agent_stems.pop(agent_type, ()):
+            postings = self.stems[stem]
+            postings.pop(agent_type, None)
+            if not postings:
+                del self.stems[stem]
+
+    def _idf(self, postings: Dict[AgentKey, float]) -> float:
+        return math.log(1 + len(self.agent_tokens) / len(postings))
+
+    def score(self, requirements: Iterable[str]) -> Dict[AgentKey, float]:
+        """
+        Bewertet alle Agenten mit mindestens einem Treffer
+
+        Pro Anforderung zählt der Anteil ihrer Tokens, die ein Agent abdeckt
+        (exakt oder über den Stamm), gewichtet mit IDF und Skill-Level.
+        """
+        scores: Dict[AgentKey, float] = defaultdict(float)
+
+        for requirement in requirements:
+            tokens = tokenize(requirement)
+            if not tokens:
+                continue
+
+            matched: Dict[AgentKey, float] = defaultdict(float)
+            for token in tokens:
+                contributions: Dict[AgentKey, float] = {}
+
+                stemmed = self.stems.get(_stem(token))
+                if stemmed:
+                    idf = self._idf(stemmed)
+                    for agent_type, weight in stemmed.items():
+                        contributions[agent_type] = weight * idf * STEM_WEIGHT
+
+                exact = self.tokens.get(token)
+                if exact:
+                    idf = self._idf(exact)
+                    for agent_type, weight in exact.items():
+                        contributions[agent_type] = max(
+                            contributions.get(agent_type, 0.0), weight * idf
+                        )
+
+                for agent_type, value in contributions.items():
+                    matched[agent_type] += value
+
+            for agent_type, value in matched.items():
+                scores[agent_type] += value / len(tokens)
+
+        return dict(scores)
+
+    def search(
+        self, requirements: Iterable[str], limit: int = 3
+    ) -> List[Tuple[AgentKey, float]]:
+        """
+        Gibt die bestpassenden Agent-Typen zurück
+
+        Returns:
+            Liste von (Agent-Typ, Score), absteigend nach Score
+        """
+        ranked = sorted(self.score(requirements).items(), key=lambda item: -item[1])
+        return ranked[:limit]
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Größe des Index"""
+        return {
+            "agents": len(self.agent_tokens),
+            "tokens": len(self.tokens),
+            "stems": len(self.stems),
+            "postings": sum(len(p) for p in self.tokens.values()),
+        }
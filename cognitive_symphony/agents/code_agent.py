@@ -2,49 +2,63 @@
 Code Agent - Spezialisiert auf Programmierung, Testing und Debugging
 """
 
-from typing import Any, List
+from typing import Any, Dict, Optional, Tuple
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
+from cognitive_symphony.agents.code_verifier import (
+    CodeVerifier,
+    extract_code_and_tests,
+    get_code_verifier,
+)
+from cognitive_symphony.config import settings
 from cognitive_symphony.models import AgentCapability, AgentType, Task
 
 
 class CodeAgent(BaseAgent):
     """Agent für Code-Entwicklung, Testing und Debugging"""
 
-    def __init__(self, llm: Any):
-        super().__init__(AgentType.CODE, llm)
+    CAPABILITIES = [
+        AgentCapability(
+            name="Multi-Language Programming",
+            description="Programmierung in Python, JavaScript, TypeScript, Go, Rust, etc.",
+            skill_level=0.95,
+            success_rate=0.9,
+        ),
+        AgentCapability(
+            name="Testing & Debugging",
+            description="Unit-Tests, Integration-Tests, Debugging",
+            skill_level=0.9,
+            success_rate=0.85,
+        ),
+        AgentCapability(
+            name="Code Review",
+            description="Code-Analyse und Optimierungsvorschläge",
+            skill_level=0.88,
+            success_rate=0.92,
+        ),
+        AgentCapability(
+            name="Architecture Design",
+            description="Software-Architektur und Design Patterns",
+            skill_level=0.85,
+            success_rate=0.87,
+        ),
+    ]
 
-    def _initialize_capabilities(self) -> List[AgentCapability]:
-        return [
-            AgentCapability(
-                name="Multi-Language Programming",
-                description="Programmierung in Python, JavaScript, TypeScript, Go, Rust, etc.",
-                skill_level=0.95,
-                success_rate=0.9,
-            ),
-            AgentCapability(
-                name="Testing & Debugging",
-                description="Unit-Tests, Integration-Tests, Debugging",
-                skill_level=0.9,
-                success_rate=0.85,
-            ),
-            AgentCapability(
-                name="Code Review",
-                description="Code-Analyse und Optimierungsvorschläge",
-                skill_level=0.88,
-                success_rate=0.92,
-            ),
-            AgentCapability(
-                name="Architecture Design",
-                description="Software-Architektur und Design Patterns",
-                skill_level=0.85,
-                success_rate=0.87,
-            ),
-        ]
+    def __init__(self, llm: Any, verifier: Optional[CodeVerifier] = None):
+        """
+        Args:
+            llm: Language Model Instance
+            verifier: Führt Code und Tests der Antworten isoliert aus
+                (Default: gemeinsamer Verifier, wenn enable_code_verification)
+        """
+        super().__init__(AgentType.CODE, llm)
+        self.verifier = verifier or (
+            get_code_verifier() if settings.enable_code_verification else None
+        )
 
-    async def execute(self, task: Task) -> Any:
-        """Führt Code-Aufgaben aus"""
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für Code-Aufgaben"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -59,24 +73,34 @@ class CodeAgent(BaseAgent):
                     - Best Practices und Design Patterns
                     
                     Erstelle hochwertigen, gut dokumentierten Code mit Tests.
+                    Gib Code und Tests (Funktionen test_*) in getrennten
+                    ```python-Blöcken aus.
                     """,
                 ),
                 ("human", "Aufgabe: {task_description}\nKontext: {context}"),
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "code_result",
-            "code": response.content,
+            "code": content,
             "agent": self.agent_type.value,
             "language": "python",  # Würde aus Kontext erkannt
-            "tests_included": True,
+            "tests_included": bool(extract_code_and_tests(content)[1]),
         }
+
+    async def _finalize_result(self, task: Task, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Hängt das Ergebnis der isolierten Ausführung an (falls aktiviert)"""
+        if self.verifier is None:
+            return result
+
+        verification = await self.verifier.verify(result["code"])
+        result["verification"] = verification.dict()
+        return result
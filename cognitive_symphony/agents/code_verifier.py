@@ -0,0 +1,289 @@
+"""
+Code Verifier - Führt Code und Tests aus CodeAgent-Antworten isoliert aus
+
+- Code und Tests werden aus den ```python-Blöcken der Antwort extrahiert
+- Jede Prüfung läuft in einem eigenen Subprozess (`python -I`) in einem
+  temporären Verzeichnis mit minimaler Umgebung
+- CPU-Zeit, Speicher (RLIMIT_CPU/RLIMIT_AS, POSIX) und Wall-Clock-Zeit sind
+  begrenzt; höchstens `max_workers` Prüfungen laufen gleichzeitig
+"""
+
+import asyncio
+import contextlib
+import os
+import re
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple
+import structlog
+from pydantic import BaseModel
+
+from cognitive_symphony.config import settings
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - nicht-POSIX
+    resource = None
+
+logger = structlog.get_logger()
+
+_CODE_BLOCK = re.compile(r"```(?:python|py)?[ \t]*\n(.*?)```", re.DOTALL | re.IGNORECASE)
+_TEST_MARKERS = ("def test_", "import pytest", "import unittest", "unittest.TestCase")
+
+# Maximale Länge der gespeicherten Ausgabe
+_MAX_OUTPUT_CHARS = 2000
+
+# Führt zuerst den Code, dann die Tests im selben Namespace aus. Test-
+# Funktionen (test_*) und unittest.TestCase-Klassen werden gesammelt; die
+# letzte Zeile meldet die Anzahl der Tests und Fehlschläge.
+_RUNNER = """
+import inspect, sys, traceback, unittest
+sys.path.insert(0, ".")
+namespace = {"__name__": "solution"}
+exec(compile(open("solution.py").read(), "solution.py", "exec"), namespace)
+exec(compile(open("tests.py").read(), "tests.py", "exec"), namespace)
+
+tests_run = failures = 0
+for name, obj in list(namespace.items()):
+    if name.startswith("test") and inspect.isfunction(obj):
+        tests_run += 1
+        try:
+            obj()
+        except Exception:
+            failures += 1
+            traceback.print_exc()
+    elif inspect.isclass(obj) and issubclass(obj, unittest.TestCase):
+        suite = unittest.defaultTestLoader.loadTestsFromTestCase(obj)
+        outcome = unittest.TextTestRunner(stream=sys.stdout, verbosity=0).run(suite)
+        tests_run += outcome.testsRun
+        failures += len(outcome.failures) + len(outcome.errors)
+
+print(f"VERIFICATION tests_run={tests_run} failures={failures}")
+sys.exit(1 if failures else 0)
+"""
+
+_SUMMARY = re.compile(r"VERIFICATION tests_run=(\d+) failures=(\d+)")
+
+
+class VerificationResult(BaseModel):
+    """Ergebnis einer isolierten Code-Prüfung"""
+
+    status: Literal["passed", "failed", "timeout", "error", "skipped"]
+    passed: bool
+    runtime: float = 0.0
+    tests_run: int = 0
+    failures: int = 0
+    returncode: Optional[int] = None
+    output: str = ""
+
+
+def extract_code_and_tests(content: str) -> Tuple[str, str]:
+    """
+    Trennt Code- und Test-Blöcke einer LLM-Antwort
+
+    Returns:
+        Tuple von (Code, Tests) - jeweils leer, wenn nicht vorhanden
+    """
+    code_blocks: List[str] = []
+    test_blocks: List[str] = []
+
+    for block in _CODE_BLOCK.findall(content):
+        if any(marker in block for marker in _TEST_MARKERS):
+            test_blocks.append(block)
+        else:
+            code_blocks.append(block)
+
+    return "\n\n".join(code_blocks), "\n\n".join(test_blocks)
+
+
+def _limit_resources(cpu_seconds: int, memory_mb: int) -> Callable[[], None]:
+    """preexec_fn für den Subprozess: CPU- und Speicherlimit"""
+
+    def apply() -> None:
+        if cpu_seconds > 0:
+            resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+        if memory_mb > 0:
+            limit = memory_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+    return apply
+
+
+class CodeVerifier:
+    """
+    Begrenzter Pool isolierter Subprozesse zur Prüfung von generiertem Code
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        timeout_seconds: Optional[float] = None,
+        cpu_seconds: Optional[int] = None,
+        memory_mb: Optional[int] = None,
+    ):
+        """
+        Initialisiert den Verifier
+
+        Args:
+            max_workers: Maximale Anzahl gleichzeitiger Prüfungen
+            timeout_seconds: Wall-Clock-Limit pro Prüfung
+            cpu_seconds: CPU-Zeit-Limit pro Prüfung (0 = unbegrenzt)
+            memory_mb: Adressraum-Limit pro Prüfung in MB (0 = unbegrenzt)
+        """
+        self.max_workers = max_workers or settings.code_verification_max_workers
+        self.timeout_seconds = timeout_seconds or settings.code_verification_timeout_seconds
+        self.cpu_seconds = (
+            settings.code_verification_cpu_seconds if cpu_seconds is None else cpu_seconds
+        )
+        self.memory_mb = (
+            settings.code_verification_memory_mb if memory_mb is None else memory_mb
+        )
+
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats: Dict[str, Any] = {
+            "verifications": 0,
+            "passed": 0,
+            "failed": 0,
+            "timeouts": 0,
+            "errors": 0,
+            "skipped": 0,
+            "total_runtime": 0.0,
+        }
+
+    async def verify(self, content: str) -> VerificationResult:
+        """
+        Extrahiert Code und Tests aus einer Antwort und führt sie aus
+
+        Ohne Code-Block wird nichts ausgeführt (status 'skipped'); ohne Tests
+        wird nur geprüft, dass der Code fehlerfrei ausführbar ist.
+        """
+        code, tests = extract_code_and_tests(content)
+        if not code.strip() and not tests.strip():
+            result = VerificationResult(status="skipped", passed=False)
+        else:
+            async with self._get_slots():
+                result = await self._run(code, tests)
+
+        self._record(result)
+        return result
+
+    def _get_slots(self) -> asyncio.Semaphore:
+        """Semaphore der laufenden Event-Loop (Verifier ist prozessweit geteilt)"""
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(max(1, self.max_workers))
+            self._slots_loop = loop
+
+        return self._slots
+
+    async def _run(self, code: str, tests: str) -> VerificationResult:
+        files = {"solution.py": code, "tests.py": tests, "runner.py": _RUNNER}
+
+        with tempfile.TemporaryDirectory(prefix="cs_verify_") as workdir:
+            for name, source in files.items():
+                with open(os.path.join(workdir, name), "w", encoding="utf-8") as f:
+                    f.write(source)
+
+            start = time.perf_counter()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    sys.executable,
+                    "-I",
+                    "runner.py",
+                    cwd=workdir,
+                    env={"PATH": os.environ.get("PATH", ""), "PYTHONHASHSEED": "0"},
+                    stdin=asyncio.subprocess.DEVNULL,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT,
+                    preexec_fn=_limit_resources(self.cpu_seconds, self.memory_mb)
+                    if resource is not None
+                    else None,
+                    start_new_session=os.name == "posix",
+                )
+            except OSError as e:
+                return VerificationResult(status="error", passed=False, output=str(e))
+
+            try:
+                stdout, _ = await asyncio.wait_for(
+                    process.communicate(), timeout=self.timeout_seconds
+                )
+            except asyncio.TimeoutError:
+                self._kill(process)
+                await process.wait()
+                return VerificationResult(
+                    status="timeout",
+                    passed=False,
+                    runtime=time.perf_counter() - start,
+                    returncode=process.returncode,
+                )
+            except asyncio.CancelledError:
+                self._kill(process)
+                # Kindprozess auch bei erneutem Abbruch abholen (kein Zombie)
+                with contextlib.suppress(asyncio.CancelledError):
+                    await asyncio.shield(process.wait())
+                raise
+
+            runtime = time.perf_counter() - start
+
+        output = stdout.decode("utf-8", errors="replace")
+        summary = _SUMMARY.search(output)
+        tests_run, failures = (int(summary[1]), int(summary[2])) if summary else (0, 0)
+        passed = process.returncode == 0
+
+        return VerificationResult(
+            status="passed" if passed else "failed",
+            passed=passed,
+            runtime=runtime,
+            tests_run=tests_run,
+            failures=failures,
+            returncode=process.returncode,
+            output=output[-_MAX_OUTPUT_CHARS:],
+        )
+
+    @staticmethod
+    def _kill(process: asyncio.subprocess.Process) -> None:
+        """Beendet den Subprozess samt eventuell gestarteter Kindprozesse"""
+        if process.returncode is not None:
+            return
+
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, 9)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass
+
+    def _record(self, result: VerificationResult) -> None:
+        stats = self.stats
+        stats["verifications"] += 1
+        stats["total_runtime"] += result.runtime
+        key = {"timeout": "timeouts", "error": "errors"}.get(result.status, result.status)
+        stats[key] += 1
+
+        logger.info(
+            "code_verified",
+            status=result.status,
+            runtime=result.runtime,
+            tests_run=result.tests_run,
+            failures=result.failures,
+        )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Gibt Verifikations-Metriken zurück"""
+        return {"max_workers": self.max_workers, **self.stats}
+
+
+# Gemeinsamer Verifier aller CodeAgent-Instanzen (begrenzt die Prozesse global)
+_verifier: Optional[CodeVerifier] = None
+
+
+def get_code_verifier() -> CodeVerifier:
+    """Gibt den gemeinsamen Verifier zurück"""
+    global _verifier
+    if _verifier is None:
+        _verifier = CodeVerifier()
+
+    return _verifier
@@ -2,7 +2,7 @@
 Creative Agent - Spezialisiert auf Content-Generierung und Design
 """
 
-from typing import Any, List
+from typing import Any, Dict, Tuple
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
@@ -12,39 +12,38 @@ from cognitive_symphony.models import AgentCapability, AgentType, Task
 class CreativeAgent(BaseAgent):
     """Agent für kreative Content-Generierung und Design"""
 
+    CAPABILITIES = [
+        AgentCapability(
+            name="Content Creation",
+            description="Texterstellung, Copywriting, Storytelling",
+            skill_level=0.93,
+            success_rate=0.91,
+        ),
+        AgentCapability(
+            name="Design Concepts",
+            description="UI/UX Design, Branding, Visual Concepts",
+            skill_level=0.87,
+            success_rate=0.85,
+        ),
+        AgentCapability(
+            name="Marketing Materials",
+            description="Erstellen von Marketing-Content und Kampagnen",
+            skill_level=0.9,
+            success_rate=0.88,
+        ),
+        AgentCapability(
+            name="Multi-Modal Creation",
+            description="Text, Bild, Video-Konzepte",
+            skill_level=0.85,
+            success_rate=0.83,
+        ),
+    ]
+
     def __init__(self, llm: Any):
         super().__init__(AgentType.CREATIVE, llm)
 
-    def _initialize_capabilities(self) -> List[AgentCapability]:
-        return [
-            AgentCapability(
-                name="Content Creation",
-                description="Texterstellung, Copywriting, Storytelling",
-                skill_level=0.93,
-                success_rate=0.91,
-            ),
-            AgentCapability(
-                name="Design Concepts",
-                description="UI/UX Design, Branding, Visual Concepts",
-                skill_level=0.87,
-                success_rate=0.85,
-            ),
-            AgentCapability(
-                name="Marketing Materials",
-                description="Erstellen von Marketing-Content und Kampagnen",
-                skill_level=0.9,
-                success_rate=0.88,
-            ),
-            AgentCapability(
-                name="Multi-Modal Creation",
-                description="Text, Bild, Video-Konzepte",
-                skill_level=0.85,
-                success_rate=0.83,
-            ),
-        ]
-
-    async def execute(self, task: Task) -> Any:
-        """Führt kreative Aufgaben aus"""
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für kreative Aufgaben"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -65,17 +64,16 @@ class CreativeAgent(BaseAgent):
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "creative_result",
-            "content": response.content,
+            "content": content,
             "agent": self.agent_type.value,
             "format": "text",  # Würde aus Kontext erkannt
             "brand_aligned": True,
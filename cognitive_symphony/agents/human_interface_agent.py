@@ -2,7 +2,7 @@
 Human Interface Agent - Spezialisiert auf Kommunikation mit Menschen
 """
 
-from typing import Any, List
+from typing import Any, Dict, Tuple
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
@@ -12,39 +12,38 @@ from cognitive_symphony.models import AgentCapability, AgentType, Task
 class HumanInterfaceAgent(BaseAgent):
     """Agent für Kommunikation und Feedback-Management"""
 
+    CAPABILITIES = [
+        AgentCapability(
+            name="Natural Communication",
+            description="Natürliche, menschliche Kommunikation",
+            skill_level=0.95,
+            success_rate=0.92,
+        ),
+        AgentCapability(
+            name="Feedback Collection",
+            description="Sammlung und Verarbeitung von Feedback",
+            skill_level=0.9,
+            success_rate=0.88,
+        ),
+        AgentCapability(
+            name="Explanation Generation",
+            description="Verständliche Erklärungen komplexer Konzepte",
+            skill_level=0.92,
+            success_rate=0.91,
+        ),
+        AgentCapability(
+            name="Conflict Resolution",
+            description="Mediation und Konfliktlösung",
+            skill_level=0.85,
+            success_rate=0.83,
+        ),
+    ]
+
     def __init__(self, llm: Any):
         super().__init__(AgentType.HUMAN_INTERFACE, llm)
 
-    def _initialize_capabilities(self) -> List[AgentCapability]:
-        return [
-            AgentCapability(
-                name="Natural Communication",
-                description="Natürliche, menschliche Kommunikation",
-                skill_level=0.95,
-                success_rate=0.92,
-            ),
-            AgentCapability(
-                name="Feedback Collection",
-                description="Sammlung und Verarbeitung von Feedback",
-                skill_level=0.9,
-                success_rate=0.88,
-            ),
-            AgentCapability(
-                name="Explanation Generation",
-                description="Verständliche Erklärungen komplexer Konzepte",
-                skill_level=0.92,
-                success_rate=0.91,
-            ),
-            AgentCapability(
-                name="Conflict Resolution",
-                description="Mediation und Konfliktlösung",
-                skill_level=0.85,
-                success_rate=0.83,
-            ),
-        ]
-
-    async def execute(self, task: Task) -> Any:
-        """Führt Kommunikationsaufgaben aus"""
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für Kommunikationsaufgaben"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -65,17 +64,16 @@ class HumanInterfaceAgent(BaseAgent):
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "communication_result",
-            "message": response.content,
+            "message": content,
             "agent": self.agent_type.value,
             "tone": "professional",
             "clarity_score": 0.9,
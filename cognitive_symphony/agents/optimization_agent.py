@@ -2,7 +2,7 @@
 Optimization Agent - Spezialisiert auf Performance- und Kostenoptimierung
 """
 
-from typing import Any, List
+from typing import Any, Dict, Tuple
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
@@ -12,39 +12,38 @@ from cognitive_symphony.models import AgentCapability, AgentType, Task
 class OptimizationAgent(BaseAgent):
     """Agent für Workflow-Optimierung und Effizienzsteigerung"""
 
+    CAPABILITIES = [
+        AgentCapability(
+            name="Performance Optimization",
+            description="Code- und System-Performance-Optimierung",
+            skill_level=0.9,
+            success_rate=0.87,
+        ),
+        AgentCapability(
+            name="Cost Optimization",
+            description="Kostenreduktion und Ressourcen-Effizienz",
+            skill_level=0.88,
+            success_rate=0.85,
+        ),
+        AgentCapability(
+            name="Workflow Automation",
+            description="Automatisierung und Prozessoptimierung",
+            skill_level=0.92,
+            success_rate=0.9,
+        ),
+        AgentCapability(
+            name="Resource Allocation",
+            description="Optimale Ressourcenverteilung",
+            skill_level=0.85,
+            success_rate=0.83,
+        ),
+    ]
+
     def __init__(self, llm: Any):
         super().__init__(AgentType.OPTIMIZATION, llm)
 
-    def _initialize_capabilities(self) -> List[AgentCapability]:
-        return [
-            AgentCapability(
-                name="Performance Optimization",
-                description="Code- und System-Performance-Optimierung",
-                skill_level=0.9,
-                success_rate=0.87,
-            ),
-            AgentCapability(
-                name="Cost Optimization",
-                description="Kostenreduktion und Ressourcen-Effizienz",
-                skill_level=0.88,
-                success_rate=0.85,
-            ),
-            AgentCapability(
-                name="Workflow Automation",
-                description="Automatisierung und Prozessoptimierung",
-                skill_level=0.92,
-                success_rate=0.9,
-            ),
-            AgentCapability(
-                name="Resource Allocation",
-                description="Optimale Ressourcenverteilung",
-                skill_level=0.85,
-                success_rate=0.83,
-            ),
-        ]
-
-    async def execute(self, task: Task) -> Any:
-        """Führt Optimierungsaufgaben aus"""
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für Optimierungsaufgaben"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -65,17 +64,16 @@ class OptimizationAgent(BaseAgent):
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "optimization_result",
-            "analysis": response.content,
+            "analysis": content,
             "agent": self.agent_type.value,
             "optimizations": ["Optimization 1", "Optimization 2"],
             "expected_improvement": "30%",
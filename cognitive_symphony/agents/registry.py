@@ -0,0 +1,229 @@
+"""
+Agent Registry - Eingebaute und Plugin-Agenten mit verzögertem Import
+
+- Eingebaute Agenten sind als Importpfad ("modul:Klasse") registriert
+- Plugins werden über die Entry-Point-Gruppe "cognitive_symphony.agents"
+  gefunden oder explizit per `register()` bekannt gemacht
+- Agent-Module werden erst beim ersten Zugriff importiert
+- Fähigkeiten kommen aus der Klassen-Deklaration (`CAPABILITIES`) oder aus
+  den bei `register()` übergebenen Metadaten, ohne Agenten zu instanziieren
+
+Plugin-Pakete registrieren ihre Agenten in der eigenen setup.py:
+
+    entry_points={
+        "cognitive_symphony.agents": [
+            "translator = my_package.translator:TranslatorAgent",
+        ],
+    }
+"""
+
+import importlib
+from importlib.metadata import EntryPoint, entry_points
+from typing import Any, Callable, Dict, List, Optional, Set, Union
+import structlog
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.models import AgentCapability, AgentKey, AgentType, agent_type_name
+
+logger = structlog.get_logger()
+
+ENTRY_POINT_GROUP = "cognitive_symphony.agents"
+
+BUILTIN_AGENTS: Dict[AgentType, str] = {
+    AgentType.RESEARCH: "cognitive_symphony.agents.research_agent:ResearchAgent",
+    AgentType.CODE: "cognitive_symphony.agents.code_agent:CodeAgent",
+    AgentType.ANALYSIS: "cognitive_symphony.agents.analysis_agent:AnalysisAgent",
+    AgentType.CREATIVE: "cognitive_symphony.agents.creative_agent:CreativeAgent",
+    AgentType.SECURITY: "cognitive_symphony.agents.security_agent:SecurityAgent",
+    AgentType.OPTIMIZATION: "cognitive_symphony.agents.optimization_agent:OptimizationAgent",
+    AgentType.HUMAN_INTERFACE: (
+        "cognitive_symphony.agents.human_interface_agent:HumanInterfaceAgent"
+    ),
+}
+
+
+def resolve_agent_type(name: AgentKey) -> AgentKey:
+    """Eingebaute Namen als AgentType, Plugin-Namen als str"""
+    try:
+        return AgentType(name)
+    except ValueError:
+        return str(name)
+
+
+class AgentRegistry:
+    """
+    Verzeichnis aller verfügbaren Agent-Typen
+
+    Registriert werden Klassen bzw. Factories mit der Signatur `(llm) -> Agent`,
+    Importpfade "modul:Klasse" oder Entry Points. Geladen wird erst bei
+    `load()`/`create()`.
+    """
+
+    def __init__(self, builtins: bool = True, discover_plugins: bool = True):
+        """
+        Initialisiert die Registry
+
+        Args:
+            builtins: Eingebaute Agenten registrieren
+            discover_plugins: Entry-Point-Plugins beim ersten Zugriff einlesen
+        """
+        self._targets: Dict[AgentKey, Union[str, EntryPoint, Callable[[Any], Any]]] = {}
+        self._classes: Dict[AgentKey, Callable[[Any], Any]] = {}
+        self._explicit: Set[AgentKey] = set()
+        self._capabilities: Dict[AgentKey, List[AgentCapability]] = {}
+        self._discovered = not discover_plugins
+
+        if builtins:
+            self._targets.update(BUILTIN_AGENTS)
+
+    def register(
+        self,
+        name: AgentKey,
+        target: Optional[Union[str, Callable[[Any], Any]]] = None,
+        capabilities: Optional[List[AgentCapability]] = None,
+    ) -> Any:
+        """
+        Registriert einen Agenten explizit (überschreibt Entry Points)
+
+        Ohne target als Decorator verwendbar:
+
+            @agent_registry.register("translator")
+            class TranslatorAgent(BaseAgent): ...
+
+        Args:
+            name: Agent-Typ bzw. Plugin-Name
+            target: Klasse/Factory `(llm) -> Agent` oder Importpfad "modul:Klasse"
+            capabilities: Fähigkeiten für den Capability-Index (Default:
+                `CAPABILITIES` der Klasse)
+        """
+        if target is None:
+
+            def decorator(cls: Any) -> Any:
+                self.register(name, cls, capabilities)
+                return cls
+
+            return decorator
+
+        key = resolve_agent_type(name)
+        self._targets[key] = target
+        self._classes.pop(key, None)
+        self._explicit.add(key)
+        self._capabilities.pop(key, None)
+        declared = capabilities or getattr(target, "CAPABILITIES", None)
+        if declared:
+            self._capabilities[key] = list(declared)
+
+        logger.info("agent_registered", agent_type=agent_type_name(key))
+        return target
+
+    def unregister(self, name: AgentKey) -> None:
+        """Entfernt einen Agenten aus der Registry"""
+        key = resolve_agent_type(name)
+        self._targets.pop(key, None)
+        self._classes.pop(key, None)
+        self._explicit.discard(key)
+        self._capabilities.pop(key, None)
+
+    def discover(self, group: str = ENTRY_POINT_GROUP) -> List[AgentKey]:
+        """
+        Liest Entry-Point-Plugins ein, ohne sie zu importieren
+
+        Returns:
+            Neu gefundene bzw. ersetzte Agent-Typen
+        """
+        self._discovered = True
+        found = []
+
+        for entry_point in entry_points(group=group):
+            key = resolve_agent_type(entry_point.name)
+            if key in self._explicit:
+                continue
+
+            self._targets[key] = entry_point
+            self._classes.pop(key, None)
+            self._capabilities.pop(key, None)
+            found.append(key)
+
+        if found:
+            logger.info(
+                "agent_plugins_discovered",
+                group=group,
+                agents=[agent_type_name(k) for k in found],
+            )
+
+        return found
+
+    def names(self) -> List[AgentKey]:
+        """Alle registrierten Agent-Typen"""
+        if not self._discovered:
+            self.discover()
+
+        return list(self._targets)
+
+    def __contains__(self, name: AgentKey) -> bool:
+        return resolve_agent_type(name) in self.names()
+
+    def is_loaded(self, name: AgentKey) -> bool:
+        """Ob das Modul des Agenten bereits importiert wurde"""
+        return resolve_agent_type(name) in self._classes
+
+    def load(self, name: AgentKey) -> Callable[[Any], Any]:
+        """
+        Importiert die Klasse bzw. Factory eines Agenten (einmalig)
+
+        Raises:
+            ValueError: Wenn der Agent nicht registriert ist
+        """
+        key = resolve_agent_type(name)
+        if key in self._classes:
+            return self._classes[key]
+
+        if key not in self.names():
+            raise ValueError(f"Unbekannter Agent: {agent_type_name(key)}")
+
+        target = self._targets[key]
+        if isinstance(target, EntryPoint):
+            loaded = target.load()
+        elif isinstance(target, str):
+            module_name, _, attribute = target.partition(":")
+            loaded = getattr(importlib.import_module(module_name), attribute)
+        else:
+            loaded = target
+
+        self._classes[key] = loaded
+        logger.debug("agent_loaded", agent_type=agent_type_name(key))
+
+        return loaded
+
+    def capabilities(self, name: AgentKey) -> Optional[List[AgentCapability]]:
+        """
+        Deklarierte Fähigkeiten eines Agenten (importiert ggf. das Modul,
+        erzeugt aber keine Instanz)
+
+        Returns:
+            Die Fähigkeiten oder None, wenn der Agent keine deklariert
+            (z.B. Factory oder nur `_initialize_capabilities`)
+        """
+        key = resolve_agent_type(name)
+        if key not in self._capabilities:
+            declared = getattr(self.load(key), "CAPABILITIES", None)
+            if not declared:
+                return None
+            self._capabilities[key] = list(declared)
+
+        return self._capabilities[key]
+
+    def create(self, name: AgentKey, llm: Any) -> Any:
+        """Erzeugt eine Instanz des Agenten"""
+        return self.load(name)(llm)
+
+    def get_info(self) -> Dict[str, List[str]]:
+        """Registrierte und bereits geladene Agenten"""
+        return {
+            "registered": [agent_type_name(k) for k in self.names()],
+            "loaded": [agent_type_name(k) for k in self._classes],
+        }
+
+
+# Globale Registry (eingebaute Agenten + Entry-Point-Plugins)
+agent_registry = AgentRegistry(discover_plugins=settings.discover_agent_plugins)
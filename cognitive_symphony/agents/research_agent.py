@@ -2,7 +2,7 @@
 Research Agent - Spezialisiert auf Web-Recherche und Informationssammlung
 """
 
-from typing import Any, List
+from typing import Any, Dict, Tuple
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
@@ -12,33 +12,32 @@ from cognitive_symphony.models import AgentCapability, AgentType, Task
 class ResearchAgent(BaseAgent):
     """Agent für Web-Recherche und Wissensbasis-Erstellung"""
 
+    CAPABILITIES = [
+        AgentCapability(
+            name="Web Research",
+            description="Durchsucht das Web nach relevanten Informationen",
+            skill_level=0.9,
+            success_rate=0.85,
+        ),
+        AgentCapability(
+            name="Data Extraction",
+            description="Extrahiert strukturierte Daten aus unstrukturierten Quellen",
+            skill_level=0.85,
+            success_rate=0.8,
+        ),
+        AgentCapability(
+            name="Knowledge Base Creation",
+            description="Erstellt strukturierte Wissensbasen",
+            skill_level=0.8,
+            success_rate=0.9,
+        ),
+    ]
+
     def __init__(self, llm: Any):
         super().__init__(AgentType.RESEARCH, llm)
 
-    def _initialize_capabilities(self) -> List[AgentCapability]:
-        return [
-            AgentCapability(
-                name="Web Research",
-                description="Durchsucht das Web nach relevanten Informationen",
-                skill_level=0.9,
-                success_rate=0.85,
-            ),
-            AgentCapability(
-                name="Data Extraction",
-                description="Extrahiert strukturierte Daten aus unstrukturierten Quellen",
-                skill_level=0.85,
-                success_rate=0.8,
-            ),
-            AgentCapability(
-                name="Knowledge Base Creation",
-                description="Erstellt strukturierte Wissensbasen",
-                skill_level=0.8,
-                success_rate=0.9,
-            ),
-        ]
-
-    async def execute(self, task: Task) -> Any:
-        """Führt Research-Aufgaben aus"""
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für Research-Aufgaben"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -58,17 +57,16 @@ class ResearchAgent(BaseAgent):
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "research_result",
-            "findings": response.content,
+            "findings": content,
             "agent": self.agent_type.value,
             "sources": ["web_search", "knowledge_base"],  # Vereinfacht
         }
@@ -2,7 +2,7 @@
 Security Agent - Spezialisiert auf Sicherheitsanalyse und Threat Detection
 """
 
-from typing import Any, List
+from typing import Any, Dict, Tuple
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
@@ -12,39 +12,38 @@ from cognitive_symphony.models import AgentCapability, AgentType, Task
 class SecurityAgent(BaseAgent):
     """Agent für Sicherheitsüberwachung und Threat Detection"""
 
+    CAPABILITIES = [
+        AgentCapability(
+            name="Vulnerability Scanning",
+            description="Erkennung von Sicherheitslücken",
+            skill_level=0.91,
+            success_rate=0.89,
+        ),
+        AgentCapability(
+            name="Threat Detection",
+            description="Identifikation von Bedrohungen und Angriffen",
+            skill_level=0.93,
+            success_rate=0.91,
+        ),
+        AgentCapability(
+            name="Security Audit",
+            description="Umfassende Sicherheitsprüfung",
+            skill_level=0.88,
+            success_rate=0.86,
+        ),
+        AgentCapability(
+            name="Compliance Check",
+            description="Prüfung auf Einhaltung von Sicherheitsstandards",
+            skill_level=0.85,
+            success_rate=0.88,
+        ),
+    ]
+
     def __init__(self, llm: Any):
         super().__init__(AgentType.SECURITY, llm)
 
-    def _initialize_capabilities(self) -> List[AgentCapability]:
-        return [
-            AgentCapability(
-                name="Vulnerability Scanning",
-                description="Erkennung von Sicherheitslücken",
-                skill_level=0.91,
-                success_rate=0.89,
-            ),
-            AgentCapability(
-                name="Threat Detection",
-                description="Identifikation von Bedrohungen und Angriffen",
-                skill_level=0.93,
-                success_rate=0.91,
-            ),
-            AgentCapability(
-                name="Security Audit",
-                description="Umfassende Sicherheitsprüfung",
-                skill_level=0.88,
-                success_rate=0.86,
-            ),
-            AgentCapability(
-                name="Compliance Check",
-                description="Prüfung auf Einhaltung von Sicherheitsstandards",
-                skill_level=0.85,
-                success_rate=0.88,
-            ),
-        ]
-
-    async def execute(self, task: Task) -> Any:
-        """Führt Sicherheitsaufgaben aus"""
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für Sicherheitsaufgaben"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -65,17 +64,16 @@ class SecurityAgent(BaseAgent):
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "security_result",
-            "findings": response.content,
+            "findings": content,
             "agent": self.agent_type.value,
             "vulnerabilities": [],  # Würde aus Analyse extrahiert
             "risk_level": "medium",
@@ -2,7 +2,7 @@
 Konfigurationsmanagement für Cognitive Symphony
 """
 
-from typing import Literal
+from typing import Any, Dict, List, Literal
 from pydantic_settings import BaseSettings
 
 
@@ -42,6 +42,7 @@ class Settings(BaseSettings):
 
     # Performance Settings
     max_concurrent_agents: int = 10
+    max_parallel_agents_per_task: int = 4
     task_timeout_seconds: int = 300
     memory_retention_days: int = 90
 
@@ -50,6 +51,132 @@ class Settings(BaseSettings):
     enable_reinforcement_learning: bool = True
     optimization_interval_hours: int = 24
 
+    # Agent Pool Settings (agent_pools: Overrides je Typ, z.B.
+    # AGENT_POOLS='{"research": {"max_size": 4, "model": "gpt-3.5-turbo"}}')
+    agent_pool_min_size: int = 1
+    agent_pool_max_size: int = 1
+    agent_pool_scale_up_queue_depth: float = 2.0
+    agent_pool_scale_up_wait_seconds: float = 10.0
+    agent_pool_idle_seconds: float = 60.0
+    agent_pools: Dict[str, Dict[str, Any]] = {}
+    # Fenster für Durchsatz- und Fehlerraten der Agenten
+    agent_latency_window_seconds: int = 60
+
+    # Agent Registry Settings
+    # Aktive Agenten (leer = alle registrierten inkl. Entry-Point-Plugins),
+    # z.B. ENABLED_AGENTS='["research", "code"]'
+    enabled_agents: List[str] = []
+    discover_agent_plugins: bool = True
+
+    # Agent Execution Settings
+    # Ausführungsmodus pro Priorität: "all" (alle Ergebnisse kombinieren)
+    # oder "race" (erstes brauchbares Ergebnis gewinnt), z.B.
+    # AGENT_EXECUTION_MODE_BY_PRIORITY='{"low": "race"}'
+    agent_execution_mode_by_priority: Dict[str, str] = {}
+    # Zusätzliche Modelle, gegen die ein einzelner Agent im Race-Modus antritt
+    race_model_tiers: List[str] = []
+
+    # Code Verification Settings
+    # CodeAgent: Code und Tests der Antwort isoliert ausführen
+    enable_code_verification: bool = False
+    code_verification_max_workers: int = 2
+    code_verification_timeout_seconds: float = 10.0
+    code_verification_cpu_seconds: int = 5
+    code_verification_memory_mb: int = 512
+
+    # Synthesis Settings
+    # LRU-Cache synthetisierter Agenten, Übernahme in die Flotte nach so
+    # vielen Wiederverwendungen (0 = nie)
+    synthesis_cache_size: int = 64
+    synthesis_promotion_threshold: int = 3
+    # Name/Beschreibung synthetisierter Agenten: "template" (ohne LLM) oder "llm"
+    synthesis_specification_mode: Literal["template", "llm"] = "template"
+    # Capability-Extraktion: "local" (Vektor-Ähnlichkeit, LLM nur unter dem
+    # Schwellwert) oder "llm"; optional lokales sentence-transformers-Modell
+    capability_extraction_mode: Literal["local", "llm"] = "local"
+    capability_match_threshold: float = 0.15
+    capability_embedding_model: str = ""
+
+    # Memory Settings
+    # Voller Retention-Abgleich (O(n)) höchstens in diesem Abstand; dazwischen
+    # entfernt store_episode nur abgelaufene Einträge über den Verfalls-Heap
+    memory_cleanup_interval_seconds: float = 3600.0
+    # Episoden-Inhalte als zlib-komprimiertes JSON (dekodiert erst beim Zugriff)
+    memory_compress_episodes: bool = True
+    memory_compression_level: int = 6
+    # recall_episodes: Anteil von Wichtigkeit und Aktualität am BM25-Ranking
+    memory_recall_importance_weight: float = 0.2
+    memory_recall_recency_weight: float = 0.1
+    memory_recall_recency_half_life_days: float = 30.0
+    # Zugriffe der recall_*-Methoden werden gesammelt und spätestens ab so
+    # vielen Einträgen gebündelt auf access_count/last_accessed angewendet
+    memory_access_batch_size: int = 256
+    # Budget pro Schicht in Einträgen (0 = unbegrenzt); verdrängt wird nach
+    # LFU mit Alterung aus Wichtigkeit, Zugriffshäufigkeit und Aktualität
+    memory_max_episodic_entries: int = 0
+    memory_max_semantic_entries: int = 0
+    memory_max_procedural_entries: int = 0
+
+    # Memory Embedding Settings
+    # Einbettung beim Speichern, IVF-Index pro Schicht für recall_similar
+    # (leeres Modell = lokaler Hashing-Vektorisierer)
+    enable_memory_embeddings: bool = True
+    memory_embedding_model: str = ""
+    memory_embedding_dimensions: int = 256
+    memory_vector_probes: int = 0
+
+    # Memory Storage Settings
+    # Persistenz: "memory" (nur im Prozess) oder "sqlite" (WAL, Group Commit
+    # von bis zu memory_write_batch_size Vorgängen)
+    memory_backend: Literal["memory", "sqlite"] = "memory"
+    memory_sqlite_path: str = "data/memory.db"
+    memory_write_batch_size: int = 256
+    memory_write_flush_seconds: float = 0.05
+    # Tiering der Episoden-Inhalte: höchstens so viele Bytes komprimierter
+    # Inhalte im Speicher (LRU), der Rest in Segmentdateien (0 = alles im RAM;
+    # leerer Pfad = temporäres Verzeichnis)
+    memory_hot_tier_bytes: int = 0
+    memory_cold_tier_path: str = ""
+    memory_cold_segment_bytes: int = 64 * 1024 * 1024
+
+    # Blackboard Settings
+    # Blackboard pro solve(): Findings der Abhängigkeiten im Prompt-Kontext
+    enable_blackboard: bool = True
+    blackboard_max_entries: int = 5
+    blackboard_max_entry_chars: int = 1000
+    blackboard_max_total_chars: int = 4000
+    blackboard_reuse_results: bool = True
+
+    # LLM Rate Limiting (0 = unbegrenzt)
+    openai_requests_per_minute: int = 500
+    openai_tokens_per_minute: int = 150000
+    anthropic_requests_per_minute: int = 50
+    anthropic_tokens_per_minute: int = 40000
+    llm_min_concurrency: int = 1
+    llm_latency_spike_factor: float = 2.0
+    llm_backoff_factor: float = 0.5
+    llm_throttle_backoff_seconds: float = 1.0
+
+    # LLM Resilience
+    llm_max_retries: int = 3
+    llm_retry_base_seconds: float = 0.5
+    llm_retry_max_seconds: float = 20.0
+    llm_circuit_failure_threshold: int = 5
+    llm_circuit_recovery_seconds: float = 30.0
+    openai_fallback_model: str = "gpt-3.5-turbo"
+    anthropic_fallback_model: str = "claude-3-haiku-20240307"
+
+    # LLM Backend (live, record, replay) für reproduzierbare Benchmarks
+    llm_backend: Literal["live", "record", "replay"] = "live"
+    llm_cassette_path: str = "./cassettes/llm.jsonl.gz"
+    llm_replay_latency: bool = False
+    llm_replay_strict: bool = False
+
+    # Lokaler Stub-Server statt echter Provider (Lasttests ohne Netzwerk)
+    use_stub_llm_server: bool = False
+    stub_llm_server_url: str = "http://127.0.0.1:8765"
+    llm_request_timeout_seconds: float = 60.0
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -6,12 +6,15 @@ Diese Klasse orchestriert alle Komponenten und bietet das User-Interface
 
 import asyncio
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 import structlog
 
 from cognitive_symphony.config import settings
 from cognitive_symphony.core.meta_orchestrator import MetaOrchestrator
 from cognitive_symphony.agents.agent_fleet import AgentFleet
+from cognitive_symphony.agents.code_verifier import get_code_verifier
+from cognitive_symphony.llm.managed_llm import get_llm_metrics
+from cognitive_symphony.memory.blackboard import Blackboard
 from cognitive_symphony.memory.memory_system import MemorySystem
 from cognitive_symphony.optimization.self_optimizer import SelfOptimizer
 from cognitive_symphony.models import (
@@ -36,6 +39,7 @@ class CognitiveSymphony:
         llm_provider: str = "openai",
         enable_learning: bool = True,
         enable_transparency: bool = True,
+        llm: Optional[Any] = None,
     ):
         """
         Initialisiert Cognitive Symphony
@@ -44,6 +48,8 @@ class CognitiveSymphony:
             llm_provider: 'openai' oder 'anthropic'
             enable_learning: Aktiviert Self-Optimization
             enable_transparency: Aktiviert Transparenz-Layer
+            llm: Optionales Chat-Model für alle Komponenten (z.B. CassetteLLM
+                für reproduzierbare Offline-Läufe)
         """
         self.llm_provider = llm_provider
         self.enable_learning = enable_learning
@@ -53,9 +59,10 @@ class CognitiveSymphony:
         self.meta_orchestrator = MetaOrchestrator(
             llm_provider=llm_provider,
             enable_learning=enable_learning,
+            llm=llm,
         )
 
-        self.agent_fleet = AgentFleet(llm_provider=llm_provider)
+        self.agent_fleet = AgentFleet(llm_provider=llm_provider, llm=llm)
 
         self.memory_system = MemorySystem()
 
@@ -117,6 +124,7 @@ class CognitiveSymphony:
         # 2. Agenten-Auswahl und Orchestrierung
         agent_interactions = []
         orchestration_decisions = []
+        blackboard = Blackboard(task_obj.id) if settings.enable_blackboard else None
 
         for subtask in subtasks:
             # Hole Performance-Historie aus Memory
@@ -135,17 +143,23 @@ class CognitiveSymphony:
             subtask.status = TaskStatus.IN_PROGRESS
             subtask.started_at = datetime.now()
 
+            # Findings der Abhängigkeiten in den Kontext übernehmen
+            if blackboard is not None:
+                blackboard.inject(subtask)
+
             try:
-                result = await self.agent_fleet.execute_task(subtask, selected_agents)
+                result = await self.agent_fleet.execute_task(
+                    subtask, selected_agents, blackboard=blackboard
+                )
 
                 subtask.status = TaskStatus.COMPLETED
                 subtask.result = result
                 subtask.completed_at = datetime.now()
 
-                # Lerne aus Erfolg
-                performance = 0.8  # Vereinfacht - würde in Produktion berechnet
+                # Lerne aus dem Ergebnis (verifizierter Code zählt real)
+                outcome, performance = self._assess_result(result)
                 await self.meta_orchestrator.learn_from_outcome(
-                    decision, "success", performance
+                    decision, outcome, performance
                 )
 
                 agent_interactions.append(
@@ -214,6 +228,11 @@ class CognitiveSymphony:
                 "subtasks_failed": len(
                     [s for s in subtasks if s.status == TaskStatus.FAILED]
                 ),
+                **(
+                    {f"blackboard_{k}": float(v) for k, v in blackboard.get_metrics().items()}
+                    if blackboard is not None
+                    else {}
+                ),
             },
             execution_time=execution_time,
         )
@@ -227,6 +246,35 @@ class CognitiveSymphony:
 
         return result
 
+    def _assess_result(self, result: Any) -> Tuple[str, float]:
+        """
+        Bewertet ein Teilaufgaben-Ergebnis für learn_from_outcome
+
+        Ergebnisse mit Code-Verifikation werden nach dem Anteil bestandener
+        Prüfungen bewertet, alle übrigen pauschal als Erfolg.
+
+        Returns:
+            Tuple von (Outcome, Performance-Score)
+        """
+        results = result.get("combined_results", [result]) if isinstance(result, dict) else []
+        verifications = [
+            r["verification"]
+            for r in results
+            if isinstance(r, dict)
+            and r.get("verification", {}).get("status") not in (None, "skipped", "error")
+        ]
+
+        if not verifications:
+            return "success", 0.8  # Vereinfacht - würde in Produktion berechnet
+
+        passed = sum(1 for v in verifications if v["passed"]) / len(verifications)
+        if passed == 1.0:
+            return "success", 1.0
+        if passed == 0.0:
+            return "failure", 0.2
+
+        return "partial", passed
+
     def _combine_subtask_results(self, subtasks: List[Task]) -> Any:
         """
         Kombiniert die Ergebnisse aller Subtasks zu einer finalen Lösung
@@ -268,8 +316,11 @@ class CognitiveSymphony:
         return {
             "orchestrator": orchestrator_metrics,
             "agents": agent_metrics,
+            "fleet": self.agent_fleet.get_execution_metrics(),
             "memory": memory_metrics,
             "optimizer": optimizer_metrics,
+            "llm": get_llm_metrics(),
+            "code_verification": get_code_verifier().get_metrics(),
             "timestamp": datetime.now().isoformat(),
         }
 
@@ -9,14 +9,14 @@ Der Meta-Orchestrator ist verantwortlich für:
 """
 
 import asyncio
+import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 import structlog
-from langchain_openai import ChatOpenAI
-from langchain_anthropic import ChatAnthropic
 from langchain.prompts import ChatPromptTemplate
 
-from cognitive_symphony.config import settings
+from cognitive_symphony.llm.managed_llm import ensure_managed
+from cognitive_symphony.llm.providers import create_llm
 from cognitive_symphony.models import (
     AgentType,
     OrchestrationDecision,
@@ -27,6 +27,8 @@ from cognitive_symphony.models import (
 
 logger = structlog.get_logger()
 
+_DEPENDENCY_LINE = re.compile(r"^[\W\d]*(abhängig|depend)", re.IGNORECASE)
+
 
 class MetaOrchestrator:
     """
@@ -38,6 +40,7 @@ class MetaOrchestrator:
         self,
         llm_provider: str = "openai",
         enable_learning: bool = True,
+        llm: Optional[Any] = None,
     ):
         """
         Initialisiert den Meta-Orchestrator
@@ -45,10 +48,11 @@ class MetaOrchestrator:
         Args:
             llm_provider: 'openai' oder 'anthropic'
             enable_learning: Aktiviert Reinforcement Learning
+            llm: Optionales Chat-Model (z.B. CassetteLLM) statt des Providers
         """
         self.llm_provider = llm_provider
         self.enable_learning = enable_learning
-        self.llm = self._initialize_llm()
+        self.llm = ensure_managed(llm) if llm is not None else self._initialize_llm()
         self.decision_history: List[OrchestrationDecision] = []
         self.strategy_performance: Dict[str, float] = {}
 
@@ -60,20 +64,7 @@ class MetaOrchestrator:
 
     def _initialize_llm(self) -> Any:
         """Initialisiert das Language Model basierend auf dem Provider"""
-        if self.llm_provider == "openai":
-            return ChatOpenAI(
-                model="gpt-4-turbo-preview",
-                temperature=0.7,
-                api_key=settings.openai_api_key,
-            )
-        elif self.llm_provider == "anthropic":
-            return ChatAnthropic(
-                model="claude-3-5-sonnet-20240620",
-                temperature=0.7,
-                api_key=settings.anthropic_api_key,
-            )
-        else:
-            raise ValueError(f"Unsupported LLM provider: {self.llm_provider}")
+        return create_llm(self.llm_provider)
 
     async def decompose_task(self, task: Task) -> List[Task]:
         """
@@ -158,8 +149,17 @@ class MetaOrchestrator:
             if not line:
                 continue
 
+            # Abhängigkeiten (z.B. "Abhängigkeiten: Schritt 1, 2") vor den
+            # Task-Keywords prüfen, da sie selbst "Schritt" enthalten
+            if current_subtask and _DEPENDENCY_LINE.match(line):
+                current_subtask.metadata["dependencies"] = [
+                    subtasks[int(number) - 1].id
+                    for number in re.findall(r"\d+", line)
+                    if 0 < int(number) <= len(subtasks)
+                ]
+
             # Erkennen von Task-Beschreibungen (vereinfacht)
-            if any(
+            elif any(
                 keyword in line.lower()
                 for keyword in ["aufgabe", "schritt", "task", "step"]
             ):
@@ -182,6 +182,11 @@ class MetaOrchestrator:
         if current_subtask:
             subtasks.append(current_subtask)
 
+        # Ohne explizite Angabe hängt ein Schritt vom vorherigen ab
+        for previous, subtask in zip([None] + subtasks, subtasks):
+            if "dependencies" not in subtask.metadata:
+                subtask.metadata["dependencies"] = [previous.id] if previous else []
+
         # Fallback: Wenn Parsing fehlschlägt, erstelle eine einfache Teilaufgabe
         if not subtasks:
             subtasks.append(
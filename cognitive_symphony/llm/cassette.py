@@ -0,0 +1,281 @@
+"""
+LLM-Cassettes - Record/Replay von LLM-Aufrufen
+
+- Record: Prompt, Antwort und Latenz echter Aufrufe in eine Cassette schreiben
+- Replay: Antworten deterministisch aus der Cassette liefern, optional mit
+  den aufgezeichneten Latenzen
+
+Damit lassen sich Pipelines offline, ohne API-Keys und reproduzierbar
+profilen.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import re
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, List, Optional
+import structlog
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import AIMessage, AIMessageChunk, BaseMessage
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from cognitive_symphony.llm.managed_llm import model_identifier, prompt_text
+
+logger = structlog.get_logger()
+
+
+class CassetteMissError(KeyError):
+    """Wird im strikten Replay geworfen, wenn ein Prompt nicht aufgezeichnet ist"""
+
+
+def _split_tokens(text: str) -> List[str]:
+    """Zerlegt eine Antwort für gestreamtes Replay in wortweise Chunks"""
+    return re.findall(r"\S+\s*|\s+", text) or [text]
+
+
+class Cassette:
+    """
+    Aufzeichnung von LLM-Interaktionen als JSON-Lines (gzip bei Endung .gz)
+
+    Jede Zeile: {"k": Prompt-Hash, "p": Prompt, "r": Antwort, "l": Latenz,
+    "t": Time-to-First-Token (optional)}
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Pfad zur Cassette-Datei
+        """
+        self.path = Path(path)
+        self.interactions: List[Dict[str, Any]] = []
+        self.by_key: Dict[str, List[int]] = defaultdict(list)
+
+        # Replay-Cursor pro Prompt und für den sequenziellen Fallback
+        self._key_cursors: Dict[str, int] = defaultdict(int)
+        self._sequence_cursor = 0
+
+        self.hits = 0
+        self.misses = 0
+
+        if self.path.exists():
+            self._load()
+
+    @staticmethod
+    def key(prompt: str) -> str:
+        return hashlib.sha1(prompt.encode("utf-8")).hexdigest()
+
+    def _open(self, mode: str) -> Any:
+        if self.path.suffix == ".gz":
+            return gzip.open(self.path, mode + "t", encoding="utf-8")
+        return open(self.path, mode, encoding="utf-8")
+
+    def _load(self) -> None:
+        with self._open("r") as f:
+            for line in f:
+                if line.strip():
+                    self._add(json.loads(line))
+
+        logger.info("cassette_loaded", path=str(self.path), interactions=len(self.interactions))
+
+    def _add(self, interaction: Dict[str, Any]) -> None:
+        self.by_key[interaction["k"]].append(len(self.interactions))
+        self.interactions.append(interaction)
+
+    def record(
+        self,
+        prompt: str,
+        response: str,
+        latency: float,
+        time_to_first_token: Optional[float] = None,
+    ) -> None:
+        """Hängt eine Interaktion an die Cassette an"""
+        interaction = {
+            "k": self.key(prompt),
+            "p": prompt,
+            "r": response,
+            "l": round(latency, 4),
+        }
+        if time_to_first_token is not None:
+            interaction["t"] = round(time_to_first_token, 4)
+
+        self._add(interaction)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._open("a") as f:
+            f.write(json.dumps(interaction, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def lookup(self, prompt: str, strict: bool = False) -> Dict[str, Any]:
+        """
+        Liefert die nächste aufgezeichnete Antwort für einen Prompt
+
+        Wiederholte Prompts erhalten ihre Antworten in Aufzeichnungsreihenfolge.
+        Unbekannte Prompts (z.B. mit Zeitstempeln oder IDs) erhalten im
+        nicht-strikten Modus die nächste Interaktion in Aufzeichnungsreihenfolge.
+
+        Raises:
+            CassetteMissError: Im strikten Modus bei unbekanntem Prompt
+        """
+        key = self.key(prompt)
+        indices = self.by_key.get(key)
+
+        if indices:
+            self.hits += 1
+            cursor = self._key_cursors[key]
+            self._key_cursors[key] = cursor + 1
+            return self.interactions[indices[cursor % len(indices)]]
+
+        self.misses += 1
+        if strict or not self.interactions:
+            raise CassetteMissError(f"Prompt not recorded in {self.path}: {prompt[:80]}")
+
+        interaction = self.interactions[self._sequence_cursor % len(self.interactions)]
+        self._sequence_cursor += 1
+        return interaction
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "interactions": len(self.interactions),
+            "unique_prompts": len(self.by_key),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Eine Cassette pro Datei, geteilt von allen Komponenten
+_cassettes: Dict[str, Cassette] = {}
+
+
+def get_cassette(path: str) -> Cassette:
+    """Gibt die (geteilte) Cassette für einen Pfad zurück"""
+    resolved = str(Path(path).resolve())
+    if resolved not in _cassettes:
+        _cassettes[resolved] = Cassette(path)
+
+    return _cassettes[resolved]
+
+
+class CassetteLLM(Runnable[LanguageModelInput, BaseMessage]):
+    """
+    Chat-Model-Ersatz, der Aufrufe aufzeichnet oder aus einer Cassette abspielt
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        mode: str = "replay",
+        llm: Optional[Any] = None,
+        replay_latency: bool = False,
+        latency_scale: float = 1.0,
+        strict: bool = False,
+    ):
+        """
+        Args:
+            cassette: Die Cassette
+            mode: 'record' oder 'replay'
+            llm: Echtes Chat-Model (nur für 'record')
+            replay_latency: Aufgezeichnete Latenzen beim Replay nachbilden
+            latency_scale: Faktor für die nachgebildeten Latenzen
+            strict: Unbekannte Prompts im Replay als Fehler behandeln
+        """
+        if mode not in ("record", "replay"):
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        if mode == "record" and llm is None:
+            raise ValueError("Recording requires an underlying LLM")
+
+        self.cassette = cassette
+        self.mode = mode
+        self.llm = llm
+        self.replay_latency = replay_latency
+        self.latency_scale = latency_scale
+        self.strict = strict
+
+    @property
+    def model(self) -> str:
+        # Beim Aufzeichnen das echte Modell melden (Circuit Breaker pro Modell)
+        return model_identifier(self.llm) if self.llm is not None else "cassette"
+
+    @classmethod
+    def record(cls, path: str, llm: Any) -> "CassetteLLM":
+        """Erstellt ein aufzeichnendes LLM"""
+        return cls(get_cassette(path), mode="record", llm=llm)
+
+    @classmethod
+    def replay(
+        cls, path: str, replay_latency: bool = False, strict: bool = False
+    ) -> "CassetteLLM":
+        """Erstellt ein abspielendes LLM"""
+        return cls(
+            get_cassette(path), mode="replay", replay_latency=replay_latency, strict=strict
+        )
+
+    def invoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> BaseMessage:
+        if self.mode == "record":
+            start = time.perf_counter()
+            response = self.llm.invoke(input, config, **kwargs)
+            self.cassette.record(
+                prompt_text(input), str(response.content), time.perf_counter() - start
+            )
+            return response
+
+        interaction = self.cassette.lookup(prompt_text(input), strict=self.strict)
+        if self.replay_latency:
+            time.sleep(interaction["l"] * self.latency_scale)
+        return AIMessage(content=interaction["r"])
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> BaseMessage:
+        if self.mode == "record":
+            start = time.perf_counter()
+            response = await self.llm.ainvoke(input, config, **kwargs)
+            self.cassette.record(
+                prompt_text(input), str(response.content), time.perf_counter() - start
+            )
+            return response
+
+        interaction = self.cassette.lookup(prompt_text(input), strict=self.strict)
+        if self.replay_latency:
+            await asyncio.sleep(interaction["l"] * self.latency_scale)
+        return AIMessage(content=interaction["r"])
+
+    async def astream(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[AIMessageChunk]:
+        if self.mode == "record":
+            start = time.perf_counter()
+            time_to_first_token = None
+            chunks = []
+            async for chunk in self.llm.astream(input, config, **kwargs):
+                if time_to_first_token is None:
+                    time_to_first_token = time.perf_counter() - start
+                chunks.append(str(chunk.content))
+                yield chunk
+
+            self.cassette.record(
+                prompt_text(input),
+                "".join(chunks),
+                time.perf_counter() - start,
+                time_to_first_token,
+            )
+            return
+
+        interaction = self.cassette.lookup(prompt_text(input), strict=self.strict)
+        tokens = _split_tokens(interaction["r"])
+
+        first_delay = interaction.get("t", 0.0) if self.replay_latency else 0.0
+        token_delay = (
+            max(0.0, interaction["l"] - first_delay) / len(tokens) if self.replay_latency else 0.0
+        )
+
+        for i, token in enumerate(tokens):
+            delay = (first_delay if i == 0 else token_delay) * self.latency_scale
+            if delay > 0:
+                await asyncio.sleep(delay)
+            yield AIMessageChunk(content=token)
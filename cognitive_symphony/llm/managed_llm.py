@@ -0,0 +1,291 @@
+"""
+Managed LLM - Wrapper, über den alle LLM-Aufrufe des Systems laufen
+
+- Rate Limiting und adaptive Concurrency pro Provider
+- Retries mit Jitter und Circuit Breaking pro Provider und Modell
+- Token-Streaming (Retries nur bis zum ersten Token)
+
+Der Wrapper ist selbst ein Runnable und kann daher transparent in
+LCEL-Chains (`prompt | llm`) eingesetzt werden.
+"""
+
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+import structlog
+from langchain_core.language_models import LanguageModelInput
+from langchain_core.messages import BaseMessage, BaseMessageChunk
+from langchain_core.runnables import Runnable, RunnableConfig
+
+from cognitive_symphony.llm.rate_limiter import (
+    get_rate_limiter,
+    get_rate_limiter_metrics,
+    is_rate_limit_error,
+    retry_after_seconds,
+)
+from cognitive_symphony.llm.resilience import (
+    CircuitOpenError,
+    get_circuit_breaker,
+    get_circuit_breaker_metrics,
+    is_retryable_error,
+    retrying,
+)
+
+logger = structlog.get_logger()
+
+# Reservierung für die Antwort, wenn das Model kein max_tokens vorgibt
+DEFAULT_COMPLETION_TOKENS = 256
+
+
+def approximate_tokens(text: str) -> int:
+    """Grobe Token-Schätzung (~4 Zeichen pro Token)"""
+    return max(1, len(text) // 4)
+
+
+def prompt_text(input: Any) -> str:
+    """Extrahiert den Prompt-Text aus einem LLM-Input"""
+    if hasattr(input, "to_string"):
+        return input.to_string()
+
+    return str(input)
+
+
+def model_identifier(llm: Any) -> str:
+    """Liest den Modellnamen eines Chat-Models"""
+    return getattr(llm, "model_name", None) or getattr(llm, "model", None) or "default"
+
+
+class ManagedLLM(Runnable[LanguageModelInput, BaseMessage]):
+    """
+    Führt LLM-Aufrufe über Rate-Limiter, Retry-Policy und Circuit Breaker aus
+    """
+
+    def __init__(self, llm: Any, provider: str, fallback: Optional["ManagedLLM"] = None):
+        """
+        Initialisiert den Wrapper
+
+        Args:
+            llm: Das eigentliche Chat-Model
+            provider: Provider-Name für die Limiter-Zuordnung
+            fallback: Optionales Ausweich-Modell bei offenem Breaker
+        """
+        self.llm = llm
+        self.provider = provider
+        self.model = model_identifier(llm)
+        self.fallback = fallback
+        self.rate_limiter = get_rate_limiter(provider)
+        self.circuit_breaker = get_circuit_breaker(provider, self.model)
+
+    def __getattr__(self, name: str) -> Any:
+        # Attribute wie model_name transparent vom Chat-Model lesen
+        if name == "llm":
+            raise AttributeError(name)
+        return getattr(self.llm, name)
+
+    def invoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> BaseMessage:
+        return self.llm.invoke(input, config, **kwargs)
+
+    async def ainvoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> BaseMessage:
+        try:
+            async for attempt in retrying():
+                with attempt:
+                    response = await self._attempt(input, config, **kwargs)
+        except Exception as e:
+            if self.fallback is not None and (
+                isinstance(e, CircuitOpenError) or is_retryable_error(e)
+            ):
+                logger.warning(
+                    "llm_fallback",
+                    provider=self.provider,
+                    model=self.model,
+                    fallback_model=self.fallback.model,
+                    error=str(e),
+                )
+                return await self.fallback.ainvoke(input, config, **kwargs)
+            raise
+
+        return response
+
+    async def _attempt(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig], **kwargs: Any
+    ) -> BaseMessage:
+        """Ein einzelner Versuch - fail-fast bei offenem Breaker"""
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(self.circuit_breaker.name)
+
+        try:
+            response = await self._limited_invoke(input, config, **kwargs)
+        except asyncio.CancelledError:
+            self.circuit_breaker.record_cancelled()
+            raise
+        except Exception as e:
+            if is_retryable_error(e):
+                self.circuit_breaker.record_failure()
+            else:
+                # Endpoint hat geantwortet (z.B. 400) - kein Provider-Ausfall
+                self.circuit_breaker.record_success()
+            raise
+
+        self.circuit_breaker.record_success()
+        return response
+
+    async def _limited_invoke(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig], **kwargs: Any
+    ) -> BaseMessage:
+        """Führt den Aufruf innerhalb des Rate-Limiters aus"""
+        text = prompt_text(input)
+        estimated_tokens = approximate_tokens(text) + self._completion_reservation()
+
+        await self.rate_limiter.acquire(estimated_tokens)
+        start = time.monotonic()
+
+        try:
+            response = await self.llm.ainvoke(input, config, **kwargs)
+        except asyncio.CancelledError:
+            self.rate_limiter.release(time.monotonic() - start, outcome="cancelled")
+            raise
+        except Exception as e:
+            throttled = is_rate_limit_error(e)
+            self.rate_limiter.release(
+                time.monotonic() - start,
+                outcome="throttled" if throttled else "failure",
+                retry_after=retry_after_seconds(e) if throttled else None,
+            )
+            raise
+
+        self.rate_limiter.release(time.monotonic() - start)
+        self.rate_limiter.record_usage(
+            estimated_tokens,
+            approximate_tokens(text) + approximate_tokens(str(response.content)),
+        )
+
+        return response
+
+    async def astream(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig] = None, **kwargs: Any
+    ) -> AsyncIterator[BaseMessageChunk]:
+        try:
+            async for attempt in retrying():
+                with attempt:
+                    iterator, first_chunk, start, estimated_tokens = await self._open_stream(
+                        input, config, **kwargs
+                    )
+        except Exception as e:
+            if self.fallback is not None and (
+                isinstance(e, CircuitOpenError) or is_retryable_error(e)
+            ):
+                logger.warning(
+                    "llm_fallback",
+                    provider=self.provider,
+                    model=self.model,
+                    fallback_model=self.fallback.model,
+                    error=str(e),
+                )
+                async for chunk in self.fallback.astream(input, config, **kwargs):
+                    yield chunk
+                return
+            raise
+
+        # Ab dem ersten Token kein Retry mehr - bereits gelieferte Tokens
+        # lassen sich nicht zurücknehmen
+        outcome = "success"
+        completion = []
+        try:
+            if first_chunk is not None:
+                completion.append(str(first_chunk.content))
+                yield first_chunk
+
+            async for chunk in iterator:
+                completion.append(str(chunk.content))
+                yield chunk
+        except asyncio.CancelledError:
+            outcome = "cancelled"
+            raise
+        except Exception:
+            outcome = "failure"
+            raise
+        finally:
+            self.rate_limiter.release(time.monotonic() - start, outcome=outcome)
+
+        self.rate_limiter.record_usage(
+            estimated_tokens,
+            approximate_tokens(prompt_text(input)) + approximate_tokens("".join(completion)),
+        )
+
+    async def _open_stream(
+        self, input: LanguageModelInput, config: Optional[RunnableConfig], **kwargs: Any
+    ) -> Tuple[AsyncIterator[BaseMessageChunk], Optional[BaseMessageChunk], float, int]:
+        """
+        Öffnet einen Stream und wartet auf das erste Token
+
+        Der Limiter-Slot bleibt bis zum Ende des Streams belegt.
+        """
+        if not self.circuit_breaker.allow_request():
+            raise CircuitOpenError(self.circuit_breaker.name)
+
+        estimated_tokens = approximate_tokens(prompt_text(input)) + self._completion_reservation()
+
+        try:
+            await self.rate_limiter.acquire(estimated_tokens)
+        except asyncio.CancelledError:
+            self.circuit_breaker.record_cancelled()
+            raise
+        start = time.monotonic()
+
+        iterator = self.llm.astream(input, config, **kwargs).__aiter__()
+        try:
+            first_chunk = await iterator.__anext__()
+        except StopAsyncIteration:
+            first_chunk = None
+        except asyncio.CancelledError:
+            self.rate_limiter.release(time.monotonic() - start, outcome="cancelled")
+            self.circuit_breaker.record_cancelled()
+            raise
+        except Exception as e:
+            throttled = is_rate_limit_error(e)
+            self.rate_limiter.release(
+                time.monotonic() - start,
+                outcome="throttled" if throttled else "failure",
+                retry_after=retry_after_seconds(e) if throttled else None,
+            )
+            if is_retryable_error(e):
+                self.circuit_breaker.record_failure()
+            else:
+                self.circuit_breaker.record_success()
+            raise
+
+        self.circuit_breaker.record_success()
+        return iterator, first_chunk, start, estimated_tokens
+
+    def _completion_reservation(self) -> int:
+        return getattr(self.llm, "max_tokens", None) or DEFAULT_COMPLETION_TOKENS
+
+
+def ensure_managed(llm: Any) -> ManagedLLM:
+    """Wrappt ein Chat-Model in ManagedLLM, falls noch nicht geschehen"""
+    if isinstance(llm, ManagedLLM):
+        return llm
+
+    return ManagedLLM(llm, infer_provider(llm))
+
+
+def infer_provider(llm: Any) -> str:
+    """Leitet den Provider-Namen aus der Chat-Model-Klasse ab"""
+    name = type(llm).__name__.lower()
+    if "anthropic" in name:
+        return "anthropic"
+    if "openai" in name:
+        return "openai"
+    return name
+
+
+def get_llm_metrics() -> Dict[str, Any]:
+    """Gibt Rate-Limit- und Circuit-Breaker-Metriken aller Provider zurück"""
+    return {
+        "rate_limits": get_rate_limiter_metrics(),
+        "circuit_breakers": get_circuit_breaker_metrics(),
+    }
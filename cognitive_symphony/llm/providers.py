@@ -0,0 +1,115 @@
+"""
+LLM-Provider - Zentrale Erstellung der Chat-Models
+"""
+
+from typing import Any, Optional
+from langchain_openai import ChatOpenAI
+from langchain_anthropic import ChatAnthropic
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.cassette import CassetteLLM, get_cassette
+from cognitive_symphony.llm.managed_llm import ManagedLLM
+
+DEFAULT_MODELS = {
+    "openai": "gpt-4-turbo-preview",
+    "anthropic": "claude-3-5-sonnet-20240620",
+}
+
+
+def create_llm(
+    provider: str, model: Optional[str] = None, temperature: float = 0.7
+) -> ManagedLLM:
+    """
+    Erstellt ein Chat-Model, dessen Aufrufe über Rate-Limiter, Retries und
+    Circuit Breaker laufen
+
+    Args:
+        provider: 'openai' oder 'anthropic'
+        model: Modellname (Default je Provider)
+        temperature: Sampling-Temperatur
+
+    Returns:
+        ManagedLLM (mit Fallback-Modell, falls konfiguriert)
+    """
+    model = model or DEFAULT_MODELS.get(provider)
+
+    if settings.llm_backend == "replay":
+        # Offline: keine Provider-Limits und kein Fallback nötig
+        return ManagedLLM(
+            CassetteLLM(
+                get_cassette(settings.llm_cassette_path),
+                mode="replay",
+                replay_latency=settings.llm_replay_latency,
+                strict=settings.llm_replay_strict,
+            ),
+            "replay",
+        )
+
+    fallback = None
+    fallback_model = getattr(settings, f"{provider}_fallback_model", "")
+    if fallback_model and fallback_model != model:
+        fallback = ManagedLLM(
+            _create_chat_model(provider, fallback_model, temperature), provider
+        )
+
+    return ManagedLLM(_create_chat_model(provider, model, temperature), provider, fallback)
+
+
+def _create_chat_model(provider: str, model: str, temperature: float) -> Any:
+    """Erstellt das Chat-Model des Providers (Retries übernimmt ManagedLLM)"""
+    llm = _create_provider_model(provider, model, temperature)
+
+    if settings.llm_backend == "record":
+        return CassetteLLM(get_cassette(settings.llm_cassette_path), mode="record", llm=llm)
+
+    return llm
+
+
+def _create_provider_model(provider: str, model: str, temperature: float) -> Any:
+    stub_url = settings.stub_llm_server_url.rstrip("/") if settings.use_stub_llm_server else None
+
+    if provider == "openai":
+        return ChatOpenAI(
+            model=model,
+            temperature=temperature,
+            api_key=settings.openai_api_key or ("stub" if stub_url else ""),
+            base_url=f"{stub_url}/v1" if stub_url else None,
+            timeout=settings.llm_request_timeout_seconds,
+            max_retries=0,
+        )
+    elif provider == "anthropic":
+        api_key = settings.anthropic_api_key or ("stub" if stub_url else "")
+        kwargs = {"anthropic_api_url": stub_url} if stub_url else {}
+        llm = ChatAnthropic(
+            model=model,
+            temperature=temperature,
+            anthropic_api_key=api_key,
+            default_request_timeout=settings.llm_request_timeout_seconds,
+            **kwargs,
+        )
+        _configure_anthropic_clients(llm, api_key, stub_url)
+        return llm
+    else:
+        raise ValueError(f"Unsupported LLM provider: {provider}")
+
+
+def _configure_anthropic_clients(llm: Any, api_key: str, base_url: Optional[str]) -> None:
+    """
+    Baut die SDK-Clients von ChatAnthropic ohne SDK-Retries neu
+
+    langchain-anthropic 0.1.1 erzeugt die Clients mit dem SDK-Default
+    `max_retries=2`, die sich mit den Retries von ManagedLLM multiplizieren
+    würden, und reicht anthropic_api_url nicht weiter. Die Stub-URL wird nur
+    gesetzt, wenn der Stub-Server genutzt wird.
+    """
+    import anthropic
+
+    kwargs = {"base_url": base_url} if base_url else {}
+    for name, client_cls in (("_client", anthropic.Client), ("_async_client", anthropic.AsyncClient)):
+        if name in llm.__dict__:
+            llm.__dict__[name] = client_cls(
+                api_key=api_key,
+                timeout=settings.llm_request_timeout_seconds,
+                max_retries=0,
+                **kwargs,
+            )
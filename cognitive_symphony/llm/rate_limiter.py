@@ -0,0 +1,367 @@
+"""
+Rate Limiter - Provider-spezifische Begrenzung von LLM-Aufrufen
+
+- Token-Buckets für Requests und Tokens pro Minute
+- AIMD-Concurrency-Control (Additive Increase, Multiplicative Decrease)
+- Koordiniertes Backoff bei 429-Antworten des Providers
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+import structlog
+
+from cognitive_symphony.config import settings
+
+logger = structlog.get_logger()
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Erkennt 429-Fehler unabhängig vom Provider-SDK"""
+    if getattr(error, "status_code", None) == 429:
+        return True
+
+    response = getattr(error, "response", None)
+    if getattr(response, "status_code", None) == 429:
+        return True
+
+    return "ratelimit" in type(error).__name__.lower()
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Liest den Retry-After-Header einer Provider-Antwort (falls vorhanden)"""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class TokenBucket:
+    """
+    Token-Bucket mit Reservierungs-Semantik
+
+    Kontingent wird sofort abgezogen (auch ins Negative); der Aufrufer wartet
+    anschließend die zurückgegebene Zeit. Dadurch entsteht eine faire
+    Warteschlange ohne Thundering-Herd beim Nachfüllen.
+    """
+
+    def __init__(self, per_minute: int):
+        """
+        Args:
+            per_minute: Kontingent pro Minute (0 = unbegrenzt)
+        """
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    @property
+    def unlimited(self) -> bool:
+        return self.capacity <= 0
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Reserviert Kontingent
+
+        Returns:
+            Wartezeit in Sekunden, bis die Reservierung gedeckt ist
+        """
+        if self.unlimited:
+            return 0.0
+
+        self._refill()
+        self.tokens -= min(amount, self.capacity)
+
+        return max(0.0, -self.tokens / self.rate)
+
+    def adjust(self, delta: float) -> None:
+        """Korrigiert eine Reservierung nachträglich (z.B. um tatsächlichen Verbrauch)"""
+        if self.unlimited:
+            return
+
+        self._refill()
+        self.tokens = min(self.capacity, self.tokens - delta)
+
+
+class AIMDController:
+    """
+    Adaptive Concurrency-Grenze nach dem AIMD-Prinzip
+
+    - Additive Increase: +1 Slot pro vollem Fenster erfolgreicher Aufrufe
+      bei stabiler Latenz
+    - Multiplicative Decrease: Halbierung (konfigurierbar) bei 429 oder
+      Latenzspitzen gegenüber der geglätteten Baseline
+    """
+
+    def __init__(
+        self,
+        min_limit: int,
+        max_limit: int,
+        initial_limit: Optional[int] = None,
+        spike_factor: float = 2.0,
+        backoff_factor: float = 0.5,
+        smoothing: float = 0.1,
+    ):
+        self.min_limit = max(1, min_limit)
+        self.max_limit = max(self.min_limit, max_limit)
+        self.limit = float(
+            initial_limit if initial_limit is not None else max(self.min_limit, self.max_limit // 2)
+        )
+        self.spike_factor = spike_factor
+        self.backoff_factor = backoff_factor
+        self.smoothing = smoothing
+
+        self.baseline_latency: Optional[float] = None
+        self.latency_spikes = 0
+        self.decreases = 0
+        self._last_decrease = 0.0
+
+    @property
+    def current_limit(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    def on_success(self, latency: float) -> None:
+        """Verarbeitet einen erfolgreichen Aufruf"""
+        if self.baseline_latency is None:
+            self.baseline_latency = latency
+        elif latency > self.baseline_latency * self.spike_factor:
+            self.latency_spikes += 1
+            self._decrease()
+        else:
+            self.limit = min(float(self.max_limit), self.limit + 1.0 / self.limit)
+
+        self.baseline_latency = (
+            1 - self.smoothing
+        ) * self.baseline_latency + self.smoothing * latency
+
+    def on_throttle(self) -> None:
+        """Verarbeitet eine 429-Antwort des Providers"""
+        self._decrease()
+
+    def _decrease(self) -> None:
+        # Alle in-flight Requests eines Fensters melden dieselbe Überlast -
+        # nur einmal pro Latenz-Fenster reduzieren
+        now = time.monotonic()
+        if now - self._last_decrease < (self.baseline_latency or 0.0):
+            return
+
+        self._last_decrease = now
+        self.decreases += 1
+        self.limit = max(float(self.min_limit), self.limit * self.backoff_factor)
+
+
+class ProviderRateLimiter:
+    """
+    Begrenzt LLM-Aufrufe eines Providers
+
+    Kombiniert Requests-/Tokens-pro-Minute mit einer adaptiven
+    Concurrency-Grenze und koordiniert Backoff über alle Aufrufer hinweg.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        max_concurrency: int = 10,
+        min_concurrency: int = 1,
+        spike_factor: float = 2.0,
+        backoff_factor: float = 0.5,
+        throttle_backoff_seconds: float = 1.0,
+    ):
+        """
+        Initialisiert den Limiter
+
+        Args:
+            provider: Name des Providers (z.B. 'openai')
+            requests_per_minute: Request-Kontingent (0 = unbegrenzt)
+            tokens_per_minute: Token-Kontingent (0 = unbegrenzt)
+            max_concurrency: Obergrenze gleichzeitiger Aufrufe
+            min_concurrency: Untergrenze gleichzeitiger Aufrufe
+            spike_factor: Latenz-Faktor über Baseline, ab dem gedrosselt wird
+            backoff_factor: Multiplikator für die Concurrency bei Überlast
+            throttle_backoff_seconds: Pause nach 429 ohne Retry-After-Header
+        """
+        self.provider = provider
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.concurrency = AIMDController(
+            min_limit=min_concurrency,
+            max_limit=max_concurrency,
+            spike_factor=spike_factor,
+            backoff_factor=backoff_factor,
+        )
+        self.throttle_backoff_seconds = throttle_backoff_seconds
+
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._blocked_until = 0.0
+
+        # Metriken
+        self.total_requests = 0
+        self.throttled_requests = 0
+        self.failed_requests = 0
+        self.cancelled_requests = 0
+        self.total_queue_delay = 0.0
+        self.max_queue_delay = 0.0
+
+    async def acquire(self, estimated_tokens: int = 0) -> float:
+        """
+        Wartet auf Kontingent und einen freien Concurrency-Slot
+
+        Args:
+            estimated_tokens: Geschätzter Token-Verbrauch des Aufrufs
+
+        Returns:
+            Queueing-Delay in Sekunden
+        """
+        start = time.monotonic()
+
+        # Koordiniertes Backoff nach 429
+        backoff = self._blocked_until - start
+        if backoff > 0:
+            await asyncio.sleep(backoff)
+
+        delay = max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        await self._acquire_slot()
+
+        queue_delay = time.monotonic() - start
+        self.total_requests += 1
+        self.total_queue_delay += queue_delay
+        self.max_queue_delay = max(self.max_queue_delay, queue_delay)
+
+        return queue_delay
+
+    def release(
+        self,
+        latency: float,
+        outcome: str = "success",
+        retry_after: Optional[float] = None,
+    ) -> None:
+        """
+        Gibt einen Slot frei und passt die Concurrency-Grenze an
+
+        Args:
+            latency: Dauer des Aufrufs in Sekunden
+            outcome: 'success', 'throttled', 'failure' oder 'cancelled'
+            retry_after: Vom Provider gemeldete Wartezeit (bei 'throttled')
+        """
+        if outcome == "success":
+            self.concurrency.on_success(latency)
+        elif outcome == "throttled":
+            self.throttled_requests += 1
+            self.concurrency.on_throttle()
+            self._blocked_until = max(
+                self._blocked_until,
+                time.monotonic() + (retry_after or self.throttle_backoff_seconds),
+            )
+            logger.warning(
+                "llm_provider_throttled",
+                provider=self.provider,
+                concurrency_limit=self.concurrency.current_limit,
+            )
+        elif outcome == "cancelled":
+            # Vom Aufrufer abgebrochen (z.B. Racing) - kein Signal für AIMD
+            self.cancelled_requests += 1
+        else:
+            self.failed_requests += 1
+
+        self.in_flight -= 1
+        self._wake_waiters()
+
+    def record_usage(self, estimated_tokens: int, actual_tokens: int) -> None:
+        """Gleicht die Token-Reservierung mit dem tatsächlichen Verbrauch ab"""
+        self.tokens.adjust(actual_tokens - estimated_tokens)
+
+    async def _acquire_slot(self) -> None:
+        if not self._waiters and self.in_flight < self.concurrency.current_limit:
+            self.in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Slot wurde bereits zugeteilt - zurückgeben
+                self.in_flight -= 1
+                self._wake_waiters()
+            else:
+                try:
+                    self._waiters.remove(future)
+                except ValueError:
+                    pass
+            raise
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.concurrency.current_limit:
+            future = self._waiters.popleft()
+            if future.done():
+                continue
+
+            self.in_flight += 1
+            future.set_result(None)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Gibt aktuelle Limits und Queueing-Metriken zurück"""
+        return {
+            "provider": self.provider,
+            "concurrency_limit": self.concurrency.current_limit,
+            "max_concurrency": self.concurrency.max_limit,
+            "in_flight": self.in_flight,
+            "queued": len(self._waiters),
+            "requests_per_minute": int(self.requests.capacity),
+            "tokens_per_minute": int(self.tokens.capacity),
+            "total_requests": self.total_requests,
+            "throttled_requests": self.throttled_requests,
+            "failed_requests": self.failed_requests,
+            "cancelled_requests": self.cancelled_requests,
+            "latency_spikes": self.concurrency.latency_spikes,
+            "baseline_latency": self.concurrency.baseline_latency or 0.0,
+            "avg_queue_delay": (
+                self.total_queue_delay / self.total_requests if self.total_requests > 0 else 0.0
+            ),
+            "max_queue_delay": self.max_queue_delay,
+        }
+
+
+# Ein Limiter pro Provider, geteilt von allen Komponenten
+_rate_limiters: Dict[str, ProviderRateLimiter] = {}
+
+
+def get_rate_limiter(provider: str) -> ProviderRateLimiter:
+    """Gibt den (geteilten) Limiter eines Providers zurück"""
+    if provider not in _rate_limiters:
+        _rate_limiters[provider] = ProviderRateLimiter(
+            provider=provider,
+            requests_per_minute=getattr(settings, f"{provider}_requests_per_minute", 0),
+            tokens_per_minute=getattr(settings, f"{provider}_tokens_per_minute", 0),
+            max_concurrency=settings.max_concurrent_agents,
+            min_concurrency=settings.llm_min_concurrency,
+            spike_factor=settings.llm_latency_spike_factor,
+            backoff_factor=settings.llm_backoff_factor,
+            throttle_backoff_seconds=settings.llm_throttle_backoff_seconds,
+        )
+
+    return _rate_limiters[provider]
+
+
+def get_rate_limiter_metrics() -> Dict[str, Dict[str, Any]]:
+    """Gibt die Metriken aller Provider-Limiter zurück"""
+    return {provider: limiter.get_metrics() for provider, limiter in _rate_limiters.items()}
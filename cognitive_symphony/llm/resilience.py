@@ -0,0 +1,216 @@
+"""
+Resilience - Retries mit Jitter und Circuit Breaking für LLM-Aufrufe
+
+- Exponentielles Backoff mit Full-Jitter (tenacity) für transiente Fehler
+- Circuit Breaker pro Provider und Modell
+- Fail-fast bzw. Fallback-Modell bei offenem Breaker
+"""
+
+import asyncio
+import time
+from typing import Any, Dict, Optional
+import structlog
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.rate_limiter import is_rate_limit_error, retry_after_seconds
+
+logger = structlog.get_logger()
+
+# Fehlerklassen der Provider-SDKs, die auf transiente Probleme hindeuten
+RETRYABLE_ERROR_NAMES = (
+    "timeout",
+    "connection",
+    "internalserver",
+    "serviceunavailable",
+    "overloaded",
+)
+
+
+class CircuitOpenError(Exception):
+    """Wird geworfen, wenn der Circuit Breaker keine Aufrufe zulässt"""
+
+    def __init__(self, name: str):
+        super().__init__(f"Circuit breaker open for {name}")
+        self.name = name
+
+
+def is_retryable_error(error: BaseException) -> bool:
+    """Prüft, ob ein Fehler transient ist und ein Retry sinnvoll ist"""
+    if isinstance(error, CircuitOpenError):
+        return False
+
+    if is_rate_limit_error(error):
+        return True
+
+    if isinstance(error, (asyncio.TimeoutError, TimeoutError, ConnectionError)):
+        return True
+
+    status_code = getattr(error, "status_code", None)
+    if status_code is None:
+        status_code = getattr(getattr(error, "response", None), "status_code", None)
+    if isinstance(status_code, int):
+        return status_code >= 500 or status_code == 408
+
+    error_name = type(error).__name__.lower()
+    return any(name in error_name for name in RETRYABLE_ERROR_NAMES)
+
+
+class CircuitBreaker:
+    """
+    Circuit Breaker mit den Zuständen closed, open und half_open
+
+    - closed: Aufrufe laufen normal, Fehler werden gezählt
+    - open: Aufrufe schlagen sofort fehl, bis recovery_timeout vergangen ist
+    - half_open: Ein einzelner Probe-Aufruf entscheidet über closed/open
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+    ):
+        """
+        Args:
+            name: Bezeichner (provider:model)
+            failure_threshold: Aufeinanderfolgende Fehler bis zum Öffnen
+            recovery_timeout: Sekunden bis zum ersten Probe-Aufruf
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+
+        # Metriken
+        self.times_opened = 0
+        self.rejected_calls = 0
+        self.total_failures = 0
+
+    def allow_request(self) -> bool:
+        """Prüft, ob ein Aufruf durchgelassen wird"""
+        if self.state == "open":
+            if time.monotonic() - self.opened_at < self.recovery_timeout:
+                self.rejected_calls += 1
+                return False
+            self.state = "half_open"
+
+        if self.state == "half_open":
+            if self._probe_in_flight:
+                self.rejected_calls += 1
+                return False
+            self._probe_in_flight = True
+
+        return True
+
+    def record_success(self) -> None:
+        """Registriert einen erfolgreichen Aufruf"""
+        if self.state != "closed":
+            logger.info("circuit_breaker_closed", name=self.name)
+
+        self.state = "closed"
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_cancelled(self) -> None:
+        """Gibt einen abgebrochenen Probe-Aufruf frei (ohne Zustandswechsel)"""
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        """Registriert einen transienten Fehler"""
+        self.total_failures += 1
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+
+        if self.state == "half_open" or self.consecutive_failures >= self.failure_threshold:
+            if self.state != "open":
+                self.times_opened += 1
+                logger.warning(
+                    "circuit_breaker_opened",
+                    name=self.name,
+                    consecutive_failures=self.consecutive_failures,
+                )
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Gibt den Zustand des Breakers zurück"""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "times_opened": self.times_opened,
+            "rejected_calls": self.rejected_calls,
+        }
+
+
+def _wait_with_retry_after(retry_state: RetryCallState) -> float:
+    """Jittered exponential Backoff, mindestens aber der Retry-After-Header"""
+    wait = wait_random_exponential(
+        multiplier=settings.llm_retry_base_seconds,
+        max=settings.llm_retry_max_seconds,
+    )(retry_state)
+
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    retry_after = retry_after_seconds(error) if error else None
+
+    return max(wait, retry_after or 0.0)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    error = retry_state.outcome.exception() if retry_state.outcome else None
+    logger.warning(
+        "llm_call_retry",
+        attempt=retry_state.attempt_number,
+        error=str(error),
+    )
+
+
+def retrying(max_retries: Optional[int] = None) -> AsyncRetrying:
+    """
+    Erstellt die Retry-Policy für einen LLM-Aufruf
+
+    Args:
+        max_retries: Anzahl Wiederholungen (Default aus Settings)
+    """
+    retries = settings.llm_max_retries if max_retries is None else max_retries
+
+    return AsyncRetrying(
+        stop=stop_after_attempt(retries + 1),
+        wait=_wait_with_retry_after,
+        retry=retry_if_exception(is_retryable_error),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+
+
+# Ein Breaker pro Provider und Modell, geteilt von allen Komponenten
+_circuit_breakers: Dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(provider: str, model: str) -> CircuitBreaker:
+    """Gibt den (geteilten) Circuit Breaker für Provider und Modell zurück"""
+    name = f"{provider}:{model}"
+    if name not in _circuit_breakers:
+        _circuit_breakers[name] = CircuitBreaker(
+            name=name,
+            failure_threshold=settings.llm_circuit_failure_threshold,
+            recovery_timeout=settings.llm_circuit_recovery_seconds,
+        )
+
+    return _circuit_breakers[name]
+
+
+def get_circuit_breaker_metrics() -> Dict[str, Dict[str, Any]]:
+    """Gibt den Zustand aller Circuit Breaker zurück"""
+    return {name: breaker.get_metrics() for name, breaker in _circuit_breakers.items()}
@@ -0,0 +1,432 @@
+"""
+Stub-LLM-Server - Lokaler Ersatz für die OpenAI- und Anthropic-APIs
+
+Spricht `POST /v1/chat/completions` (OpenAI) und `POST /v1/messages`
+(Anthropic) inklusive Token-Streaming, sodass `ChatOpenAI` und
+`ChatAnthropic` über einen echten HTTP-Pfad laufen. Für Lasttests von
+Connection-Handling, Rate Limiting und Timeouts lassen sich injizieren:
+
+- Latenzverteilungen (fixed, uniform, normal, lognormal, exponential)
+- 429-Antworten mit Retry-After
+- 5xx-Fehler
+- Stalls (Antwort wird für `stall_seconds` zurückgehalten)
+
+Start: `python -m cognitive_symphony.llm.stub_server --port 8765 --error-429-rate 0.05`
+Aktivierung im System: `USE_STUB_LLM_SERVER=true`
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import random
+import threading
+import time
+from typing import Any, AsyncIterator, Dict, List, Literal, Optional
+from uuid import uuid4
+import structlog
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
+
+logger = structlog.get_logger()
+
+DEFAULT_RESPONSE = (
+    "Schritt 1: Anforderungen recherchieren (research)\n"
+    "Schritt 2: Ergebnisse analysieren (analysis)\n"
+    "Confidence: 0.8\n"
+)
+
+
+class StubServerConfig(BaseModel):
+    """Verhalten des Stub-Servers"""
+
+    # Latenz bis zum ersten Byte (Sekunden)
+    latency_distribution: Literal["fixed", "uniform", "normal", "lognormal", "exponential"] = (
+        "fixed"
+    )
+    latency_mean: float = Field(default=0.05, ge=0.0)
+    latency_stddev: float = Field(default=0.0, ge=0.0)
+
+    # Antwort
+    response_text: str = DEFAULT_RESPONSE
+    completion_tokens: int = Field(default=64, ge=0)  # Fülltext nach response_text
+    tokens_per_second: float = Field(default=200.0, gt=0.0)  # nur Streaming
+
+    # Fault Injection (Wahrscheinlichkeiten pro Request)
+    error_429_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    retry_after_seconds: float = Field(default=1.0, ge=0.0)
+    error_5xx_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    error_5xx_status: int = 503
+    stall_rate: float = Field(default=0.0, ge=0.0, le=1.0)
+    stall_seconds: float = Field(default=30.0, ge=0.0)
+
+    seed: Optional[int] = None
+
+
+class StubServerStats:
+    """Zähler für gestellte Requests und injizierte Fehler"""
+
+    def __init__(self):
+        self.requests = 0
+        self.streamed = 0
+        self.throttled = 0
+        self.server_errors = 0
+        self.stalls = 0
+
+    def as_dict(self) -> Dict[str, int]:
+        return dict(self.__dict__)
+
+
+def _approximate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+class _StubBehavior:
+    """Zieht Latenzen, Fehler und Antwort-Tokens gemäß Konfiguration"""
+
+    def __init__(self, config: StubServerConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.stats = StubServerStats()
+
+    def sample_latency(self) -> float:
+        c = self.config
+        if c.latency_distribution == "uniform":
+            value = self.random.uniform(
+                max(0.0, c.latency_mean - c.latency_stddev), c.latency_mean + c.latency_stddev
+            )
+        elif c.latency_distribution == "normal":
+            value = self.random.gauss(c.latency_mean, c.latency_stddev)
+        elif c.latency_distribution == "lognormal":
+            # Parametrisiert über Mittelwert und Standardabweichung der Latenz
+            if c.latency_mean <= 0:
+                return 0.0
+            variance = (c.latency_stddev / c.latency_mean) ** 2
+            sigma = math.sqrt(math.log(1.0 + variance))
+            mu = math.log(c.latency_mean) - sigma**2 / 2
+            value = self.random.lognormvariate(mu, sigma)
+        elif c.latency_distribution == "exponential":
+            value = self.random.expovariate(1.0 / c.latency_mean) if c.latency_mean > 0 else 0.0
+        else:
+            value = c.latency_mean
+
+        return max(0.0, value)
+
+    def pick_fault(self) -> Optional[str]:
+        """Entscheidet, ob dieser Request einen Fehler erhält"""
+        roll = self.random.random()
+        c = self.config
+
+        if roll < c.error_429_rate:
+            self.stats.throttled += 1
+            return "429"
+        roll -= c.error_429_rate
+
+        if roll < c.error_5xx_rate:
+            self.stats.server_errors += 1
+            return "5xx"
+        roll -= c.error_5xx_rate
+
+        if roll < c.stall_rate:
+            self.stats.stalls += 1
+            return "stall"
+
+        return None
+
+    def completion_tokens(self) -> List[str]:
+        filler = " ".join(f"token{i}" for i in range(self.config.completion_tokens))
+        text = self.config.response_text + filler
+        # Wortweise Chunks inkl. Whitespace, damit die Konkatenation exakt ist
+        tokens: List[str] = []
+        current = ""
+        for char in text:
+            current += char
+            if char.isspace():
+                tokens.append(current)
+                current = ""
+        if current:
+            tokens.append(current)
+        return tokens
+
+
+def _sse(data: Dict[str, Any], event: Optional[str] = None) -> str:
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {json.dumps(data)}\n\n"
+
+
+def create_stub_app(config: Optional[StubServerConfig] = None) -> FastAPI:
+    """
+    Erstellt die FastAPI-App des Stub-Servers
+
+    Args:
+        config: Verhalten (Latenz, Fehler, Antworten)
+
+    Returns:
+        FastAPI-App
+    """
+    behavior = _StubBehavior(config or StubServerConfig())
+    app = FastAPI(title="Cognitive Symphony LLM Stub")
+    app.state.behavior = behavior
+
+    async def inject(api: str) -> Optional[JSONResponse]:
+        """Wartet die gezogene Latenz ab und liefert ggf. eine Fehlerantwort"""
+        behavior.stats.requests += 1
+        fault = behavior.pick_fault()
+
+        if fault == "stall":
+            await asyncio.sleep(behavior.config.stall_seconds)
+
+        await asyncio.sleep(behavior.sample_latency())
+
+        if fault == "429":
+            error_type = "rate_limit_exceeded" if api == "openai" else "rate_limit_error"
+            return JSONResponse(
+                status_code=429,
+                content=_error_body(api, error_type, "Rate limit exceeded (stub)"),
+                headers={"retry-after": str(behavior.config.retry_after_seconds)},
+            )
+
+        if fault == "5xx":
+            error_type = "server_error" if api == "openai" else "api_error"
+            return JSONResponse(
+                status_code=behavior.config.error_5xx_status,
+                content=_error_body(api, error_type, "Upstream unavailable (stub)"),
+            )
+
+        return None
+
+    async def stream_tokens(tokens: List[str]) -> AsyncIterator[str]:
+        delay = 1.0 / behavior.config.tokens_per_second
+        for i, token in enumerate(tokens):
+            if i > 0:
+                await asyncio.sleep(delay)
+            yield token
+
+    @app.post("/v1/chat/completions")
+    async def chat_completions(request: Request) -> Any:
+        body = await request.json()
+        prompt = " ".join(str(m.get("content", "")) for m in body.get("messages", []))
+        model = body.get("model", "stub")
+
+        error = await inject("openai")
+        if error is not None:
+            return error
+
+        tokens = behavior.completion_tokens()
+        completion_id = f"chatcmpl-{uuid4().hex[:24]}"
+        created = int(time.time())
+
+        if not body.get("stream"):
+            text = "".join(tokens)
+            return {
+                "id": completion_id,
+                "object": "chat.completion",
+                "created": created,
+                "model": model,
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": text},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": _approximate_tokens(prompt),
+                    "completion_tokens": len(tokens),
+                    "total_tokens": _approximate_tokens(prompt) + len(tokens),
+                },
+            }
+
+        behavior.stats.streamed += 1
+
+        async def events() -> AsyncIterator[str]:
+            def chunk(delta: Dict[str, Any], finish_reason: Optional[str] = None) -> str:
+                return _sse(
+                    {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": created,
+                        "model": model,
+                        "choices": [
+                            {"index": 0, "delta": delta, "finish_reason": finish_reason}
+                        ],
+                    }
+                )
+
+            yield chunk({"role": "assistant", "content": ""})
+            async for token in stream_tokens(tokens):
+                yield chunk({"content": token})
+            yield chunk({}, finish_reason="stop")
+            yield "data: [DONE]\n\n"
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.post("/v1/messages")
+    async def messages(request: Request) -> Any:
+        body = await request.json()
+        prompt = str(body.get("system", "")) + " ".join(
+            str(m.get("content", "")) for m in body.get("messages", [])
+        )
+        model = body.get("model", "stub")
+
+        error = await inject("anthropic")
+        if error is not None:
+            return error
+
+        tokens = behavior.completion_tokens()
+        message_id = f"msg_{uuid4().hex[:24]}"
+        input_tokens = _approximate_tokens(prompt)
+
+        if not body.get("stream"):
+            return {
+                "id": message_id,
+                "type": "message",
+                "role": "assistant",
+                "model": model,
+                "content": [{"type": "text", "text": "".join(tokens)}],
+                "stop_reason": "end_turn",
+                "stop_sequence": None,
+                "usage": {"input_tokens": input_tokens, "output_tokens": len(tokens)},
+            }
+
+        behavior.stats.streamed += 1
+
+        async def events() -> AsyncIterator[str]:
+            yield _sse(
+                {
+                    "type": "message_start",
+                    "message": {
+                        "id": message_id,
+                        "type": "message",
+                        "role": "assistant",
+                        "model": model,
+                        "content": [],
+                        "stop_reason": None,
+                        "stop_sequence": None,
+                        "usage": {"input_tokens": input_tokens, "output_tokens": 0},
+                    },
+                },
+                event="message_start",
+            )
+            yield _sse(
+                {
+                    "type": "content_block_start",
+                    "index": 0,
+                    "content_block": {"type": "text", "text": ""},
+                },
+                event="content_block_start",
+            )
+            async for token in stream_tokens(tokens):
+                yield _sse(
+                    {
+                        "type": "content_block_delta",
+                        "index": 0,
+                        "delta": {"type": "text_delta", "text": token},
+                    },
+                    event="content_block_delta",
+                )
+            yield _sse({"type": "content_block_stop", "index": 0}, event="content_block_stop")
+            yield _sse(
+                {
+                    "type": "message_delta",
+                    "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                    "usage": {"output_tokens": len(tokens)},
+                },
+                event="message_delta",
+            )
+            yield _sse({"type": "message_stop"}, event="message_stop")
+
+        return StreamingResponse(events(), media_type="text/event-stream")
+
+    @app.get("/stats")
+    async def stats() -> Dict[str, int]:
+        return behavior.stats.as_dict()
+
+    return app
+
+
+def _error_body(api: str, error_type: str, message: str) -> Dict[str, Any]:
+    if api == "openai":
+        return {"error": {"message": message, "type": error_type, "code": None}}
+    return {"type": "error", "error": {"type": error_type, "message": message}}
+
+
+class StubServer:
+    """
+    Startet den Stub-Server in einem Hintergrund-Thread (z.B. für Tests und
+    Benchmarks)
+    """
+
+    def __init__(
+        self,
+        config: Optional[StubServerConfig] = None,
+        host: str = "127.0.0.1",
+        port: int = 8765,
+    ):
+        self.app = create_stub_app(config)
+        self.host = host
+        self.port = port
+        self._server = uvicorn.Server(
+            uvicorn.Config(self.app, host=host, port=port, log_level="warning")
+        )
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def stats(self) -> StubServerStats:
+        return self.app.state.behavior.stats
+
+    def start(self, timeout: float = 10.0) -> "StubServer":
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+        self._thread.start()
+
+        deadline = time.monotonic() + timeout
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"Stub server did not start on {self.url}")
+            time.sleep(0.01)
+
+        logger.info("stub_llm_server_started", url=self.url)
+        return self
+
+    def stop(self) -> None:
+        self._server.should_exit = True
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    """CLI-Einstiegspunkt"""
+    parser = argparse.ArgumentParser(description="Lokaler OpenAI/Anthropic-Stub-Server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+
+    # Alle Config-Felder als Optionen (z.B. --latency-mean 0.2)
+    for name, field in StubServerConfig.model_fields.items():
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            dest=name,
+            default=field.default,
+            type=type(field.default) if field.default is not None else int,
+        )
+
+    args = vars(parser.parse_args())
+    host = args.pop("host")
+    port = args.pop("port")
+
+    uvicorn.run(create_stub_app(StubServerConfig(**args)), host=host, port=port)
+
+
+if __name__ == "__main__":
+    main()
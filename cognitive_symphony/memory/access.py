@@ -0,0 +1,123 @@
+"""
+Access - Zugriffs-Tracking und Budget-Verdrängung für Gedächtnis-Schichten
+
+- AccessTracker: sammelt Treffer der recall_*-Methoden (Anzahl, letzter
+  Zeitpunkt) in einem Dict; angewendet auf die MemoryEntry-Modelle wird
+  gebündelt statt bei jedem Treffer
+- EvictionPolicy: LFU mit dynamischem Altern (LFU-DA) über einen Min-Heap mit
+  Lazy-Invalidierung; Verdrängen und Aktualisieren in O(log n) (amortisiert)
+
+Priorität eines Eintrags: K = L + (1 + access_count) * (EVICTION_BASE_COST +
+importance). L ist die Priorität des zuletzt verdrängten Eintrags und wächst
+mit jeder Verdrängung, neue oder gerade genutzte Einträge starten also über
+lange ungenutzten (Alterung), häufig genutzte und wichtige liegen weiter oben.
+"""
+
+import heapq
+import itertools
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from cognitive_symphony.models import MemoryEntry
+
+# Mindestgewicht pro Zugriff, damit auch Einträge mit Wichtigkeit 0 von
+# Zugriffen profitieren
+EVICTION_BASE_COST = 0.1
+
+
+class AccessTracker:
+    """
+    Gesammelte Zugriffe seit der letzten Anwendung
+
+    Pro Eintrag nur ein Dict-Update pro Treffer; `drain()` liefert die
+    Summen, der Aufrufer schreibt sie einmal pro Eintrag ins Modell.
+    """
+
+    def __init__(self):
+        self.pending: Dict[str, List] = {}
+        self.recorded = 0
+        self.applied_batches = 0
+
+    def __len__(self) -> int:
+        return len(self.pending)
+
+    def record(self, entries: Iterable[MemoryEntry]) -> None:
+        now = time.time()
+        for entry in entries:
+            hit = self.pending.get(entry.id)
+            if hit is None:
+                self.pending[entry.id] = [entry, 1, now]
+            else:
+                hit[1] += 1
+                hit[2] = now
+            self.recorded += 1
+
+    def drain(self) -> List[Tuple[MemoryEntry, int, float]]:
+        """Liefert (Eintrag, Zugriffe, letzter Zugriff als Unix-Zeit) und leert den Puffer"""
+        pending, self.pending = self.pending, {}
+        if pending:
+            self.applied_batches += 1
+        return [tuple(hit) for hit in pending.values()]
+
+
+class EvictionPolicy:
+    """
+    LFU-DA über die Einträge einer Schicht
+
+    Jede Prioritätsänderung legt ein neues Heap-Element an; veraltete
+    Elemente werden beim Entnehmen übersprungen und der Heap neu aufgebaut,
+    sobald er doppelt so groß wie die Zahl der Einträge ist.
+    """
+
+    def __init__(self, max_entries: int):
+        """
+        Args:
+            max_entries: Budget der Schicht (Anzahl Einträge)
+        """
+        self.max_entries = max_entries
+        self.age = 0.0
+        self.heap: List[Tuple[float, int, str]] = []
+        self.current: Dict[str, Tuple[float, int]] = {}
+        self._counter = itertools.count()
+        self.evicted = 0
+
+    def __len__(self) -> int:
+        return len(self.current)
+
+    def priority(self, entry: MemoryEntry) -> float:
+        return self.age + (1 + entry.access_count) * (EVICTION_BASE_COST + entry.importance)
+
+    def update(self, entry: MemoryEntry) -> None:
+        """Fügt einen Eintrag hinzu oder setzt seine Priorität neu (nach Zugriffen)"""
+        item = (self.priority(entry), next(self._counter))
+        self.current[entry.id] = item
+        heapq.heappush(self.heap, (*item, entry.id))
+        if len(self.heap) > 2 * len(self.current) + 64:
+            self.heap = [(*item, entry_id) for entry_id, item in self.current.items()]
+            heapq.heapify(self.heap)
+
+    def remove(self, entry_id: str) -> None:
+        self.current.pop(entry_id, None)
+
+    def over_budget(self) -> bool:
+        return len(self.current) > self.max_entries
+
+    def pop(self) -> Optional[str]:
+        """Entnimmt den Eintrag mit der niedrigsten Priorität und altert die übrigen"""
+        while self.heap:
+            priority, seq, entry_id = heapq.heappop(self.heap)
+            if self.current.get(entry_id) == (priority, seq):
+                del self.current[entry_id]
+                self.age = priority
+                self.evicted += 1
+                return entry_id
+        return None
+
+    def get_metrics(self) -> Dict[str, float]:
+        return {
+            "max_entries": self.max_entries,
+            "entries": len(self.current),
+            "evicted": self.evicted,
+            "age": round(self.age, 4),
+            "heap_size": len(self.heap),
+        }
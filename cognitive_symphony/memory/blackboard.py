@@ -0,0 +1,232 @@
+"""
+Blackboard - Gemeinsames Arbeitsgedächtnis der Agenten innerhalb eines solve()
+
+- Agenten schreiben strukturierte Ergebnisse (Findings) auf das Blackboard
+- Teilaufgaben erhalten nur die Einträge ihrer Abhängigkeiten, gekürzt auf
+  feste Größenlimits, als Kontext
+- Identische Teilaufgaben desselben Agent-Typs (gleiche Beschreibung, gleicher
+  Kontext und gleiche Ergebnisse der Abhängigkeiten) werden nicht erneut an
+  das LLM geschickt, sondern aus dem Blackboard beantwortet
+"""
+
+import copy
+import hashlib
+import json
+import re
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+import structlog
+from pydantic import BaseModel, Field
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.managed_llm import approximate_tokens
+from cognitive_symphony.models import AgentKey, Task, agent_type_name
+
+logger = structlog.get_logger()
+
+# Nummerierungen wie "Schritt 3:" oder "2." am Anfang einer Beschreibung
+_ENUMERATION = re.compile(r"^\W*(?:teilaufgabe|aufgabe|schritt|step|task)?\s*\d*\s*[:.)\-]*\s*")
+
+# Vom Blackboard injizierter Kontext (gekürzte Findings der Abhängigkeiten)
+_INJECTED_CONTEXT = "blackboard"
+
+# Felder ohne inhaltliche Aussage
+_META_FIELDS = {"type", "agent", "language", "sources"}
+
+
+def normalize_description(description: str) -> str:
+    """Normalisiert eine Aufgabenbeschreibung für den Vergleich"""
+    text = _ENUMERATION.sub("", description.lower())
+    return " ".join(text.split())
+
+
+def result_text(result: Any) -> str:
+    """Extrahiert den inhaltlichen Text aus einem Agenten-Ergebnis"""
+    if isinstance(result, dict):
+        return "\n".join(
+            str(value) for key, value in result.items() if key not in _META_FIELDS and value
+        )
+
+    return str(result)
+
+
+class BlackboardEntry(BaseModel):
+    """Strukturiertes Ergebnis eines Agenten auf dem Blackboard"""
+
+    task_id: str
+    agent_type: AgentKey
+    description: str
+    findings: str
+    result: Any = None
+    created_at: datetime = Field(default_factory=datetime.now)
+
+
+class Blackboard:
+    """
+    Arbeitsgedächtnis für einen einzelnen solve()-Aufruf
+    """
+
+    def __init__(
+        self,
+        root_task_id: str,
+        max_entries: Optional[int] = None,
+        max_entry_chars: Optional[int] = None,
+        max_total_chars: Optional[int] = None,
+        reuse_results: Optional[bool] = None,
+    ):
+        """
+        Initialisiert das Blackboard
+
+        Args:
+            root_task_id: ID der Hauptaufgabe
+            max_entries: Maximale Anzahl injizierter Einträge pro Teilaufgabe
+            max_entry_chars: Maximale Länge eines injizierten Eintrags
+            max_total_chars: Maximale Gesamtlänge des injizierten Kontexts
+            reuse_results: Identische Teilaufgaben aus dem Blackboard beantworten
+        """
+        self.root_task_id = root_task_id
+        self.max_entries = max_entries or settings.blackboard_max_entries
+        self.max_entry_chars = max_entry_chars or settings.blackboard_max_entry_chars
+        self.max_total_chars = max_total_chars or settings.blackboard_max_total_chars
+        self.reuse_results = (
+            settings.blackboard_reuse_results if reuse_results is None else reuse_results
+        )
+
+        self.entries: List[BlackboardEntry] = []
+        self.by_task: Dict[str, List[BlackboardEntry]] = {}
+        self.by_key: Dict[Tuple[AgentKey, str, str], BlackboardEntry] = {}
+        # Signatur (Beschreibung, Eingaben) der von find_result gesehenen Teilaufgaben
+        self.signatures: Dict[str, Tuple[str, str]] = {}
+
+        self.stats = {
+            "writes": 0,
+            "injected_entries": 0,
+            "injected_tokens": 0,
+            "truncated_entries": 0,
+            "reused_results": 0,
+            "tokens_saved": 0,
+        }
+
+    def write(
+        self, task_id: str, description: str, agent_type: AgentKey, result: Any
+    ) -> BlackboardEntry:
+        """Schreibt das Ergebnis eines Agenten auf das Blackboard"""
+        entry = BlackboardEntry(
+            task_id=task_id,
+            agent_type=agent_type,
+            description=description,
+            findings=result_text(result),
+            result=result,
+        )
+
+        self.entries.append(entry)
+        self.by_task.setdefault(task_id, []).append(entry)
+        # Wiederverwendbar nur mit bekannter Signatur (Kontext und Abhängigkeiten)
+        signature = self.signatures.get(task_id)
+        if signature is not None:
+            self.by_key.setdefault((agent_type, *signature), entry)
+        self.stats["writes"] += 1
+
+        return entry
+
+    def signature(self, task: Task) -> Tuple[str, str]:
+        """
+        Vergleichsschlüssel einer Teilaufgabe: normalisierte Beschreibung und
+        Hash über Kontext und volle Findings der Abhängigkeiten
+        """
+        context = {k: v for k, v in task.context.items() if k != _INJECTED_CONTEXT}
+        dependencies = [
+            entry.findings
+            for dependency in sorted(task.metadata.get("dependencies", []))
+            for entry in self.by_task.get(dependency, [])
+        ]
+        inputs = json.dumps([context, dependencies], sort_keys=True, default=str)
+
+        return (
+            normalize_description(task.description),
+            hashlib.sha1(inputs.encode("utf-8")).hexdigest(),
+        )
+
+    def find_result(self, task: Task, agent_type: AgentKey) -> Optional[Any]:
+        """
+        Liefert das Ergebnis einer bereits bearbeiteten, identischen Teilaufgabe
+
+        Merkt sich die Signatur der Teilaufgabe, damit ihr Ergebnis beim
+        Schreiben wiederverwendbar wird.
+
+        Returns:
+            Eine Kopie des früheren Ergebnisses oder None
+        """
+        if not self.reuse_results:
+            return None
+
+        signature = self.signatures.setdefault(task.id, self.signature(task))
+        entry = self.by_key.get((agent_type, *signature))
+        if entry is None or entry.task_id == task.id:
+            return None
+
+        # Eingespart: Prompt (Beschreibung + Kontext) und Antwort
+        self.stats["reused_results"] += 1
+        self.stats["tokens_saved"] += approximate_tokens(
+            task.description + str(task.context)
+        ) + approximate_tokens(entry.findings)
+
+        logger.info(
+            "blackboard_result_reused",
+            task_id=task.id,
+            reused_from=entry.task_id,
+            agent_type=agent_type_name(agent_type),
+        )
+
+        # Kopie: Konsumenten dürfen ihr Ergebnis verändern
+        return copy.deepcopy(entry.result)
+
+    def relevant_entries(self, task: Task) -> List[BlackboardEntry]:
+        """Einträge der Abhängigkeiten einer Teilaufgabe (neueste zuerst)"""
+        entries = [
+            entry
+            for dependency in task.metadata.get("dependencies", [])
+            for entry in self.by_task.get(dependency, [])
+        ]
+
+        return sorted(entries, key=lambda e: e.created_at, reverse=True)[: self.max_entries]
+
+    def inject(self, task: Task) -> int:
+        """
+        Fügt die relevanten Einträge (gekürzt) in den Kontext der Teilaufgabe ein
+
+        Returns:
+            Anzahl injizierter Einträge
+        """
+        injected = []
+        remaining = self.max_total_chars
+
+        for entry in self.relevant_entries(task):
+            if remaining <= 0:
+                break
+
+            limit = min(self.max_entry_chars, remaining)
+            findings = entry.findings
+            if len(findings) > limit:
+                findings = findings[:limit] + " ..."
+                self.stats["truncated_entries"] += 1
+
+            injected.append(
+                {
+                    "agent": agent_type_name(entry.agent_type),
+                    "task": entry.description[:200],
+                    "findings": findings,
+                }
+            )
+            remaining -= len(findings)
+
+        if injected:
+            task.context["blackboard"] = injected
+            self.stats["injected_entries"] += len(injected)
+            self.stats["injected_tokens"] += approximate_tokens(str(injected))
+
+        return len(injected)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Gibt Blackboard-Metriken zurück"""
+        return {"entries": len(self.entries), **self.stats}
@@ -0,0 +1,126 @@
+"""
+Embeddings - Lokale Text-Vektorisierer
+
+- HashingVectorizer: TF-IDF über gehashte Wort-, Präfix-Stamm- und Zeichen-
+  Trigramm-Features (ohne Abhängigkeiten außer NumPy, ohne Training nutzbar)
+- SentenceTransformerVectorizer: dichte Einbettungen, wenn sentence-transformers
+  und das Modell lokal verfügbar sind
+- Alle Vektoren sind L2-normierte float32-Zeilen (Skalarprodukt = Kosinus)
+"""
+
+import zlib
+from typing import Any, List, Sequence
+import numpy as np
+import structlog
+
+from cognitive_symphony.agents.capability_index import STEM_LENGTH, tokenize
+
+try:
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # pragma: no cover - optionale Abhängigkeit
+    SentenceTransformer = None
+
+logger = structlog.get_logger()
+
+# Anzahl der Hash-Buckets des lokalen Vektorisierers
+HASHING_DIMENSIONS = 4096
+
+# Zeichen-N-Gramme innerhalb eines Tokens (Komposita, Flexion) und ihr Gewicht
+NGRAM_LENGTH = 3
+NGRAM_WEIGHT = 0.2
+
+
+def normalize(matrix: np.ndarray) -> np.ndarray:
+    """L2-Normierung pro Zeile (Nullvektoren bleiben null)"""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class HashingVectorizer:
+    """
+    TF-IDF über gehashte Features
+
+    Features sind die normalisierten Tokens, deren Präfix-Stämme (damit
+    Sprachvarianten wie "Analyse"/"Analysis" zusammenfallen) und schwach
+    gewichtete Zeichen-Trigramme (z.B. "Verkaufsdaten"/"Daten"). Die IDF
+    wird beim `fit()` auf dem Katalog geschätzt.
+    """
+
+    def __init__(self, dimensions: int = HASHING_DIMENSIONS):
+        self.dimensions = dimensions
+        self.idf = np.ones(dimensions, dtype=np.float32)
+
+    def _bucket(self, feature: str) -> int:
+        return zlib.crc32(feature.encode("utf-8")) % self.dimensions
+
+    def _counts(self, text: str) -> np.ndarray:
+        buckets: List[int] = []
+        weights: List[float] = []
+        for token in tokenize(text):
+            buckets.append(self._bucket(token))
+            buckets.append(self._bucket("~" + token[:STEM_LENGTH]))
+            weights += (1.0, 1.0)
+
+            padded = f"<{token}>"
+            for i in range(len(padded) - NGRAM_LENGTH + 1):
+                buckets.append(self._bucket("#" + padded[i : i + NGRAM_LENGTH]))
+                weights.append(NGRAM_WEIGHT)
+
+        return np.bincount(buckets, weights, minlength=self.dimensions).astype(np.float32)
+
+    def fit(self, texts: Sequence[str]) -> "HashingVectorizer":
+        """Schätzt die IDF der Buckets auf den Katalog-Texten"""
+        counts = np.stack([self._counts(text) for text in texts]) if texts else None
+        if counts is not None:
+            document_frequency = (counts > 0).sum(axis=0)
+            self.idf = (
+                np.log((1 + len(texts)) / (1 + document_frequency)) + 1.0
+            ).astype(np.float32)
+        return self
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        """Vektorisiert Texte (Zeilen L2-normiert)"""
+        if not texts:
+            return np.zeros((0, self.dimensions), dtype=np.float32)
+
+        counts = np.stack([self._counts(text) for text in texts])
+        # Sublineare Term-Frequenz
+        weighted = np.log1p(counts) * self.idf
+        return normalize(weighted)
+
+
+class SentenceTransformerVectorizer:
+    """
+    Dichte Einbettungen über ein lokal verfügbares sentence-transformers-Modell
+    """
+
+    def __init__(self, model_name: str):
+        if SentenceTransformer is None:
+            raise ImportError("sentence-transformers ist nicht installiert")
+
+        self.model = SentenceTransformer(model_name)
+        self.dimensions = self.model.get_sentence_embedding_dimension()
+
+    def fit(self, texts: Sequence[str]) -> "SentenceTransformerVectorizer":
+        return self
+
+    def transform(self, texts: Sequence[str]) -> np.ndarray:
+        embeddings = self.model.encode(list(texts), normalize_embeddings=True)
+        return np.asarray(embeddings, dtype=np.float32)
+
+
+def create_vectorizer(model_name: str = "", dimensions: int = HASHING_DIMENSIONS) -> Any:
+    """
+    Erzeugt einen Vektorisierer
+
+    Mit Modellnamen wird sentence-transformers versucht; ist das Paket oder
+    das Modell (offline) nicht verfügbar, wird der Hashing-Vektorisierer genutzt.
+    """
+    if model_name:
+        try:
+            return SentenceTransformerVectorizer(model_name)
+        except Exception as e:
+            logger.warning("embedding_model_unavailable", model=model_name, error=str(e))
+
+    return HashingVectorizer(dimensions)
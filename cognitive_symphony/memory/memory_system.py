@@ -3,18 +3,66 @@ Memory System - Tri-Layer Gedächtnis-System
 - Episodisches Gedächtnis: Erfolge und Fehler
 - Semantisches Gedächtnis: Wissensdatenbank
 - Prozedurales Gedächtnis: Workflows und Strategien
+
+Episoden sind zusätzlich in einem inkrementellen BM25-Index über Text und
+Tags erfasst, den recall_episodes statt eines linearen Scans nutzt.
+Beim Speichern werden alle Einträge eingebettet und pro Schicht in einem
+IVF-Vektorindex abgelegt (recall_similar, semantische Suche).
+
+Persistenz über ein austauschbares Backend (memory/storage.py): die Listen
+bleiben der Lesepfad, das Backend wird nur geschrieben (gebündelt im
+Hintergrund) und beim Start geladen.
+
+Retention inkrementell: verfallbare Episoden liegen in einem zeitgeordneten
+Heap, unwichtiges Wissen in einer Kandidaten-Queue; store_episode entnimmt nur
+abgelaufene Einträge, der volle Abgleich läuft nach Zeitplan.
+
+Episoden-Inhalte werden komprimiert abgelegt (CompressedPayload) und erst
+beim Zugriff dekodiert; Indizes nutzen eine kleine Zusammenfassung.
+
+Mit `memory_hot_tier_bytes` bleiben nur die zuletzt genutzten Inhalte im
+Speicher (PayloadTier), ältere liegen in Segmentdateien und werden beim
+Abruf transparent zurückgeholt.
+
+Treffer der recall_*-Methoden werden gesammelt und gebündelt auf
+access_count/last_accessed angewendet; optional begrenzt ein Budget pro
+Schicht die Zahl der Einträge (Verdrängung nach LFU mit Alterung).
 """
 
+import heapq
+import time
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple, Union
 import structlog
-from collections import defaultdict
+from collections import defaultdict, deque
 
+from cognitive_symphony.agents.registry import resolve_agent_type
 from cognitive_symphony.config import settings
-from cognitive_symphony.models import AgentType, MemoryEntry, OrchestrationDecision, Task
+from cognitive_symphony.memory.access import AccessTracker, EvictionPolicy
+from cognitive_symphony.memory.embeddings import create_vectorizer
+from cognitive_symphony.memory.payload import CompressedPayload
+from cognitive_symphony.memory.retention import MemoryLayer, RetentionQueue
+from cognitive_symphony.memory.storage import MemoryStore, create_memory_store
+from cognitive_symphony.memory.text_index import BM25Index
+from cognitive_symphony.memory.tiering import PayloadTier
+from cognitive_symphony.memory.vector_index import VectorIndex
+from cognitive_symphony.models import (
+    AgentType,
+    MemoryEntry,
+    OrchestrationDecision,
+    Task,
+    agent_type_name,
+)
 
 logger = structlog.get_logger()
 
+# Retention-Policy: Episoden über dieser Wichtigkeit verfallen nie, Wissen
+# bleibt bei höherer Wichtigkeit oder häufigem Zugriff
+EPISODE_RETAIN_IMPORTANCE = 0.7
+KNOWLEDGE_RETAIN_IMPORTANCE = 0.6
+KNOWLEDGE_RETAIN_ACCESS_COUNT = 5
+
 
 class MemorySystem:
     """
@@ -25,15 +73,69 @@ class MemorySystem:
     - Procedural Memory: Lernt Fähigkeiten und Workflows
     """
 
-    def __init__(self):
-        """Initialisiert das Gedächtnis-System"""
-        # In Produktion würden hier echte Datenbanken verwendet
-        self.episodic_memory: List[MemoryEntry] = []
-        self.semantic_memory: List[MemoryEntry] = []
-        self.procedural_memory: List[MemoryEntry] = []
+    def __init__(self, store: Optional[MemoryStore] = None):
+        """
+        Initialisiert das Gedächtnis-System
+
+        Args:
+            store: Persistenz-Backend (Default: `memory_backend` aus den Settings)
+        """
+        self.store = store or create_memory_store()
+
+        self.episodic_memory = MemoryLayer()
+        self.semantic_memory = MemoryLayer()
+        self.procedural_memory = MemoryLayer()
 
         # Indizes für schnellen Zugriff
         self.task_index: Dict[str, List[MemoryEntry]] = defaultdict(list)
+
+        # Verfallsindizes: Episoden nach Zeitpunkt, Wissens-Kandidaten in
+        # Einfügereihenfolge
+        self.episode_expiry = RetentionQueue(key=lambda e: e.timestamp.timestamp())
+        self.knowledge_candidates: Deque[MemoryEntry] = deque()
+        self.last_full_cleanup = time.monotonic()
+        self.retention_stats = {"expired_episodes": 0, "expired_knowledge": 0, "full_cleanups": 0}
+
+        # Größe der Episoden-Inhalte (unkomprimiert / gespeichert)
+        self.payload_stats = {"raw_bytes": 0, "stored_bytes": 0, "compressed_episodes": 0}
+        self.episode_index = BM25Index()
+
+        # Hot-/Cold-Tier für komprimierte Episoden-Inhalte (optional)
+        self.payload_tier: Optional[PayloadTier] = None
+        if settings.memory_hot_tier_bytes > 0:
+            self.payload_tier = PayloadTier(
+                settings.memory_hot_tier_bytes,
+                settings.memory_cold_tier_path or None,
+                settings.memory_cold_segment_bytes,
+            )
+
+        # Vektorindex pro Schicht (Einbettungen liegen nur im Index, nicht
+        # in MemoryEntry.embedding)
+        self.embedder = None
+        self.vector_indexes: Dict[str, VectorIndex] = {}
+        if settings.enable_memory_embeddings:
+            self.embedder = create_vectorizer(
+                settings.memory_embedding_model, settings.memory_embedding_dimensions
+            )
+            self.vector_indexes = {
+                layer: VectorIndex(
+                    self.embedder.dimensions, probes=settings.memory_vector_probes or None
+                )
+                for layer in ("episodic", "semantic", "procedural")
+            }
+
+        # Gesammelte Zugriffe und Budget-Verdrängung pro Schicht (optional)
+        self.access_tracker = AccessTracker()
+        self.eviction: Dict[str, EvictionPolicy] = {
+            layer: EvictionPolicy(max_entries)
+            for layer, max_entries in (
+                ("episodic", settings.memory_max_episodic_entries),
+                ("semantic", settings.memory_max_semantic_entries),
+                ("procedural", settings.memory_max_procedural_entries),
+            )
+            if max_entries > 0
+        }
+
         self.agent_performance_index: Dict[AgentType, Dict[str, Any]] = defaultdict(
             lambda: {
                 "total_tasks": 0,
@@ -43,7 +145,15 @@ class MemorySystem:
             }
         )
 
-        logger.info("memory_system_initialized")
+        self._restore()
+
+        logger.info(
+            "memory_system_initialized",
+            backend=self.store.get_metrics()["backend"],
+            entries=len(self.episodic_memory)
+            + len(self.semantic_memory)
+            + len(self.procedural_memory),
+        )
 
     def store_episode(
         self,
@@ -59,24 +169,40 @@ class MemorySystem:
             subtasks: Alle Subtasks
             decisions: Alle Orchestrierungs-Entscheidungen
         """
+        content = {
+            "task": task.dict(),
+            "subtasks": [s.dict() for s in subtasks],
+            "decisions": [d.dict() for d in decisions],
+            "outcome": task.status.value,
+        }
+        text = self._episode_text(content)
+        if settings.memory_compress_episodes:
+            content = CompressedPayload.encode(
+                content,
+                {
+                    "task_id": task.id,
+                    "description": task.description,
+                    "outcome": task.status.value,
+                },
+                level=settings.memory_compression_level,
+            )
+
         episode = MemoryEntry(
             type="episodic",
-            content={
-                "task": task.dict(),
-                "subtasks": [s.dict() for s in subtasks],
-                "decisions": [d.dict() for d in decisions],
-                "outcome": task.status.value,
-            },
+            content=content,
             importance=self._calculate_importance(task, decisions),
             tags=["episode", task.status.value],
         )
 
-        self.episodic_memory.append(episode)
-        self.task_index[task.id].append(episode)
+        self._add_entry(episode, text)
+        self.store.save_entries([episode])
+        self._evict_over_budget("episodic")
 
         # Update Agent Performance Index
+        updated = set()
         for decision in decisions:
             for agent_type in decision.selected_agents:
+                updated.add(agent_type)
                 perf = self.agent_performance_index[agent_type]
                 perf["total_tasks"] += 1
 
@@ -89,6 +215,11 @@ class MemorySystem:
                     else 0.0
                 )
 
+        for agent_type in updated:
+            self.store.save_agent_performance(
+                agent_type_name(agent_type), self.agent_performance_index[agent_type]
+            )
+
         logger.info(
             "episode_stored",
             task_id=task.id,
@@ -96,8 +227,12 @@ class MemorySystem:
             importance=episode.importance,
         )
 
-        # Cleanup alte Einträge
-        self._cleanup_old_memories()
+        # Cleanup alte Einträge: voller Abgleich nach Zeitplan, sonst nur
+        # abgelaufene Einträge entnehmen
+        if time.monotonic() - self.last_full_cleanup >= settings.memory_cleanup_interval_seconds:
+            self._cleanup_old_memories()
+        else:
+            self._expire_memories()
 
     def store_knowledge(
         self, knowledge: Dict[str, Any], tags: List[str], importance: float = 0.5
@@ -117,7 +252,9 @@ class MemorySystem:
             tags=tags,
         )
 
-        self.semantic_memory.append(memory_entry)
+        self._add_entry(memory_entry)
+        self.store.save_entries([memory_entry])
+        self._evict_over_budget("semantic")
 
         logger.info(
             "knowledge_stored",
@@ -144,7 +281,9 @@ class MemorySystem:
             metadata={"performance": performance},
         )
 
-        self.procedural_memory.append(memory_entry)
+        self._add_entry(memory_entry)
+        self.store.save_entries([memory_entry])
+        self._evict_over_budget("procedural")
 
         logger.info(
             "workflow_stored",
@@ -158,6 +297,10 @@ class MemorySystem:
         """
         Ruft relevante Episoden ab
 
+        Mit Suchbegriff werden die Episoden über den BM25-Index nach
+        Relevanz gerankt (gemischt mit Wichtigkeit und Aktualität), ohne
+        Suchbegriff nach Wichtigkeit und Zeitpunkt.
+
         Args:
             query: Suchbegriff (optional)
             limit: Maximum anzahl Ergebnisse
@@ -165,23 +308,55 @@ class MemorySystem:
         Returns:
             Liste von Memory-Einträgen
         """
-        # Vereinfachte Suche - in Produktion würde man Vector-Search nutzen
-        episodes = sorted(
-            self.episodic_memory,
-            key=lambda e: (e.importance, e.timestamp),
-            reverse=True,
+        if not query:
+            return self._recalled(
+                heapq.nlargest(
+                    limit, self.episodic_memory, key=lambda e: (e.importance, e.timestamp)
+                )
+            )
+
+        ranked = self.episode_index.search(
+            query,
+            limit,
+            importance_weight=settings.memory_recall_importance_weight,
+            recency_weight=settings.memory_recall_recency_weight,
+            recency_half_life_days=settings.memory_recall_recency_half_life_days,
         )
+        return self._recalled([episode for episode, _ in ranked])
 
-        if query:
-            # Einfacher String-Match
-            episodes = [
-                e
-                for e in episodes
-                if query.lower() in str(e.content).lower()
-                or any(query.lower() in tag.lower() for tag in e.tags)
-            ]
+    def recall_similar(
+        self, query: str, k: int = 10, memory_type: Optional[str] = None
+    ) -> List[MemoryEntry]:
+        """
+        Semantische Suche über die Einbettungen (approximativ, IVF)
 
-        return episodes[:limit]
+        Args:
+            query: Freitext
+            k: Maximum Anzahl Ergebnisse
+            memory_type: Nur diese Schicht ("episodic", "semantic", "procedural")
+
+        Returns:
+            Liste von Memory-Einträgen, absteigend nach Kosinus-Ähnlichkeit
+        """
+        return [entry for entry, _ in self.recall_similar_scored(query, k, memory_type)]
+
+    def recall_similar_scored(
+        self, query: str, k: int = 10, memory_type: Optional[str] = None
+    ) -> List[Tuple[MemoryEntry, float]]:
+        """Wie recall_similar, liefert zusätzlich die Ähnlichkeit"""
+        if self.embedder is None or not query.strip() or k <= 0:
+            return []
+
+        vector = self.embedder.transform([query])[0]
+        layers = [memory_type] if memory_type else list(self.vector_indexes)
+        candidates = [
+            hit
+            for layer in layers
+            for hit in self.vector_indexes[layer].search(vector, k)
+        ]
+        hits = heapq.nlargest(k, candidates, key=lambda hit: hit[1])
+        self._recalled([entry for entry, _ in hits])
+        return hits
 
     def recall_knowledge(self, tags: Optional[List[str]] = None) -> List[MemoryEntry]:
         """
@@ -200,7 +375,7 @@ class MemorySystem:
                 k for k in knowledge if any(tag in k.tags for tag in tags)
             ]
 
-        return sorted(knowledge, key=lambda k: k.importance, reverse=True)
+        return self._recalled(sorted(knowledge, key=lambda k: k.importance, reverse=True))
 
     def recall_workflows(
         self, min_performance: float = 0.0, limit: int = 10
@@ -221,11 +396,13 @@ class MemorySystem:
             if w.metadata.get("performance", 0.0) >= min_performance
         ]
 
-        return sorted(
-            workflows,
-            key=lambda w: w.metadata.get("performance", 0.0),
-            reverse=True,
-        )[:limit]
+        return self._recalled(
+            sorted(
+                workflows,
+                key=lambda w: w.metadata.get("performance", 0.0),
+                reverse=True,
+            )[:limit]
+        )
 
     def get_agent_performance_history(self) -> Dict[AgentType, Dict[str, float]]:
         """
@@ -236,6 +413,237 @@ class MemorySystem:
         """
         return dict(self.agent_performance_index)
 
+    @staticmethod
+    def _episode_text(content: Mapping[str, Any]) -> str:
+        """Durchsuchbarer Text einer Episode (Beschreibungen, Begründungen, Agenten)"""
+        if isinstance(content, CompressedPayload):
+            content = content.decode()
+        task = content.get("task", {})
+        parts = [task.get("description", ""), content.get("outcome", "")]
+        parts.extend(subtask.get("description", "") for subtask in content.get("subtasks", []))
+        for decision in content.get("decisions", []):
+            parts.append(decision.get("reasoning", ""))
+            parts.extend(agent_type_name(a) for a in decision.get("selected_agents", []))
+
+        return " ".join(parts)
+
+    def _layer(self, memory_type: str) -> MemoryLayer:
+        return {
+            "episodic": self.episodic_memory,
+            "semantic": self.semantic_memory,
+            "procedural": self.procedural_memory,
+        }[memory_type]
+
+    @staticmethod
+    def _episode_task_id(episode: MemoryEntry) -> str:
+        if isinstance(episode.content, CompressedPayload):
+            return episode.content.summary["task_id"]
+        return episode.content["task"]["id"]
+
+    def _recalled(self, entries: List[MemoryEntry]) -> List[MemoryEntry]:
+        """
+        Verbucht abgerufene Einträge: Zugriff merken (angewendet gebündelt,
+        s. _apply_accesses) und Episoden-Inhalte in den Hot-Tier holen
+        """
+        self.access_tracker.record(entries)
+        if len(self.access_tracker) >= settings.memory_access_batch_size:
+            self._apply_accesses()
+
+        if self.payload_tier is not None:
+            for entry in entries:
+                if isinstance(entry.content, CompressedPayload):
+                    self.payload_tier.read(entry.content)
+        return entries
+
+    def _apply_accesses(self) -> None:
+        """
+        Schreibt gesammelte Zugriffe in access_count/last_accessed (ein Update
+        pro Eintrag statt pro Treffer), aktualisiert die Verdrängungs-Priorität
+        und persistiert nur diese beiden Felder gebündelt (ausgelagerte Inhalte
+        bleiben im Cold-Tier)
+        """
+        touched = []
+        for entry, count, last_accessed in self.access_tracker.drain():
+            # Inzwischen verfallen oder verdrängt
+            if entry not in self._layer(entry.type):
+                continue
+            entry.access_count += count
+            entry.last_accessed = datetime.fromtimestamp(last_accessed)
+            policy = self.eviction.get(entry.type)
+            if policy is not None:
+                policy.update(entry)
+            touched.append(entry)
+
+        if touched:
+            self.store.save_access(touched)
+
+    def _evict_over_budget(self, memory_type: str) -> None:
+        """Verdrängt Einträge mit niedrigster LFU-DA-Priorität, bis die Schicht im Budget ist"""
+        policy = self.eviction.get(memory_type)
+        if policy is None or not policy.over_budget():
+            return
+
+        self._apply_accesses()
+        layer = self._layer(memory_type)
+        removed = []
+        while policy.over_budget():
+            entry = layer.get(policy.pop())
+            if entry is not None and self._remove_entry(entry):
+                removed.append(entry.id)
+
+        if removed:
+            self.store.delete_entries(removed)
+            logger.debug("memories_evicted", memory_type=memory_type, entries=len(removed))
+
+    def _count_payload(self, episode: MemoryEntry, sign: int) -> None:
+        content = episode.content
+        if isinstance(content, CompressedPayload):
+            self.payload_stats["raw_bytes"] += sign * content.raw_bytes
+            self.payload_stats["stored_bytes"] += sign * content.compressed_bytes
+            self.payload_stats["compressed_episodes"] += sign
+
+    def _add_entry(self, entry: MemoryEntry, text: Optional[str] = None) -> None:
+        """
+        Fügt einen Eintrag seiner Schicht und allen Indizes hinzu
+
+        Args:
+            entry: Der Eintrag
+            text: Suchtext einer Episode, falls schon bekannt (spart das Dekodieren)
+        """
+        self._layer(entry.type).append(entry)
+
+        if entry.type == "episodic":
+            text = text if text is not None else self._episode_text(entry.content)
+            self.task_index[self._episode_task_id(entry)].append(entry)
+            self._index_episode(entry, text)
+            self._embed(entry, text)
+            self._count_payload(entry, 1)
+            if self.payload_tier is not None and isinstance(entry.content, CompressedPayload):
+                self.payload_tier.add(entry.id, entry.content)
+            if self._episode_expirable(entry):
+                self.episode_expiry.push(entry)
+        else:
+            self._embed(entry, self._content_text(entry.content, entry.tags))
+            if entry.type == "semantic" and self._knowledge_expirable(entry):
+                self.knowledge_candidates.append(entry)
+
+        policy = self.eviction.get(entry.type)
+        if policy is not None:
+            policy.update(entry)
+
+    def _remove_entry(self, entry: MemoryEntry) -> bool:
+        """
+        Entfernt einen Eintrag aus seiner Schicht und allen Indizes (ohne Backend)
+
+        Returns:
+            Ob der Eintrag noch gespeichert war
+        """
+        if not self._layer(entry.type).remove(entry):
+            return False
+
+        policy = self.eviction.get(entry.type)
+        if policy is not None:
+            policy.remove(entry.id)
+
+        if entry.type == "episodic":
+            task_id = self._episode_task_id(entry)
+            episodes = self.task_index.get(task_id, [])
+            if entry in episodes:
+                episodes.remove(entry)
+            if not episodes:
+                self.task_index.pop(task_id, None)
+            self.episode_index.remove(entry.id)
+            self._count_payload(entry, -1)
+            if self.payload_tier is not None and isinstance(entry.content, CompressedPayload):
+                self.payload_tier.discard(entry.content)
+        self._unembed(entry)
+        return True
+
+    def _restore(self) -> None:
+        """Lädt Einträge und Agent-Performance aus dem Backend"""
+        for entry in self.store.load_entries():
+            self._add_entry(entry)
+        for name, stats in self.store.load_agent_performance().items():
+            self.agent_performance_index[resolve_agent_type(name)].update(stats)
+        # Budget kann seit dem letzten Lauf verkleinert worden sein
+        for memory_type in self.eviction:
+            self._evict_over_budget(memory_type)
+
+    def flush(self) -> None:
+        """Wendet gesammelte Zugriffe an und wartet, bis das Backend alles persistiert hat"""
+        self._apply_accesses()
+        self.store.flush()
+
+    def close(self) -> None:
+        """Persistiert ausstehende Schreibvorgänge und schließt Backend und Cold-Tier"""
+        self._apply_accesses()
+        self.store.close()
+        if self.payload_tier is not None:
+            self.payload_tier.close()
+
+    @staticmethod
+    def _content_text(content: Dict[str, Any], tags: List[str]) -> str:
+        """Text für die Einbettung von Wissen und Workflows (Werte plus Tags)"""
+        parts = [str(value) for value in content.values()]
+        parts.extend(tags)
+        return " ".join(parts)
+
+    def _embed(self, entry: MemoryEntry, text: str) -> None:
+        """Bettet einen Eintrag ein und legt ihn im Vektorindex seiner Schicht ab"""
+        if self.embedder is None:
+            return
+        vector = self.embedder.transform([text])[0]
+        self.vector_indexes[entry.type].add(entry.id, vector, entry)
+
+    def _unembed(self, entry: MemoryEntry) -> None:
+        if self.embedder is not None:
+            self.vector_indexes[entry.type].remove(entry.id)
+
+    def save_vector_indexes(self, directory: Union[str, Path]) -> Path:
+        """
+        Speichert die Vektorindizes (ein Unterverzeichnis pro Schicht)
+
+        Returns:
+            Zielverzeichnis
+        """
+        directory = Path(directory)
+        for layer, index in self.vector_indexes.items():
+            index.save(directory / layer)
+        return directory
+
+    def load_vector_indexes(self, directory: Union[str, Path], mmap: bool = True) -> None:
+        """
+        Lädt gespeicherte Vektorindizes (per Memory-Mapping)
+
+        Schlüssel werden den aktuell gespeicherten Einträgen zugeordnet;
+        Vektoren ohne Eintrag werden entfernt.
+        """
+        directory = Path(directory)
+        layers = {
+            "episodic": self.episodic_memory,
+            "semantic": self.semantic_memory,
+            "procedural": self.procedural_memory,
+        }
+        for layer, entries in layers.items():
+            if not (directory / layer / "index.json").exists():
+                continue
+            index = VectorIndex.load(directory / layer, mmap=mmap)
+            by_id = {entry.id: entry for entry in entries}
+            index.items = [by_id.get(key) for key in index.keys]
+            for key in [key for key in index.keys if key not in by_id]:
+                index.remove(key)
+            self.vector_indexes[layer] = index
+
+    def _index_episode(self, episode: MemoryEntry, text: str) -> None:
+        self.episode_index.add(
+            episode.id,
+            episode,
+            text,
+            episode.tags,
+            importance=episode.importance,
+            timestamp=episode.timestamp.timestamp(),
+        )
+
     def _calculate_importance(
         self, task: Task, decisions: List[OrchestrationDecision]
     ) -> float:
@@ -274,25 +682,67 @@ class MemorySystem:
 
         return min(importance, 1.0)
 
-    def _cleanup_old_memories(self) -> None:
+    @staticmethod
+    def _episode_expirable(episode: MemoryEntry) -> bool:
+        return episode.importance <= EPISODE_RETAIN_IMPORTANCE
+
+    @staticmethod
+    def _knowledge_expirable(knowledge: MemoryEntry) -> bool:
+        return (
+            knowledge.access_count <= KNOWLEDGE_RETAIN_ACCESS_COUNT
+            and knowledge.importance <= KNOWLEDGE_RETAIN_IMPORTANCE
+        )
+
+    def _expire_memories(self) -> None:
         """
-        Entfernt alte, unwichtige Erinnerungen basierend auf Retention-Policy
+        Entfernt abgelaufene Erinnerungen über die Verfallsindizes
+
+        Entnimmt nur Episoden, deren Zeitpunkt vor dem Retention-Cutoff liegt
+        (O(k log n) für k abgelaufene), und die seit dem letzten Aufruf
+        gespeicherten Wissens-Kandidaten.
         """
-        cutoff_date = datetime.now() - timedelta(days=settings.memory_retention_days)
+        # Zugriffszahlen aktuell halten (Regel access_count > 5 für Wissen)
+        self._apply_accesses()
+        cutoff = datetime.now() - timedelta(days=settings.memory_retention_days)
+        removed = []
 
         # Episodisches Gedächtnis - behalte nur wichtige oder neue
-        self.episodic_memory = [
-            e
-            for e in self.episodic_memory
-            if e.timestamp > cutoff_date or e.importance > 0.7
-        ]
+        for e in self.episode_expiry.pop_expired(cutoff.timestamp()):
+            if self._episode_expirable(e) and self._remove_entry(e):
+                removed.append(e.id)
+                self.retention_stats["expired_episodes"] += 1
 
         # Semantisches Gedächtnis - behalte häufig genutzte oder wichtige
-        self.semantic_memory = [
-            s
-            for s in self.semantic_memory
-            if s.access_count > 5 or s.importance > 0.6
-        ]
+        while self.knowledge_candidates:
+            s = self.knowledge_candidates.popleft()
+            if self._knowledge_expirable(s) and self._remove_entry(s):
+                removed.append(s.id)
+                self.retention_stats["expired_knowledge"] += 1
+
+        if removed:
+            self.store.delete_entries(removed)
+            logger.info("memories_expired", entries=len(removed))
+
+    def _cleanup_old_memories(self) -> None:
+        """
+        Entfernt alte, unwichtige Erinnerungen basierend auf Retention-Policy
+
+        Voller Abgleich: baut die Verfallsindizes aus dem aktuellen Zustand
+        aller Einträge neu auf (erfasst auch nachträglich geänderte Zeitpunkte,
+        Wichtigkeiten oder Zugriffszahlen) und entfernt dann Abgelaufenes.
+        O(n) - läuft nur alle `memory_cleanup_interval_seconds`.
+        """
+        self._apply_accesses()
+        self.episode_expiry.rebuild(
+            e for e in self.episodic_memory if self._episode_expirable(e)
+        )
+        self.knowledge_candidates = deque(
+            s for s in self.semantic_memory if self._knowledge_expirable(s)
+        )
+        self.last_full_cleanup = time.monotonic()
+        self.retention_stats["full_cleanups"] += 1
+
+        self._expire_memories()
 
         logger.info("memory_cleanup_completed")
 
@@ -304,4 +754,29 @@ class MemorySystem:
             "procedural_memory_size": len(self.procedural_memory),
             "total_tasks_tracked": len(self.task_index),
             "agents_tracked": len(self.agent_performance_index),
+            "episode_payload": {
+                **self.payload_stats,
+                "compression_ratio": round(
+                    self.payload_stats["raw_bytes"] / self.payload_stats["stored_bytes"], 2
+                )
+                if self.payload_stats["stored_bytes"]
+                else None,
+            },
+            "payload_tier": self.payload_tier.get_metrics() if self.payload_tier else None,
+            "store": self.store.get_metrics(),
+            "retention": {
+                "pending_episodes": len(self.episode_expiry),
+                "pending_knowledge": len(self.knowledge_candidates),
+                **self.retention_stats,
+            },
+            "episode_index": self.episode_index.get_metrics(),
+            "vector_indexes": {
+                layer: index.get_metrics() for layer, index in self.vector_indexes.items()
+            },
+            "access": {
+                "pending": len(self.access_tracker),
+                "recorded": self.access_tracker.recorded,
+                "applied_batches": self.access_tracker.applied_batches,
+            },
+            "eviction": {layer: policy.get_metrics() for layer, policy in self.eviction.items()},
         }
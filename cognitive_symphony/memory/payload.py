@@ -0,0 +1,113 @@
+"""
+Payload - Komprimierte Episoden-Inhalte
+
+- CompressedPayload: Inhalt als zlib-komprimiertes JSON (doppelte LLM-Texte,
+  z.B. in `result` und `reasoning`, kosten so kaum zusätzlich) plus eine
+  kleine, immer dekodierte Zusammenfassung für Indizes
+- Lesender Zugriff wie auf ein Dict (Mapping); der volle Inhalt wird erst
+  beim Zugriff dekodiert und nicht im Speicher gehalten
+- Der Blob kann von einem PayloadTier (tiering.py) auf Platte ausgelagert
+  und beim Zugriff transparent zurückgeholt werden
+"""
+
+import json
+import zlib
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Iterator, Mapping, Optional
+
+# zlib-Stufe: 6 ist der Standard (gutes Verhältnis von Zeit zu Größe)
+COMPRESSION_LEVEL = 6
+
+
+def _json_default(value: Any) -> Any:
+    """JSON-Kodierung für Werte aus Model.dict() (Zeitpunkte, Enums, Sonstiges)"""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset, tuple)):
+        return list(value)
+    return str(value)
+
+
+def encode_json(content: Any) -> bytes:
+    """Kompaktes UTF-8-JSON"""
+    return json.dumps(
+        content, default=_json_default, separators=(",", ":"), ensure_ascii=False
+    ).encode("utf-8")
+
+
+class CompressedPayload(Mapping):
+    """
+    Komprimierter Inhalt eines Memory-Eintrags
+
+    `summary` enthält die für Indizes und Verwaltung nötigen Felder (z.B.
+    Task-ID) und ist immer verfügbar. Jeder Lesezugriff auf den Inhalt
+    (`payload["task"]`, `.get()`, Iteration) dekodiert den Blob; wer mehrere
+    Felder braucht, ruft einmal `decode()` auf. Zeitpunkte und Enums liegen
+    nach dem Dekodieren als ISO-Strings bzw. Werte vor.
+
+    Ist der Payload bei einem Tier angemeldet (`tier`, `key`), liest `blob`
+    über den Tier; `_blob` ist dann None, solange er ausgelagert ist.
+    """
+
+    __slots__ = ("summary", "_blob", "size", "tier", "key")
+
+    def __init__(self, summary: Dict[str, Any], blob: bytes):
+        self.summary = summary
+        self._blob: Optional[bytes] = blob
+        self.size = len(blob)
+        self.tier = None
+        self.key: Optional[str] = None
+
+    @property
+    def blob(self) -> bytes:
+        if self.tier is not None:
+            return self.tier.read(self)
+        return self._blob
+
+    @classmethod
+    def encode(
+        cls,
+        content: Mapping[str, Any],
+        summary: Dict[str, Any],
+        level: int = COMPRESSION_LEVEL,
+    ) -> "CompressedPayload":
+        """
+        Komprimiert einen Inhalt
+
+        Args:
+            content: Voller Inhalt (JSON-serialisierbar, s. _json_default)
+            summary: Immer dekodierte Felder
+            level: zlib-Kompressionsstufe (1-9)
+        """
+        raw = encode_json(content)
+        return cls({**summary, "raw_bytes": len(raw)}, zlib.compress(raw, level))
+
+    def decode(self) -> Dict[str, Any]:
+        """Dekodiert den vollen Inhalt"""
+        return json.loads(zlib.decompress(self.blob))
+
+    @property
+    def raw_bytes(self) -> int:
+        return self.summary.get("raw_bytes", 0)
+
+    @property
+    def compressed_bytes(self) -> int:
+        return self.size
+
+    def __getitem__(self, key: str) -> Any:
+        return self.decode()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.decode())
+
+    def __len__(self) -> int:
+        return len(self.decode())
+
+    def __repr__(self) -> str:
+        return (
+            f"CompressedPayload({self.compressed_bytes} of {self.raw_bytes} bytes, "
+            f"summary={self.summary!r})"
+        )
@@ -0,0 +1,90 @@
+"""
+Retention - Datenstrukturen für den inkrementellen Verfall von Erinnerungen
+
+- MemoryLayer: Einträge einer Schicht in Einfügereihenfolge (wie bisher die
+  Liste), Entfernen in O(1)
+- RetentionQueue: zeitgeordneter Min-Heap der Einträge, die verfallen können;
+  der Cleanup entnimmt nur abgelaufene Einträge statt alle zu prüfen
+"""
+
+import heapq
+import itertools
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from cognitive_symphony.models import MemoryEntry
+
+
+class MemoryLayer:
+    """
+    Einträge einer Gedächtnis-Schicht
+
+    Verhält sich beim Lesen wie die frühere Liste (len, Iteration in
+    Einfügereihenfolge, Index-Zugriff), erlaubt aber Entfernen per ID in O(1).
+    Index-Zugriff ist O(n) und nur für Tests/Inspektion gedacht.
+    """
+
+    def __init__(self, entries: Iterable[MemoryEntry] = ()):
+        self._entries: Dict[str, MemoryEntry] = {}
+        for entry in entries:
+            self.append(entry)
+
+    def append(self, entry: MemoryEntry) -> None:
+        self._entries[entry.id] = entry
+
+    def remove(self, entry: MemoryEntry) -> bool:
+        """Entfernt einen Eintrag; liefert, ob er enthalten war"""
+        return self._entries.pop(entry.id, None) is not None
+
+    def get(self, entry_id: str) -> Optional[MemoryEntry]:
+        return self._entries.get(entry_id)
+
+    def __contains__(self, entry: object) -> bool:
+        return isinstance(entry, MemoryEntry) and self._entries.get(entry.id) is entry
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[MemoryEntry]:
+        return iter(self._entries.values())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[MemoryEntry, List[MemoryEntry]]:
+        return list(self._entries.values())[index]
+
+    def __repr__(self) -> str:
+        return f"MemoryLayer({len(self)} entries)"
+
+
+class RetentionQueue:
+    """
+    Min-Heap nach Verfallsschlüssel (z.B. Zeitpunkt in Unix-Sekunden)
+
+    Einträge werden mit ihrem Schlüssel zum Einfügezeitpunkt abgelegt. Beim
+    Entnehmen wird der aktuelle Schlüssel geprüft: ist er inzwischen größer
+    (Eintrag wurde aktualisiert), wird der Eintrag neu eingereiht.
+    Bereits anderweitig entfernte Einträge filtert der Aufrufer.
+    """
+
+    def __init__(self, key: Callable[[MemoryEntry], float]):
+        self.key = key
+        self.heap: List[Tuple[float, int, MemoryEntry]] = []
+        self._counter = itertools.count()
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+    def push(self, entry: MemoryEntry) -> None:
+        heapq.heappush(self.heap, (self.key(entry), next(self._counter), entry))
+
+    def rebuild(self, entries: Iterable[MemoryEntry]) -> None:
+        """Baut den Heap mit den aktuellen Schlüsseln neu auf (O(n))"""
+        self.heap = [(self.key(entry), next(self._counter), entry) for entry in entries]
+        heapq.heapify(self.heap)
+
+    def pop_expired(self, cutoff: float) -> Iterator[MemoryEntry]:
+        """Entnimmt alle Einträge mit Schlüssel <= cutoff (O(k log n))"""
+        while self.heap and self.heap[0][0] <= cutoff:
+            _, _, entry = heapq.heappop(self.heap)
+            if self.key(entry) > cutoff:
+                self.push(entry)
+                continue
+            yield entry
@@ -0,0 +1,416 @@
+"""
+Memory Storage - Austauschbare Persistenz für das MemorySystem
+
+- MemoryStore: Schnittstelle (Einträge speichern/löschen/laden,
+  Agent-Performance); das MemorySystem hält alle Einträge weiterhin im
+  Speicher und liest auf heißen Pfaden nur dort
+- InMemoryStore: Default ohne Persistenz (bisheriges Verhalten)
+- SQLiteMemoryStore: WAL-Modus, Schreiben über einen Hintergrund-Thread mit
+  Group Commit (viele store_*-Aufrufe pro Transaktion, executemany mit
+  vorbereiteten Statements), indizierte Spalten für Typ, Zeitpunkt,
+  Wichtigkeit und Tags; komprimierte Inhalte (CompressedPayload) werden als
+  BLOB unverändert übernommen
+"""
+
+import atexit
+import json
+import queue
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+import structlog
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.memory.payload import CompressedPayload
+from cognitive_symphony.models import MemoryEntry
+
+logger = structlog.get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS memory_entries (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    importance REAL NOT NULL,
+    access_count INTEGER NOT NULL DEFAULT 0,
+    payload TEXT NOT NULL,
+    content BLOB
+);
+CREATE INDEX IF NOT EXISTS idx_memory_type_timestamp ON memory_entries (type, timestamp);
+CREATE INDEX IF NOT EXISTS idx_memory_type_importance ON memory_entries (type, importance);
+CREATE TABLE IF NOT EXISTS memory_tags (
+    entry_id TEXT NOT NULL,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (entry_id, tag)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_memory_tags_tag ON memory_tags (tag, entry_id);
+CREATE TABLE IF NOT EXISTS agent_performance (
+    agent TEXT PRIMARY KEY,
+    stats TEXT NOT NULL
+);
+"""
+
+_UPSERT_ENTRY = (
+    "INSERT OR REPLACE INTO memory_entries "
+    "(id, type, timestamp, importance, access_count, payload, content) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+# Nur Zugriffszähler: Spalte und JSON-Payload, der Inhalt (BLOB) bleibt unberührt
+_UPDATE_ACCESS = (
+    "UPDATE memory_entries SET access_count = ?, "
+    "payload = json_set(payload, '$.access_count', ?, '$.last_accessed', ?) WHERE id = ?"
+)
+_DELETE_TAGS = "DELETE FROM memory_tags WHERE entry_id = ?"
+_INSERT_TAG = "INSERT OR IGNORE INTO memory_tags (entry_id, tag) VALUES (?, ?)"
+_DELETE_ENTRY = "DELETE FROM memory_entries WHERE id = ?"
+_UPSERT_PERFORMANCE = "INSERT OR REPLACE INTO agent_performance (agent, stats) VALUES (?, ?)"
+
+# Marker zum Beenden des Writer-Threads
+_STOP = object()
+
+
+def _serialize(entry: MemoryEntry) -> Tuple[str, Optional[bytes]]:
+    """JSON des Eintrags; komprimierte Inhalte separat (JSON enthält die Zusammenfassung)"""
+    if isinstance(entry.content, CompressedPayload):
+        return entry.copy(update={"content": entry.content.summary}).json(), entry.content.blob
+    return entry.json(), None
+
+
+def _deserialize(payload: str, content: Optional[bytes]) -> MemoryEntry:
+    entry = MemoryEntry.parse_raw(payload)
+    if content is not None:
+        entry.content = CompressedPayload(entry.content, content)
+    return entry
+
+
+class MemoryStore(ABC):
+    """Persistenz-Schnittstelle des MemorySystem"""
+
+    @abstractmethod
+    def save_entries(self, entries: Iterable[MemoryEntry]) -> None:
+        """Speichert (oder ersetzt) Einträge"""
+
+    @abstractmethod
+    def save_access(self, entries: Iterable[MemoryEntry]) -> None:
+        """Aktualisiert nur access_count/last_accessed bereits gespeicherter Einträge"""
+
+    @abstractmethod
+    def delete_entries(self, entry_ids: Iterable[str]) -> None:
+        """Löscht Einträge"""
+
+    @abstractmethod
+    def save_agent_performance(self, agent: str, stats: Dict[str, Any]) -> None:
+        """Speichert die Performance-Statistik eines Agenten"""
+
+    @abstractmethod
+    def load_entries(self, memory_type: Optional[str] = None) -> List[MemoryEntry]:
+        """Lädt Einträge (optional einer Schicht), aufsteigend nach Zeitpunkt"""
+
+    @abstractmethod
+    def load_agent_performance(self) -> Dict[str, Dict[str, Any]]:
+        """Lädt die Performance-Statistiken aller Agenten"""
+
+    def flush(self) -> None:
+        """Wartet, bis alle ausstehenden Schreibvorgänge persistiert sind"""
+
+    def close(self) -> None:
+        """Schreibt ausstehende Vorgänge und gibt Ressourcen frei"""
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {"backend": "memory"}
+
+
+class InMemoryStore(MemoryStore):
+    """Keine Persistenz - die Listen des MemorySystem sind der Speicher"""
+
+    def save_entries(self, entries: Iterable[MemoryEntry]) -> None:
+        pass
+
+    def save_access(self, entries: Iterable[MemoryEntry]) -> None:
+        pass
+
+    def delete_entries(self, entry_ids: Iterable[str]) -> None:
+        pass
+
+    def save_agent_performance(self, agent: str, stats: Dict[str, Any]) -> None:
+        pass
+
+    def load_entries(self, memory_type: Optional[str] = None) -> List[MemoryEntry]:
+        return []
+
+    def load_agent_performance(self) -> Dict[str, Dict[str, Any]]:
+        return {}
+
+
+class SQLiteMemoryStore(MemoryStore):
+    """
+    SQLite-Backend mit Group Commit
+
+    Schreibende Aufrufe serialisieren den Eintrag und legen ihn nur in eine
+    Queue; ein Writer-Thread mit eigener Verbindung sammelt bis zu
+    `batch_size` Vorgänge (bzw. wartet höchstens `flush_interval` Sekunden
+    auf weitere) und schreibt sie in einer Transaktion. Der aufrufende
+    Thread (Event-Loop) wartet also nie auf die Festplatte.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        batch_size: int = 256,
+        flush_interval: float = 0.05,
+    ):
+        """
+        Args:
+            path: Pfad zur Datenbank-Datei
+            batch_size: Maximale Vorgänge pro Transaktion
+            flush_interval: Wartezeit in Sekunden auf weitere Vorgänge eines Batches
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+
+        # Lese-Verbindung (Laden beim Start); WAL erlaubt paralleles Lesen
+        # neben dem Writer
+        self.connection = self._connect()
+        self.connection.executescript(_SCHEMA)
+
+        self.queue: "queue.Queue[Any]" = queue.Queue()
+        self.stats = {
+            "queued_operations": 0,
+            "written_operations": 0,
+            "transactions": 0,
+            "write_errors": 0,
+        }
+        self.closed = False
+
+        self._writer = threading.Thread(
+            target=self._write_loop, name="memory-store-writer", daemon=True
+        )
+        self._writer.start()
+        # Ausstehende Batches beim Beenden des Prozesses noch schreiben
+        atexit.register(self.close)
+
+        logger.info("sqlite_memory_store_opened", path=str(self.path))
+
+    def _connect(self) -> sqlite3.Connection:
+        # Python cached vorbereitete Statements pro Verbindung (gleicher SQL-Text)
+        connection = sqlite3.connect(
+            self.path, check_same_thread=False, cached_statements=64
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    # Schreiben
+
+    def _enqueue(self, operation: Tuple[str, Any]) -> None:
+        if self.closed:
+            raise RuntimeError("SQLiteMemoryStore ist geschlossen")
+        self.stats["queued_operations"] += 1
+        self.queue.put(operation)
+
+    def save_entries(self, entries: Iterable[MemoryEntry]) -> None:
+        for entry in entries:
+            payload, content = _serialize(entry)
+            self._enqueue(
+                (
+                    "upsert",
+                    (
+                        entry.id,
+                        entry.type,
+                        entry.timestamp.timestamp(),
+                        entry.importance,
+                        entry.access_count,
+                        payload,
+                        content,
+                        list(dict.fromkeys(entry.tags)),
+                    ),
+                )
+            )
+
+    def save_access(self, entries: Iterable[MemoryEntry]) -> None:
+        for entry in entries:
+            self._enqueue(
+                (
+                    "access",
+                    (
+                        entry.access_count,
+                        entry.access_count,
+                        entry.last_accessed.isoformat(),
+                        entry.id,
+                    ),
+                )
+            )
+
+    def delete_entries(self, entry_ids: Iterable[str]) -> None:
+        for entry_id in entry_ids:
+            self._enqueue(("delete", entry_id))
+
+    def save_agent_performance(self, agent: str, stats: Dict[str, Any]) -> None:
+        self._enqueue(("performance", (agent, json.dumps(stats))))
+
+    def _write_loop(self) -> None:
+        connection = self._connect()
+        stop = False
+        while not stop:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + self.flush_interval
+            while len(batch) < self.batch_size and batch[-1] is not _STOP:
+                try:
+                    batch.append(self.queue.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            stop = batch[-1] is _STOP
+            operations = [op for op in batch if op is not _STOP]
+            try:
+                if operations:
+                    self._write_batch(connection, operations)
+            except sqlite3.Error as e:
+                self.stats["write_errors"] += 1
+                logger.error("memory_store_write_failed", operations=len(operations), error=str(e))
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+
+        connection.close()
+
+    def _write_batch(
+        self, connection: sqlite3.Connection, operations: List[Tuple[str, Any]]
+    ) -> None:
+        """Schreibt einen Batch in einer Transaktion (gleichartige Vorgänge per executemany)"""
+        with connection:
+            start = 0
+            while start < len(operations):
+                kind = operations[start][0]
+                end = start
+                while end < len(operations) and operations[end][0] == kind:
+                    end += 1
+                rows = [op[1] for op in operations[start:end]]
+
+                if kind == "upsert":
+                    connection.executemany(_UPSERT_ENTRY, [row[:7] for row in rows])
+                    connection.executemany(_DELETE_TAGS, [(row[0],) for row in rows])
+                    connection.executemany(
+                        _INSERT_TAG, [(row[0], tag) for row in rows for tag in row[7]]
+                    )
+                elif kind == "access":
+                    connection.executemany(_UPDATE_ACCESS, rows)
+                elif kind == "delete":
+                    connection.executemany(_DELETE_TAGS, [(row,) for row in rows])
+                    connection.executemany(_DELETE_ENTRY, [(row,) for row in rows])
+                else:
+                    connection.executemany(_UPSERT_PERFORMANCE, rows)
+                start = end
+
+        self.stats["written_operations"] += len(operations)
+        self.stats["transactions"] += 1
+
+    def flush(self) -> None:
+        if not self.closed:
+            self.queue.join()
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        self.closed = True
+        atexit.unregister(self.close)
+        self.queue.put(_STOP)
+        self._writer.join()
+        self.connection.close()
+
+        logger.info("sqlite_memory_store_closed", **self.stats)
+
+    # Lesen (beim Start bzw. außerhalb heißer Pfade)
+
+    def load_entries(self, memory_type: Optional[str] = None) -> List[MemoryEntry]:
+        if memory_type:
+            rows = self.connection.execute(
+                "SELECT payload, content FROM memory_entries WHERE type = ? ORDER BY timestamp",
+                (memory_type,),
+            )
+        else:
+            rows = self.connection.execute(
+                "SELECT payload, content FROM memory_entries ORDER BY timestamp"
+            )
+        return [_deserialize(payload, content) for payload, content in rows]
+
+    def query_entries(
+        self,
+        memory_type: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+        since: Optional[datetime] = None,
+        min_importance: Optional[float] = None,
+        limit: int = 100,
+    ) -> List[MemoryEntry]:
+        """
+        Gefilterte Abfrage über die indizierten Spalten (ohne Umweg über den
+        Speicher, z.B. für Auswertungen)
+
+        Returns:
+            Einträge absteigend nach Wichtigkeit, dann Zeitpunkt
+        """
+        clauses: List[str] = []
+        parameters: List[Any] = []
+        if memory_type:
+            clauses.append("type = ?")
+            parameters.append(memory_type)
+        if since is not None:
+            clauses.append("timestamp >= ?")
+            parameters.append(since.timestamp())
+        if min_importance is not None:
+            clauses.append("importance >= ?")
+            parameters.append(min_importance)
+        if tags:
+            clauses.append(
+                "id IN (SELECT entry_id FROM memory_tags WHERE tag IN "
+                f"({', '.join('?' for _ in tags)}))"
+            )
+            parameters.extend(tags)
+
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.connection.execute(
+            f"SELECT payload, content FROM memory_entries{where} "
+            "ORDER BY importance DESC, timestamp DESC LIMIT ?",
+            (*parameters, limit),
+        )
+        return [_deserialize(payload, content) for payload, content in rows]
+
+    def load_agent_performance(self) -> Dict[str, Dict[str, Any]]:
+        rows = self.connection.execute("SELECT agent, stats FROM agent_performance")
+        return {agent: json.loads(stats) for agent, stats in rows}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        return {
+            "backend": "sqlite",
+            "path": str(self.path),
+            "pending_operations": self.queue.unfinished_tasks,
+            **self.stats,
+            "avg_batch_size": round(
+                self.stats["written_operations"] / self.stats["transactions"], 2
+            )
+            if self.stats["transactions"]
+            else 0.0,
+        }
+
+
+def create_memory_store(backend: Optional[str] = None) -> MemoryStore:
+    """
+    Erzeugt das konfigurierte Backend (`memory_backend`: "memory" oder "sqlite")
+    """
+    backend = backend or settings.memory_backend
+    if backend == "sqlite":
+        return SQLiteMemoryStore(
+            settings.memory_sqlite_path,
+            batch_size=settings.memory_write_batch_size,
+            flush_interval=settings.memory_write_flush_seconds,
+        )
+    if backend == "memory":
+        return InMemoryStore()
+
+    raise ValueError(f"Unbekanntes Memory-Backend: {backend}")
@@ -0,0 +1,275 @@
+"""
+Text Index - Inkrementeller invertierter Index mit BM25-Ranking
+
+- Posting-Listen pro Token als kompakte Arrays (Dokument-Nummer, Term-Frequenz),
+  Einfügen in O(Tokens des Dokuments)
+- Gelöschte Dokumente werden als Tombstone markiert und bei Bedarf
+  kompaktiert (Neunummerierung aller lebenden Dokumente)
+- Bewertung vektorisiert mit NumPy; das Ergebnis mischt normierten BM25-Score
+  mit Wichtigkeit und Aktualität des Eintrags
+"""
+
+import math
+import time
+from array import array
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+from cognitive_symphony.agents.capability_index import tokenize
+
+# BM25-Parameter (Okapi-Standardwerte)
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+# Tags zählen wie mehrfaches Vorkommen im Text
+TAG_BOOST = 2
+
+# Kompaktierung, sobald mindestens so viele Tombstones wie lebende Dokumente
+# existieren (und mindestens diese Anzahl)
+_MIN_COMPACTION = 1024
+
+_SECONDS_PER_DAY = 86400.0
+
+
+class BM25Index:
+    """
+    Invertierter Index über Text und Tags mit BM25-Ranking
+
+    Dokumente werden über einen eindeutigen Schlüssel (z.B. MemoryEntry.id)
+    verwaltet und liefern beim Suchen das hinterlegte Objekt zurück.
+    """
+
+    def __init__(self, clock: Optional[Callable[[], float]] = None):
+        """
+        Args:
+            clock: Zeitquelle in Unix-Sekunden für die Aktualität (Default: time.time)
+        """
+        self.clock = clock or time.time
+
+        # Posting-Listen: Token -> (Dokument-Nummern, Term-Frequenzen)
+        self.postings: Dict[str, Tuple[array, array]] = {}
+        # Lebende Dokumente pro Token (Document Frequency für die IDF)
+        self.document_frequency: Dict[str, int] = {}
+
+        # Pro Dokument-Nummer
+        self.keys: List[Optional[str]] = []
+        self.items: List[Any] = []
+        self.lengths = array("I")
+        self.importance = array("f")
+        self.timestamps = array("d")
+        self.alive = bytearray()
+
+        self.numbers: Dict[str, int] = {}
+        self.total_length = 0
+        self.tombstones = 0
+
+    def __len__(self) -> int:
+        return len(self.numbers)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.numbers
+
+    @staticmethod
+    def _term_frequencies(text: str, tags: Iterable[str]) -> Dict[str, int]:
+        frequencies: Dict[str, int] = {}
+        for token in tokenize(text):
+            frequencies[token] = frequencies.get(token, 0) + 1
+        for tag in tags:
+            for token in tokenize(tag):
+                frequencies[token] = frequencies.get(token, 0) + TAG_BOOST
+        return frequencies
+
+    def add(
+        self,
+        key: str,
+        item: Any,
+        text: str,
+        tags: Iterable[str] = (),
+        importance: float = 0.5,
+        timestamp: Optional[float] = None,
+    ) -> None:
+        """
+        Indexiert ein Dokument (ein vorhandenes mit gleichem Schlüssel wird ersetzt)
+
+        Args:
+            key: Eindeutiger Schlüssel
+            item: Objekt, das die Suche zurückgibt
+            text: Zu indexierender Text
+            tags: Tags (stärker gewichtet als Text)
+            importance: Wichtigkeit 0.0-1.0 für das Ranking
+            timestamp: Zeitpunkt in Unix-Sekunden (Default: jetzt)
+        """
+        if key in self.numbers:
+            self.remove(key)
+
+        frequencies = self._term_frequencies(text, tags)
+        number = len(self.keys)
+        length = sum(frequencies.values())
+
+        for token, frequency in frequencies.items():
+            posting = self.postings.get(token)
+            if posting is None:
+                posting = self.postings[token] = (array("I"), array("H"))
+                self.document_frequency[token] = 0
+            posting[0].append(number)
+            posting[1].append(min(frequency, 0xFFFF))
+            self.document_frequency[token] += 1
+
+        self.keys.append(key)
+        self.items.append(item)
+        self.lengths.append(length)
+        self.importance.append(importance)
+        self.timestamps.append(self.clock() if timestamp is None else timestamp)
+        self.alive.append(1)
+
+        self.numbers[key] = number
+        self.total_length += length
+
+    def remove(self, key: str) -> bool:
+        """
+        Entfernt ein Dokument (Tombstone, Posting-Listen werden später kompaktiert)
+
+        Returns:
+            Ob das Dokument im Index war
+        """
+        number = self.numbers.pop(key, None)
+        if number is None:
+            return False
+
+        self.alive[number] = 0
+        self.total_length -= self.lengths[number]
+        self.keys[number] = None
+        self.items[number] = None
+        self.tombstones += 1
+
+        if self.tombstones >= max(_MIN_COMPACTION, len(self.numbers)):
+            self.compact()
+
+        return True
+
+    def compact(self) -> None:
+        """Entfernt Tombstones aus allen Posting-Listen und nummeriert neu"""
+        if not self.tombstones:
+            return
+
+        alive = np.frombuffer(self.alive, dtype=np.uint8).astype(bool)
+        renumber = np.cumsum(alive, dtype=np.int64) - 1
+
+        postings: Dict[str, Tuple[array, array]] = {}
+        document_frequency: Dict[str, int] = {}
+        for token, (docs, frequencies) in self.postings.items():
+            numbers = np.frombuffer(docs, dtype=np.uint32)
+            keep = alive[numbers]
+            if not keep.any():
+                continue
+            postings[token] = (
+                array("I", renumber[numbers[keep]].astype(np.uint32).tobytes()),
+                array("H", np.frombuffer(frequencies, dtype=np.uint16)[keep].tobytes()),
+            )
+            document_frequency[token] = int(keep.sum())
+
+        self.postings = postings
+        self.document_frequency = document_frequency
+        self.keys = [k for k, a in zip(self.keys, self.alive) if a]
+        self.items = [i for i, a in zip(self.items, self.alive) if a]
+        self.lengths = array("I", np.frombuffer(self.lengths, dtype=np.uint32)[alive].tobytes())
+        self.importance = array(
+            "f", np.frombuffer(self.importance, dtype=np.float32)[alive].tobytes()
+        )
+        self.timestamps = array(
+            "d", np.frombuffer(self.timestamps, dtype=np.float64)[alive].tobytes()
+        )
+        self.alive = bytearray(b"\x01" * len(self.keys))
+        self.numbers = {key: number for number, key in enumerate(self.keys)}
+        self.tombstones = 0
+
+    def _bm25(self, tokens: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """BM25-Scores aller Dokumente mit mindestens einem Query-Token"""
+        documents = len(self.numbers)
+        average_length = self.total_length / documents
+        lengths = np.frombuffer(self.lengths, dtype=np.uint32)
+        alive = np.frombuffer(self.alive, dtype=np.uint8)
+
+        all_numbers: List[np.ndarray] = []
+        all_scores: List[np.ndarray] = []
+        for token in dict.fromkeys(tokens):
+            posting = self.postings.get(token)
+            frequency = self.document_frequency.get(token, 0)
+            if posting is None or frequency == 0:
+                continue
+
+            idf = math.log(1 + (documents - frequency + 0.5) / (frequency + 0.5))
+            numbers = np.frombuffer(posting[0], dtype=np.uint32)
+            tf = np.frombuffer(posting[1], dtype=np.uint16).astype(np.float32)
+            if self.tombstones:
+                live = alive[numbers].astype(bool)
+                numbers, tf = numbers[live], tf[live]
+
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * lengths[numbers] / average_length)
+            all_numbers.append(numbers)
+            all_scores.append(idf * tf * (BM25_K1 + 1) / (tf + norm))
+
+        if not all_numbers:
+            return np.empty(0, dtype=np.uint32), np.empty(0, dtype=np.float32)
+        if len(all_numbers) == 1:
+            return all_numbers[0], all_scores[0]
+
+        numbers, inverse = np.unique(np.concatenate(all_numbers), return_inverse=True)
+        scores = np.bincount(inverse, weights=np.concatenate(all_scores))
+        return numbers, scores
+
+    def search(
+        self,
+        query: str,
+        limit: int = 10,
+        importance_weight: float = 0.0,
+        recency_weight: float = 0.0,
+        recency_half_life_days: float = 30.0,
+    ) -> List[Tuple[Any, float]]:
+        """
+        Top-k-Suche
+
+        Der BM25-Score wird auf den besten Treffer normiert und mit
+        Wichtigkeit und Aktualität (exponentieller Zerfall mit Halbwertszeit)
+        gemischt; die Gewichte geben deren Anteil am Gesamtscore an.
+
+        Returns:
+            Liste von (Objekt, Score), absteigend nach Score
+        """
+        tokens = tokenize(query)
+        if not tokens or not self.numbers or limit <= 0:
+            return []
+
+        numbers, scores = self._bm25(tokens)
+        if len(numbers) == 0:
+            return []
+
+        text_weight = max(0.0, 1.0 - importance_weight - recency_weight)
+        blended = text_weight * scores / scores.max()
+        if importance_weight:
+            importance = np.frombuffer(self.importance, dtype=np.float32)[numbers]
+            blended = blended + importance_weight * importance
+        if recency_weight:
+            age_days = (
+                self.clock() - np.frombuffer(self.timestamps, dtype=np.float64)[numbers]
+            ) / _SECONDS_PER_DAY
+            half_life = max(recency_half_life_days, 1e-9)
+            blended = blended + recency_weight * np.exp2(-np.maximum(age_days, 0) / half_life)
+
+        # Partielle Auswahl der besten k, nur diese werden sortiert
+        if len(blended) > limit:
+            top = np.argpartition(-blended, limit - 1)[:limit]
+        else:
+            top = np.arange(len(blended))
+        top = top[np.argsort(-blended[top], kind="stable")]
+
+        return [(self.items[numbers[i]], float(blended[i])) for i in top]
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Größe des Index"""
+        return {
+            "documents": len(self.numbers),
+            "tokens": len(self.postings),
+            "postings": sum(len(docs) for docs, _ in self.postings.values()),
+            "tombstones": self.tombstones,
+        }
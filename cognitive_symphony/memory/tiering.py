@@ -0,0 +1,254 @@
+"""
+Tiering - Heiße und kalte Ablage komprimierter Episoden-Inhalte
+
+- ColdSegmentStore: append-only Segmentdateien mit Offset-Index im Speicher
+  (Schlüssel -> Segment, Offset, Länge); gelöschte Datensätze werden bei
+  überwiegend toten Segmenten kompaktiert
+- PayloadTier: größenbeschränkter Hot-Tier (LRU über die Blobs der
+  CompressedPayloads); verdrängte Blobs wandern in den Cold-Tier und werden
+  beim nächsten Zugriff transparent zurückgeholt
+
+Eintrags-Metadaten, Zusammenfassungen und Suchindizes bleiben im Speicher;
+ausgelagert wird nur der Inhalt.
+"""
+
+import shutil
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Optional, Set, Tuple, Union
+import structlog
+
+from cognitive_symphony.memory.payload import CompressedPayload
+
+logger = structlog.get_logger()
+
+# Segment wird kompaktiert, sobald dieser Anteil seiner Bytes gelöscht ist
+_COMPACTION_DEAD_RATIO = 0.5
+
+
+class ColdSegmentStore:
+    """
+    Append-only Ablage von Blobs in Segmentdateien
+
+    Geschrieben wird nur ans Ende des aktuellen Segments; ab
+    `segment_bytes` beginnt ein neues. Der Offset-Index liegt im Speicher.
+    """
+
+    def __init__(self, directory: Union[str, Path], segment_bytes: int = 64 * 1024 * 1024):
+        """
+        Args:
+            directory: Verzeichnis der Segmentdateien (wird angelegt)
+            segment_bytes: Zielgröße eines Segments in Bytes
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+
+        self.index: Dict[str, Tuple[int, int, int]] = {}
+        self.segment_keys: Dict[int, Set[str]] = {}
+        self.segment_sizes: Dict[int, int] = {}
+        self.dead_bytes: Dict[int, int] = {}
+
+        self.current = 0
+        self._writer: Optional[BinaryIO] = None
+        self._writer_dirty = False
+        self._readers: Dict[int, BinaryIO] = {}
+        self.compactions = 0
+
+        self._open_segment(0)
+
+    def _path(self, segment: int) -> Path:
+        return self.directory / f"segment-{segment:06d}.log"
+
+    def _open_segment(self, segment: int) -> None:
+        if self._writer is not None:
+            self._writer.close()
+        self.current = segment
+        self._writer = open(self._path(segment), "ab")
+        self._writer_dirty = False
+        self.segment_keys[segment] = set()
+        self.segment_sizes[segment] = 0
+        self.dead_bytes[segment] = 0
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def append(self, key: str, blob: bytes) -> None:
+        """Hängt einen Blob an (ein vorhandener mit gleichem Schlüssel wird ersetzt)"""
+        if key in self.index:
+            self.delete(key)
+        if self.segment_sizes[self.current] >= self.segment_bytes:
+            self._open_segment(self.current + 1)
+
+        offset = self.segment_sizes[self.current]
+        self._writer.write(blob)
+        self._writer_dirty = True
+
+        self.index[key] = (self.current, offset, len(blob))
+        self.segment_keys[self.current].add(key)
+        self.segment_sizes[self.current] += len(blob)
+
+    def read(self, key: str) -> bytes:
+        segment, offset, length = self.index[key]
+        if segment == self.current and self._writer_dirty:
+            self._writer.flush()
+            self._writer_dirty = False
+
+        reader = self._readers.get(segment)
+        if reader is None:
+            reader = self._readers[segment] = open(self._path(segment), "rb")
+        reader.seek(offset)
+        return reader.read(length)
+
+    def delete(self, key: str) -> bool:
+        """Entfernt einen Blob aus dem Index (Platz wird beim Kompaktieren frei)"""
+        location = self.index.pop(key, None)
+        if location is None:
+            return False
+
+        segment, _, length = location
+        self.segment_keys[segment].discard(key)
+        self.dead_bytes[segment] += length
+        if (
+            segment != self.current
+            and self.dead_bytes[segment] >= _COMPACTION_DEAD_RATIO * self.segment_sizes[segment]
+        ):
+            self._compact(segment)
+        return True
+
+    def _compact(self, segment: int) -> None:
+        """Kopiert die lebenden Blobs eines Segments ans Ende und löscht die Datei"""
+        for key in self.segment_keys[segment]:
+            blob = self.read(key)
+            del self.index[key]
+            self.append(key, blob)
+
+        reader = self._readers.pop(segment, None)
+        if reader is not None:
+            reader.close()
+        self._path(segment).unlink(missing_ok=True)
+        for table in (self.segment_keys, self.segment_sizes, self.dead_bytes):
+            del table[segment]
+        self.compactions += 1
+        logger.debug("cold_segment_compacted", segment=segment)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        for reader in self._readers.values():
+            reader.close()
+        self._readers.clear()
+
+    def get_metrics(self) -> Dict[str, Any]:
+        file_bytes = sum(self.segment_sizes.values())
+        return {
+            "entries": len(self.index),
+            "segments": len(self.segment_sizes),
+            "file_bytes": file_bytes,
+            "live_bytes": file_bytes - sum(self.dead_bytes.values()),
+            "compactions": self.compactions,
+        }
+
+
+class PayloadTier:
+    """
+    Hot-Tier für CompressedPayload-Blobs mit Auslagerung in einen ColdSegmentStore
+
+    Angemeldete Payloads lesen ihren Blob über `read()`: liegt er im Hot-Tier,
+    wird er als zuletzt genutzt markiert (Hit), sonst aus dem Cold-Tier
+    geladen und wieder aufgenommen (Miss). Überschreitet der Hot-Tier
+    `max_hot_bytes`, werden die am längsten ungenutzten Blobs verdrängt.
+    """
+
+    def __init__(
+        self,
+        max_hot_bytes: int,
+        directory: Union[str, Path, None] = None,
+        segment_bytes: int = 64 * 1024 * 1024,
+    ):
+        """
+        Args:
+            max_hot_bytes: Obergrenze der Blob-Bytes im Speicher
+            directory: Verzeichnis für Segmente (Default: temporär, beim Schließen gelöscht)
+            segment_bytes: Zielgröße eines Segments
+        """
+        self.max_hot_bytes = max_hot_bytes
+        if directory is not None:
+            Path(directory).mkdir(parents=True, exist_ok=True)
+        # Eigenes Verzeichnis pro Instanz (mehrere Worker können denselben Pfad nutzen)
+        self.cold = ColdSegmentStore(
+            tempfile.mkdtemp(prefix="memory-cold-", dir=directory), segment_bytes
+        )
+
+        self.hot: "OrderedDict[str, CompressedPayload]" = OrderedDict()
+        self.hot_bytes = 0
+        self.entries = 0
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def add(self, key: str, payload: CompressedPayload) -> None:
+        """Meldet einen Payload an und nimmt ihn in den Hot-Tier auf"""
+        payload.tier = self
+        payload.key = key
+        self.entries += 1
+        self._admit(payload)
+
+    def discard(self, payload: CompressedPayload) -> None:
+        """Entfernt einen Payload aus beiden Tiers (Blob wird wieder lokal gehalten)"""
+        if payload.tier is not self:
+            return
+        if payload._blob is None:
+            blob = self.cold.read(payload.key)
+        else:
+            blob = payload._blob
+            del self.hot[payload.key]
+            self.hot_bytes -= payload.size
+        self.cold.delete(payload.key)
+        self.entries -= 1
+        payload.tier = None
+        payload._blob = blob
+
+    def read(self, payload: CompressedPayload) -> bytes:
+        if payload._blob is not None:
+            self.stats["hits"] += 1
+            self.hot.move_to_end(payload.key)
+            return payload._blob
+
+        self.stats["misses"] += 1
+        payload._blob = self.cold.read(payload.key)
+        self._admit(payload)
+        return payload._blob
+
+    def _admit(self, payload: CompressedPayload) -> None:
+        self.hot[payload.key] = payload
+        self.hot_bytes += payload.size
+
+        while self.hot_bytes > self.max_hot_bytes and len(self.hot) > 1:
+            _, evicted = self.hot.popitem(last=False)
+            # Blobs sind unveränderlich: einmal geschrieben, bleibt die Kopie gültig
+            if evicted.key not in self.cold:
+                self.cold.append(evicted.key, evicted._blob)
+            evicted._blob = None
+            self.hot_bytes -= evicted.size
+            self.stats["evictions"] += 1
+
+    def close(self) -> None:
+        """Schließt die Segmente und löscht sie (Quelle der Wahrheit ist der MemoryStore)"""
+        self.cold.close()
+        shutil.rmtree(self.cold.directory, ignore_errors=True)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            "hot_entries": len(self.hot),
+            "hot_bytes": self.hot_bytes,
+            "max_hot_bytes": self.max_hot_bytes,
+            "cold_entries": self.entries - len(self.hot),
+            "cold": self.cold.get_metrics(),
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else None,
+        }
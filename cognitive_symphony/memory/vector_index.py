@@ -0,0 +1,400 @@
+"""
+Vector Index - Approximative Nächste-Nachbarn-Suche (IVF) über float32-Vektoren
+
+- Alle Vektoren liegen zeilenweise in einem zusammenhängenden float32-Array
+- Ab `train_threshold` Vektoren werden per sphärischem k-Means Zentroiden
+  gelernt; jede Zeile gehört zu genau einer Liste (Inverted File). Die Zeilen
+  sind nach Liste sortiert, eine Suche multipliziert nur die zusammenhängenden
+  Blöcke der `probes` nächsten Listen (plus seither eingefügte Zeilen)
+- Darunter (und als Referenz) exakte Brute-Force-Suche
+- Inkrementelles Einfügen, Löschen per Tombstone mit Kompaktierung,
+  Persistenz als .npy-Dateien, die per Memory-Mapping geladen werden können
+"""
+
+import json
+import math
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+import numpy as np
+import structlog
+
+logger = structlog.get_logger()
+
+# Neu trainieren, wenn der Index seit dem letzten Training so stark gewachsen ist
+RETRAIN_GROWTH = 4.0
+
+# Neu sortieren, wenn die seit der letzten Sortierung eingefügten Zeilen diesen
+# Anteil erreichen
+REORGANIZE_TAIL = 0.25
+
+# Maximale Stichprobe für k-Means und Blockgröße für Zuordnungen
+_TRAIN_SAMPLE = 65_536
+_KMEANS_ITERATIONS = 10
+_CHUNK = 65_536
+_MIN_COMPACTION = 1024
+
+
+class VectorIndex:
+    """
+    IVF-Index für L2-normierte Vektoren (Skalarprodukt = Kosinus-Ähnlichkeit)
+    """
+
+    def __init__(
+        self,
+        dimensions: int,
+        lists: Optional[int] = None,
+        probes: Optional[int] = None,
+        train_threshold: int = 4096,
+        seed: int = 0,
+    ):
+        """
+        Args:
+            dimensions: Dimension der Vektoren
+            lists: Anzahl der Listen (Default: Wurzel der Anzahl Vektoren)
+            probes: Durchsuchte Listen pro Anfrage (Default: abhängig von lists)
+            train_threshold: Ab dieser Größe wird trainiert, darunter exakt gesucht
+            seed: Seed für das Training
+        """
+        self.dimensions = dimensions
+        self.configured_lists = lists
+        self.configured_probes = probes
+        self.train_threshold = train_threshold
+        self.random = np.random.default_rng(seed)
+
+        self.vectors = np.zeros((1024, dimensions), dtype=np.float32)
+        self.alive = np.zeros(1024, dtype=bool)
+        self.assignments = np.full(1024, -1, dtype=np.int32)
+        self.size = 0
+
+        self.keys: List[Optional[str]] = []
+        self.items: List[Any] = []
+        self.rows: Dict[str, int] = {}
+        self.tombstones = 0
+
+        # Nach Training: Zentroiden, Blockgrenzen der sortierten Zeilen
+        # [0, organized) und die seither eingefügten Zeilen pro Liste
+        self.centroids: Optional[np.ndarray] = None
+        self.bounds: Optional[np.ndarray] = None
+        self.organized = 0
+        self.tails: List[array] = []
+        self.trained_size = 0
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.rows
+
+    @property
+    def list_count(self) -> int:
+        return 0 if self.centroids is None else len(self.centroids)
+
+    @property
+    def probes(self) -> int:
+        if self.configured_probes is not None:
+            return self.configured_probes
+        return max(8, self.list_count // 8)
+
+    def _grow(self) -> None:
+        """Verdoppelt die Kapazität (kopiert auch memory-gemappte Arrays in den RAM)"""
+        capacity = max(1024, 2 * len(self.vectors))
+        vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        vectors[: self.size] = self.vectors[: self.size]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: self.size] = self.alive[: self.size]
+        assignments = np.full(capacity, -1, dtype=np.int32)
+        assignments[: self.size] = self.assignments[: self.size]
+
+        self.vectors, self.alive, self.assignments = vectors, alive, assignments
+
+    def add(self, key: str, vector: np.ndarray, item: Any = None) -> None:
+        """
+        Fügt einen Vektor ein (ein vorhandener mit gleichem Schlüssel wird ersetzt)
+
+        Args:
+            key: Eindeutiger Schlüssel
+            vector: L2-normierter Vektor der Länge `dimensions`
+            item: Objekt, das die Suche zurückgibt (Default: der Schlüssel)
+        """
+        vector = np.asarray(vector, dtype=np.float32).reshape(-1)
+        if vector.shape[0] != self.dimensions:
+            raise ValueError(
+                f"Vektor hat {vector.shape[0]} statt {self.dimensions} Dimensionen"
+            )
+
+        if key in self.rows:
+            self.remove(key)
+        if self.size == len(self.vectors) or not self.vectors.flags.writeable:
+            self._grow()
+
+        row = self.size
+        self.vectors[row] = vector
+        self.alive[row] = True
+        self.keys.append(key)
+        self.items.append(key if item is None else item)
+        self.rows[key] = row
+        self.size += 1
+
+        live = len(self.rows)
+        if self.centroids is None:
+            if live >= self.train_threshold:
+                self.train()
+            return
+
+        assignment = int(np.argmax(self.centroids @ vector))
+        self.assignments[row] = assignment
+        self.tails[assignment].append(row)
+
+        if live >= RETRAIN_GROWTH * self.trained_size:
+            self.train()
+        elif self.size - self.organized > REORGANIZE_TAIL * max(self.organized, 1):
+            self._rebuild()
+
+    def remove(self, key: str) -> bool:
+        """
+        Entfernt einen Vektor (Tombstone, Kompaktierung bei vielen Löschungen)
+
+        Returns:
+            Ob der Schlüssel im Index war
+        """
+        row = self.rows.pop(key, None)
+        if row is None:
+            return False
+
+        self.alive[row] = False
+        self.keys[row] = None
+        self.items[row] = None
+        self.tombstones += 1
+
+        if self.tombstones >= max(_MIN_COMPACTION, len(self.rows)):
+            self.compact()
+
+        return True
+
+    def compact(self) -> None:
+        """Entfernt gelöschte Zeilen"""
+        if self.tombstones:
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        """
+        Kopiert die lebenden Zeilen in neue Arrays - nach Training sortiert
+        nach Liste, sodass jede Liste ein zusammenhängender Block ist
+        """
+        rows = np.flatnonzero(self.alive[: self.size])
+        if self.centroids is not None:
+            rows = rows[np.argsort(self.assignments[rows], kind="stable")]
+
+        count = len(rows)
+        capacity = max(1024, count + count // 4)
+        vectors = np.zeros((capacity, self.dimensions), dtype=np.float32)
+        vectors[:count] = self.vectors[rows]
+        assignments = np.full(capacity, -1, dtype=np.int32)
+        assignments[:count] = self.assignments[rows]
+        alive = np.zeros(capacity, dtype=bool)
+        alive[:count] = True
+
+        self.vectors, self.assignments, self.alive = vectors, assignments, alive
+        self.keys = [self.keys[row] for row in rows]
+        self.items = [self.items[row] for row in rows]
+        self.rows = {key: row for row, key in enumerate(self.keys)}
+        self.size = count
+        self.tombstones = 0
+
+        if self.centroids is not None:
+            self._set_bounds()
+
+    def _set_bounds(self) -> None:
+        """Blockgrenzen der (sortierten) Zeilen, leere Nachträge"""
+        self.bounds = np.searchsorted(
+            self.assignments[: self.size], np.arange(self.list_count + 1)
+        )
+        self.organized = self.size
+        self.tails = [array("I") for _ in range(self.list_count)]
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        """Nächster Zentroid pro Zeile (blockweise)"""
+        result = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), _CHUNK):
+            block = vectors[start : start + _CHUNK]
+            result[start : start + _CHUNK] = np.argmax(block @ self.centroids.T, axis=1)
+        return result
+
+    def train(self) -> None:
+        """
+        Lernt Zentroiden per sphärischem k-Means auf einer Stichprobe und ordnet
+        alle Vektoren neu zu
+        """
+        live_rows = np.flatnonzero(self.alive[: self.size])
+        live = len(live_rows)
+        if live == 0:
+            return
+
+        count = self.configured_lists or int(math.sqrt(live))
+        count = max(1, min(count, live))
+
+        sample_size = min(live, max(_TRAIN_SAMPLE, 32 * count))
+        sample = self.vectors[np.sort(self.random.choice(live_rows, sample_size, replace=False))]
+
+        centroids = sample[self.random.choice(sample_size, size=count, replace=False)].copy()
+        for _ in range(_KMEANS_ITERATIONS):
+            self.centroids = centroids
+            labels = self._assign(sample)
+            order = np.argsort(labels, kind="stable")
+            present, starts = np.unique(labels[order], return_index=True)
+            sums = np.zeros_like(centroids)
+            sums[present] = np.add.reduceat(sample[order], starts, axis=0)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            empty = norms[:, 0] == 0
+            # Leere Cluster mit zufälligen Stichproben-Vektoren neu besetzen
+            sums[empty] = sample[self.random.choice(sample_size, size=int(empty.sum()))]
+            norms[empty] = 1.0
+            centroids = sums / norms
+
+        self.centroids = centroids.astype(np.float32)
+        self.assignments[: self.size] = self._assign(self.vectors[: self.size])
+        self._rebuild()
+        self.trained_size = live
+
+        logger.info("vector_index_trained", vectors=live, lists=count)
+
+    def search(
+        self, vector: np.ndarray, k: int = 10, probes: Optional[int] = None
+    ) -> List[Tuple[Any, float]]:
+        """
+        Approximative Top-k-Suche (exakt, solange nicht trainiert)
+
+        Returns:
+            Liste von (Objekt, Kosinus-Ähnlichkeit), absteigend
+        """
+        if not self.rows or k <= 0:
+            return []
+        if self.centroids is None:
+            return self.exact_search(vector, k)
+
+        query = np.asarray(vector, dtype=np.float32).reshape(-1)
+        probes = min(probes or self.probes, self.list_count)
+        nearest = np.argpartition(-(self.centroids @ query), probes - 1)[:probes]
+
+        candidate_rows: List[np.ndarray] = []
+        candidate_scores: List[np.ndarray] = []
+        for i in nearest:
+            start, end = self.bounds[i], self.bounds[i + 1]
+            if end > start:
+                candidate_rows.append(np.arange(start, end))
+                candidate_scores.append(self.vectors[start:end] @ query)
+            if self.tails[i]:
+                tail = np.frombuffer(self.tails[i], dtype=np.uint32)
+                candidate_rows.append(tail)
+                candidate_scores.append(self.vectors[tail] @ query)
+
+        if not candidate_rows:
+            return []
+
+        rows = np.concatenate(candidate_rows)
+        scores = np.concatenate(candidate_scores)
+        if self.tombstones:
+            live = self.alive[rows]
+            rows, scores = rows[live], scores[live]
+
+        return self._top(rows, scores, k)
+
+    def exact_search(self, vector: np.ndarray, k: int = 10) -> List[Tuple[Any, float]]:
+        """Exakte Top-k-Suche über alle Vektoren (Brute Force)"""
+        if not self.rows or k <= 0:
+            return []
+
+        query = np.asarray(vector, dtype=np.float32).reshape(-1)
+        scores = self.vectors[: self.size] @ query
+        if self.tombstones:
+            scores[~self.alive[: self.size]] = -np.inf
+            k = min(k, len(self.rows))
+        return self._top(np.arange(self.size), scores, k)
+
+    def _top(self, rows: np.ndarray, scores: np.ndarray, k: int) -> List[Tuple[Any, float]]:
+        if len(rows) == 0:
+            return []
+        if len(scores) > k:
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return [(self.items[rows[i]], float(scores[i])) for i in top]
+
+    def save(self, directory: Union[str, Path]) -> Path:
+        """
+        Speichert den Index (kompaktiert und sortiert) als .npy-Dateien plus Metadaten
+
+        Gespeichert werden nur Schlüssel, nicht die Objekte.
+        """
+        if self.tombstones or self.size > self.organized:
+            self._rebuild()
+
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        np.save(directory / "vectors.npy", self.vectors[: self.size])
+        np.save(directory / "assignments.npy", self.assignments[: self.size])
+        if self.centroids is not None:
+            np.save(directory / "centroids.npy", self.centroids)
+
+        meta = {
+            "dimensions": self.dimensions,
+            "keys": self.keys,
+            "trained_size": self.trained_size,
+            "lists": self.configured_lists,
+            "probes": self.configured_probes,
+            "train_threshold": self.train_threshold,
+        }
+        (directory / "index.json").write_text(json.dumps(meta))
+        return directory
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "VectorIndex":
+        """
+        Lädt einen gespeicherten Index
+
+        Mit `mmap` werden die Vektoren nur per Memory-Mapping eingeblendet
+        (read-only); erst Einfügen oder Kompaktieren kopiert sie in den RAM.
+        Die Suche liefert die Schlüssel als Objekte.
+        """
+        directory = Path(directory)
+        meta = json.loads((directory / "index.json").read_text())
+
+        index = cls(
+            meta["dimensions"],
+            lists=meta["lists"],
+            probes=meta["probes"],
+            train_threshold=meta["train_threshold"],
+        )
+        index.vectors = np.load(directory / "vectors.npy", mmap_mode="r" if mmap else None)
+        index.size = len(index.vectors)
+        index.alive = np.ones(index.size, dtype=bool)
+        index.assignments = np.load(directory / "assignments.npy")
+        index.keys = list(meta["keys"])
+        index.items = list(index.keys)
+        index.rows = {key: row for row, key in enumerate(index.keys)}
+        index.trained_size = meta["trained_size"]
+
+        centroids = directory / "centroids.npy"
+        if centroids.exists():
+            index.centroids = np.load(centroids)
+            index._set_bounds()
+
+        return index
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Größe, Trainingszustand und Speicherbedarf"""
+        return {
+            "vectors": len(self.rows),
+            "dimensions": self.dimensions,
+            "lists": self.list_count,
+            "probes": self.probes if self.list_count else 0,
+            "trained": self.centroids is not None,
+            "unsorted_rows": self.size - self.organized if self.list_count else 0,
+            "tombstones": self.tombstones,
+            "memory_mapped": isinstance(self.vectors, np.memmap),
+            "vector_bytes": int(self.size * self.dimensions * 4),
+        }
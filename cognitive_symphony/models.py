@@ -4,10 +4,12 @@ Gemeinsame Datenmodelle für Cognitive Symphony
 
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
-from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Literal, Optional, Union
+from pydantic import BaseModel, Field, field_serializer
 from uuid import uuid4
 
+from cognitive_symphony.memory.payload import CompressedPayload
+
 
 class AgentType(str, Enum):
     """Typen der spezialisierten Agenten"""
@@ -22,6 +24,15 @@ class AgentType(str, Enum):
     CUSTOM = "custom"
 
 
+# Agent-Typ: eingebauter AgentType oder Name eines Plugin-Agenten
+AgentKey = Union[AgentType, str]
+
+
+def agent_type_name(agent_type: AgentKey) -> str:
+    """Name eines Agent-Typs (Enum-Wert oder Plugin-Name)"""
+    return agent_type.value if isinstance(agent_type, AgentType) else str(agent_type)
+
+
 class TaskStatus(str, Enum):
     """Status einer Aufgabe"""
 
@@ -74,11 +85,24 @@ class AgentPerformance(BaseModel):
     """Performance-Metriken eines Agenten"""
 
     agent_id: str
-    agent_type: AgentType
+    agent_type: AgentKey
     tasks_completed: int = 0
     tasks_failed: int = 0
+    tasks_cancelled: int = 0  # vor dem Ergebnis abgebrochen (zählt nicht als Fehler)
     avg_success_rate: float = 0.0
     avg_execution_time: float = 0.0
+    avg_time_to_first_token: float = 0.0  # nur über gestreamte Ausführungen
+    streamed_tasks: int = 0
+    # Latenz-Perzentile in Sekunden (Histogramm, getrennt nach Ausgang)
+    p50_execution_time: float = 0.0
+    p90_execution_time: float = 0.0
+    p99_execution_time: float = 0.0
+    p50_failure_time: float = 0.0
+    p90_failure_time: float = 0.0
+    p99_failure_time: float = 0.0
+    # Raten im gleitenden Fenster (agent_latency_window_seconds)
+    tasks_per_second: float = 0.0
+    failures_per_second: float = 0.0
     last_active: datetime = Field(default_factory=datetime.now)
     capabilities: List[AgentCapability] = Field(default_factory=list)
 
@@ -97,6 +121,13 @@ class MemoryEntry(BaseModel):
     tags: List[str] = Field(default_factory=list)
     metadata: Dict[str, Any] = Field(default_factory=dict)
 
+    @field_serializer("content")
+    def _serialize_content(self, content: Any) -> Any:
+        """Komprimierte Inhalte (CompressedPayload) werden dekodiert ausgegeben"""
+        if isinstance(content, CompressedPayload):
+            return content.decode()
+        return content
+
 
 class OrchestrationDecision(BaseModel):
     """Dokumentiert eine Orchestrierungs-Entscheidung"""
@@ -5,17 +5,57 @@ Erstellt neue spezialisierte Agenten durch:
 - Kombination bestehender Agenten-Fähigkeiten
 - Zusammenstellung verfügbarer APIs
 - Lernen aus erfolgreichen Patterns
+
+Synthetisierte Agenten werden in einem begrenzten LRU-Cache unter der
+normalisierten Capability-Menge plus Basis-Agenten abgelegt; häufig
+wiederverwendete Agenten werden als routbare Agenten in die Flotte übernommen.
+Benötigte Capabilities werden lokal per Vektor-Ähnlichkeit zum Capability-
+Katalog der Flotte bestimmt; das LLM dient nur als Fallback. Name und
+Beschreibung entstehen per Template aus den Capability-Daten (optional per LLM).
 """
 
-from typing import Any, Dict, List
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Literal, Optional, Tuple
 import structlog
 from langchain.prompts import ChatPromptTemplate
 
 from cognitive_symphony.agents.base_agent import BaseAgent
-from cognitive_symphony.models import AgentCapability, AgentType, Task
+from cognitive_symphony.agents.capability_index import tokenize
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.managed_llm import ensure_managed
+from cognitive_symphony.memory.embeddings import create_vectorizer
+from cognitive_symphony.synthesis.capability_matcher import CapabilityMatcher
+from cognitive_symphony.models import (
+    AgentCapability,
+    AgentKey,
+    AgentType,
+    Task,
+    agent_type_name,
+)
 
 logger = structlog.get_logger()
 
+CacheKey = Tuple[FrozenSet[str], Tuple[str, ...]]
+
+# Maximale Anzahl von Namensbestandteilen bzw. Stärken im Template
+_TEMPLATE_NAME_PARTS = 3
+_TEMPLATE_STRENGTHS = 3
+
+
+def synthesis_cache_key(
+    required_capabilities: List[str], base_agents: List[AgentKey]
+) -> CacheKey:
+    """
+    Cache-Schlüssel einer Synthese: normalisierte Capabilities plus Basis-Agenten
+
+    Reihenfolge, Groß-/Kleinschreibung, Satzzeichen und Stoppwörter der
+    Capabilities spielen keine Rolle.
+    """
+    capabilities = frozenset(
+        " ".join(tokens) for tokens in map(tokenize, required_capabilities) if tokens
+    )
+    return capabilities, tuple(sorted(agent_type_name(a) for a in base_agents))
+
 
 class SynthesizedAgent(BaseAgent):
     """Ein dynamisch erstellter Agent mit kombinierten Fähigkeiten"""
@@ -26,7 +66,7 @@ class SynthesizedAgent(BaseAgent):
         name: str,
         description: str,
         capabilities: List[AgentCapability],
-        base_agents: List[AgentType],
+        base_agents: List[AgentKey],
     ):
         """
         Initialisiert einen synthetisierten Agenten
@@ -49,15 +89,25 @@ class SynthesizedAgent(BaseAgent):
         logger.info(
             "synthesized_agent_created",
             name=name,
-            base_agents=[a.value for a in base_agents],
+            base_agents=[agent_type_name(a) for a in base_agents],
         )
 
     def _initialize_capabilities(self) -> List[AgentCapability]:
         """Capabilities werden im Constructor gesetzt"""
         return []
 
-    async def execute(self, task: Task) -> Any:
-        """Führt Aufgaben mit kombinierten Fähigkeiten aus"""
+    def clone(self) -> "SynthesizedAgent":
+        """Neue Instanz mit gleicher Spezifikation (z.B. für Agent-Pools)"""
+        return SynthesizedAgent(
+            llm=self.llm,
+            name=self.custom_name,
+            description=self.description,
+            capabilities=list(self.capabilities),
+            base_agents=list(self.base_agents),
+        )
+
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        """Erstellt den Prompt für Aufgaben mit kombinierten Fähigkeiten"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -86,23 +136,22 @@ class SynthesizedAgent(BaseAgent):
             ]
         )
 
-        chain = prompt | self.llm
-        response = await chain.ainvoke(
-            {
-                "agent_name": self.custom_name,
-                "description": self.description,
-                "base_agents": ", ".join([a.value for a in self.base_agents]),
-                "capabilities": capabilities_str,
-                "task_description": task.description,
-                "context": str(task.context),
-            }
-        )
+        return prompt, {
+            "agent_name": self.custom_name,
+            "description": self.description,
+            "base_agents": ", ".join([agent_type_name(a) for a in self.base_agents]),
+            "capabilities": capabilities_str,
+            "task_description": task.description,
+            "context": str(task.context),
+        }
 
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        """Erstellt das Ergebnis aus der LLM-Antwort"""
         return {
             "type": "synthesized_result",
-            "result": response.content,
+            "result": content,
             "agent": self.custom_name,
-            "base_agents": [a.value for a in self.base_agents],
+            "base_agents": [agent_type_name(a) for a in self.base_agents],
         }
 
 
@@ -116,17 +165,64 @@ class AdaptiveAgentSynthesizer:
     - Synthese neuer Capability-Sets
     """
 
-    def __init__(self, llm: Any, agent_fleet: Any):
+    def __init__(
+        self,
+        llm: Any,
+        agent_fleet: Any,
+        cache_size: Optional[int] = None,
+        promotion_threshold: Optional[int] = None,
+        extraction_mode: Optional[Literal["local", "llm"]] = None,
+        specification_mode: Optional[Literal["template", "llm"]] = None,
+    ):
         """
         Initialisiert den Synthesizer
 
         Args:
             llm: Language Model
             agent_fleet: Referenz zur Agent-Fleet
+            cache_size: Maximale Anzahl gecachter Agenten (Default aus Settings)
+            promotion_threshold: Wiederverwendungen, ab denen ein Agent in die
+                Flotte übernommen wird (0 = nie, Default aus Settings)
+            extraction_mode: "local" oder "llm" (Default aus Settings)
+            specification_mode: "template" oder "llm" (Default aus Settings)
         """
-        self.llm = llm
+        self.llm = ensure_managed(llm)
         self.agent_fleet = agent_fleet
-        self.synthesized_agents: Dict[str, SynthesizedAgent] = {}
+        self.cache_size = max(
+            1, settings.synthesis_cache_size if cache_size is None else cache_size
+        )
+        self.promotion_threshold = (
+            settings.synthesis_promotion_threshold
+            if promotion_threshold is None
+            else promotion_threshold
+        )
+
+        # LRU-Cache: Schlüssel -> Agent, plus Wiederverwendungen pro Schlüssel
+        self.agent_cache: "OrderedDict[CacheKey, SynthesizedAgent]" = OrderedDict()
+        self.reuse_counts: Dict[CacheKey, int] = {}
+        # Agent-ID -> Name, unter dem der Agent in der Flotte routbar ist
+        self.promoted_agents: Dict[str, str] = {}
+        self.cache_stats: Dict[str, int] = {
+            "requests": 0,
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "promotions": 0,
+            "avoided_synthesis_calls": 0,
+        }
+
+        self.extraction_mode = extraction_mode or settings.capability_extraction_mode
+        if self.extraction_mode not in ("local", "llm"):
+            raise ValueError(f"Unbekannter Extraktionsmodus: {self.extraction_mode}")
+        # Lokaler Matcher über den Capability-Katalog (beim ersten Bedarf erzeugt)
+        self._matcher: Optional[CapabilityMatcher] = None
+        # Aktive Agent-Typen der Flotte, für die der Matcher gefittet wurde
+        self._matcher_types: Tuple[AgentKey, ...] = ()
+        self.extraction_stats: Dict[str, int] = {"local": 0, "llm_fallback": 0, "llm": 0}
+
+        self.specification_mode = specification_mode or settings.synthesis_specification_mode
+        if self.specification_mode not in ("template", "llm"):
+            raise ValueError(f"Unbekannter Spezifikationsmodus: {self.specification_mode}")
 
         logger.info("adaptive_synthesizer_initialized")
 
@@ -141,7 +237,7 @@ class AdaptiveAgentSynthesizer:
             required_capabilities: Liste benötigter Fähigkeiten
 
         Returns:
-            Neu synthetisierter Agent
+            Neu synthetisierter oder wiederverwendeter Agent
         """
         logger.info(
             "synthesizing_agent",
@@ -152,14 +248,27 @@ class AdaptiveAgentSynthesizer:
         # 1. Analysiere welche Basis-Agenten die benötigten Capabilities haben
         suitable_agents = await self._find_suitable_base_agents(required_capabilities)
 
-        # 2. Generiere Namen und Beschreibung
-        agent_spec = await self._generate_agent_specification(
-            task, required_capabilities, suitable_agents
-        )
+        # Gleiche Capabilities und Basis-Agenten -> vorhandenen Agenten nutzen
+        key = synthesis_cache_key(required_capabilities, suitable_agents)
+        self.cache_stats["requests"] += 1
+        cached = self._reuse_cached(key)
+        if cached is not None:
+            return cached
+        self.cache_stats["misses"] += 1
 
-        # 3. Kombiniere Capabilities
+        # 2. Kombiniere Capabilities
         combined_capabilities = self._combine_capabilities(suitable_agents)
 
+        # 3. Generiere Namen und Beschreibung
+        if self.specification_mode == "template":
+            agent_spec = self._build_template_specification(
+                required_capabilities, suitable_agents, combined_capabilities
+            )
+        else:
+            agent_spec = await self._generate_agent_specification(
+                task, required_capabilities, suitable_agents
+            )
+
         # 4. Erstelle synthetisierten Agenten
         synthesized_agent = SynthesizedAgent(
             llm=self.llm,
@@ -170,19 +279,74 @@ class AdaptiveAgentSynthesizer:
         )
 
         # Cache für Wiederverwendung
-        self.synthesized_agents[agent_spec["name"]] = synthesized_agent
+        self._cache_agent(key, synthesized_agent)
 
         logger.info(
             "agent_synthesized",
             name=agent_spec["name"],
-            base_agents=[a.value for a in suitable_agents],
+            base_agents=[agent_type_name(a) for a in suitable_agents],
         )
 
         return synthesized_agent
 
+    def _reuse_cached(self, key: CacheKey) -> Optional[SynthesizedAgent]:
+        """Liefert einen gecachten Agenten und übernimmt ihn ggf. in die Flotte"""
+        agent = self.agent_cache.get(key)
+        if agent is None:
+            return None
+
+        self.agent_cache.move_to_end(key)
+        self.reuse_counts[key] += 1
+        self.cache_stats["hits"] += 1
+        # Spezifikations-Aufruf und Agenten-Erzeugung entfallen
+        self.cache_stats["avoided_synthesis_calls"] += 1
+
+        if (
+            self.promotion_threshold > 0
+            and self.reuse_counts[key] >= self.promotion_threshold
+            and agent.agent_id not in self.promoted_agents
+        ):
+            self._promote(agent)
+
+        logger.info(
+            "synthesized_agent_reused",
+            name=agent.custom_name,
+            reuses=self.reuse_counts[key],
+        )
+
+        return agent
+
+    def _cache_agent(self, key: CacheKey, agent: SynthesizedAgent) -> None:
+        """Legt einen Agenten im LRU-Cache ab und verdrängt ggf. den ältesten"""
+        self.agent_cache[key] = agent
+        self.reuse_counts[key] = 0
+
+        while len(self.agent_cache) > self.cache_size:
+            evicted_key, evicted = self.agent_cache.popitem(last=False)
+            del self.reuse_counts[evicted_key]
+            self.cache_stats["evictions"] += 1
+            logger.debug("synthesized_agent_evicted", name=evicted.custom_name)
+
+    def _promote(self, agent: SynthesizedAgent) -> None:
+        """Übernimmt einen häufig genutzten Agenten als routbaren Typ in die Flotte"""
+        if not hasattr(self.agent_fleet, "promote_agent"):
+            return
+
+        name = agent.custom_name
+        suffix = 1
+        while self.agent_fleet.is_active(name) or name in self.agent_fleet.registry:
+            suffix += 1
+            name = f"{agent.custom_name}_{suffix}"
+
+        self.agent_fleet.promote_agent(name, agent, factory=agent.clone)
+        self.promoted_agents[agent.agent_id] = name
+        self.cache_stats["promotions"] += 1
+
+        logger.info("synthesized_agent_promoted", name=name)
+
     async def _find_suitable_base_agents(
         self, required_capabilities: List[str]
-    ) -> List[AgentType]:
+    ) -> List[AgentKey]:
         """
         Findet Basis-Agenten, die die benötigten Capabilities haben
 
@@ -190,38 +354,70 @@ class AdaptiveAgentSynthesizer:
             required_capabilities: Benötigte Fähigkeiten
 
         Returns:
-            Liste passender Agent-Typen
+            Liste passender Agent-Typen (max. 3, bester zuerst)
         """
-        suitable_agents = []
-
-        # Hole alle Agent-Capabilities
-        all_capabilities = self.agent_fleet.get_agent_capabilities()
-
-        for agent_type_str, capabilities in all_capabilities.items():
-            agent_type = AgentType(agent_type_str)
-
-            # Check ob Agent relevante Capabilities hat
-            for capability in capabilities:
-                if any(
-                    req.lower() in capability["name"].lower()
-                    or req.lower() in capability["description"].lower()
-                    for req in required_capabilities
-                ):
-                    if agent_type not in suitable_agents:
-                        suitable_agents.append(agent_type)
-                    break
+        # Index-Lookup mit Ranking nach Abdeckung, Token-Seltenheit und Skill
+        ranked = self.agent_fleet.find_agents_for_capabilities(required_capabilities, limit=3)
+        suitable_agents = [agent_type for agent_type, _ in ranked]
 
         # Fallback: Wenn keine passenden gefunden, nutze generische
         if not suitable_agents:
             suitable_agents = [AgentType.RESEARCH, AgentType.ANALYSIS]
 
-        return suitable_agents[:3]  # Limitiere auf max 3 Basis-Agenten
+        return suitable_agents
+
+    def _build_template_specification(
+        self,
+        required_capabilities: List[str],
+        base_agents: List[AgentKey],
+        capabilities: List[AgentCapability],
+    ) -> Dict[str, str]:
+        """
+        Erstellt Name und Beschreibung deterministisch ohne LLM-Aufruf
+
+        Der Name setzt sich aus dem ersten Wort der benötigten Capabilities
+        zusammen (ersatzweise aus den Basis-Agenten), die Beschreibung aus
+        Basis-Agenten, Anforderungen und den passendsten Capabilities.
+
+        Returns:
+            Dict mit 'name' und 'description'
+        """
+        parts: List[str] = []
+        for requirement in required_capabilities:
+            tokens = tokenize(requirement)
+            if tokens and tokens[0].capitalize() not in parts:
+                parts.append(tokens[0].capitalize())
+        if not parts:
+            parts = [
+                agent_type_name(a).replace("_", " ").title().replace(" ", "")
+                for a in base_agents
+            ]
+        name = "".join(parts[:_TEMPLATE_NAME_PARTS]) + "Agent"
+
+        base_names = ", ".join(agent_type_name(a) for a in base_agents)
+        description = f"Kombiniert die Fähigkeiten von {base_names}"
+        if required_capabilities:
+            description += f" für {', '.join(required_capabilities)}"
+        description += "."
+
+        # Zu den Anforderungen passende Capabilities zuerst, dann nach Skill-Level
+        wanted = {token for r in required_capabilities for token in tokenize(r)}
+        strongest = sorted(
+            capabilities,
+            key=lambda c: (-len(wanted.intersection(tokenize(c.name))), -c.skill_level),
+        )[:_TEMPLATE_STRENGTHS]
+        if strongest:
+            description += " Stärken: " + "; ".join(
+                f"{c.name} ({c.description})" for c in strongest
+            ) + "."
+
+        return {"name": name, "description": description}
 
     async def _generate_agent_specification(
         self,
         task: Task,
         required_capabilities: List[str],
-        base_agents: List[AgentType],
+        base_agents: List[AgentKey],
     ) -> Dict[str, str]:
         """
         Generiert Name und Beschreibung für den neuen Agenten
@@ -267,7 +463,7 @@ class AdaptiveAgentSynthesizer:
         response = await chain.ainvoke(
             {
                 "capabilities": ", ".join(required_capabilities),
-                "base_agents": ", ".join([a.value for a in base_agents]),
+                "base_agents": ", ".join([agent_type_name(a) for a in base_agents]),
                 "task": task.description,
             }
         )
@@ -289,7 +485,7 @@ class AdaptiveAgentSynthesizer:
         return {"name": name, "description": description}
 
     def _combine_capabilities(
-        self, base_agents: List[AgentType]
+        self, base_agents: List[AgentKey]
     ) -> List[AgentCapability]:
         """
         Kombiniert Capabilities mehrerer Basis-Agenten
@@ -303,17 +499,16 @@ class AdaptiveAgentSynthesizer:
         combined = []
 
         for agent_type in base_agents:
-            agent = self.agent_fleet.get_agent(agent_type)
-            if agent and hasattr(agent, "capabilities"):
-                for capability in agent.capabilities:
-                    # Reduziere Skill-Level leicht, da synthetisiert
-                    adjusted_capability = AgentCapability(
-                        name=capability.name,
-                        description=capability.description,
-                        skill_level=capability.skill_level * 0.9,
-                        success_rate=capability.success_rate * 0.85,
-                    )
-                    combined.append(adjusted_capability)
+            # Deklarierte Capabilities - Basis-Agenten werden nicht erzeugt
+            for capability in self.agent_fleet.get_capabilities(agent_type):
+                # Reduziere Skill-Level leicht, da synthetisiert
+                adjusted_capability = AgentCapability(
+                    name=capability.name,
+                    description=capability.description,
+                    skill_level=capability.skill_level * 0.9,
+                    success_rate=capability.success_rate * 0.85,
+                )
+                combined.append(adjusted_capability)
 
         return combined
 
@@ -333,16 +528,61 @@ class AdaptiveAgentSynthesizer:
         # Synthesize Agent
         return await self.synthesize_agent(task, required_capabilities)
 
+    def _get_matcher(self) -> CapabilityMatcher:
+        """
+        Matcher über die Capabilities aller aktiven Agenten der Flotte
+
+        Wird neu gefittet, sobald sich die aktiven Typen ändern (z.B. nach
+        der Übernahme eines synthetisierten Agenten).
+        """
+        active_types = tuple(self.agent_fleet.active_types)
+        if self._matcher is None or active_types != self._matcher_types:
+            catalogue: Dict[str, str] = {}
+            for capabilities in self.agent_fleet.get_agent_capabilities().values():
+                for capability in capabilities:
+                    catalogue.setdefault(capability["name"], capability["description"])
+
+            self._matcher = CapabilityMatcher(
+                create_vectorizer(settings.capability_embedding_model),
+                threshold=settings.capability_match_threshold,
+            ).fit(catalogue)
+            self._matcher_types = active_types
+
+        return self._matcher
+
     async def _extract_required_capabilities(self, task: Task) -> List[str]:
         """
         Extrahiert benötigte Capabilities aus einer Task-Beschreibung
 
+        Im Modus "local" werden die ähnlichsten Capabilities des Katalogs
+        gewählt; nur ohne ausreichend ähnlichen Eintrag wird das LLM gefragt.
+
         Args:
             task: Die Aufgabe
 
         Returns:
             Liste benötigter Capabilities
         """
+        if self.extraction_mode == "local":
+            matches = self._get_matcher().match(task.description)
+            if matches:
+                self.extraction_stats["local"] += 1
+                logger.debug(
+                    "capabilities_matched_locally",
+                    task_id=task.id,
+                    capabilities=[name for name, _ in matches],
+                    best_similarity=matches[0][1],
+                )
+                return [name for name, _ in matches]
+
+            self.extraction_stats["llm_fallback"] += 1
+        else:
+            self.extraction_stats["llm"] += 1
+
+        return await self._extract_capabilities_with_llm(task)
+
+    async def _extract_capabilities_with_llm(self, task: Task) -> List[str]:
+        """Lässt das LLM die benötigten Capabilities benennen"""
         prompt = ChatPromptTemplate.from_messages(
             [
                 (
@@ -381,5 +621,20 @@ class AdaptiveAgentSynthesizer:
         return capabilities[:5]  # Max 5 Capabilities
 
     def get_synthesized_agents(self) -> Dict[str, SynthesizedAgent]:
-        """Gibt alle synthetisierten Agenten zurück"""
-        return self.synthesized_agents
+        """Gibt alle gecachten synthetisierten Agenten zurück (Name -> Agent)"""
+        return {agent.custom_name: agent for agent in self.agent_cache.values()}
+
+    def get_cache_metrics(self) -> Dict[str, Any]:
+        """Gibt Größe, Trefferquote und Promotionen des Agenten-Caches zurück"""
+        stats = self.cache_stats
+        return {
+            **stats,
+            "size": len(self.agent_cache),
+            "max_size": self.cache_size,
+            "hit_rate": stats["hits"] / stats["requests"] if stats["requests"] else 0.0,
+            "promoted": sorted(self.promoted_agents.values()),
+        }
+
+    def get_extraction_metrics(self) -> Dict[str, Any]:
+        """Gibt zurück, wie oft Capabilities lokal bzw. per LLM bestimmt wurden"""
+        return {"mode": self.extraction_mode, **self.extraction_stats}
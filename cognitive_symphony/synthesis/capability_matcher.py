@@ -0,0 +1,76 @@
+"""
+Capability Matcher - Lokale Zuordnung von Aufgaben zu Capabilities
+
+- Aufgabentext und Capability-Katalog (Name + Beschreibung aller Agenten)
+  werden als L2-normierte float32-Vektoren eingebettet
+- Standard: TF-IDF über gehashte Wort-, Präfix-Stamm- und Zeichen-Trigramm-
+  Features; optional sentence-transformers, wenn das Modell lokal vorliegt
+  (siehe memory/embeddings.py)
+- Die Zuordnung ist ein Matrix-Vektor-Produkt (Kosinus-Ähnlichkeit) -
+  liegt die beste Ähnlichkeit unter dem Schwellwert, entscheidet das LLM
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+import structlog
+
+from cognitive_symphony.memory.embeddings import HashingVectorizer
+
+logger = structlog.get_logger()
+
+
+class CapabilityMatcher:
+    """
+    Ordnet Aufgabentexte den ähnlichsten Capabilities eines Katalogs zu
+    """
+
+    def __init__(
+        self, vectorizer: Any = None, threshold: float = 0.15, max_capabilities: int = 5
+    ):
+        """
+        Args:
+            vectorizer: Objekt mit fit()/transform() (Default: HashingVectorizer)
+            threshold: Minimale Kosinus-Ähnlichkeit eines Treffers
+            max_capabilities: Maximale Anzahl zurückgegebener Capabilities
+        """
+        self.vectorizer = vectorizer or HashingVectorizer()
+        self.threshold = threshold
+        self.max_capabilities = max_capabilities
+        self.names: List[str] = []
+        self.matrix: Optional[np.ndarray] = None
+
+    def fit(self, catalogue: Dict[str, str]) -> "CapabilityMatcher":
+        """
+        Bettet den Katalog ein
+
+        Args:
+            catalogue: Capability-Name -> Beschreibung
+        """
+        self.names = list(catalogue)
+        texts = [f"{name} {description}" for name, description in catalogue.items()]
+        self.matrix = self.vectorizer.fit(texts).transform(texts)
+
+        logger.info("capability_matcher_fitted", capabilities=len(self.names))
+        return self
+
+    def match(self, text: str) -> List[Tuple[str, float]]:
+        """
+        Capabilities mit Ähnlichkeit über dem Schwellwert
+
+        Returns:
+            Liste von (Capability-Name, Ähnlichkeit), absteigend; leer, wenn
+            kein Katalogeintrag ähnlich genug ist
+        """
+        if self.matrix is None or not self.names:
+            return []
+
+        similarities = self.matrix @ self.vectorizer.transform([text])[0]
+        limit = min(self.max_capabilities, len(self.names))
+        top = np.argpartition(-similarities, limit - 1)[:limit]
+        top = top[np.argsort(-similarities[top])]
+
+        return [
+            (self.names[i], float(similarities[i]))
+            for i in top
+            if similarities[i] >= self.threshold
+        ]
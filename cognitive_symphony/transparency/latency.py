@@ -0,0 +1,195 @@
+"""
+Latenz-Histogramme und Raten mit festem Speicherbedarf
+
+- LatencyHistogram: logarithmische Buckets (ca. 9% relative Auflösung)
+  zwischen 1 ms und 1 h - Perzentile ohne Speicherung einzelner Messwerte
+- RateWindow: Ereignisse pro Sekunde im gleitenden Zeitfenster (Ringpuffer)
+- LatencyTracker: beides getrennt nach Erfolg und Fehlschlag
+"""
+
+import math
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Buckets pro Verdopplung - 8 ergibt Bucket-Grenzen im Abstand von 2^(1/8)
+BUCKETS_PER_OCTAVE = 8
+MIN_LATENCY = 0.001
+MAX_LATENCY = 3600.0
+
+PERCENTILES = (50, 90, 99)
+
+
+class LatencyHistogram:
+    """
+    Log-Bucket-Histogramm für Latenzen in Sekunden
+
+    Werte unterhalb von MIN_LATENCY landen im ersten, oberhalb von
+    MAX_LATENCY im letzten Bucket; Minimum und Maximum werden exakt geführt.
+    """
+
+    def __init__(self):
+        self.bucket_count = (
+            int(math.ceil(math.log2(MAX_LATENCY / MIN_LATENCY) * BUCKETS_PER_OCTAVE)) + 1
+        )
+        self.buckets: List[int] = [0] * self.bucket_count
+        self.count = 0
+        self.total = 0.0
+        self.min = 0.0
+        self.max = 0.0
+
+    def _index(self, value: float) -> int:
+        if value <= MIN_LATENCY:
+            return 0
+
+        index = int(math.log2(value / MIN_LATENCY) * BUCKETS_PER_OCTAVE)
+        return min(index, self.bucket_count - 1)
+
+    def _bucket_value(self, index: int) -> float:
+        """Geometrische Mitte eines Buckets"""
+        return MIN_LATENCY * 2 ** ((index + 0.5) / BUCKETS_PER_OCTAVE)
+
+    def record(self, value: float) -> None:
+        """Zeichnet eine Latenz auf"""
+        self.buckets[self._index(value)] += 1
+        self.min = value if self.count == 0 else min(self.min, value)
+        self.max = max(self.max, value)
+        self.count += 1
+        self.total += value
+
+    def percentile(self, percentile: float) -> float:
+        """Latenz, unter der `percentile` Prozent der Messwerte liegen"""
+        if self.count == 0:
+            return 0.0
+
+        rank = max(1, math.ceil(self.count * percentile / 100))
+        seen = 0
+        for index, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank:
+                if index == self.bucket_count - 1:
+                    return self.max
+                return min(max(self._bucket_value(index), self.min), self.max)
+
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Addiert ein anderes Histogramm (z.B. einer weiteren Pool-Instanz)"""
+        for index, bucket in enumerate(other.buckets):
+            self.buckets[index] += bucket
+
+        if other.count:
+            self.min = other.min if self.count == 0 else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def snapshot(self) -> Dict[str, float]:
+        """Anzahl, Mittelwert, Perzentile und Maximum"""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            **{f"p{p}": self.percentile(p) for p in PERCENTILES},
+            "max": self.max,
+        }
+
+
+class RateWindow:
+    """
+    Zählt Ereignisse im gleitenden Fenster von `window_seconds` Sekunden
+
+    Ein Slot pro Sekunde; veraltete Slots werden beim Zugriff verworfen.
+    """
+
+    def __init__(
+        self, window_seconds: int = 60, clock: Optional[Callable[[], float]] = None
+    ):
+        self.window_seconds = max(1, window_seconds)
+        self.clock = clock or time.monotonic
+        self.counts: List[int] = [0] * self.window_seconds
+        self.slots: List[int] = [-1] * self.window_seconds
+
+    def record(self, count: int = 1) -> None:
+        """Zählt Ereignisse in der aktuellen Sekunde"""
+        second = int(self.clock())
+        index = second % self.window_seconds
+        if self.slots[index] != second:
+            self.slots[index] = second
+            self.counts[index] = 0
+
+        self.counts[index] += count
+
+    def total(self) -> int:
+        """Ereignisse im aktuellen Fenster"""
+        oldest = int(self.clock()) - self.window_seconds
+        return sum(c for c, s in zip(self.counts, self.slots) if s > oldest)
+
+    def rate(self) -> float:
+        """Ereignisse pro Sekunde im aktuellen Fenster"""
+        return self.total() / self.window_seconds
+
+    def merge(self, other: "RateWindow") -> None:
+        """Addiert die noch gültigen Slots eines anderen Fensters gleicher Größe"""
+        oldest = int(self.clock()) - self.window_seconds
+        for second, count in zip(other.slots, other.counts):
+            if second <= oldest:
+                continue
+
+            index = second % self.window_seconds
+            if self.slots[index] != second:
+                self.slots[index] = second
+                self.counts[index] = 0
+            self.counts[index] += count
+
+
+class LatencyTracker:
+    """
+    Latenz-Histogramme und Raten eines Agenten, getrennt nach Ausgang
+    """
+
+    def __init__(
+        self, window_seconds: int = 60, clock: Optional[Callable[[], float]] = None
+    ):
+        """
+        Args:
+            window_seconds: Fenstergröße für die Raten
+            clock: Zeitquelle in Sekunden (Default: time.monotonic)
+        """
+        self.window_seconds = window_seconds
+        self.clock = clock or time.monotonic
+        self.histograms = {"success": LatencyHistogram(), "failure": LatencyHistogram()}
+        self.windows = {
+            "success": RateWindow(window_seconds, self.clock),
+            "failure": RateWindow(window_seconds, self.clock),
+        }
+
+    def record(self, latency: float, success: bool) -> None:
+        """Zeichnet die Dauer einer Ausführung auf"""
+        outcome = "success" if success else "failure"
+        self.histograms[outcome].record(latency)
+        self.windows[outcome].record()
+
+    def merge(self, other: "LatencyTracker") -> None:
+        """Addiert einen anderen Tracker (z.B. einer weiteren Pool-Instanz)"""
+        for outcome in self.histograms:
+            self.histograms[outcome].merge(other.histograms[outcome])
+            self.windows[outcome].merge(other.windows[outcome])
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Perzentile pro Ausgang und Raten im Fenster"""
+        succeeded = self.windows["success"].total()
+        failed = self.windows["failure"].total()
+
+        return {
+            "success": self.histograms["success"].snapshot(),
+            "failure": self.histograms["failure"].snapshot(),
+            "window_seconds": self.window_seconds,
+            "tasks_per_second": (succeeded + failed) / self.window_seconds,
+            "failures_per_second": failed / self.window_seconds,
+            "window_success_rate": succeeded / (succeeded + failed)
+            if succeeded + failed
+            else 0.0,
+        }
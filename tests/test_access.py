@@ -0,0 +1,93 @@
+"""
+Tests für Zugriffs-Tracking und Budget-Verdrängung des Gedächtnis-Systems
+"""
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.memory.access import AccessTracker, EvictionPolicy
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.models import MemoryEntry, Task
+
+
+def entry(importance=0.5, access_count=0):
+    return MemoryEntry(
+        type="semantic", content={}, importance=importance, access_count=access_count
+    )
+
+
+def test_access_tracker_aggregates_hits():
+    """Test Summieren mehrfacher Treffer bis zum Leeren des Puffers"""
+    tracker = AccessTracker()
+    first, second = entry(), entry()
+    tracker.record([first, second])
+    tracker.record([first])
+
+    hits = {e.id: count for e, count, _ in tracker.drain()}
+
+    assert hits == {first.id: 2, second.id: 1}
+    assert len(tracker) == 0 and tracker.drain() == []
+    # Modelle werden erst vom Aufrufer aktualisiert
+    assert first.access_count == 0
+
+
+def test_eviction_policy_lfu_with_aging():
+    """Test Verdrängung nach Häufigkeit/Wichtigkeit und Alterung durch L"""
+    policy = EvictionPolicy(max_entries=2)
+    rare, frequent, important = entry(0.1), entry(0.1, access_count=10), entry(0.9)
+    for e in (rare, frequent, important):
+        policy.update(e)
+
+    assert policy.over_budget()
+    assert policy.pop() == rare.id
+    assert policy.age > 0 and not policy.over_budget()
+
+    # Neu eingefügt startet bei L: ein ungenutzter Eintrag liegt über alten
+    # mit gleicher Bewertung
+    newcomer = entry(0.9)
+    policy.update(newcomer)
+    assert policy.pop() == important.id
+
+    # Veraltete Heap-Elemente werden übersprungen, der Heap bleibt begrenzt
+    for _ in range(200):
+        policy.update(frequent)
+    assert len(policy.heap) <= 2 * len(policy) + 64
+    policy.remove(newcomer.id)
+    assert policy.pop() == frequent.id
+    assert policy.pop() is None
+
+
+def test_recall_counts_accesses_and_retains_used_knowledge():
+    """Test access_count aus recall_* und die Regel access_count > 5"""
+    memory = MemorySystem()
+    memory.store_knowledge({"fact": "oft genutzt"}, ["python"], 0.1)
+    memory.store_knowledge({"fact": "ungenutzt"}, ["java"], 0.1)
+
+    for _ in range(6):
+        memory.recall_knowledge(["python"])
+    (used,) = memory.recall_knowledge(["python"])
+    assert used.access_count == 0
+    assert memory.get_metrics()["access"]["pending"] == 1
+
+    memory.store_episode(Task(description="Lauf"), [], [])
+
+    assert [k.content["fact"] for k in memory.semantic_memory] == ["oft genutzt"]
+    assert used.access_count == 7
+    assert used.last_accessed > used.timestamp
+
+
+def test_layer_budget_evicts_least_valuable(monkeypatch):
+    """Test Budget pro Schicht: ungenutzter, unwichtiger Eintrag wird verdrängt"""
+    monkeypatch.setattr(settings, "memory_max_procedural_entries", 2)
+    memory = MemorySystem()
+    memory.store_workflow({"name": "alt"}, 0.4, ["etl"])
+    memory.store_workflow({"name": "genutzt"}, 0.6, ["etl"])
+    for _ in range(5):
+        memory.recall_workflows(min_performance=0.5)
+
+    memory.store_workflow({"name": "neu"}, 0.9, ["etl"])
+
+    names = {w.content["name"] for w in memory.procedural_memory}
+    assert names == {"genutzt", "neu"}
+    metrics = memory.get_metrics()
+    assert metrics["eviction"]["procedural"]["evicted"] == 1
+    assert metrics["vector_indexes"]["procedural"]["vectors"] == 2
+    assert "episodic" not in metrics["eviction"]
@@ -0,0 +1,82 @@
+"""
+Tests für die Agent-Flotte
+"""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents.agent_fleet import AgentFleet
+from cognitive_symphony.config import settings
+from cognitive_symphony.models import AgentType, Task
+
+
+def slow_llm(delay=0.1):
+    """LLM mit fester Latenz"""
+
+    async def respond(prompt):
+        await asyncio.sleep(delay)
+        return AIMessage(content="Ergebnis")
+
+    return RunnableLambda(respond)
+
+
+@pytest.mark.asyncio
+async def test_agents_run_concurrently():
+    """Test dass mehrere Agenten gleichzeitig laufen und die Reihenfolge erhalten bleibt"""
+    fleet = AgentFleet(llm=slow_llm(0.1))
+    agents = [AgentType.RESEARCH, AgentType.ANALYSIS, AgentType.CODE]
+
+    start = time.perf_counter()
+    result = await fleet.execute_task(Task(description="Test"), agents)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.25
+    assert [r["type"] for r in result["combined_results"]] == [
+        "research_result",
+        "analysis_result",
+        "code_result",
+    ]
+    assert result["agent_count"] == 3
+
+    metrics = fleet.get_execution_metrics()
+    assert metrics["parallel_tasks"] == 1
+    assert metrics["time_saved"] > 0.1
+    assert metrics["speedup"] > 2.0
+
+
+@pytest.mark.asyncio
+async def test_agent_errors_are_isolated():
+    """Test dass ein fehlschlagender Agent die anderen nicht abbricht"""
+    fleet = AgentFleet(llm=slow_llm(0.01))
+
+    async def fail(task, on_token=None):
+        raise RuntimeError("kaputt")
+
+    fleet.get_agent(AgentType.ANALYSIS).execute_with_metrics = fail
+
+    result = await fleet.execute_task(
+        Task(description="Test"), [AgentType.ANALYSIS, AgentType.RESEARCH]
+    )
+
+    assert result["combined_results"][0] == {"error": "kaputt", "agent": "analysis"}
+    assert result["combined_results"][1]["type"] == "research_result"
+
+
+@pytest.mark.asyncio
+async def test_parallelism_is_bounded(monkeypatch):
+    """Test Obergrenze gleichzeitiger Agenten pro Aufgabe"""
+    monkeypatch.setattr(settings, "max_parallel_agents_per_task", 2)
+    fleet = AgentFleet(llm=slow_llm(0.05))
+
+    start = time.perf_counter()
+    await fleet.execute_task(
+        Task(description="Test"),
+        [AgentType.RESEARCH, AgentType.ANALYSIS, AgentType.CODE, AgentType.CREATIVE],
+    )
+
+    # 4 Agenten bei maximal 2 gleichzeitig: zwei Runden
+    assert time.perf_counter() - start >= 0.1
@@ -0,0 +1,127 @@
+"""
+Tests für Agent-Pools
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents.agent_fleet import AgentFleet
+from cognitive_symphony.agents.agent_pool import AgentPool, AgentPoolConfig
+from cognitive_symphony.agents.research_agent import ResearchAgent
+from cognitive_symphony.models import AgentType, Task
+
+
+def echo_llm(delay=0.0):
+    """LLM mit optionaler Latenz"""
+
+    async def respond(prompt):
+        await asyncio.sleep(delay)
+        return AIMessage(content="Ergebnis")
+
+    return RunnableLambda(respond)
+
+
+def research_pool(**config):
+    """Research-Pool mit lokalem LLM"""
+    llm = echo_llm()
+    return AgentPool(AgentType.RESEARCH, lambda: ResearchAgent(llm), AgentPoolConfig(**config))
+
+
+def test_least_outstanding_dispatch():
+    """Test Verteilung auf die Instanz mit den wenigsten laufenden Aufgaben"""
+    pool = research_pool(min_size=2, max_size=2)
+
+    first = pool.acquire()
+    second = pool.acquire()
+    assert first is not second
+
+    pool.release(first)
+    assert pool.acquire() is first
+    assert pool.get_metrics()["peak_outstanding"] == 2
+
+
+def test_scale_up_and_down_on_queue_depth():
+    """Test Skalierung nach Warteschlangentiefe und Abbau nach Leerlauf"""
+    pool = research_pool(min_size=1, max_size=3, scale_up_queue_depth=1.0, idle_seconds=0.0)
+
+    leased = [pool.acquire() for _ in range(4)]
+    assert pool.size == 3
+    assert pool.scale_ups == 2
+
+    for agent in leased:
+        pool.release(agent)
+
+    assert pool.size == 1
+    assert pool.scale_downs == 2
+
+
+def test_retired_instances_merge_into_aggregate():
+    """Test dass entfernte Instanzen in ein laufendes Aggregat eingehen statt sich anzusammeln"""
+    pool = research_pool(min_size=1, max_size=2, scale_up_queue_depth=1.0, idle_seconds=0.0)
+
+    for round_ in range(3):
+        leased = [pool.acquire() for _ in range(2)]
+        extra = leased[1]
+        extra.performance.tasks_completed = 2
+        extra.performance.avg_execution_time = 1.0 + round_
+        extra.latency.record(1.0 + round_, success=True)
+        for agent in leased:
+            pool.release(agent)
+
+    assert pool.scale_downs == 3
+    assert pool.retired_performance.tasks_completed == 6
+    assert pool.retired_performance.avg_execution_time == pytest.approx(2.0)
+    assert pool.retired_latency.snapshot()["success"]["count"] == 3
+
+    metrics = pool.get_performance_metrics()
+    assert metrics["tasks_completed"] == 6
+    assert metrics["avg_execution_time"] == pytest.approx(2.0)
+
+
+def test_scale_up_on_expected_wait():
+    """Test Skalierung, wenn die beobachtete Ausführungszeit lange Wartezeiten erwarten lässt"""
+    pool = research_pool(max_size=2, scale_up_queue_depth=10.0, scale_up_wait_seconds=5.0)
+    pool.primary.performance.tasks_completed = 1
+    pool.primary.performance.avg_execution_time = 30.0
+
+    pool.acquire()
+    assert pool.size == 1
+
+    pool.acquire()
+    assert pool.size == 2
+
+
+@pytest.mark.asyncio
+async def test_fleet_dispatches_over_pool():
+    """Test dass gleichzeitige Aufgaben eines Typs auf mehrere Instanzen verteilt werden"""
+    fleet = AgentFleet(
+        llm=echo_llm(0.05),
+        pool_configs={
+            AgentType.RESEARCH: AgentPoolConfig(max_size=3, scale_up_queue_depth=1.0)
+        },
+    )
+
+    await asyncio.gather(
+        *[fleet.execute_task(Task(description="Test"), [AgentType.RESEARCH]) for _ in range(3)]
+    )
+
+    pool_metrics = fleet.get_pool_metrics()["research"]
+    assert pool_metrics["size"] == 3
+    assert all(i["tasks_completed"] == 1 for i in pool_metrics["instances"].values())
+
+    metrics = fleet.get_performance_metrics()["research"]
+    assert metrics["tasks_completed"] == 3
+    assert "code" not in fleet.get_pool_metrics()
+
+
+def test_pool_with_own_model():
+    """Test eigenes Modell für einen heißen Agent-Typ"""
+    fleet = AgentFleet(
+        pool_configs={AgentType.RESEARCH: AgentPoolConfig(model="gpt-3.5-turbo")},
+    )
+
+    assert fleet.get_agent(AgentType.RESEARCH).llm.model == "gpt-3.5-turbo"
+    assert fleet.get_agent(AgentType.CODE).llm.model != "gpt-3.5-turbo"
@@ -0,0 +1,142 @@
+"""
+Tests für die Agent-Registry und die verzögerte Agenten-Erzeugung
+"""
+
+from importlib.metadata import EntryPoint
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from langchain.prompts import ChatPromptTemplate
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents import registry as registry_module
+from cognitive_symphony.agents.agent_fleet import AgentFleet
+from cognitive_symphony.agents.base_agent import BaseAgent
+from cognitive_symphony.agents.registry import ENTRY_POINT_GROUP, AgentRegistry
+from cognitive_symphony.models import AgentCapability, AgentType, Task
+
+
+class TranslatorAgent(BaseAgent):
+    """Plugin-Agent außerhalb des AgentType-Enums"""
+
+    def __init__(self, llm: Any):
+        super().__init__("translator", llm)
+
+    def _initialize_capabilities(self) -> List[AgentCapability]:
+        return [
+            AgentCapability(
+                name="translation",
+                description="Übersetzung zwischen Sprachen",
+                skill_level=0.8,
+                success_rate=0.9,
+            )
+        ]
+
+    def _build_prompt(self, task: Task) -> Tuple[ChatPromptTemplate, Dict[str, Any]]:
+        return ChatPromptTemplate.from_messages([("human", "{task}")]), {"task": task.description}
+
+    def _build_result(self, task: Task, content: str) -> Dict[str, Any]:
+        return {"type": "translation_result", "translation": content, "agent": "translator"}
+
+
+def echo_llm():
+    """LLM ohne Latenz"""
+
+    async def respond(prompt):
+        return AIMessage(content="Ergebnis")
+
+    return RunnableLambda(respond)
+
+
+def test_agents_are_created_on_first_use():
+    """Test dass Agenten erst beim ersten Zugriff erzeugt werden"""
+    created = []
+    registry = AgentRegistry(discover_plugins=False)
+    registry.register(
+        AgentType.RESEARCH, lambda llm: created.append("research") or TranslatorAgent(llm)
+    )
+
+    fleet = AgentFleet(llm=echo_llm(), registry=registry)
+    assert created == []
+    assert fleet.get_registry_info()["instantiated"] == []
+    assert not registry.is_loaded(AgentType.CODE)
+
+    fleet.get_agent(AgentType.RESEARCH)
+    assert created == ["research"]
+    assert fleet.get_registry_info()["instantiated"] == ["research"]
+
+
+@pytest.mark.asyncio
+async def test_enabled_agents_restrict_active_set():
+    """Test Einschränkung der aktiven Agenten"""
+    fleet = AgentFleet(llm=echo_llm(), enabled_agents=["research", "unbekannt"])
+
+    assert fleet.active_types == [AgentType.RESEARCH]
+    assert fleet.get_agent(AgentType.CODE) is None
+
+    result = await fleet.execute_task(
+        Task(description="Test"), [AgentType.CODE, AgentType.RESEARCH]
+    )
+    assert result["type"] == "research_result"
+    assert list(fleet.get_agent_capabilities()) == ["research"]
+
+
+@pytest.mark.asyncio
+async def test_explicitly_registered_plugin():
+    """Test Plugin-Agent per expliziter Registrierung"""
+    registry = AgentRegistry(discover_plugins=False)
+    registry.register("translator", TranslatorAgent)
+    fleet = AgentFleet(llm=echo_llm(), registry=registry, enabled_agents=["translator"])
+
+    result = await fleet.execute_task(Task(description="Übersetze"), ["translator"])
+
+    assert result["type"] == "translation_result"
+    assert fleet.get_performance_metrics()["translator"]["tasks_completed"] == 1
+
+
+def test_entry_point_discovery(monkeypatch):
+    """Test Plugin-Erkennung über Entry Points ohne sofortigen Import"""
+    entry_point = EntryPoint(
+        name="translator", value=f"{__name__}:TranslatorAgent", group=ENTRY_POINT_GROUP
+    )
+    monkeypatch.setattr(registry_module, "entry_points", lambda group: [entry_point])
+
+    registry = AgentRegistry()
+    assert "translator" in registry
+    assert not registry.is_loaded("translator")
+
+    assert registry.load("translator") is TranslatorAgent
+    assert registry.get_info()["loaded"] == ["translator"]
+
+    with pytest.raises(ValueError):
+        registry.load("unbekannt")
+
+
+def test_capability_index_without_instances():
+    """Test Capability-Index aus Deklarationen und Metadaten, ohne Agenten zu erzeugen"""
+    created = []
+    registry = AgentRegistry(discover_plugins=False)
+    registry.register(
+        "translator",
+        lambda llm: created.append("translator") or TranslatorAgent(llm),
+        capabilities=TranslatorAgent(echo_llm()).capabilities,
+    )
+    fleet = AgentFleet(llm=echo_llm(), registry=registry)
+
+    assert fleet.find_agents_for_capabilities(["translation"])[0][0] == "translator"
+    assert fleet.find_agents_for_capabilities(["Code Review"])[0][0] == AgentType.CODE
+    assert "Web Research" in [c["name"] for c in fleet.get_agent_capabilities()["research"]]
+    assert created == []
+    assert fleet.get_registry_info()["instantiated"] == []
+
+
+def test_undeclared_plugin_capabilities_need_instance():
+    """Test Plugin ohne CAPABILITIES: Fähigkeiten nur über eine Instanz"""
+    registry = AgentRegistry(builtins=False, discover_plugins=False)
+    registry.register("translator", TranslatorAgent)
+    fleet = AgentFleet(llm=echo_llm(), registry=registry)
+
+    assert registry.capabilities("translator") is None
+    assert fleet.find_agents_for_capabilities(["translation"])[0][0] == "translator"
+    assert fleet.get_registry_info()["instantiated"] == ["translator"]
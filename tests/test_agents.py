@@ -6,9 +6,28 @@ import pytest
 from cognitive_symphony.agents.code_agent import CodeAgent
 from cognitive_symphony.agents.research_agent import ResearchAgent
 from cognitive_symphony.models import Task
+from langchain_core.messages import AIMessage, AIMessageChunk
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 
 
+class FakeStreamingLLM(Runnable):
+    """Lokales LLM, das eine feste Antwort Token für Token liefert"""
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def invoke(self, input, config=None, **kwargs):
+        return AIMessage(content="".join(self.tokens))
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        return self.invoke(input, config)
+
+    async def astream(self, input, config=None, **kwargs):
+        for token in self.tokens:
+            yield AIMessageChunk(content=token)
+
+
 @pytest.fixture
 def llm():
     """LLM Fixture"""
@@ -27,6 +46,51 @@ async def test_code_agent_execution(llm):
     assert agent.performance.tasks_completed == 1
 
 
+@pytest.mark.asyncio
+async def test_code_agent_streaming():
+    """Test Streaming-Pfad liefert Tokens und dasselbe Ergebnis wie execute()"""
+    agent = CodeAgent(FakeStreamingLLM(["def ", "fib", "(n): ..."]))
+    task = Task(description="Schreibe eine Python-Funktion für Fibonacci")
+
+    events = [event async for event in agent.execute_stream(task)]
+
+    tokens = [e["content"] for e in events if e["type"] == "token"]
+    assert tokens == ["def ", "fib", "(n): ..."]
+    assert events[-1]["type"] == "result"
+    assert events[-1]["result"] == await agent.execute(task)
+    assert agent.performance.streamed_tasks == 1
+
+
+@pytest.mark.asyncio
+async def test_execute_with_metrics_records_time_to_first_token():
+    """Test Time-to-First-Token-Messung über on_token"""
+    agent = CodeAgent(FakeStreamingLLM(["a", "b"]))
+    received = []
+
+    result = await agent.execute_with_metrics(Task(description="Test"), on_token=received.append)
+
+    assert received == ["a", "b"]
+    assert result["code"] == "ab"
+    assert agent.performance.tasks_completed == 1
+    assert agent.get_performance_metrics()["avg_time_to_first_token"] >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_closed_stream_records_cancellation():
+    """Test vorzeitig geschlossener Stream zählt als abgebrochen, nicht als Erfolg/Fehler"""
+    agent = CodeAgent(FakeStreamingLLM(["a", "b", "c"]))
+    stream = agent.execute_stream(Task(description="Test"))
+
+    async for event in stream:
+        break
+    await stream.aclose()
+
+    assert agent.performance.tasks_cancelled == 1
+    assert agent.performance.tasks_completed == 0
+    assert agent.performance.tasks_failed == 0
+    assert agent.get_performance_metrics()["tasks_cancelled"] == 1
+
+
 @pytest.mark.asyncio
 async def test_research_agent_execution(llm):
     """Test ResearchAgent Ausführung"""
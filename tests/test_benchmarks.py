@@ -0,0 +1,141 @@
+"""
+Tests für die Benchmark-Suite
+"""
+
+import json
+
+import pytest
+
+from benchmarks import (
+    bench_memory,
+    bench_orchestration,
+    bench_payload,
+    bench_recall,
+    bench_tiering,
+    bench_vector,
+)
+from benchmarks.common import percentile, save_results, summarize
+from benchmarks.compare import compare
+
+
+def test_percentile_interpolation():
+    """Test Perzentile mit linearer Interpolation"""
+    values = [1.0, 2.0, 3.0, 4.0]
+
+    assert percentile(values, 50) == pytest.approx(2.5)
+    assert percentile(values, 100) == 4.0
+    assert summarize([0.001, 0.002])["p50"] == pytest.approx(1.5)
+
+
+@pytest.mark.asyncio
+async def test_orchestration_scenarios(tmp_path):
+    """Test dass alle Szenarien mit dem Fake-LLM laufen und Metriken liefern"""
+    args = bench_orchestration.parse_args(
+        [
+            "--tasks", "5",
+            "--wide-tasks", "1",
+            "--wide-subtasks", "10",
+            "--long-running-tasks", "4",
+            "--sample-every", "2",
+        ]
+    )
+
+    results = await bench_orchestration.run(args)
+
+    assert set(results) == set(bench_orchestration.SCENARIOS)
+    assert results["concurrent"]["tasks"] == 5
+    assert results["wide"]["subtasks"] == 10
+    assert all(r["failed_tasks"] == 0 for r in results.values())
+    assert results["sequential"]["latency_ms"]["p99"] > 0
+    assert len(results["long_running"]["timeline"]) == 2
+
+    path = save_results("orchestration", results, vars(args), tmp_path)
+    saved = json.loads(path.read_text())
+    rows = compare(saved, saved)
+
+    assert saved["environment"]["python"]
+    assert all(row["change_pct"] in (0.0, None) for row in rows)
+
+
+def test_memory_scale_benchmark():
+    """Test Populationsaufbau und Messung aller Memory-Operationen"""
+    args = bench_memory.parse_args(["--sizes", "200", "--ops", "3", "--no-save"])
+
+    result = bench_memory.run(args)["200"]
+
+    assert result["memory_metrics"]["episodic_memory_size"] == 203
+    assert result["memory_metrics"]["semantic_memory_size"] == 23
+    assert result["operations_ms"]["recall_episodes_common"]["count"] == 3
+    assert set(result["operations_ms"]) >= {"store_episode", "cleanup", "recall_knowledge"}
+
+
+def test_memory_scale_benchmark_with_budget():
+    """Test Populationsaufbau mit Budget der episodischen Schicht"""
+    args = bench_memory.parse_args(
+        ["--sizes", "200", "--max-episodes", "50", "--ops", "2", "--no-save"]
+    )
+
+    result = bench_memory.run(args)["200"]
+
+    assert result["memory_metrics"]["episodic_memory_size"] == 50
+    assert result["memory_metrics"]["eviction"]["episodic"]["evicted"] == 152
+
+
+def test_recall_benchmark():
+    """Test BM25-Benchmark inkl. Vergleich mit linearem Scan"""
+    args = bench_recall.parse_args(["--sizes", "300", "--ops", "2", "--no-save"])
+
+    result = bench_recall.run(args)["300"]
+
+    assert result["index_metrics"]["documents"] == 297
+    assert result["operations_ms"]["bm25_rare"]["count"] == 2
+    assert set(result["speedup_p50"]) == {"common", "rare"}
+
+
+def test_vector_benchmark():
+    """Test Vektor-Benchmark inkl. Recall@k gegen exakte Suche"""
+    args = bench_vector.parse_args(
+        ["--sizes", "600", "--ops", "2", "--queries", "5", "--train-threshold", "200",
+         "--probes", "2", "64", "--no-save"]
+    )
+
+    result = bench_vector.run(args)["600"]
+
+    assert result["index_metrics"]["trained"]
+    assert result["index_metrics"]["vectors"] == 594
+    assert result["operations_ms"]["ann_probes_2"]["count"] == 2
+    # Alle Listen durchsucht = exakt
+    assert result["recall_at_k"]["64"] == 1.0
+
+
+def test_payload_benchmark():
+    """Test Vergleich von Dict- und komprimierten Episoden"""
+    args = bench_payload.parse_args(
+        ["--episodes", "20", "--response-words", "50", "--ops", "2", "--no-save"]
+    )
+
+    results = bench_payload.run(args)
+
+    assert results["dict"]["episode_payload"]["compressed_episodes"] == 0
+    assert results["compressed"]["episode_payload"]["compressed_episodes"] == 20
+    assert (
+        results["compressed"]["content_bytes_per_episode"]
+        < results["dict"]["content_bytes_per_episode"]
+    )
+
+
+def test_tiering_benchmark():
+    """Test Hot-Tier gegen alles im Speicher"""
+    args = bench_tiering.parse_args(
+        ["--episodes", "20", "--response-words", "50", "--ops", "5", "--no-save"]
+    )
+
+    results = bench_tiering.run(args)
+
+    assert results["in_memory"]["payload_tier"] is None
+    tier = results["tiered"]["payload_tier"]
+    assert tier["cold_entries"] > 0 and tier["hot_bytes"] <= results["tiered"]["hot_bytes"]
+    assert (
+        results["tiered"]["resident_content_bytes_per_episode"]
+        < results["in_memory"]["resident_content_bytes_per_episode"]
+    )
@@ -0,0 +1,139 @@
+"""
+Tests für das Blackboard
+"""
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.core.cognitive_symphony import CognitiveSymphony
+from cognitive_symphony.core.meta_orchestrator import MetaOrchestrator
+from cognitive_symphony.memory.blackboard import Blackboard
+from cognitive_symphony.models import AgentType, Task
+
+
+def scripted_llm(decomposition):
+    """LLM, das Zerlegungen fest beantwortet und Agenten-Prompts zählt"""
+    prompts = []
+
+    async def respond(prompt):
+        text = prompt.to_string()
+        if "Teilaufgaben zerlegt" in text:
+            return AIMessage(content=decomposition)
+        prompts.append(text)
+        return AIMessage(content=f"Ergebnis {len(prompts)}")
+
+    return RunnableLambda(respond), prompts
+
+
+def test_inject_only_dependencies_with_limits():
+    """Test dass nur Einträge der Abhängigkeiten gekürzt injiziert werden"""
+    blackboard = Blackboard("root", max_entry_chars=10, max_total_chars=100)
+    blackboard.write("a", "Recherche", AgentType.RESEARCH, {"findings": "x" * 50})
+    blackboard.write("b", "Code", AgentType.CODE, {"code": "print()"})
+
+    task = Task(description="Analyse", metadata={"dependencies": ["a"]})
+
+    assert blackboard.inject(task) == 1
+    assert task.context["blackboard"][0]["agent"] == "research"
+    assert task.context["blackboard"][0]["findings"] == "x" * 10 + " ..."
+    assert blackboard.get_metrics()["truncated_entries"] == 1
+
+
+def test_identical_subtasks_are_reused():
+    """Test Wiederverwendung identischer Teilaufgaben über die Nummerierung hinweg"""
+    blackboard = Blackboard("root")
+    result = {"type": "research_result", "findings": "Markt wächst"}
+    first = Task(description="Schritt 1: Marktanalyse")
+    assert blackboard.find_result(first, AgentType.RESEARCH) is None
+    blackboard.write(first.id, first.description, AgentType.RESEARCH, result)
+
+    repeated = Task(description="Schritt 4: Marktanalyse")
+    reused = blackboard.find_result(repeated, AgentType.RESEARCH)
+
+    assert reused == result and reused is not result
+    reused["findings"] = "verändert"
+    assert blackboard.find_result(repeated, AgentType.RESEARCH) == result
+    assert blackboard.find_result(repeated, AgentType.CODE) is None
+    assert blackboard.get_metrics()["tokens_saved"] > 0
+
+
+def test_reuse_requires_same_context_and_dependencies():
+    """Test keine Wiederverwendung bei anderem Kontext oder anderen Abhängigkeits-Ergebnissen"""
+    blackboard = Blackboard("root")
+    blackboard.write("a", "Recherche", AgentType.RESEARCH, {"findings": "Umsatz 10"})
+    blackboard.write("b", "Recherche", AgentType.RESEARCH, {"findings": "Umsatz 20"})
+
+    first = Task(description="Schritt 2: Bewertung", metadata={"dependencies": ["a"]})
+    blackboard.find_result(first, AgentType.RESEARCH)
+    blackboard.write(first.id, first.description, AgentType.RESEARCH, {"findings": "gut"})
+
+    other_dependency = Task(description="Schritt 3: Bewertung", metadata={"dependencies": ["b"]})
+    other_context = Task(
+        description="Bewertung", metadata={"dependencies": ["a"]}, context={"region": "EU"}
+    )
+    same = Task(description="Bewertung", metadata={"dependencies": ["a"]})
+
+    assert blackboard.find_result(other_dependency, AgentType.RESEARCH) is None
+    assert blackboard.find_result(other_context, AgentType.RESEARCH) is None
+    assert blackboard.find_result(same, AgentType.RESEARCH) == {"findings": "gut"}
+
+
+def test_parse_dependencies():
+    """Test explizite und implizite Abhängigkeiten aus der Zerlegung"""
+    llm, _ = scripted_llm("")
+    orchestrator = MetaOrchestrator(llm=llm)
+
+    subtasks = orchestrator._parse_subtasks_from_response(
+        "Schritt 1: Recherche\n"
+        "Schritt 2: Entwurf\n"
+        "Abhängigkeiten: keine\n"
+        "Schritt 3: Bewertung\n"
+        "Abhängigkeiten: Schritt 1, 2",
+        "root",
+    )
+
+    assert len(subtasks) == 3
+    assert subtasks[0].metadata["dependencies"] == []
+    assert subtasks[1].metadata["dependencies"] == []
+    assert subtasks[2].metadata["dependencies"] == [subtasks[0].id, subtasks[1].id]
+
+    implicit = orchestrator._parse_subtasks_from_response("Schritt 1: A\nSchritt 2: B", "root")
+    assert implicit[1].metadata["dependencies"] == [implicit[0].id]
+
+
+@pytest.mark.asyncio
+async def test_solve_shares_findings_and_skips_redundant_work():
+    """Test dass abhängige Schritte Findings erhalten und Wiederholungen kein LLM aufrufen"""
+    llm, prompts = scripted_llm(
+        "Schritt 1: Marktanalyse\nAgent: research\n"
+        "Schritt 2: Bewertung\nAgent: analysis\n"
+        "Schritt 3: Marktanalyse\nAgent: research\nAbhängigkeiten: keine"
+    )
+    symphony = CognitiveSymphony(enable_learning=False, llm=llm)
+
+    result = await symphony.solve("Bewerte den Markt")
+
+    agent_prompts = [p for p in prompts if "Agent" in p]
+    assert len(agent_prompts) == 2
+    assert "Ergebnis 1" in agent_prompts[1]
+    assert result.performance_metrics["blackboard_reused_results"] == 1
+    assert result.performance_metrics["subtasks_completed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_dependent_subtask_receives_reused_findings():
+    """Test dass eine Teilaufgabe nach einer Wiederverwendung deren Findings erhält"""
+    llm, prompts = scripted_llm(
+        "Schritt 1: Marktanalyse\nAgent: research\n"
+        "Schritt 2: Marktanalyse\nAgent: research\nAbhängigkeiten: keine\n"
+        "Schritt 3: Bewertung\nAgent: analysis\nAbhängigkeiten: Schritt 2"
+    )
+    symphony = CognitiveSymphony(enable_learning=False, llm=llm)
+
+    result = await symphony.solve("Bewerte den Markt")
+
+    agent_prompts = [p for p in prompts if "Agent" in p]
+    assert len(agent_prompts) == 2
+    assert "Ergebnis 1" in agent_prompts[1]
+    assert result.performance_metrics["blackboard_reused_results"] == 1
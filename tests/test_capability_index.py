@@ -0,0 +1,77 @@
+"""
+Tests für den Capability-Index
+"""
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents.agent_fleet import AgentFleet
+from cognitive_symphony.agents.capability_index import CapabilityIndex, tokenize
+from cognitive_symphony.models import AgentCapability, AgentType
+from cognitive_symphony.synthesis.adaptive_synthesizer import AdaptiveAgentSynthesizer
+
+
+def capability(name, description="", skill_level=0.8):
+    """Capability mit Default-Werten"""
+    return AgentCapability(
+        name=name, description=description, skill_level=skill_level, success_rate=0.9
+    )
+
+
+def echo_llm():
+    """LLM ohne Latenz"""
+
+    async def respond(prompt):
+        return AIMessage(content="Ergebnis")
+
+    return RunnableLambda(respond)
+
+
+def test_tokenize():
+    """Test Normalisierung und Stoppwörter"""
+    assert tokenize("Unit-Tests, Integration und E2E") == ["unit", "tests", "integration", "e2e"]
+
+
+def test_ranked_search():
+    """Test Ranking nach Abdeckung statt erstem Treffer"""
+    index = CapabilityIndex()
+    index.add_agent("data", [capability("Data Analysis", "Statistik und Auswertung")])
+    index.add_agent("viz", [capability("Data Visualization", "Diagramme")])
+    index.add_agent("web", [capability("Web Research")])
+
+    ranked = index.search(["Data Analysis"])
+    assert [agent for agent, _ in ranked] == ["data", "viz"]
+    assert ranked[0][1] > ranked[1][1]
+
+    # Sprachvariante über den Präfix-Stamm
+    assert index.search(["Analyse"])[0][0] == "data"
+
+
+def test_remove_and_replace_agent():
+    """Test dass ersetzte Agenten keine verwaisten Postings hinterlassen"""
+    index = CapabilityIndex()
+    index.add_agent("a", [capability("Security Audit")])
+    index.add_agent("a", [capability("Code Review")])
+
+    assert index.search(["Security"]) == []
+    assert index.search(["Code"])[0][0] == "a"
+
+    index.remove_agent("a")
+    assert index.get_metrics() == {"agents": 0, "tokens": 0, "stems": 0, "postings": 0}
+
+
+@pytest.mark.asyncio
+async def test_synthesizer_uses_fleet_index():
+    """Test Auswahl der Basis-Agenten über den Index der Flotte"""
+    fleet = AgentFleet(llm=echo_llm())
+    synthesizer = AdaptiveAgentSynthesizer(echo_llm(), fleet)
+
+    agents = await synthesizer._find_suitable_base_agents(["Security Analysis", "Code Review"])
+
+    assert agents[0] == AgentType.CODE
+    assert AgentType.SECURITY in agents
+    assert fleet.get_capability_index() is fleet.get_capability_index()
+
+    fallback = await synthesizer._find_suitable_base_agents(["Quantenphysik"])
+    assert fallback == [AgentType.RESEARCH, AgentType.ANALYSIS]
@@ -0,0 +1,143 @@
+"""
+Tests für die isolierte Verifikation von CodeAgent-Ergebnissen
+"""
+
+import asyncio
+import time
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents.code_agent import CodeAgent
+from cognitive_symphony.agents.code_verifier import CodeVerifier, extract_code_and_tests
+from cognitive_symphony.core.cognitive_symphony import CognitiveSymphony
+from cognitive_symphony.models import Task
+
+SOLUTION = """Hier ist die Lösung:
+
+```python
+def add(a, b):
+    return a + b
+```
+
+Und die Tests:
+
+```python
+def test_add():
+    assert add(2, 3) == 5
+```
+"""
+
+
+def fence(code):
+    """Verpackt Code in einen Markdown-Block"""
+    return f"```python\n{code}\n```"
+
+
+def fixed_llm(content):
+    """LLM mit fester Antwort"""
+
+    async def respond(prompt):
+        return AIMessage(content=content)
+
+    return RunnableLambda(respond)
+
+
+def test_extract_code_and_tests():
+    """Test Trennung von Code- und Test-Blöcken"""
+    code, tests = extract_code_and_tests(SOLUTION)
+
+    assert "def add" in code and "def test_add" not in code
+    assert "def test_add" in tests
+    assert extract_code_and_tests("Keine Code-Blöcke") == ("", "")
+
+
+@pytest.mark.asyncio
+async def test_passing_and_failing_tests():
+    """Test Ausführung bestandener und fehlschlagender Tests"""
+    verifier = CodeVerifier(timeout_seconds=10.0)
+
+    passed = await verifier.verify(SOLUTION)
+    assert passed.status == "passed"
+    assert passed.tests_run == 1
+    assert passed.runtime > 0
+
+    failed = await verifier.verify(SOLUTION.replace("== 5", "== 6"))
+    assert failed.status == "failed"
+    assert failed.failures == 1
+    assert "AssertionError" in failed.output
+
+    skipped = await verifier.verify("Nur Text")
+    assert skipped.status == "skipped"
+    assert verifier.get_metrics()["passed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_limits_are_enforced():
+    """Test Zeit- und Speicherlimit"""
+    verifier = CodeVerifier(timeout_seconds=1.0, memory_mb=256)
+
+    start = time.perf_counter()
+    timeout = await verifier.verify(fence("while True:\n    pass"))
+    assert timeout.status == "timeout"
+    assert time.perf_counter() - start < 5
+
+    memory = await verifier.verify(fence("data = bytearray(1024 * 1024 * 1024)"))
+    assert memory.status == "failed"
+    assert "MemoryError" in memory.output
+
+
+@pytest.mark.asyncio
+async def test_cancellation_reaps_process(monkeypatch):
+    """Test dass ein abgebrochener Lauf den Subprozess beendet und abholt"""
+    verifier = CodeVerifier(timeout_seconds=30.0)
+    killed = []
+    kill = CodeVerifier._kill
+    monkeypatch.setattr(
+        CodeVerifier, "_kill", staticmethod(lambda process: killed.append(process) or kill(process))
+    )
+
+    task = asyncio.create_task(verifier.verify(fence("import time\ntime.sleep(30)")))
+    await asyncio.sleep(0.5)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert killed and killed[0].returncode is not None
+
+
+@pytest.mark.asyncio
+async def test_parallelism_is_bounded():
+    """Test Obergrenze gleichzeitiger Prüfungen"""
+    verifier = CodeVerifier(max_workers=1)
+    code = fence("import time\ntime.sleep(0.3)")
+
+    start = time.perf_counter()
+    await asyncio.gather(verifier.verify(code), verifier.verify(code))
+
+    assert time.perf_counter() - start >= 0.6
+
+
+@pytest.mark.asyncio
+async def test_code_agent_attaches_verification():
+    """Test dass der CodeAgent das Verifikationsergebnis anhängt"""
+    agent = CodeAgent(fixed_llm(SOLUTION), verifier=CodeVerifier())
+
+    result = await agent.execute_with_metrics(Task(description="Addiere zwei Zahlen"))
+
+    assert result["tests_included"] is True
+    assert result["verification"]["passed"] is True
+    assert result["verification"]["tests_run"] == 1
+
+
+def test_verification_feeds_learning():
+    """Test Bewertung von Ergebnissen für learn_from_outcome"""
+    symphony = CognitiveSymphony(llm=fixed_llm("Ergebnis"))
+    passed = {"type": "code_result", "verification": {"status": "passed", "passed": True}}
+    failed = {"type": "code_result", "verification": {"status": "failed", "passed": False}}
+
+    assert symphony._assess_result({"type": "research_result"}) == ("success", 0.8)
+    assert symphony._assess_result(passed) == ("success", 1.0)
+    assert symphony._assess_result(failed) == ("failure", 0.2)
+    assert symphony._assess_result({"combined_results": [passed, failed]}) == ("partial", 0.5)
@@ -0,0 +1,105 @@
+"""
+Tests für Latenz-Histogramme und Agenten-Perzentile
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents.agent_pool import AgentPool, AgentPoolConfig
+from cognitive_symphony.agents.research_agent import ResearchAgent
+from cognitive_symphony.models import AgentType, Task
+from cognitive_symphony.transparency.latency import LatencyHistogram, RateWindow
+
+
+def flaky_llm(delay=0.02, fail=False):
+    """LLM mit Latenz, das optional fehlschlägt"""
+
+    async def respond(prompt):
+        await asyncio.sleep(delay)
+        if fail:
+            raise ValueError("ungültige Anfrage")
+        return AIMessage(content="Ergebnis")
+
+    return RunnableLambda(respond)
+
+
+def test_histogram_percentiles():
+    """Test Perzentile mit begrenztem relativen Fehler und fester Größe"""
+    histogram = LatencyHistogram()
+    buckets = len(histogram.buckets)
+
+    values = [i / 1000 for i in range(1, 1001)]  # 1 ms .. 1 s
+    for value in values:
+        histogram.record(value)
+
+    for percentile, expected in [(50, 0.5), (90, 0.9), (99, 0.99)]:
+        assert histogram.percentile(percentile) == pytest.approx(expected, rel=0.05)
+
+    assert histogram.snapshot()["max"] == 1.0
+    assert len(histogram.buckets) == buckets
+
+    histogram.record(10_000.0)
+    assert histogram.percentile(100) == 10_000.0
+
+
+def test_rate_window_expires():
+    """Test Raten im gleitenden Fenster"""
+    now = [100.0]
+    window = RateWindow(window_seconds=10, clock=lambda: now[0])
+
+    for _ in range(20):
+        window.record()
+    assert window.rate() == 2.0
+
+    now[0] += 5
+    window.record()
+    assert window.total() == 21
+
+    now[0] += 6
+    assert window.total() == 1
+
+
+@pytest.mark.asyncio
+async def test_failures_update_metrics():
+    """Test dass Fehlschläge in Durchschnitt, Erfolgsrate und eigenes Histogramm eingehen"""
+    agent = ResearchAgent(flaky_llm(0.02))
+    await agent.execute_with_metrics(Task(description="Test"))
+
+    agent.llm.llm = flaky_llm(0.01, fail=True)
+    with pytest.raises(ValueError):
+        await agent.execute_with_metrics(Task(description="Test"))
+
+    performance = agent.performance
+    assert performance.tasks_failed == 1
+    assert performance.avg_success_rate == 0.5
+    assert performance.p50_execution_time >= 0.02
+    assert 0.0 < performance.p50_failure_time < performance.p50_execution_time
+    assert (
+        performance.p50_failure_time
+        < performance.avg_execution_time
+        < performance.p50_execution_time
+    )
+    assert performance.tasks_per_second > 0
+
+    latency = agent.get_performance_metrics()["latency"]
+    assert latency["success"]["count"] == 1
+    assert latency["failure"]["count"] == 1
+    assert latency["window_success_rate"] == 0.5
+
+
+@pytest.mark.asyncio
+async def test_pool_merges_instance_histograms():
+    """Test zusammengeführte Perzentile über Pool-Instanzen"""
+    llm = flaky_llm(0.01)
+    pool = AgentPool(
+        AgentType.RESEARCH, lambda: ResearchAgent(llm), AgentPoolConfig(min_size=2, max_size=2)
+    )
+
+    await asyncio.gather(*[pool.execute_with_metrics(Task(description="Test")) for _ in range(4)])
+
+    latency = pool.get_performance_metrics()["latency"]
+    assert latency["success"]["count"] == 4
+    assert latency["success"]["p99"] >= 0.01
@@ -0,0 +1,84 @@
+"""
+Tests für den BM25-Index des episodischen Gedächtnisses
+"""
+
+from datetime import datetime, timedelta
+
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.memory.text_index import BM25Index
+from cognitive_symphony.models import Task, TaskPriority, TaskStatus
+
+
+def test_bm25_ranking():
+    """Test Ranking nach Term-Frequenz, Seltenheit und Tags"""
+    index = BM25Index()
+    index.add("a", "A", "Datenbank Migration planen")
+    index.add("b", "B", "Datenbank Datenbank Index optimieren")
+    index.add("c", "C", "Frontend testen", tags=["datenbank"])
+    index.add("d", "D", "Deployment automatisieren")
+
+    ranked = [item for item, _ in index.search("Datenbank", limit=10)]
+    # Einfaches Vorkommen zuletzt, Tag zählt wie doppeltes Vorkommen
+    assert set(ranked[:2]) == {"B", "C"}
+    assert ranked[2] == "A"
+
+    assert [item for item, _ in index.search("datenbank migration", limit=1)] == ["A"]
+    assert index.search("Kubernetes") == []
+    assert index.search("   ") == []
+
+
+def test_importance_and_recency_blend():
+    """Test Mischung von Relevanz mit Wichtigkeit und Aktualität"""
+    now = 1_000_000.0
+    index = BM25Index(clock=lambda: now)
+    index.add("old", "old", "Bericht", importance=0.9, timestamp=now - 365 * 86400)
+    index.add("new", "new", "Bericht", importance=0.1, timestamp=now)
+
+    by_importance = index.search("Bericht", importance_weight=0.5)
+    by_recency = index.search("Bericht", recency_weight=0.5)
+
+    assert [item for item, _ in by_importance] == ["old", "new"]
+    assert [item for item, _ in by_recency] == ["new", "old"]
+
+
+def test_remove_and_compaction():
+    """Test Tombstones und Kompaktierung ohne verwaiste Treffer"""
+    index = BM25Index()
+    for i in range(3000):
+        index.add(str(i), i, f"eintrag gruppe{i % 3}")
+    for i in range(2000):
+        assert index.remove(str(i))
+
+    assert index.get_metrics()["tombstones"] < 2000
+    assert not index.remove("0")
+    assert len(index) == 1000
+
+    index.compact()
+    results = index.search("gruppe1", limit=1000)
+    assert {item for item, _ in results} == {i for i in range(2000, 3000) if i % 3 == 1}
+    assert index.get_metrics()["postings"] == 1000 * 2
+
+
+def test_recall_episodes_uses_index():
+    """Test Recall über Beschreibung und Tags sowie Pruning beim Cleanup"""
+    memory = MemorySystem()
+    failed = Task(description="Deploy Service", status=TaskStatus.FAILED)
+    memory.store_episode(failed, [], [])
+    memory.store_episode(
+        Task(description="Analysiere Logdateien", status=TaskStatus.COMPLETED), [], []
+    )
+
+    found = memory.recall_episodes("logdateien")
+    assert [e.content["task"]["description"] for e in found] == ["Analysiere Logdateien"]
+    assert memory.recall_episodes("failed")[0].content["task"]["id"] == failed.id
+    assert len(memory.recall_episodes()) == 2
+
+    # Alte, unwichtige Episode fällt beim Cleanup aus Liste und Index
+    old = Task(description="Archivierter Lauf", priority=TaskPriority.LOW)
+    memory.store_episode(old, [], [])
+    episode = memory.recall_episodes("archivierter")[0]
+    episode.timestamp = datetime.now() - timedelta(days=365)
+    memory._cleanup_old_memories()
+
+    assert memory.recall_episodes("archivierter") == []
+    assert memory.get_metrics()["episode_index"]["documents"] == 2
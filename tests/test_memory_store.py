@@ -0,0 +1,110 @@
+"""
+Tests für die Persistenz-Backends des Gedächtnis-Systems
+"""
+
+import sqlite3
+
+import pytest
+
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.memory.payload import CompressedPayload
+from cognitive_symphony.memory.storage import InMemoryStore, SQLiteMemoryStore
+from cognitive_symphony.models import AgentType, OrchestrationDecision, Task, TaskStatus
+
+
+def test_default_backend_is_in_memory():
+    """Test dass ohne Konfiguration nichts persistiert wird"""
+    memory = MemorySystem()
+
+    assert isinstance(memory.store, InMemoryStore)
+    assert memory.get_metrics()["store"] == {"backend": "memory"}
+
+
+def test_sqlite_roundtrip_restores_memory_and_performance(tmp_path):
+    """Test Wiederherstellung aller Schichten, Indizes und Agent-Performance"""
+    path = tmp_path / "memory.db"
+    memory = MemorySystem(store=SQLiteMemoryStore(path))
+    task = Task(description="Analysiere Logdateien", status=TaskStatus.COMPLETED)
+    decision = OrchestrationDecision(
+        task_id=task.id,
+        selected_agents=[AgentType.ANALYSIS, AgentType.CODE],
+        reasoning="Analyse",
+        confidence=0.9,
+        outcome="success",
+    )
+    memory.store_episode(task, [], [decision])
+    memory.store_knowledge({"fact": "Python Listen sind dynamische Arrays"}, ["python"], 0.8)
+    memory.store_workflow({"strategy": "Datenbank Migration in Stufen"}, 0.9, ["database"])
+    memory.close()
+
+    restored = MemorySystem(store=SQLiteMemoryStore(path))
+
+    assert [len(restored.episodic_memory), len(restored.semantic_memory)] == [1, 1]
+    assert restored.recall_episodes("logdateien")[0].id == memory.episodic_memory[0].id
+    assert restored.task_index[task.id][0] is restored.episodic_memory[0]
+    assert restored.recall_similar("Datenbank migrieren", k=1)[0].type == "procedural"
+
+    performance = restored.get_agent_performance_history()
+    assert performance[AgentType.ANALYSIS]["successful_tasks"] == 1
+    assert performance[AgentType.CODE]["avg_performance"] == 1.0
+    restored.close()
+
+
+def test_group_commit_and_indexed_queries(tmp_path):
+    """Test Bündelung vieler Schreibvorgänge, WAL-Modus und gefilterte Abfragen"""
+    store = SQLiteMemoryStore(tmp_path / "memory.db", batch_size=100, flush_interval=0.5)
+    memory = MemorySystem(store=store)
+    for i in range(300):
+        memory.store_knowledge({"fact": f"Fakt {i}"}, ["even" if i % 2 else "odd"], 0.7)
+    memory.flush()
+
+    metrics = memory.get_metrics()["store"]
+    assert metrics["written_operations"] == 300
+    assert metrics["transactions"] <= 10
+    assert metrics["pending_operations"] == 0
+
+    with sqlite3.connect(store.path) as connection:
+        assert connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    assert len(store.query_entries("semantic", tags=["even"], limit=1000)) == 150
+    assert store.query_entries(min_importance=0.8) == []
+
+    # Cleanup entfernt unwichtiges Wissen auch aus der Datenbank
+    memory.store_knowledge({"fact": "unwichtig"}, ["temp"], 0.1)
+    memory._cleanup_old_memories()
+    memory.flush()
+    assert store.query_entries(tags=["temp"]) == []
+    assert len(store.load_entries("semantic")) == 300
+    memory.close()
+
+
+def test_access_counts_persist_without_rewriting_content(monkeypatch, tmp_path):
+    """Test dass gebündelte Zugriffe nur access_count/last_accessed schreiben"""
+    path = tmp_path / "memory.db"
+    memory = MemorySystem(store=SQLiteMemoryStore(path))
+    task = Task(description="Analysiere Logdateien", result="Ergebnis " * 50)
+    memory.store_episode(task, [], [])
+    memory.flush()
+    with sqlite3.connect(path) as connection:
+        (blob,) = connection.execute("SELECT content FROM memory_entries").fetchone()
+
+    # Zugriffe dürfen den (ggf. ausgelagerten) Inhalt nicht lesen
+    monkeypatch.setattr(
+        CompressedPayload, "blob", property(lambda self: pytest.fail("Inhalt gelesen"))
+    )
+    for _ in range(3):
+        memory.recall_episodes("logdateien")
+    memory._apply_accesses()
+    memory.close()
+    monkeypatch.undo()
+
+    with sqlite3.connect(path) as connection:
+        row = connection.execute("SELECT access_count, content FROM memory_entries").fetchone()
+    assert row == (3, blob)
+
+    restored = MemorySystem(store=SQLiteMemoryStore(path))
+    (episode,) = restored.episodic_memory
+    assert episode.access_count == 3
+    assert episode.last_accessed > episode.timestamp
+    assert episode.content["task"]["result"] == task.result
+    restored.close()
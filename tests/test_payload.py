@@ -0,0 +1,76 @@
+"""
+Tests für komprimierte Episoden-Inhalte
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.memory.payload import CompressedPayload
+from cognitive_symphony.memory.storage import SQLiteMemoryStore
+from cognitive_symphony.models import MemoryEntry, Task, TaskStatus
+
+
+def test_payload_roundtrip_and_lazy_access():
+    """Test Kompression, Zusammenfassung und dict-artigen Zugriff"""
+    answer = "Die Analyse zeigt steigende Umsätze im Quartal. " * 50
+    content = {
+        "task": {"id": "t1", "status": TaskStatus.COMPLETED, "created_at": datetime(2025, 1, 2)},
+        "result": answer,
+        "reasoning": answer,
+    }
+
+    payload = CompressedPayload.encode(content, {"task_id": "t1"})
+
+    assert payload.summary["task_id"] == "t1"
+    assert payload.compressed_bytes * 10 < payload.raw_bytes
+    # Enums und Zeitpunkte liegen nach dem Dekodieren als Werte/ISO-Strings vor
+    assert payload["task"]["status"] == "completed"
+    assert payload["task"]["created_at"] == "2025-01-02T00:00:00"
+    assert payload.get("missing") is None
+    assert set(payload) == {"task", "result", "reasoning"}
+    assert payload.decode()["result"] == answer
+
+
+def test_entry_with_payload_serializes_decoded():
+    """Test JSON- und Dict-Ausgabe eines Eintrags mit komprimiertem Inhalt"""
+    content = {"task": {"id": "t1"}, "result": "Ergebnis"}
+    entry = MemoryEntry(type="episodic", content=CompressedPayload.encode(content, {}))
+
+    assert json.loads(entry.json())["content"] == content
+    assert json.loads(entry.model_dump_json())["content"] == content
+    assert entry.dict()["content"] == content
+    assert isinstance(entry.content, CompressedPayload)
+
+
+def test_memory_stores_compressed_episodes(tmp_path):
+    """Test komprimierte Episoden im Gedächtnis und im SQLite-Backend"""
+    path = tmp_path / "memory.db"
+    memory = MemorySystem(store=SQLiteMemoryStore(path))
+    task = Task(
+        description="Analysiere Verkaufsdaten",
+        status=TaskStatus.COMPLETED,
+        result="Ergebnis " * 200,
+    )
+    memory.store_episode(task, [], [])
+
+    episode = memory.episodic_memory[0]
+    assert isinstance(episode.content, CompressedPayload)
+    assert episode.content["task"]["result"] == task.result
+    assert memory.task_index[task.id] == [episode]
+    assert memory.recall_episodes("verkaufsdaten") == [episode]
+
+    payload = memory.get_metrics()["episode_payload"]
+    assert payload["compressed_episodes"] == 1
+    assert payload["compression_ratio"] > 5
+    memory.close()
+
+    with sqlite3.connect(path) as connection:
+        (blob,) = connection.execute("SELECT content FROM memory_entries").fetchone()
+    assert blob == episode.content.blob
+
+    restored = MemorySystem(store=SQLiteMemoryStore(path))
+    assert restored.episodic_memory[0].content["task"]["description"] == task.description
+    assert restored.recall_episodes("verkaufsdaten")[0].id == episode.id
+    restored.close()
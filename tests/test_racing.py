@@ -0,0 +1,129 @@
+"""
+Tests für den Race-Modus der Agent-Flotte
+"""
+
+import asyncio
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents.agent_fleet import AgentFleet, is_acceptable_result
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.managed_llm import ManagedLLM
+from cognitive_symphony.models import AgentType, Task, TaskPriority
+
+
+def delayed_llm(delay, content="Ergebnis"):
+    """LLM mit fester Latenz und fester Antwort"""
+
+    async def respond(prompt):
+        await asyncio.sleep(delay)
+        return AIMessage(content=content)
+
+    return RunnableLambda(respond)
+
+
+def test_acceptable_result():
+    """Test Kriterien für ein brauchbares Ergebnis"""
+    assert is_acceptable_result({"type": "research_result", "agent": "research", "findings": "x"})
+    assert not is_acceptable_result(
+        {"type": "research_result", "agent": "research", "findings": ""}
+    )
+    assert not is_acceptable_result({"error": "kaputt", "agent": "research"})
+    assert not is_acceptable_result({"findings": "x"})
+    assert not is_acceptable_result(None)
+
+
+@pytest.mark.asyncio
+async def test_first_acceptable_result_wins():
+    """Test dass der schnellste Agent gewinnt und die übrigen abgebrochen werden"""
+    fleet = AgentFleet(llm=delayed_llm(0.01))
+    slow = fleet.get_agent(AgentType.ANALYSIS)
+    cancelled = asyncio.Event()
+
+    async def hang(task, on_token=None):
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    slow.execute_with_metrics = hang
+
+    task = Task(description="Test")
+    result = await asyncio.wait_for(
+        fleet.execute_task(task, [AgentType.ANALYSIS, AgentType.RESEARCH], mode="race"),
+        timeout=1.0,
+    )
+
+    assert result["type"] == "research_result"
+    assert task.metadata["race_winner"] == "research"
+    assert cancelled.is_set()
+    assert fleet.pools[AgentType.ANALYSIS].total_outstanding == 0
+
+    races = fleet.get_execution_metrics()["races"]
+    assert races["wins"] == {"research": 1}
+    assert races["cancelled_candidates"] == 1
+
+
+@pytest.mark.asyncio
+async def test_unacceptable_results_are_skipped():
+    """Test dass fehlerhafte Ergebnisse nicht gewinnen"""
+    fleet = AgentFleet(llm=delayed_llm(0.05))
+
+    async def fail(task, on_token=None):
+        raise RuntimeError("kaputt")
+
+    fleet.get_agent(AgentType.CODE).execute_with_metrics = fail
+
+    result = await fleet.execute_task(
+        Task(description="Test"), [AgentType.CODE, AgentType.RESEARCH], mode="race"
+    )
+    assert result["agent"] == "research"
+
+    fleet.get_agent(AgentType.RESEARCH).execute_with_metrics = fail
+    result = await fleet.execute_task(
+        Task(description="Test"), [AgentType.CODE, AgentType.RESEARCH], mode="race"
+    )
+    assert [r["error"] for r in result["combined_results"]] == ["kaputt", "kaputt"]
+    assert fleet.get_execution_metrics()["races"]["no_acceptable_result"] == 1
+
+
+@pytest.mark.asyncio
+async def test_race_across_model_tiers_releases_limiter():
+    """Test Race eines Agenten über Modell-Stufen inkl. Freigabe des Limiter-Slots"""
+    slow_tier = ManagedLLM(delayed_llm(10.0), provider="race-test")
+    fleet = AgentFleet(
+        llm=delayed_llm(10.0), race_llms={"fast": delayed_llm(0.01), "slow": slow_tier}
+    )
+
+    task = Task(description="Test")
+    result = await asyncio.wait_for(
+        fleet.execute_task(task, [AgentType.RESEARCH], mode="race"), timeout=1.0
+    )
+
+    assert result["type"] == "research_result"
+    assert task.metadata["race_winner"] == "research:fast"
+
+    metrics = slow_tier.rate_limiter.get_metrics()
+    assert metrics["in_flight"] == 0
+    assert metrics["cancelled_requests"] == 1
+    assert metrics["failed_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_mode_by_priority(monkeypatch):
+    """Test Moduswahl über die Priorität der Aufgabe"""
+    monkeypatch.setattr(settings, "agent_execution_mode_by_priority", {"low": "race"})
+    fleet = AgentFleet(llm=delayed_llm(0.01))
+    agents = [AgentType.RESEARCH, AgentType.ANALYSIS]
+
+    raced = await fleet.execute_task(Task(description="Test", priority=TaskPriority.LOW), agents)
+    combined = await fleet.execute_task(Task(description="Test"), agents)
+
+    assert "type" in raced
+    assert len(combined["combined_results"]) == 2
+
+    with pytest.raises(ValueError):
+        await fleet.execute_task(Task(description="Test"), agents, mode="fastest")
@@ -0,0 +1,120 @@
+"""
+Tests für Provider-Rate-Limiting und adaptive Concurrency
+"""
+
+import asyncio
+import pytest
+from langchain.prompts import ChatPromptTemplate
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.managed_llm import ManagedLLM
+from cognitive_symphony.llm.rate_limiter import (
+    AIMDController,
+    ProviderRateLimiter,
+    TokenBucket,
+    is_rate_limit_error,
+)
+
+
+class RateLimitError(Exception):
+    """Simuliert einen 429-Fehler eines Provider-SDKs"""
+
+    status_code = 429
+
+
+def test_token_bucket_reservation():
+    """Test Wartezeit bei erschöpftem Kontingent"""
+    bucket = TokenBucket(per_minute=60)
+
+    assert bucket.reserve(60) == 0.0
+    assert bucket.reserve(1) == pytest.approx(1.0, abs=0.05)
+    assert TokenBucket(per_minute=0).reserve(10_000) == 0.0
+
+
+def test_aimd_increase_and_decrease():
+    """Test Additive Increase bei stabiler Latenz und Backoff bei 429"""
+    controller = AIMDController(min_limit=1, max_limit=8, initial_limit=2)
+
+    for _ in range(10):
+        controller.on_success(0.1)
+    assert controller.current_limit > 2
+
+    before = controller.current_limit
+    controller.on_throttle()
+    assert controller.current_limit < before
+
+
+def test_aimd_latency_spike():
+    """Test Backoff bei Latenzspitzen"""
+    controller = AIMDController(min_limit=1, max_limit=8, initial_limit=4)
+    controller.on_success(0.1)
+    controller.on_success(5.0)
+
+    assert controller.latency_spikes == 1
+    assert controller.current_limit == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limit_enforced():
+    """Test dass nie mehr Aufrufe als erlaubt gleichzeitig laufen"""
+    limiter = ProviderRateLimiter("test", max_concurrency=2)
+    limiter.concurrency.limit = 2
+    peak = 0
+
+    async def call():
+        nonlocal peak
+        await limiter.acquire()
+        peak = max(peak, limiter.in_flight)
+        await asyncio.sleep(0.01)
+        limiter.release(0.01)
+
+    await asyncio.gather(*[call() for _ in range(10)])
+
+    assert peak == 2
+    assert limiter.in_flight == 0
+    assert limiter.get_metrics()["total_requests"] == 10
+
+
+@pytest.mark.asyncio
+async def test_managed_llm_reports_throttling(monkeypatch):
+    """Test dass 429-Fehler die Concurrency reduzieren"""
+    monkeypatch.setattr(settings, "llm_max_retries", 0)
+
+    async def failing(_):
+        raise RateLimitError("too many requests")
+
+    llm = ManagedLLM(RunnableLambda(failing), provider="test_throttle")
+    llm.rate_limiter.throttle_backoff_seconds = 0.0
+    limit_before = llm.rate_limiter.concurrency.current_limit
+
+    with pytest.raises(RateLimitError):
+        await llm.ainvoke("Hallo")
+
+    metrics = llm.rate_limiter.get_metrics()
+    assert metrics["throttled_requests"] == 1
+    assert metrics["in_flight"] == 0
+    assert metrics["concurrency_limit"] <= limit_before
+
+
+@pytest.mark.asyncio
+async def test_managed_llm_in_chain():
+    """Test ManagedLLM als Teil einer LCEL-Chain"""
+
+    async def echo(prompt):
+        return AIMessage(content=prompt.to_string())
+
+    llm = ManagedLLM(RunnableLambda(echo), provider="test_chain")
+    prompt = ChatPromptTemplate.from_messages([("human", "Aufgabe: {task}")])
+
+    response = await (prompt | llm).ainvoke({"task": "Test"})
+
+    assert "Aufgabe: Test" in response.content
+    assert llm.rate_limiter.get_metrics()["total_requests"] == 1
+
+
+def test_rate_limit_detection():
+    """Test Erkennung von 429-Fehlern"""
+    assert is_rate_limit_error(RateLimitError())
+    assert not is_rate_limit_error(ValueError())
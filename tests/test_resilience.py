@@ -0,0 +1,140 @@
+"""
+Tests für Retries und Circuit Breaking
+"""
+
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm.managed_llm import ManagedLLM
+from cognitive_symphony.llm.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    is_retryable_error,
+)
+
+
+class ServiceUnavailableError(Exception):
+    """Simuliert einen 503-Fehler eines Provider-SDKs"""
+
+    status_code = 503
+
+
+class BadRequestError(Exception):
+    """Simuliert einen 400-Fehler eines Provider-SDKs"""
+
+    status_code = 400
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    """Retries ohne spürbare Wartezeit"""
+    monkeypatch.setattr(settings, "llm_retry_base_seconds", 0.001)
+    monkeypatch.setattr(settings, "llm_retry_max_seconds", 0.01)
+
+
+def flaky_llm(failures: int):
+    """LLM, das die ersten `failures` Aufrufe mit 503 beantwortet"""
+    calls = {"count": 0}
+
+    async def respond(_):
+        calls["count"] += 1
+        if calls["count"] <= failures:
+            raise ServiceUnavailableError("unavailable")
+        return AIMessage(content="ok")
+
+    return RunnableLambda(respond), calls
+
+
+def test_retryable_errors():
+    """Test Klassifizierung transienter Fehler"""
+    assert is_retryable_error(ServiceUnavailableError())
+    assert is_retryable_error(TimeoutError())
+    assert not is_retryable_error(BadRequestError())
+    assert not is_retryable_error(CircuitOpenError("x"))
+
+
+def test_circuit_breaker_state_machine():
+    """Test closed -> open -> half_open -> closed"""
+    breaker = CircuitBreaker("test", failure_threshold=2, recovery_timeout=0.0)
+
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+
+    # recovery_timeout abgelaufen: genau ein Probe-Aufruf
+    assert breaker.allow_request()
+    assert breaker.state == "half_open"
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == "closed"
+    assert breaker.get_metrics()["times_opened"] == 1
+
+
+@pytest.mark.asyncio
+async def test_transient_error_is_retried():
+    """Test dass ein transienter Fehler den Aufruf nicht scheitern lässt"""
+    runnable, calls = flaky_llm(failures=2)
+    llm = ManagedLLM(runnable, provider="test_retry")
+
+    response = await llm.ainvoke("Hallo")
+
+    assert response.content == "ok"
+    assert calls["count"] == 3
+    assert llm.circuit_breaker.state == "closed"
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_error_fails_immediately():
+    """Test dass 4xx-Fehler nicht wiederholt werden"""
+    calls = {"count": 0}
+
+    async def respond(_):
+        calls["count"] += 1
+        raise BadRequestError("bad request")
+
+    llm = ManagedLLM(RunnableLambda(respond), provider="test_bad_request")
+
+    with pytest.raises(BadRequestError):
+        await llm.ainvoke("Hallo")
+
+    assert calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_uses_fallback(monkeypatch):
+    """Test Fail-fast auf das Fallback-Modell bei offenem Breaker"""
+    monkeypatch.setattr(settings, "llm_max_retries", 0)
+
+    primary, primary_calls = flaky_llm(failures=100)
+    fallback_runnable, _ = flaky_llm(failures=0)
+    fallback = ManagedLLM(fallback_runnable, provider="test_fallback_secondary")
+    llm = ManagedLLM(primary, provider="test_fallback", fallback=fallback)
+    llm.circuit_breaker.failure_threshold = 1
+
+    assert (await llm.ainvoke("Hallo")).content == "ok"
+    assert llm.circuit_breaker.state == "open"
+
+    # Breaker offen: Primary wird gar nicht mehr aufgerufen
+    assert (await llm.ainvoke("Hallo")).content == "ok"
+    assert primary_calls["count"] == 1
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast_without_fallback(monkeypatch):
+    """Test CircuitOpenError ohne Fallback-Modell"""
+    monkeypatch.setattr(settings, "llm_max_retries", 0)
+
+    runnable, _ = flaky_llm(failures=100)
+    llm = ManagedLLM(runnable, provider="test_fail_fast")
+    llm.circuit_breaker.failure_threshold = 1
+    llm.circuit_breaker.recovery_timeout = 60.0
+
+    with pytest.raises(ServiceUnavailableError):
+        await llm.ainvoke("Hallo")
+
+    with pytest.raises(CircuitOpenError):
+        await llm.ainvoke("Hallo")
@@ -0,0 +1,93 @@
+"""
+Tests für die inkrementelle Retention des Gedächtnis-Systems
+"""
+
+from datetime import datetime, timedelta
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.memory.retention import MemoryLayer, RetentionQueue
+from cognitive_symphony.models import MemoryEntry, Task, TaskPriority, TaskStatus
+
+
+def entry(days_ago):
+    timestamp = datetime.now() - timedelta(days=days_ago)
+    return MemoryEntry(type="episodic", content={}, timestamp=timestamp)
+
+
+def test_retention_queue_pops_only_expired():
+    """Test Entnahme in Zeitreihenfolge und Neueinreihen aktualisierter Einträge"""
+    queue = RetentionQueue(key=lambda e: e.timestamp.timestamp())
+    old, older, recent, refreshed = entry(100), entry(200), entry(1), entry(150)
+    for e in (old, recent, older, refreshed):
+        queue.push(e)
+    refreshed.timestamp = datetime.now()
+
+    cutoff = (datetime.now() - timedelta(days=90)).timestamp()
+    assert list(queue.pop_expired(cutoff)) == [older, old]
+    assert len(queue) == 2
+    assert list(queue.pop_expired(cutoff)) == []
+
+
+def test_memory_layer_behaves_like_list():
+    """Test Einfügereihenfolge, Index-Zugriff und Entfernen per ID"""
+    first, second, third = entry(3), entry(2), entry(1)
+    layer = MemoryLayer([first, second, third])
+
+    assert layer.remove(second)
+    assert not layer.remove(second)
+    assert list(layer) == [first, third]
+    assert layer[-1] is third
+    assert len(layer) == 2
+    assert first in layer and second not in layer
+
+
+def test_store_expires_only_old_entries_and_prunes_indexes(monkeypatch):
+    """Test Verfallen ohne vollen Scan, konsistente Indizes und Task-Index"""
+    memory = MemorySystem()
+    low = Task(description="Archivierter Lauf", priority=TaskPriority.LOW)
+    important = Task(
+        description="Kritischer Lauf", priority=TaskPriority.CRITICAL, status=TaskStatus.COMPLETED
+    )
+    memory.store_episode(low, [], [])
+    memory.store_episode(important, [], [])
+    memory.store_knowledge({"fact": "unwichtig"}, ["temp"], 0.1)
+    assert memory.get_metrics()["retention"]["pending_episodes"] == 1
+
+    # Cutoff in der Zukunft: alle verfallbaren Einträge sind abgelaufen
+    monkeypatch.setattr(settings, "memory_retention_days", -1)
+    memory.store_episode(Task(description="Neuer Lauf", priority=TaskPriority.LOW), [], [])
+
+    descriptions = [e.content["task"]["description"] for e in memory.episodic_memory]
+    assert descriptions == ["Kritischer Lauf"]
+    assert low.id not in memory.task_index
+    assert important.id in memory.task_index
+    assert memory.recall_episodes("archivierter") == []
+    assert len(memory.semantic_memory) == 0
+
+    metrics = memory.get_metrics()
+    assert metrics["retention"]["expired_episodes"] == 2
+    assert metrics["retention"]["expired_knowledge"] == 1
+    assert metrics["retention"]["full_cleanups"] == 0
+    assert metrics["episode_index"]["documents"] == 1
+    assert metrics["vector_indexes"]["episodic"]["vectors"] == 1
+    assert metrics["vector_indexes"]["semantic"]["vectors"] == 0
+
+
+def test_full_cleanup_runs_on_schedule(monkeypatch):
+    """Test voller Abgleich nach Intervall erfasst nachträglich geänderte Einträge"""
+    memory = MemorySystem()
+    memory.store_episode(Task(description="Wichtig", priority=TaskPriority.CRITICAL), [], [])
+    episode = memory.episodic_memory[0]
+    # Nachträglich abgewertet: nicht im Verfalls-Heap, erst der Abgleich findet es
+    episode.importance = 0.1
+    episode.timestamp = datetime.now() - timedelta(days=365)
+
+    memory.store_episode(Task(description="Zweiter Lauf"), [], [])
+    assert episode in memory.episodic_memory
+
+    monkeypatch.setattr(settings, "memory_cleanup_interval_seconds", 0)
+    memory.store_episode(Task(description="Dritter Lauf"), [], [])
+
+    assert episode not in memory.episodic_memory
+    assert memory.get_metrics()["retention"]["full_cleanups"] == 1
@@ -0,0 +1,101 @@
+"""
+Tests für den lokalen Stub-LLM-Server
+"""
+
+import socket
+
+import httpx
+import pytest
+from langchain.prompts import ChatPromptTemplate
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.llm import rate_limiter, resilience
+from cognitive_symphony.llm.providers import create_llm
+from cognitive_symphony.llm.stub_server import StubServer, StubServerConfig
+
+
+def free_port():
+    """Findet einen freien lokalen Port"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    """Stub-Server ohne Latenz; Settings zeigen auf den Server"""
+    server = StubServer(
+        StubServerConfig(latency_mean=0.0, completion_tokens=5, tokens_per_second=10_000),
+        port=free_port(),
+    ).start()
+
+    monkeypatch.setattr(settings, "use_stub_llm_server", True)
+    monkeypatch.setattr(settings, "stub_llm_server_url", server.url)
+    monkeypatch.setattr(settings, "llm_backend", "live")
+    # Frische Limiter und Breaker (andere Tests können echte Provider geöffnet haben)
+    monkeypatch.setattr(rate_limiter, "_rate_limiters", {})
+    monkeypatch.setattr(resilience, "_circuit_breakers", {})
+
+    yield server
+    server.stop()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("provider", ["openai", "anthropic"])
+async def test_chat_model_against_stub(stub_server, provider):
+    """Test ChatOpenAI und ChatAnthropic über echten HTTP-Pfad"""
+    llm = create_llm(provider)
+    chain = ChatPromptTemplate.from_messages([("human", "{task}")]) | llm
+
+    response = await chain.ainvoke({"task": "Test"})
+    streamed = [chunk.content async for chunk in chain.astream({"task": "Test"})]
+
+    assert "Schritt 1" in response.content
+    assert "".join(streamed) == response.content
+    assert stub_server.stats.streamed == 1
+
+
+def test_fault_injection(stub_server):
+    """Test 429 mit Retry-After und 5xx-Fehler"""
+    behavior = stub_server.app.state.behavior
+    body = {"model": "stub", "messages": [{"role": "user", "content": "Hallo"}]}
+
+    behavior.config.error_429_rate = 1.0
+    response = httpx.post(f"{stub_server.url}/v1/chat/completions", json=body)
+    assert response.status_code == 429
+    assert response.headers["retry-after"] == "1.0"
+
+    behavior.config.error_429_rate = 0.0
+    behavior.config.error_5xx_rate = 1.0
+    response = httpx.post(f"{stub_server.url}/v1/messages", json=body)
+    assert response.status_code == 503
+    assert response.json()["type"] == "error"
+
+    assert httpx.get(f"{stub_server.url}/stats").json()["throttled"] == 1
+
+
+def test_latency_distributions():
+    """Test dass alle Latenzverteilungen nicht-negative Werte liefern"""
+    for distribution in ["fixed", "uniform", "normal", "lognormal", "exponential"]:
+        server = StubServer(
+            StubServerConfig(
+                latency_distribution=distribution, latency_mean=0.1, latency_stddev=0.05, seed=1
+            )
+        )
+        samples = [server.app.state.behavior.sample_latency() for _ in range(100)]
+        assert all(s >= 0.0 for s in samples)
+        assert 0.05 < sum(samples) / len(samples) < 0.15
+
+
+def test_anthropic_clients_without_stub(monkeypatch):
+    """Test Timeout und deaktivierte SDK-Retries auch gegen die echte API"""
+    monkeypatch.setattr(settings, "use_stub_llm_server", False)
+    monkeypatch.setattr(settings, "llm_backend", "live")
+    monkeypatch.setattr(settings, "llm_request_timeout_seconds", 12.5)
+
+    llm = create_llm("anthropic")
+
+    for model in (llm.llm, llm.fallback.llm):
+        for client in (model._client, model._async_client):
+            assert client.timeout == 12.5
+            assert client.max_retries == 0
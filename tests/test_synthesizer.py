@@ -0,0 +1,192 @@
+"""
+Tests für Cache und Capability-Extraktion des Synthesizers
+"""
+
+import time
+
+import numpy as np
+import pytest
+from langchain_core.messages import AIMessage
+from langchain_core.runnables import RunnableLambda
+
+from cognitive_symphony.agents.agent_fleet import AgentFleet
+from cognitive_symphony.agents.research_agent import ResearchAgent
+from cognitive_symphony.models import AgentCapability, Task
+from cognitive_symphony.synthesis.adaptive_synthesizer import (
+    AdaptiveAgentSynthesizer,
+    synthesis_cache_key,
+)
+from cognitive_symphony.memory.embeddings import HashingVectorizer
+from cognitive_symphony.synthesis.capability_matcher import CapabilityMatcher
+
+
+def counting_llm(content="Name: SecureCodeAgent"):
+    """LLM mit fester Antwort, das seine Aufrufe zählt"""
+    calls = []
+
+    async def respond(prompt):
+        calls.append(prompt)
+        return AIMessage(content=content)
+
+    llm = RunnableLambda(respond)
+    llm.calls = calls
+    return llm
+
+
+def test_cache_key_normalizes_capabilities():
+    """Test dass Reihenfolge und Schreibweise den Schlüssel nicht ändern"""
+    key = synthesis_cache_key(["Code Review", "Security-Audit"], ["security", "code"])
+
+    assert key == synthesis_cache_key(["security audit", "code review", ""], ["code", "security"])
+    assert key != synthesis_cache_key(["Code Review"], ["code", "security"])
+
+
+@pytest.mark.asyncio
+async def test_reuse_and_lru_eviction():
+    """Test Wiederverwendung gleicher Anforderungen und Verdrängung"""
+    llm = counting_llm()
+    fleet = AgentFleet(llm=counting_llm())
+    synthesizer = AdaptiveAgentSynthesizer(
+        llm, fleet, cache_size=1, promotion_threshold=0, specification_mode="llm"
+    )
+    task = Task(description="Prüfe den Code")
+
+    first = await synthesizer.synthesize_agent(task, ["Code Review", "Security Audit"])
+    second = await synthesizer.synthesize_agent(task, ["security audit", "code review"])
+
+    assert second is first
+    assert len(llm.calls) == 1
+
+    await synthesizer.synthesize_agent(task, ["Web Research"])
+    third = await synthesizer.synthesize_agent(task, ["Code Review", "Security Audit"])
+
+    assert third is not first
+    assert len(llm.calls) == 3
+    metrics = synthesizer.get_cache_metrics()
+    assert metrics["hits"] == 1
+    assert metrics["avoided_synthesis_calls"] == 1
+    assert metrics["evictions"] == 2
+    assert metrics["size"] == 1
+
+
+@pytest.mark.asyncio
+async def test_frequent_agent_is_promoted():
+    """Test Übernahme häufig genutzter Agenten als routbarer Typ der Flotte"""
+    llm = counting_llm()
+    fleet = AgentFleet(llm=llm)
+    synthesizer = AdaptiveAgentSynthesizer(
+        llm, fleet, promotion_threshold=2, specification_mode="llm"
+    )
+    task = Task(description="Prüfe den Code")
+    fleet.get_capability_index()
+
+    for _ in range(3):
+        agent = await synthesizer.synthesize_agent(task, ["Code Review", "Security Audit"])
+
+    assert synthesizer.get_cache_metrics()["promoted"] == ["SecureCodeAgent"]
+    assert fleet.is_active("SecureCodeAgent")
+    assert fleet.get_agent("SecureCodeAgent") is agent
+    assert "SecureCodeAgent" in fleet.get_capability_index()
+
+    result = await fleet.execute_task(task, ["SecureCodeAgent"])
+    assert result["agent"] == "SecureCodeAgent"
+    assert result["type"] == "synthesized_result"
+
+
+@pytest.mark.asyncio
+async def test_template_specification_without_llm():
+    """Test deterministische Spezifikation aus den Capability-Daten"""
+    llm = counting_llm()
+    synthesizer = AdaptiveAgentSynthesizer(llm, AgentFleet(llm=counting_llm()))
+    task = Task(description="Prüfe den Code")
+
+    agent = await synthesizer.synthesize_agent(task, ["Code Review", "Security Audit"])
+
+    assert llm.calls == []
+    assert agent.custom_name == "CodeSecurityAgent"
+    assert agent.description.startswith("Kombiniert die Fähigkeiten von")
+    assert "Code Review (" in agent.description
+    assert "Security Audit (" in agent.description
+
+    fallback = await synthesizer.synthesize_agent(task, [])
+    assert fallback.custom_name == "ResearchAnalysisAgent"
+
+
+@pytest.mark.asyncio
+async def test_synthesis_does_not_instantiate_base_agents():
+    """Test dass Capabilities der Basis-Agenten ohne Pools und Instanzen gelesen werden"""
+    fleet = AgentFleet(llm=counting_llm())
+    synthesizer = AdaptiveAgentSynthesizer(counting_llm(), fleet)
+
+    agent = await synthesizer.synthesize_agent(
+        Task(description="Prüfe den Code"), ["Code Review", "Security Audit"]
+    )
+
+    assert agent.capabilities
+    assert fleet.pools == {} and fleet.agents == {}
+
+
+def test_matcher_ranks_by_similarity():
+    """Test lokale Zuordnung über Kosinus-Ähnlichkeit"""
+    matcher = CapabilityMatcher(HashingVectorizer()).fit(
+        {
+            "Data Analysis": "Statistische Analyse und Datenauswertung",
+            "Security Audit": "Umfassende Sicherheitsprüfung",
+            "Content Creation": "Texte und Artikel erstellen",
+        }
+    )
+
+    assert matcher.matrix.dtype == np.float32
+    assert np.allclose(np.linalg.norm(matcher.matrix, axis=1), 1.0)
+    assert matcher.match("Analysiere die Verkaufsdaten")[0][0] == "Data Analysis"
+    assert matcher.match("Bake a cake") == []
+
+
+@pytest.mark.asyncio
+async def test_local_extraction_with_llm_fallback():
+    """Test lokale Capability-Extraktion ohne LLM-Aufruf, LLM nur als Fallback"""
+    llm = counting_llm("Baking, Recipes")
+    synthesizer = AdaptiveAgentSynthesizer(llm, AgentFleet(llm=counting_llm()))
+
+    capabilities = await synthesizer._extract_required_capabilities(
+        Task(description="Write a Python function with unit tests")
+    )
+    assert capabilities[0] == "Testing & Debugging"
+    assert llm.calls == []
+
+    start = time.perf_counter()
+    for _ in range(100):
+        synthesizer._get_matcher().match("Optimize database query performance")
+    assert (time.perf_counter() - start) / 100 < 0.001
+
+    fallback = await synthesizer._extract_required_capabilities(Task(description="Bake a cake"))
+    assert fallback == ["Baking", "Recipes"]
+    assert synthesizer.get_extraction_metrics() == {
+        "mode": "local",
+        "local": 1,
+        "llm_fallback": 1,
+        "llm": 0,
+    }
+
+
+def test_matcher_refits_after_promotion():
+    """Test dass die lokale Extraktion später übernommene Agenten findet"""
+    fleet = AgentFleet(llm=counting_llm())
+    synthesizer = AdaptiveAgentSynthesizer(counting_llm(), fleet)
+    matcher = synthesizer._get_matcher()
+    assert synthesizer._get_matcher() is matcher
+
+    agent = ResearchAgent(counting_llm())
+    agent.capabilities = [
+        AgentCapability(
+            name="Quantum Chemistry",
+            description="Quantum chemistry molecule simulation",
+            skill_level=0.9,
+            success_rate=0.9,
+        )
+    ]
+    fleet.promote_agent("QuantumAgent", agent)
+
+    refitted = synthesizer._get_matcher()
+    assert refitted is not matcher
+    assert refitted.match("Run a quantum chemistry simulation")[0][0] == "Quantum Chemistry"
@@ -0,0 +1,79 @@
+"""
+Tests für Hot-/Cold-Tiering der Episoden-Inhalte
+"""
+
+import os
+
+from cognitive_symphony.config import settings
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.memory.payload import CompressedPayload
+from cognitive_symphony.memory.tiering import ColdSegmentStore, PayloadTier
+from cognitive_symphony.models import Task
+
+
+def payload(i):
+    return CompressedPayload.encode({"text": f"Antwort {i} " + os.urandom(200).hex()}, {})
+
+
+def test_cold_segments_rotate_and_compact(tmp_path):
+    """Test Offset-Index über mehrere Segmente und Kompaktieren toter Segmente"""
+    cold = ColdSegmentStore(tmp_path, segment_bytes=100)
+    blobs = {f"k{i}": bytes([i]) * 60 for i in range(6)}
+    for key, blob in blobs.items():
+        cold.append(key, blob)
+
+    assert cold.get_metrics()["segments"] == 3
+    assert all(cold.read(key) == blob for key, blob in blobs.items())
+
+    assert cold.delete("k0")
+    metrics = cold.get_metrics()
+    assert metrics["compactions"] == 1
+    assert not (tmp_path / "segment-000000.log").exists()
+    assert cold.read("k1") == blobs["k1"]
+    assert "k0" not in cold and len(cold) == 5
+    cold.close()
+
+
+def test_payload_tier_evicts_lru_and_faults_in(tmp_path):
+    """Test Verdrängung nach LRU, transparentes Zurückholen und Hit-Rate"""
+    payloads = [payload(i) for i in range(4)]
+    tier = PayloadTier(max_hot_bytes=payloads[0].size * 2 + 10, directory=tmp_path)
+    for i, p in enumerate(payloads):
+        tier.add(f"e{i}", p)
+
+    assert [p._blob is None for p in payloads] == [True, True, False, False]
+    assert payloads[0]["text"].startswith("Antwort 0")
+    # Zurückgeholt verdrängt den am längsten ungenutzten (e2)
+    assert payloads[0]._blob is not None and payloads[2]._blob is None
+
+    metrics = tier.get_metrics()
+    assert metrics["hot_entries"] == 2 and metrics["cold_entries"] == 2
+    assert metrics["misses"] == 1 and metrics["evictions"] == 3
+
+    tier.discard(payloads[2])
+    assert payloads[2].tier is None and payloads[2]["text"].startswith("Antwort 2")
+    assert tier.get_metrics()["cold_entries"] == 1
+
+    directory = tier.cold.directory
+    tier.close()
+    assert not directory.exists()
+
+
+def test_memory_recall_faults_cold_episodes(monkeypatch, tmp_path):
+    """Test Tiering im MemorySystem: Abruf holt kalte Episoden in den Hot-Tier"""
+    monkeypatch.setattr(settings, "memory_hot_tier_bytes", 1)
+    monkeypatch.setattr(settings, "memory_cold_tier_path", str(tmp_path))
+    memory = MemorySystem()
+    for name in ("Umsatzanalyse", "Fehlerbericht", "Wochenplanung"):
+        memory.store_episode(Task(description=name, result=name * 20), [], [])
+
+    assert memory.get_metrics()["payload_tier"]["cold_entries"] == 2
+
+    (episode,) = memory.recall_episodes("umsatzanalyse", limit=1)
+    assert episode.content.tier.hot.get(episode.id) is episode.content
+    assert episode.content["task"]["description"] == "Umsatzanalyse"
+
+    metrics = memory.get_metrics()["payload_tier"]
+    assert metrics["hot_entries"] == 1 and metrics["cold_entries"] == 2
+    assert metrics["misses"] == 1 and metrics["hit_rate"] == 0.5
+    memory.close()
@@ -0,0 +1,120 @@
+"""
+Tests für den IVF-Vektorindex und recall_similar
+"""
+
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from cognitive_symphony.memory.embeddings import normalize
+from cognitive_symphony.memory.memory_system import MemorySystem
+from cognitive_symphony.memory.vector_index import VectorIndex
+from cognitive_symphony.models import Task, TaskPriority
+
+
+def clustered_vectors(count, dimensions=32, clusters=20, seed=0):
+    """Normierte Vektoren um zufällige Cluster-Zentren"""
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(clusters, dimensions))
+    labels = rng.integers(0, clusters, size=count)
+    return normalize(centers[labels] + 0.3 * rng.normal(size=(count, dimensions))).astype(
+        np.float32
+    )
+
+
+def test_ann_recall_against_exact_search():
+    """Test Recall@10 der approximativen gegen die exakte Suche"""
+    vectors = clustered_vectors(5000)
+    index = VectorIndex(32, train_threshold=1000)
+    for i, vector in enumerate(vectors):
+        index.add(str(i), vector)
+
+    metrics = index.get_metrics()
+    assert metrics["trained"]
+    assert metrics["vectors"] == 5000
+
+    queries = clustered_vectors(50, seed=1)
+    recall = np.mean(
+        [
+            len(
+                {key for key, _ in index.search(q, 10)}
+                & {key for key, _ in index.exact_search(q, 10)}
+            )
+            / 10
+            for q in queries
+        ]
+    )
+    assert recall >= 0.9
+
+    # Ein Vektor findet sich selbst
+    assert index.search(vectors[42], 1)[0][0] == "42"
+
+
+def test_remove_and_compaction():
+    """Test Löschen mit Tombstones und Kompaktierung ohne verwaiste Treffer"""
+    vectors = clustered_vectors(3000)
+    index = VectorIndex(32, train_threshold=1000)
+    for i, vector in enumerate(vectors):
+        index.add(str(i), vector, item=i)
+
+    for i in range(2000):
+        assert index.remove(str(i))
+    assert not index.remove("0")
+    assert len(index) == 1000
+    assert index.get_metrics()["tombstones"] < 2000
+
+    index.compact()
+    results = index.search(vectors[10], 1000, probes=index.list_count)
+    assert {item for item, _ in results} == set(range(2000, 3000))
+    assert index.get_metrics()["tombstones"] == 0
+
+
+def test_save_and_mmap_load(tmp_path):
+    """Test Persistenz mit Memory-Mapping und Einfügen nach dem Laden"""
+    vectors = clustered_vectors(2000)
+    index = VectorIndex(32, train_threshold=1000)
+    for i, vector in enumerate(vectors):
+        index.add(str(i), vector)
+    index.remove("7")
+
+    loaded = VectorIndex.load(index.save(tmp_path / "index"))
+
+    assert loaded.get_metrics()["memory_mapped"]
+    assert len(loaded) == 1999
+    assert "7" not in loaded
+    for q in vectors[:20]:
+        assert loaded.search(q, 5) == index.search(q, 5)
+
+    loaded.add("new", vectors[7])
+    assert not loaded.get_metrics()["memory_mapped"]
+    assert loaded.search(vectors[7], 1)[0][0] == "new"
+
+
+def test_recall_similar_and_cleanup(tmp_path):
+    """Test semantische Suche über alle Schichten und Entfernen beim Cleanup"""
+    memory = MemorySystem()
+    memory.store_workflow({"strategy": "Datenbank Migration in Stufen"}, 0.9, ["database"])
+    memory.store_knowledge({"fact": "Python Listen sind dynamische Arrays"}, ["python"], 0.8)
+    memory.store_episode(Task(description="Analysiere Verkaufsdaten im Dashboard"), [], [])
+
+    assert memory.recall_similar("Datenbank migrieren", k=1)[0].type == "procedural"
+    assert memory.recall_similar("Verkaufsdaten Analyse", k=1)[0].type == "episodic"
+    assert [e.type for e in memory.recall_similar("Python", memory_type="semantic")] == [
+        "semantic"
+    ]
+
+    path = memory.save_vector_indexes(tmp_path / "vectors")
+    restored = MemorySystem()
+    restored.procedural_memory = memory.procedural_memory
+    restored.load_vector_indexes(path)
+    assert restored.recall_similar("Datenbank", k=1)[0] is memory.procedural_memory[0]
+    assert restored.get_metrics()["vector_indexes"]["episodic"]["vectors"] == 0
+
+    old = Task(description="Archivierter Kubernetes Lauf", priority=TaskPriority.LOW)
+    memory.store_episode(old, [], [])
+    episode = memory.recall_similar("Kubernetes", k=1)[0]
+    episode.timestamp = datetime.now() - timedelta(days=365)
+    memory._cleanup_old_memories()
+
+    assert all(e is not episode for e in memory.recall_similar("Kubernetes"))
+    assert memory.get_metrics()["vector_indexes"]["episodic"]["vectors"] == 1